@@ -1,6 +1,7 @@
 from ._anvil_designer import AdminPanelTemplate
 from anvil import *
 import anvil.server
+import anvil.media
 import anvil.tables as tables
 import anvil.tables.query as q
 from anvil.tables import app_tables
@@ -44,6 +45,16 @@ class AdminPanel(AdminPanelTemplate):
         local_reg = LocalSubtagRegistry()
         local_reg.download_json("currency")
 
+    def export_metadata_json_click(self, **event_args):
+        local_reg = LocalSubtagRegistry()
+        local_reg.download_json(LocalSubtagRegistry.METADATA)
+
+    def export_langcodes_snapshot_click(self, **event_args):
+        anvil.media.download(anvil.server.call("export_langcodes_snapshot"))
+
+    def export_fallback_chains_click(self, **event_args):
+        anvil.media.download(anvil.server.call("export_fallback_chains"))
+
 
 
 
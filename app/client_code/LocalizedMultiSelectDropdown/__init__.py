@@ -9,6 +9,8 @@ from anvil.tables import app_tables
 #
 # This software is published at https://github.com/anvilistas/anvil-extras
 
+from bisect import bisect_left as _bisect_left
+
 import anvil.js as _js
 from anvil import HtmlPanel as _HtmlPanel
 from anvil.js.window import Function as _Function
@@ -68,9 +70,15 @@ _defaults = {
     "none_results_text": "No results matched {0}",
     "none_selected_text": "Nothing selected",
     "select_all_text": "Select All",
-    "deselect_all_text": "Deselect All"
+    "deselect_all_text": "Deselect All",
+    "max_rendered_items": 0,
+    "more_items_text": "{0} more – refine the search",
+    "virtual_scroll": 600,
 }
 
+# distance in pixels from the end of the menu at which more options are rendered
+_SCROLL_MARGIN = 100
+
 
 def _props_property(prop, setter):
     def getprop(self):
@@ -118,6 +126,29 @@ class LocalizedMultiSelectDropdown(LocalizedMultiSelectDropdownTemplate):
 
         self._values = {}
         self._invalid = []
+        # Options are identified by stable keys, so that changes of the items only
+        # touch the <option> elements of the items that changed.
+        self._options = {}
+        self._signatures = {}
+        self._order = []
+        self._position = {}
+        self._elements = {}
+        self._rendered = []
+        self._next_key = 0
+        # The selection is kept in Python: the keys of the selected options in item
+        # order, and a map from hashable values to the keys of their options.
+        self._chosen = {}
+        self._lookup = {}
+        self._unhashable = []
+        # State of the virtualized mode (see max_rendered_items)
+        self._virtual = False
+        self._query = ""
+        self._search_index = None
+        self._filtered = None
+        self._window_end = 0
+        self._remaining = 0
+        self._hint = None
+        self._select_all = None
         # Any code you write here will run when the form opens
         self._props = props = _defaults | properties
         props["items"] = props["items"] or []
@@ -127,9 +158,9 @@ class LocalizedMultiSelectDropdown(LocalizedMultiSelectDropdownTemplate):
 
         self.set_event_handler("x-popover-init", self._mk_popover)
         self._user_selected_all(False)
-        self._reset()
         if selected:
             self.selected = selected
+        self._reset()
         self._init = True
 
     def _reset(self):
@@ -141,8 +172,12 @@ class LocalizedMultiSelectDropdown(LocalizedMultiSelectDropdownTemplate):
         self._el.on("hidden.bs.select", self._closed)
         menu = self._el.data("selectpicker")["$menu"]
         menu.find(".bs-actionsbox").on("click", self._user_selected_all)
+        menu.find(".bs-searchbox input").on("input", self._search)
+        menu.find(".inner").on("scroll", self._scrolled)
 
     def format_selected_text(self, count, total):
+        # not all the selected options are rendered (see max_rendered_items)
+        count = len(self._chosen)
         if count > 3:
             return f"{count} items selected"
         return ", ".join(self.selected_keys)
@@ -160,48 +195,192 @@ class LocalizedMultiSelectDropdown(LocalizedMultiSelectDropdownTemplate):
     def items(self, value):
         self._props["items"] = value
         selected = self.selected + self._invalid
-        self._el.children().remove()
-        options, values = _clean_items(value)
-        self._el.append(options)
-        self._values = values
-        self.selected = selected
+        previous = {}
+        for key, signature in self._signatures.items():
+            previous.setdefault(signature, []).append(key)
+        self._options, self._values, self._signatures, self._next_key = _clean_items(
+            value, previous, self._next_key
+        )
+        self._order = list(self._values)
+        self._position = {key: idx for idx, key in enumerate(self._order)}
+        self._index_values()
+        limit = self._props.get("max_rendered_items") or 0
+        self._virtual = bool(limit) and len(self._values) > limit
+        self._search_index = None
+        self._query = ""
+        self._filtered = None
+        self._window_end = limit
+        to_select, self._invalid = self._find_keys(selected)
+        self._chosen = dict.fromkeys(to_select)
+        self._render()
+        self._select_options()
         if self._init:
             self._el.selectpicker("refresh")
             self._el.selectpicker("render")
 
     @property
     def selected_keys(self):
-        return [e.textContent for e in _S("option:selected", self._el) if e.value != ""]
+        return [_item_text(self.items[self._position[key]]) for key in self._chosen]
 
     @property
     def selected(self):
-        return [
-            self._values[e.value]
-            for e in _S("option:selected", self._el)
-            if e.value != ""
-        ]
+        return [self._values[key] for key in self._chosen]
 
     @selected.setter
     def selected(self, values):
-        FOUND = object()
+        to_select, self._invalid = self._find_keys(values)
+        self._chosen = dict.fromkeys(to_select)
+        if self._virtual:
+            self._render()
+        self._select_options()
+        if self._init:
+            self._el.selectpicker("refresh")
+
+    def _index_values(self):
+        self._lookup = {}
+        self._unhashable = []
+        for key, val in self._values.items():
+            try:
+                self._lookup.setdefault(val, []).append(key)
+            except TypeError:
+                self._unhashable.append((key, val))
 
+    def _find_keys(self, values):
+        # Return the option keys of the given values (in item order) and the values
+        # not found. Each value selects at most one option.
         if not isinstance(values, (list, tuple)):
             values = [values]
-        else:
-            values = list(values)
 
+        used = set()
         to_select = []
-        for key, val in self._values.items():
+        invalid = []
+        for val in values:
             try:
-                idx = values.index(val)
-            except ValueError:
-                pass
+                candidates = self._lookup.get(val, ())
+            except TypeError:
+                candidates = ()
+            key = next((k for k in candidates if k not in used), None)
+            if key is None:
+                # unhashable values can only be compared one by one
+                key = next(
+                    (k for k, v in self._unhashable if k not in used and v == val), None
+                )
+            if key is None:
+                invalid.append(val)
             else:
-                values[idx] = FOUND
+                used.add(key)
                 to_select.append(key)
 
-        self._invalid = [val for val in values if val is not FOUND]
-        self._el.selectpicker("val", to_select)
+        return sorted(to_select, key=self._position.__getitem__), invalid
+
+    def _select_options(self):
+        # Set the selected state of the <option> elements directly. Unlike
+        # selectpicker("val"), this is linear in the number of options.
+        for key, element in self._elements.items():
+            element.selected = key in self._chosen
+
+    def _render(self):
+        # Update the <option> elements to match the items. In the virtualized mode,
+        # only the selected items and the first max_rendered_items items matching
+        # the search are added. Options whose key is kept are neither recreated nor
+        # moved, unless their order changed.
+        if self._hint is not None:
+            _S(self._hint).remove()
+            self._hint = None
+        keys = self._window() if self._virtual else self._order
+        wanted = set(keys)
+        for key in self._rendered:
+            if key not in wanted:
+                _S(self._elements.pop(key)).remove()
+
+        new = [key for key in keys if key not in self._elements]
+        if new:
+            created = _S("\n".join(self._options[key] for key in new)).filter("option")
+            for element in created:
+                element.selected = element.value in self._chosen
+                self._elements[element.value] = element
+
+        # Options in the longest run that is still in order stay where they are.
+        old_position = {key: idx for idx, key in enumerate(self._rendered)}
+        kept = [key for key in keys if key in old_position]
+        stable = {kept[idx] for idx in _increasing([old_position[key] for key in kept])}
+
+        previous = None
+        batch = []
+        for key in keys + [None]:
+            if key is not None and key not in stable:
+                batch.append(self._elements[key])
+                continue
+            if batch:
+                if previous is None:
+                    self._el.prepend(_S(batch))
+                else:
+                    _S(previous).after(_S(batch))
+                batch = []
+            previous = None if key is None else self._elements[key]
+        self._rendered = list(keys)
+
+        if self._virtual and self._remaining:
+            # a disabled option telling how many matches are not rendered. Its tokens
+            # make it pass the filter of bootstrap-select.
+            text = self._props["more_items_text"].format(self._remaining)
+            hint = _S("<option disabled class='fluent-more-items' value=''></option>")
+            self._hint = hint.text(text).attr("data-tokens", self._query)[0]
+            self._el.append(self._hint)
+
+    def _window(self):
+        positions, self._remaining = _window(
+            self._matches(),
+            [self._position[key] for key in self._chosen],
+            self._window_end,
+            self._props["max_rendered_items"],
+        )
+        return [self._order[idx] for idx in positions]
+
+    def _matches(self):
+        # the positions of the items matching the search, in item order
+        if self._filtered is None:
+            if self._query and self._search_index is None:
+                self._search_index = [_search_text(item) for item in self.items]
+            self._filtered = _matching(self._search_index, len(self._order), self._query)
+        return self._filtered
+
+    def _refresh_window(self):
+        self._render()
+        self._el.selectpicker("refresh")
+        if self._query:
+            # let bootstrap-select filter the new options, too
+            self._el.data("selectpicker")["$searchbox"].trigger("propertychange")
+
+    def _update_chosen(self, clicked_index, is_selected):
+        if clicked_index is None and self._virtual and self._select_all is not None:
+            # the select all buttons apply to all the items matching the search, not
+            # only to the rendered ones
+            matched = [self._order[idx] for idx in self._matches()]
+            unmatched = set(self._chosen).difference(matched)
+            chosen = [key for key in self._chosen if key in unmatched]
+            if self._select_all:
+                chosen += [
+                    key for key in matched if _selectable(self.items[self._position[key]])
+                ]
+        elif clicked_index is None:
+            # val() or (de)select all: read the rendered options. The selection of the
+            # items that are not rendered (see max_rendered_items) is kept.
+            rendered = set(self._rendered)
+            chosen = [key for key in self._chosen if key not in rendered]
+            chosen += [e.value for e in _S("option:selected", self._el) if e.value != ""]
+        else:
+            # the index may include the placeholder option of bootstrap-select
+            key = self._el[0].options.item(clicked_index).value
+            if key not in self._position:
+                return
+            if self._props["multiple"]:
+                chosen = [k for k in self._chosen if k != key]
+            else:
+                chosen = []
+            if is_selected:
+                chosen.append(key)
+        self._chosen = dict.fromkeys(sorted(chosen, key=self._position.__getitem__))
 
     width = _component_property("width", "data-width", _css_length)
     multiple = _component_property("multiple", "multiple")
@@ -213,6 +392,13 @@ class LocalizedMultiSelectDropdown(LocalizedMultiSelectDropdownTemplate):
     none_selected_text = _component_property("none_selected_text", "data-none-selected-text")
     select_all_text = _component_property("select_all_text", "data-select-all-text")
     deselect_all_text = _component_property("deselect_all_text", "data-deselect-all-text")
+    virtual_scroll = _component_property("virtual_scroll", "data-virtual-scroll")
+    max_rendered_items = _props_property(
+        "max_rendered_items", lambda s, v: setattr(s, "items", s.items) if s._init else None
+    )
+    more_items_text = _props_property(
+        "more_items_text", lambda s, v: s._refresh_window() if s._virtual else None
+    )
     tag = _HtmlPanel.tag
 
     @property
@@ -236,9 +422,38 @@ class LocalizedMultiSelectDropdown(LocalizedMultiSelectDropdownTemplate):
         self.raise_event("opened")
 
     def _closed(self, *e):
+        limit = self._props["max_rendered_items"]
+        if self._virtual and (self._query or self._window_end > limit):
+            self._query = ""
+            self._filtered = None
+            self._window_end = limit
+            self._refresh_window()
         self.raise_event("closed")
 
+    def _search(self, e):
+        if not self._virtual:
+            return
+        query = e.target.value.strip().lower()
+        if query == self._query:
+            return
+        self._query = query
+        self._filtered = None
+        self._window_end = self._props["max_rendered_items"]
+        self._refresh_window()
+
+    def _scrolled(self, e):
+        # render the next max_rendered_items matches when the end of the menu is
+        # scrolled into view
+        if not self._virtual or not self._remaining:
+            return
+        inner = e.target
+        if inner.scrollTop + inner.clientHeight < inner.scrollHeight - _SCROLL_MARGIN:
+            return
+        self._window_end += self._props["max_rendered_items"]
+        self._refresh_window()
+
     def change(self, e, clickedIndex, isSelected, prev):
+        self._update_chosen(clickedIndex, isSelected)
         if clickedIndex is not None or self._select_all_is_user:
             self._user_selected_all(False)
             self.raise_event("change")
@@ -246,6 +461,12 @@ class LocalizedMultiSelectDropdown(LocalizedMultiSelectDropdownTemplate):
     def _user_selected_all(self, e):
         # either e is False or it's a js event
         self._select_all_is_user = bool(e)
+        if not e:
+            self._select_all = None
+        elif _S(e.target).closest(".bs-select-all").length:
+            self._select_all = True
+        elif _S(e.target).closest(".bs-deselect-all").length:
+            self._select_all = False
 
     def _mk_popover(self, init_node, **event_args):
         # this is a bit of a hack - we're using the libraries private methods for this
@@ -255,24 +476,25 @@ class LocalizedMultiSelectDropdown(LocalizedMultiSelectDropdownTemplate):
 ##### PRIVATE Functions #####
 
 
-def _option_from_str(item: str, idx: str) -> tuple:
+def _option_from_str(item: str, idx: int, option_key: str) -> tuple:
     key = value = item
     if item == "---":
-        return "<option data-divider='true'></option>", object()  # dummy value
+        # dummy value
+        return f"<option data-divider='true' value={option_key}></option>", object()
     else:
-        return f"<option value={idx}>{key}</option>", value
+        return f"<option value={option_key}>{key}</option>", value
 
 
-def _option_from_tuple(item: tuple, idx: int) -> tuple:
+def _option_from_tuple(item: tuple, idx: int, option_key: str) -> tuple:
     key, value = item
     if not isinstance(key, str):
         raise TypeError(
             f"expectected a tuple of the form str, value in items at idx {idx}"
         )
-    return f"<option value={idx}>{key}</option>", value
+    return f"<option value={option_key}>{key}</option>", value
 
 
-def _option_from_dict(item: dict, idx: int) -> tuple:
+def _option_from_dict(item: dict, idx: int, option_key: str) -> tuple:
     sentinel = object()
 
     # if they only set a key and not a value then use the key as the value
@@ -293,29 +515,104 @@ def _option_from_dict(item: dict, idx: int) -> tuple:
                         {f'data-tokens={tokens}' if tokens else ''}
                         {f'data-content={content}' if content else ''}
                         {f'title={title}' if title else ''}
-                        value={idx}>
+                        value={option_key}>
                         {item.get('key')}
                 </option>"""
 
     return option, value
 
 
-def _clean_items(items):
-    options = []
+def _clean_items(items, previous: dict, next_key: int) -> tuple:
+    # previous maps the signatures of the current items to their option keys. An
+    # item with the same signature keeps its key (and its <option> element).
+    options = {}
     value_dict = {}
+    signatures = {}
 
     for idx, item in enumerate(items):
+        signature = (type(item).__name__, repr(item))
+        if previous.get(signature):
+            option_key = previous[signature].pop(0)
+        else:
+            # use strings since the value from jquery is always a string
+            option_key = str(next_key)
+            next_key += 1
+
         if isinstance(item, str):
-            option, value = _option_from_str(item, idx)
+            option, value = _option_from_str(item, idx, option_key)
         elif isinstance(item, (tuple, list)):
-            option, value = _option_from_tuple(item, idx)
+            option, value = _option_from_tuple(item, idx, option_key)
         elif isinstance(item, dict):
-            option, value = _option_from_dict(item, idx)
+            option, value = _option_from_dict(item, idx, option_key)
         else:
             raise TypeError(f"Invalid item at index {idx} (got type {type(item)})")
 
-        # use strings since the value from jquery is always a string
-        value_dict[str(idx)] = value
-        options.append(option)
+        value_dict[option_key] = value
+        options[option_key] = option
+        signatures[option_key] = signature
+
+    return options, value_dict, signatures, next_key
 
-    return _S("\n".join(options)), value_dict
+
+def _increasing(seq: list) -> list:
+    # Return the indexes of a longest strictly increasing subsequence of seq.
+    tails = []
+    tail_indexes = []
+    parents = [None] * len(seq)
+    for idx, value in enumerate(seq):
+        pos = _bisect_left(tails, value)
+        if pos == len(tails):
+            tails.append(value)
+            tail_indexes.append(idx)
+        else:
+            tails[pos] = value
+            tail_indexes[pos] = idx
+        parents[idx] = tail_indexes[pos - 1] if pos else None
+
+    result = []
+    idx = tail_indexes[-1] if tail_indexes else None
+    while idx is not None:
+        result.append(idx)
+        idx = parents[idx]
+    return result[::-1]
+
+
+def _item_text(item) -> str:
+    if isinstance(item, str):
+        return item
+    if isinstance(item, (tuple, list)):
+        return item[0]
+    return item.get("key")
+
+
+def _search_text(item) -> str:
+    # The text live search is matched against, like bootstrap-select does.
+    text = _item_text(item) or ""
+    if isinstance(item, dict):
+        text = " ".join([text, item.get("tokens") or "", item.get("subtext") or ""])
+    return text.lower()
+
+
+def _selectable(item) -> bool:
+    # whether select all selects the item, like bootstrap-select does
+    if isinstance(item, str):
+        return item != "---"
+    if isinstance(item, dict):
+        return item.get("enabled", True)
+    return True
+
+
+def _matching(search_index, count: int, query: str) -> list:
+    # The positions of the items whose search text contains the query.
+    if not query:
+        return list(range(count))
+    return [idx for idx, text in enumerate(search_index) if query in text]
+
+
+def _window(matches: list, chosen: list, end: int, limit: int) -> tuple:
+    # The positions to render in the virtualized mode and the number of matches that
+    # are left out: the first `end` matches, plus at most `limit` selected items
+    # outside of them, so that the selection stays visible and can be changed.
+    shown = set(matches[:end])
+    extra = [idx for idx in chosen if idx not in shown][:limit]
+    return sorted(shown.union(extra)), max(len(matches) - end, 0)
@@ -5,10 +5,12 @@ import anvil.tables as tables
 import anvil.tables.query as q
 from anvil.tables import app_tables
 from ..fluent import fluent, Message as M
-from ..registries import CLDRFile, CLDRLocale
+from ..registries import CLDRFile, CLDRLocale, LocalSubtagRegistry
 from .._test import TestCase
 
 from datetime import timedelta
+from json import loads
+import anvil.js
 
 
 class _test_display_names(_test_display_namesTemplate, TestCase):
@@ -45,3 +47,52 @@ class _test_display_names(_test_display_namesTemplate, TestCase):
             len(fluent.get_locale_options(translatable_only = True)),
             len(fluent.get_locale_options(translatable_only = False))
         )
+
+        # Translated names are remembered per locale, type and style. Only codes
+        # that have not been translated before are translated.
+        fluent._names.clear()
+        calls = []
+        translate = fluent._translate_display_names
+        fluent._translate_display_names = lambda codes, *args: calls.append(list(codes)) or translate(codes, *args)
+        try:
+            self.assertEqual(fluent.get_region_name(["AT", "AT"]), ["Österreich", "Österreich"])
+            self.assertEqual(fluent.get_region_name(["at", "CH"]), ["Österreich", "Schweiz"])
+            self.assertEqual(fluent.get_region_name("adrab"), None)
+            self.assertEqual(fluent.get_region_name("adrab"), None)
+            self.assertEqual(calls, [["AT"], ["CH"], ["ADRAB"]])
+            self.assertEqual(
+                list(fluent._names),
+                [(tuple(fluent.locale), "region", tuple(fluent.STYLE_DIALECT_LONG))]
+            )
+        finally:
+            del fluent._translate_display_names
+
+        # An invalid code does not spoil the translation of the other codes.
+        names = fluent._translate_display_names(["AT", "ADRAB", "CH", "US"], "region", fluent.STYLE_DIALECT_LONG)
+        self.assertEqual(
+            names, 
+            {"AT": "Österreich", "ADRAB": None, "CH": "Schweiz", "US": "Vereinigte Staaten"}
+        )
+
+        # Persisted options are tagged with the content hash from the metadata asset
+        # and are reused without translating them again.
+        fluent.configure(persist_options=True)
+        options = fluent.get_region_options()
+        key = (tuple(fluent.locale), "region", "region", tuple(fluent.STYLE_DIALECT_LONG), False)
+        stored = loads(anvil.js.window.localStorage.getItem(fluent._options_storage_key(key)))
+        self.assertEqual(stored["version"], LocalSubtagRegistry(True).get_content_hash("region"))
+        self.assertEqual(stored["options"], options)
+        fluent._options.clear()
+        fluent._translate_options = None  # Fails if the options are translated again.
+        try:
+            self.assertEqual(fluent.get_region_options(), options)
+        finally:
+            del fluent._translate_options
+            fluent.configure(persist_options=False)
+
+        # Fetching and caching CLDR files on the server (served by a local HTTP server)
+        anvil.server.call('test_cldr_fetch')
+        anvil.server.call('test_cldr_archive')
+
+        # Display names compiled from the CLDR tables on the server
+        anvil.server.call('test_display_names')
@@ -34,3 +34,7 @@ class _test_locale_match(_test_locale_matchTemplate, TestCase):
 
         # Test the same stuff on the server
         anvil.server.call('test_locale')
+        anvil.server.call('test_locale_index')
+        anvil.server.call('test_closest_match_many')
+        anvil.server.call('test_langcodes_snapshot')
+        anvil.server.call('test_langcodes_data_json')
@@ -5,8 +5,14 @@ import anvil.tables as tables
 import anvil.tables.query as q
 from anvil.tables import app_tables
 from datetime import datetime
+from itertools import permutations
 
-class _test_localizedmultiselectdropdown(_test_localizedmultiselectdropdownTemplate):
+from .._test import TestCase
+from ..LocalizedMultiSelectDropdown import (
+    _increasing, _item_text, _matching, _search_text, _selectable, _window
+)
+
+class _test_localizedmultiselectdropdown(_test_localizedmultiselectdropdownTemplate, TestCase):
     def __init__(self, **properties):
         # Set Form properties and Data Bindings.
         self.init_components(**properties)
@@ -24,7 +30,157 @@ class _test_localizedmultiselectdropdown(_test_localizedmultiselectdropdownTempl
                 "tokens": "Manhours"
             }
         ]
+        self.test_increasing()
+        self.test_keyed_diff()
+        self.test_selection()
         self.dropdown.items = options
+        self.test_search()
+        self.test_window()
+        self.test_virtualized()
+
+    def test_increasing(self):
+        def longest(seq):
+            # length of the longest strictly increasing subsequence, the slow way
+            lengths = []
+            for idx, value in enumerate(seq):
+                lengths.append(1 + max([lengths[j] for j in range(idx) if seq[j] < value] + [0]))
+            return max(lengths + [0])
+
+        for size in range(6):
+            for seq in permutations(range(size)):
+                indexes = _increasing(list(seq))
+                values = [seq[idx] for idx in indexes]
+                self.assertEqual(indexes, sorted(set(indexes)))
+                self.assertEqual(values, sorted(set(values)))
+                self.assertEqual(len(indexes), longest(seq))
+        self.assertEqual(_increasing([]), [])
+        self.assertEqual(_increasing([0, 1, 2, 3]), [0, 1, 2, 3])
+        self.assertEqual(_increasing([3, 0, 1, 2]), [1, 2, 3])
+        self.assertEqual(len(_increasing([3, 2, 1, 0])), 1)
+        # gaps, as left by removed options
+        self.assertEqual(_increasing([7, 2, 9, 4, 12]), [1, 3, 4])
+
+    def _rendered_texts(self, dropdown):
+        keys = [e.value for e in dropdown._el.find("option") if e.value != ""]
+        return [_item_text(dropdown.items[dropdown._position[key]]) for key in keys]
+
+    def test_keyed_diff(self):
+        dropdown = self.dropdown
+        dropdown.items = ["A", "B", "C", "D"]
+        dropdown.selected = ["A", "C"]
+        elements = {
+            _item_text(dropdown.items[dropdown._position[key]]): element
+            for key, element in dropdown._elements.items()
+        }
+
+        # reorder, remove and add at once
+        dropdown.items = ["D", "A", "C", "E"]
+        self.assertEqual(self._rendered_texts(dropdown), ["D", "A", "C", "E"])
+        self.assertEqual(len(dropdown._elements), 4)
+        for text in ["A", "C", "D"]:
+            key = dropdown._order[dropdown.items.index(text)]
+            self.assertTrue(dropdown._elements[key] is elements[text])
+        key = dropdown._order[dropdown.items.index("E")]
+        self.assertFalse(dropdown._elements[key] in elements.values())
+        self.assertEqual(dropdown.selected, ["A", "C"])
+
+        # items that are equal to others are told apart by their position
+        dropdown.items = ["C", "A", "C", "A"]
+        self.assertEqual(self._rendered_texts(dropdown), ["C", "A", "C", "A"])
+        self.assertEqual(len(set(dropdown._order)), 4)
+        dropdown.items = []
+        self.assertEqual(self._rendered_texts(dropdown), [])
+        self.assertEqual(dropdown._elements, {})
+
+    def test_selection(self):
+        dropdown = self.dropdown
+        dropdown.items = [("One", 1), ("Two", 2), ("Three", 3)]
+        dropdown.selected = [3, 1]
+        # the selection is kept in item order
+        self.assertEqual(dropdown.selected, [1, 3])
+        self.assertEqual(dropdown.selected_keys, ["One", "Three"])
+
+        # values that are missing are not selected, but remembered
+        dropdown.selected = [2, 99]
+        self.assertEqual(dropdown.selected, [2])
+        self.assertEqual(dropdown._invalid, [99])
+        dropdown.items = [("Two", 2), ("Ninety-nine", 99)]
+        self.assertEqual(dropdown.selected, [2, 99])
+
+        # replacing the items keeps the values that are still there
+        dropdown.selected = [2, 99]
+        dropdown.items = [("Ninety-nine", 99), ("Four", 4)]
+        self.assertEqual(dropdown.selected, [99])
+        dropdown.items = [("Two", 2), ("Four", 4), ("Ninety-nine", 99)]
+        self.assertEqual(dropdown.selected, [2, 99])
+
+        # equal values select one option each, unhashable values are compared
+        dropdown.items = [("A", 1), ("B", 1), ("L", [1]), ("D", {"x": 1})]
+        dropdown.selected = [1]
+        self.assertEqual(dropdown.selected_keys, ["A"])
+        dropdown.selected = [{"x": 1}, 1, [1], 1]
+        self.assertEqual(dropdown.selected_keys, ["A", "B", "L", "D"])
+        self.assertEqual(dropdown._invalid, [])
+
+        # select all and deselect all set the rendered options, then raise change
+        dropdown.items = ["A", "B", "C"]
+        for element in dropdown._elements.values():
+            element.selected = True
+        dropdown._update_chosen(None, None)
+        self.assertEqual(dropdown.selected, ["A", "B", "C"])
+        dropdown.items = ["B", "C", "D"]
+        self.assertEqual(dropdown.selected, ["B", "C"])
+        for element in dropdown._elements.values():
+            element.selected = False
+        dropdown._update_chosen(None, None)
+        self.assertEqual(dropdown.selected, [])
+        dropdown.selected = []
+        dropdown.items = []
+
+    def test_search(self):
+        self.assertEqual(_search_text("Deutsch"), "deutsch")
+        self.assertEqual(_search_text(("English", "en")), "english")
+        self.assertEqual(
+            _search_text({"key": "Option", "tokens": "Manhours", "subtext": "Pick me"}),
+            "option manhours pick me"
+        )
+        self.assertEqual(_search_text({"value": 1}), "  ")
+        texts = [_search_text(item) for item in ["Alpha", "Beta", "Alphabet"]]
+        self.assertEqual(_matching(texts, 3, "alpha"), [0, 2])
+        self.assertEqual(_matching(texts, 3, "gamma"), [])
+        self.assertEqual(_matching(None, 3, ""), [0, 1, 2])
+        self.assertFalse(_selectable("---"))
+        self.assertFalse(_selectable({"key": "Off", "enabled": False}))
+        self.assertTrue(_selectable(("On", 1)))
+
+    def test_window(self):
+        matches = list(range(0, 100, 2))
+        # the first matches and a hint for the rest
+        self.assertEqual(_window(matches, [], 3, 3), ([0, 2, 4], 47))
+        # scrolling extends the window
+        self.assertEqual(_window(matches, [], 6, 3), ([0, 2, 4, 6, 8, 10], 44))
+        # selected items stay rendered, but at most limit of them
+        self.assertEqual(_window(matches, [2, 7, 9, 11], 2, 2), ([0, 2, 7, 9], 48))
+        self.assertEqual(_window(matches[:2], [], 5, 5), ([0, 2], 0))
+
+    def test_virtualized(self):
+        items = [f"Item {idx}" for idx in range(1000)]
+        self.custom_1.max_rendered_items = 50
+        self.custom_1.items = items
+        self.custom_1.selected = ["Item 999"]
+        self.assertEqual(len(self.custom_1._rendered), 51)
+        self.assertEqual(self.custom_1._remaining, 950)
+        self.assertEqual(self.custom_1.selected, ["Item 999"])
+        # select all applies to all the matches of the search
+        self.custom_1._query = "item 1"
+        self.custom_1._filtered = None
+        self.custom_1._select_all = True
+        self.custom_1._update_chosen(None, None)
+        self.assertEqual(len(self.custom_1.selected), 112)
+        self.custom_1._select_all = False
+        self.custom_1._update_chosen(None, None)
+        self.assertEqual(self.custom_1.selected, ["Item 999"])
+        self.custom_1._select_all = None
 
     def native_datepicker_1_change(self, value, **event_args):
         """This method is called Called when the value is modified."""
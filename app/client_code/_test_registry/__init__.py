@@ -0,0 +1,25 @@
+from ._anvil_designer import _test_registryTemplate
+from anvil import *
+import anvil.server
+
+from ..registries import RegistryIndex
+from .._test import TestCase
+
+
+class _test_registry(_test_registryTemplate, TestCase):
+    def __init__(self, **properties):
+        # Set Form properties and Data Bindings.
+        self.init_components(**properties)
+
+        # Accents are only removed on the server, so search without them here.
+        index = RegistryIndex({"AT": "Austria", "AU": "Australia", "US": "United States"})
+        self.assertEqual(index.codes_with_prefix("a"), ["AT", "AU"])
+        self.assertEqual(index.search("au"), [("AU", "Australia"), ("AT", "Austria")])
+        self.assertEqual(index.search("united st"), [("US", "United States")])
+
+        # Test the same stuff on the server
+        anvil.server.call('test_registry_index')
+        anvil.server.call('test_registry_search')
+        anvil.server.call('test_registry_format')
+        anvil.server.call('test_registry_descriptions')
+        anvil.server.call('test_registry_metadata')
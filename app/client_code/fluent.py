@@ -36,6 +36,9 @@ class Fluent:
 
     SUPPORTED_VALUE_TYPES = (date, datetime, time, int, float,)
 
+    OPTIONS_STORAGE_PREFIX = "fluent_anvil.options"
+    """Prefix of the browser's localStorage keys used when persisting options."""
+
     def _update_locale_class(self):
         new_value = f"{self._root}{self._index}"
         
@@ -50,6 +53,11 @@ class Fluent:
         import anvil.server
         self._update_locale_class()
 
+        # Names and options are only valid for the locale they were translated to.
+        locale = tuple(self._locale)
+        self._names = {k: v for k, v in self._names.items() if k[0] == locale}
+        self._options = {k: v for k, v in self._options.items() if k[0] == locale}
+
         if anvil.server.context.type == "server_module":
             return
         
@@ -102,6 +110,9 @@ class Fluent:
             "timeStyle": "medium"
         }
         self.number_options = None
+        self.persist_options = False
+        self._names = {}
+        self._options = {}
         self._reload()
 
     def configure(
@@ -111,7 +122,8 @@ class Fluent:
             root: str = None,
             index: str = None,
             datetime_options: dict = None,
-            number_options: dict = None
+            number_options: dict = None,
+            persist_options: bool = None
     ):
         """Configure the translation system.
 
@@ -143,6 +155,11 @@ class Fluent:
                 documentation of the Fluent.format() method for a (possibly incomplete) 
                 list of options or the documentation of JavaScript's Intl.NumberFormat
                 object (which is used internally) for a complete list of options.           
+            persist_options: If True, the dictionaries returned by the get_*_options()
+                methods are stored in the browser's localStorage, so that they do not 
+                have to be translated again on the next page load. They are refreshed 
+                when the subtag registry changes. This requires the registry's 
+                metadata asset (see LocalSubtagRegistry.export_json()).
         """
         if root is not None:
             self._root = root if root.endswith("/") else f"{root}/"
@@ -156,6 +173,8 @@ class Fluent:
             self.datetime_options = datetime_options
         if number_options is not None:
             self.number_options = number_options
+        if persist_options is not None:
+            self.persist_options = persist_options
         
         self._update_locale_class()
         self._reload()
@@ -462,6 +481,9 @@ class Fluent:
     def _get_display_name(self, code: list, typename: str, style: tuple):
         """ Translate the given code using JavaScript.
 
+        Translations are remembered per locale, type and style. Only codes that have 
+        not been translated before are sent to JavaScript, all of them at once.
+
         Args:
             codes: List of identifiers or single identifier string to translate.
             typename: The type ("language", "region", "currency") to translate.
@@ -469,20 +491,45 @@ class Fluent:
                 STYLE_DIALECT_LONG, STYLE_DIALECT_SHORT, STYLE_DIALECT_NARROW,
                 STYLE_STANDARD_LONG, STYLE_STANDARD_SHORT, STYLE_STANDARD_NARROW. 
         """            
-        from fluent_anvil.js import fluent_js
-        
-        select = lambda n, c: n if n and n.lower() != c.lower() else None
-        
         codes = [code] if isinstance(code, str) else code
+        memo = self._names.setdefault((tuple(self._locale), typename, tuple(style)), {})
+        missing = [cd for cd in dict.fromkeys(codes) if cd not in memo]
+        if missing:
+            memo.update(self._translate_display_names(missing, typename, style))
+        names = [memo[cd] for cd in codes]
+        return names[0] if isinstance(code, str) else names        
+
+    def _translate_display_names(self, codes: list, typename: str, style: tuple) -> dict:
+        """Translate the given codes using JavaScript. Returns a dict code -> name. 
+
+        The name is None if there is no translation or the code is invalid.
+        """
+        import anvil.server
+        select = lambda n, c: n if n and n.lower() != c.lower() else None
+
+        if anvil.server.context.type == "server_module":
+            # There is no Intl.DisplayNames on the server. Use the names compiled
+            # from the CLDR data instead.
+            from fluent_anvil.display_names import get_display_names
+            names = get_display_names(codes, self._locale, typename, *style)
+            return {cd: select(name, cd) for cd, name in zip(codes, names)}
+
+        from fluent_anvil.js import fluent_js
         try:
             names = fluent_js.get_display_name(codes, self._locale, typename, *style)
         except anvil.js.ExternalError as err:
-            if err.original_error.name.lower() == "rangeerror":
-                return None
-            raise err
+            if err.original_error.name.lower() != "rangeerror":
+                raise err
+            if len(codes) == 1:
+                return {codes[0]: None}
+            # Do not let a single invalid code spoil the whole batch. Translating
+            # the halves separately finds the invalid codes in a few calls.
+            middle = len(codes) // 2
+            names = self._translate_display_names(codes[:middle], typename, style)
+            names.update(self._translate_display_names(codes[middle:], typename, style))
+            return names
             
-        names = [select(name, code[i]) for i, name in enumerate(names)]
-        return names[0] if isinstance(code, str) else names        
+        return {cd: select(name, cd) for cd, name in zip(codes, names)}
 
     def _get_options(self, displaytype:str, typename: str, style = STYLE_DIALECT_LONG, translatable_only: bool = True) -> dict:
         """Return the options for the given display type, style, etc.
@@ -498,6 +545,57 @@ class Fluent:
                 translated. Set to False to return all options even if the name is
                 only available in English.
         """
+        key = (tuple(self._locale), typename, displaytype, tuple(style), translatable_only)
+        if key not in self._options:
+            options = self._load_options(key)
+            if options is None:
+                options = self._translate_options(displaytype, typename, style, translatable_only)
+                self._store_options(key, options)
+            self._options[key] = options
+        return {**self._options[key]}
+
+    def _options_storage_key(self, key: tuple) -> str:
+        from json import dumps
+        return f"{self.OPTIONS_STORAGE_PREFIX}:{dumps(key)}"
+
+    def _load_options(self, key: tuple):
+        """Return the options persisted in the browser or None."""
+        from json import loads
+        if not self.persist_options:
+            return None
+        try:
+            item = anvil.js.window.localStorage.getItem(self._options_storage_key(key))
+        except anvil.js.ExternalError:
+            return None  # Storage is not accessible, e.g., due to privacy settings.
+        if not item:
+            return None
+        data = loads(item)
+        version = self._options_version(key[1])
+        if version is None or data.get("version") != version:
+            return None
+        return data["options"]
+
+    def _store_options(self, key: tuple, options: dict):
+        from json import dumps
+        if not self.persist_options:
+            return
+        version = self._options_version(key[1])
+        if version is None:
+            return  # Without a version, stored options could never be invalidated.
+        data = {"version": version, "options": options}
+        try:
+            anvil.js.window.localStorage.setItem(self._options_storage_key(key), dumps(data))
+        except anvil.js.ExternalError:
+            pass  # Storage is full or not accessible. Keep the options in memory only.
+
+    def _options_version(self, typename: str) -> str:
+        """Return the content hash of the registry type the options are made of.
+
+        Only the small metadata asset is downloaded (once), not the type itself.
+        """
+        return LocalSubtagRegistry(True).get_content_hash(typename)
+
+    def _translate_options(self, displaytype: str, typename: str, style: tuple, translatable_only: bool) -> dict:
         registry = LocalSubtagRegistry(True).get_tags(typename)
         tags = list(registry.keys()) if isinstance(registry, dict) else registry
         transl = self._get_display_name(tags, displaytype, style)
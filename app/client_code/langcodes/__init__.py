@@ -12,6 +12,7 @@ on the functions in langcodes, scroll down and read the docstrings.
 Some of these functions, particularly those that work with the names of
 languages, require the `language_data` module to be installed.
 """
+from functools import lru_cache
 from operator import itemgetter
 import sys
 
@@ -77,6 +78,28 @@ class Language:
         {'language'},
     ]
 
+    # Instances are kept alive forever by the class level caches below, so they
+    # use slots instead of a per-instance __dict__ to reduce their memory footprint.
+    __slots__ = (
+        'language',
+        'extlangs',
+        'script',
+        'territory',
+        'variants',
+        'extensions',
+        'private',
+        '_simplified',
+        '_searchable',
+        '_broader',
+        '_assumed',
+        '_filled',
+        '_macrolanguage',
+        '_str_tag',
+        '_dict',
+        '_disp_separator',
+        '_disp_pattern',
+    )
+
     # Values cached at the class level
     _INSTANCES = {}
     _PARSE_CACHE = {}
@@ -260,8 +283,6 @@ class Language:
         >>> Language.get('sh-QU')
         Language.make(language='sr', script='Latn', territory='EU')
         """
-        from .data_dicts import LANGUAGE_REPLACEMENTS
-
         if isinstance(tag, Language):
             if not normalize:
                 # shortcut: we have the tag already
@@ -272,8 +293,18 @@ class Language:
             # way that we've already solved.
             tag = tag.to_tag()
 
-        if (tag, normalize) in Language._PARSE_CACHE:
-            return Language._PARSE_CACHE[tag, normalize]
+        # The tag may be replaced below, so remember what was asked for.
+        key = (tag, normalize)
+        if key in Language._PARSE_CACHE:
+            return Language._PARSE_CACHE[key]
+
+        from .snapshot import cached_language
+        result = cached_language(tag, normalize)
+        if result is not None:
+            Language._PARSE_CACHE[key] = result
+            return result
+
+        from .data_dicts import LANGUAGE_REPLACEMENTS
 
         data = {}
 
@@ -329,7 +360,7 @@ class Language:
                 data[typ] = value
 
         result = Language.make(**data)
-        Language._PARSE_CACHE[tag, normalize] = result
+        Language._PARSE_CACHE[key] = result
         return result
 
     def to_tag(self) -> str:
@@ -468,10 +499,10 @@ class Language:
         >>> Language.get('yue-Hant').prefer_macrolanguage()
         Language.make(language='yue', script='Hant')
         """
-        from .data_dicts import NORMALIZED_MACROLANGUAGES
-
         if self._macrolanguage is not None:
             return self._macrolanguage
+
+        from .data_dicts import NORMALIZED_MACROLANGUAGES
         language = self.language or 'und'
         if language in NORMALIZED_MACROLANGUAGES:
             self._macrolanguage = self.update_dict(
@@ -639,18 +670,19 @@ class Language:
         if self._filled is not None:
             return self._filled
 
-        for tag in self.broader_tags():
-            from .data_dicts import LIKELY_SUBTAGS
-            if tag in LIKELY_SUBTAGS:
-                result = Language.get(LIKELY_SUBTAGS[tag], normalize=False)
-                result = result.update(self)
-                self._filled = result
-                return result
-
-        raise RuntimeError(
-            "Couldn't fill in likely values. This represents a problem with "
-            "the LIKELY_SUBTAGS data."
+        language, script, territory = self.language, self.script, self.territory
+        if language and script and territory:
+            # Nothing left to fill in.
+            triple = (language, script, territory)
+        else:
+            # Walk through the broader tags in LIKELY_SUBTAGS on strings only; the
+            # results are cached per triple.
+            triple = _maximized_triple(language, script, territory)
+
+        self._filled = self.update_dict(
+            {'language': triple[0], 'script': triple[1], 'territory': triple[2]}
         )
+        return self._filled
 
     # Support an old, wordier name for the method
     fill_likely_values = maximize
@@ -677,34 +709,21 @@ class Language:
         if supported == self:
             return 0
 
+        from .language_distance import tuple_distance_cached
+        return tuple_distance_cached(self._match_triple(), supported._match_triple())
+
+    def _match_triple(self) -> tuple:
+        """
+        Get the maximized (language, script, territory) triple that is used to
+        compute language distances.
+        """
         # CLDR has realized that these matching rules are undermined when the
         # unspecified language 'und' gets maximized to 'en-Latn-US', so this case
         # is specifically not maximized:
         if self.language is None and self.script is None and self.territory is None:
-            desired_triple = ('und', 'Zzzz', 'ZZ')
-        else:
-            desired_complete = self.prefer_macrolanguage().maximize()
-            desired_triple = (
-                desired_complete.language,
-                desired_complete.script,
-                desired_complete.territory,
-            )
-
-        if (
-            supported.language is None
-            and supported.script is None
-            and supported.territory is None
-        ):
-            supported_triple = ('und', 'Zzzz', 'ZZ')
-        else:
-            supported_complete = supported.prefer_macrolanguage().maximize()
-            supported_triple = (
-                supported_complete.language,
-                supported_complete.script,
-                supported_complete.territory,
-            )
-        from .language_distance import tuple_distance_cached
-        return tuple_distance_cached(desired_triple, supported_triple)
+            return ('und', 'Zzzz', 'ZZ')
+        complete = self.prefer_macrolanguage().maximize()
+        return (complete.language, complete.script, complete.territory)
 
     def is_valid(self) -> bool:
         """
@@ -1472,6 +1491,66 @@ class Language:
         return self.to_tag()
 
 
+# Maximum number of (language, script, territory) combinations whose likely values
+# are cached by Language.maximize(), in addition to the Language instances
+MAXIMIZE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=MAXIMIZE_CACHE_SIZE)
+def _maximized_triple(language: str, script: str, territory: str) -> tuple:
+    from .data_dicts import LIKELY_SUBTAGS, NORMALIZED_MACROLANGUAGES
+
+    return _likely_triple(
+        language, script, territory, LIKELY_SUBTAGS, NORMALIZED_MACROLANGUAGES
+    )
+
+
+def _likely_triple(
+    language: str,
+    script: str,
+    territory: str,
+    likely_subtags: dict,
+    macrolanguages: dict,
+) -> tuple:
+    """
+    Fill in the likely values of a (language, script, territory) triple, any of
+    which may be None.
+
+    This walks through the same increasingly general tags as
+    `Language.broader_tags`, but works on strings instead of Language objects.
+    """
+    macro = macrolanguages.get(language, language) if language else None
+    for keep_language, keep_script, keep_territory in (
+        (True, True, True),
+        (True, False, True),
+        (True, True, False),
+        (True, False, False),
+        (False, True, False),
+        (False, False, False),
+    ):
+        for start_language in (language, macro):
+            subtags = [(start_language if keep_language else None) or 'und']
+            if keep_script and script:
+                subtags.append(script)
+            if keep_territory and territory:
+                subtags.append(territory)
+            tag = '-'.join(subtags)
+            if tag in likely_subtags:
+                likely_language, likely_script, likely_territory = (
+                    likely_subtags[tag].split('-')
+                )
+                return (
+                    language or likely_language,
+                    script or likely_script,
+                    territory or likely_territory,
+                )
+
+    raise RuntimeError(
+        "Couldn't fill in likely values. This represents a problem with "
+        "the LIKELY_SUBTAGS data."
+    )
+
+
 # Make the get(), find(), and find_name() functions available at the top level
 get = Language.get
 find = Language.find
@@ -1820,6 +1899,181 @@ def closest_match(
     return match_distances[0]
 
 
+def closest_match_many(
+    desired_languages,
+    supported_languages,
+    max_distance: int = 25,
+    executor=None,
+    chunksize: int = 1000,
+) -> list:
+    """
+    Like `closest_match`, but for many desired languages at once. Returns a list
+    of (language code, distance) tuples in the order of `desired_languages`.
+
+    This is meant for bulk jobs where the same desired languages appear over and
+    over again. Each distinct desired language is only standardized and
+    maximized once, and the supported languages are only parsed once.
+
+    >>> closest_match_many(['fr', 'en-AU', 'fr', 'ja'], ['de', 'en-GB', 'fr'])
+    [('fr', 0), ('en-GB', 3), ('fr', 0), ('und', 1000)]
+
+    >>> closest_match_many(['pt', 'af'], ['pt-BR', 'pt-PT', 'nl'])
+    [('pt-BR', 0), ('nl', 24)]
+
+    Very large inputs can be distributed across workers by passing an executor
+    from `concurrent.futures`, such as a ProcessPoolExecutor. The distinct
+    desired languages are sent to the executor in chunks of `chunksize` tags.
+    """
+    desired_languages = [str(desired) for desired in desired_languages]
+    unique = list(dict.fromkeys(desired_languages))
+    index = _supported_index(supported_languages)
+
+    if executor is None:
+        matches = _closest_matches_indexed(unique, index, max_distance)
+    else:
+        chunks = [
+            (unique[start:start + chunksize], index, max_distance)
+            for start in range(0, len(unique), chunksize)
+        ]
+        matches = []
+        for chunk_matches in executor.map(_closest_matches_chunk, chunks):
+            matches.extend(chunk_matches)
+
+    results = dict(zip(unique, matches))
+    return [results[desired] for desired in desired_languages]
+
+
+def _supported_index(supported_languages) -> tuple:
+    """
+    Prepare the supported languages for matching: a set for exact lookups and a
+    list of (language code, match triple) tuples in the given order.
+    """
+    supported_languages = [str(supported) for supported in supported_languages]
+    triples = [
+        (supported, Language.get(supported)._match_triple())
+        for supported in supported_languages
+    ]
+    return set(supported_languages), triples
+
+
+def _closest_matches_chunk(args: tuple) -> list:
+    return _closest_matches_indexed(*args)
+
+
+def _closest_matches_indexed(desired_languages, index, max_distance) -> list:
+    from .language_distance import tuple_distance_cached
+
+    supported_set, supported_triples = index
+    matches = []
+    for desired in desired_languages:
+        # The same shortcuts as in closest_match()
+        if desired in supported_set:
+            matches.append((desired, 0))
+            continue
+        desired = standardize_tag(desired)
+        if desired in supported_set:
+            matches.append((desired, 0))
+            continue
+
+        desired_triple = Language.get(desired)._match_triple()
+        best = ('und', 1000)
+        for supported, supported_triple in supported_triples:
+            distance = tuple_distance_cached(desired_triple, supported_triple)
+            # Strictly less, so that the first one wins in case of a tie.
+            if distance <= max_distance and distance < best[1]:
+                best = (supported, distance)
+        matches.append(best)
+    return matches
+
+
+# Added to the distance of a match per position of the desired language in
+# `ranked_matches` by default, so that the languages a user prefers rank first.
+DESIRED_POSITION_PENALTY = 5
+
+
+def ranked_matches(
+    desired_languages,
+    supported_languages,
+    k: int = 10,
+    max_distance: int = 25,
+    position_penalty: int = DESIRED_POSITION_PENALTY,
+) -> list:
+    """
+    Rank the supported languages by how well they match any of the
+    `desired_languages`, which are given in order of preference. Returns up to
+    `k` (language code, distance) tuples, best first. Each supported language
+    appears only once, with its best distance.
+
+    The preference order counts: Each position further down the list of
+    desired languages adds `position_penalty` (by default,
+    `DESIRED_POSITION_PENALTY`) to the distance used for ranking, so a close
+    match of a more preferred language beats an exact match of a less preferred
+    one. Ties are broken by the position of the desired
+    language, then by the position in `supported_languages`. As in
+    `closest_match`, an exact match of a desired language comes before its other
+    matches. Supported languages farther away than `max_distance` are left out.
+    The returned distances are the plain distances (see `tag_distance`).
+
+    >>> ranked_matches('pt', ['en', 'pt-PT', 'pt-BR'])
+    [('pt-BR', 0), ('pt-PT', 5)]
+
+    >>> ranked_matches('de-AT', ['en', 'de-CH', 'de'], max_distance=100)
+    [('de-CH', 4), ('de', 4), ('en', 84)]
+
+    >>> ranked_matches(['fr', 'en'], ['de', 'en', 'fr'], k=2)
+    [('fr', 0), ('en', 0)]
+
+    >>> ranked_matches(['de-AT', 'en'], ['en', 'de'])
+    [('de', 4), ('en', 0)]
+
+    A less preferred language comes first once its match is closer by more than
+    the penalty of its position:
+
+    >>> ranked_matches(['de-AT', 'en'], ['en', 'de'], position_penalty=2)
+    [('en', 0), ('de', 4)]
+
+    >>> ranked_matches(['en-AU', 'fr'], ['fr', 'en-GB'])
+    [('en-GB', 3), ('fr', 0)]
+
+    >>> ranked_matches(['en-AU', 'fr'], ['fr', 'en-GB'], position_penalty=0)
+    [('fr', 0), ('en-GB', 3)]
+
+    >>> ranked_matches('ja', ['en'])
+    []
+
+    Every pair of desired and supported language is only compared once, and only
+    the best `k` candidates are sorted, so this is much cheaper than calling
+    `closest_match` repeatedly to build a list of fallbacks.
+    """
+    from heapq import nsmallest
+    from .language_distance import tuple_distance_cached
+
+    if isinstance(desired_languages, (str, Language)):
+        desired_languages = [desired_languages]
+    supported_set, supported_triples = _supported_index(supported_languages)
+
+    best = {}
+    for position, desired in enumerate(dict.fromkeys(map(str, desired_languages))):
+        standardized = standardize_tag(desired)
+        # The same precedence of exact matches as in closest_match()
+        exact = desired if desired in supported_set else standardized
+        desired_triple = Language.get(standardized)._match_triple()
+        penalty = position * position_penalty
+        for order, (supported, supported_triple) in enumerate(supported_triples):
+            if supported == exact:
+                distance, order = 0, -1
+            else:
+                distance = tuple_distance_cached(desired_triple, supported_triple)
+                if distance > max_distance:
+                    continue
+            key = (distance + penalty, position, order, distance)
+            if supported not in best or key < best[supported]:
+                best[supported] = key
+
+    ranked = nsmallest(k, best.items(), key=itemgetter(1))
+    return [(supported, key[3]) for supported, key in ranked]
+
+
 def closest_supported_match(
     desired_language: str,
     supported_languages,
@@ -0,0 +1,170 @@
+"""
+Benchmarks for the language tag handling of langcodes. These are not part of the app;
+run them from the client_code directory, e.g.:
+
+    python -m langcodes.benchmark memory
+
+Without arguments, all benchmarks run.
+"""
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+import langcodes
+from langcodes import Language, snapshot, tag_parser
+from langcodes.data_dicts import LIKELY_SUBTAGS
+from langcodes.language_distance import _DISTANCE_CACHE
+
+# Tags as they appear in Accept-Language headers: mostly simple shapes, plus a few
+# that need the full parser (variants, extensions, extlangs, private use).
+PARSE_CORPUS = [
+    'en', 'en-US', 'en-GB', 'en-AU', 'en-CA', 'en-IN', 'de', 'de-DE', 'de-AT',
+    'de-CH', 'fr', 'fr-FR', 'fr-CA', 'fr-BE', 'es', 'es-ES', 'es-MX', 'es-419',
+    'it', 'it-IT', 'pt', 'pt-BR', 'pt-PT', 'nl', 'nl-NL', 'sv-SE', 'pl-PL',
+    'ru-RU', 'ja', 'ja-JP', 'ko-KR', 'zh', 'zh-CN', 'zh-TW', 'zh-Hans',
+    'zh-Hant-TW', 'yue-HK',
+    'de-CH-1996', 'en-US-u-ca-buddhist', 'zh-yue-HK', 'sl-rozaj-biske',
+    'x-private', 'en-x-twain', 'sr-Latn-RS-u-nu-latn',
+]
+
+# The first locale match of a new process: common Accept-Language tags against the
+# locales of the test app
+COLD_START_TAGS = ['fr-FR', 'es-ES', 'pt-BR', 'it-IT', 'nl-NL', 'ja-JP', 'zh-CN']
+COLD_START_AVAILABLE = ['de-DE', 'en-US', 'es-MX']
+COLD_START_SCRIPT = f"""
+import time
+start = time.perf_counter()
+from coldstart.langcodes import closest_match
+for tag in {COLD_START_TAGS!r}:
+    closest_match(tag, {COLD_START_AVAILABLE!r})
+print(time.perf_counter() - start)
+"""
+
+
+def _corpus() -> list:
+    """All tags in LIKELY_SUBTAGS (keys and values), without duplicates."""
+    tags = dict.fromkeys(LIKELY_SUBTAGS)
+    tags.update(dict.fromkeys(LIKELY_SUBTAGS.values()))
+    return list(tags)
+
+
+def _clear_caches():
+    Language._INSTANCES.clear()
+    Language._PARSE_CACHE.clear()
+    _DISTANCE_CACHE.clear()
+
+
+def bench_memory():
+    """Memory used by the Language objects of all tags in LIKELY_SUBTAGS, maximized."""
+    tags = _corpus()
+    _clear_caches()
+    tracemalloc.start()
+    for tag in tags:
+        Language.get(tag).maximize()
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    instances = list(Language._INSTANCES.values())
+    size = sum(
+        sys.getsizeof(lang) + (sys.getsizeof(lang.__dict__) if hasattr(lang, "__dict__") else 0)
+        for lang in instances
+    )
+    print(f"tags: {len(tags)}, Language instances: {len(instances)}")
+    print(f"per instance: {size / len(instances):.0f} bytes, all instances: {size / 1024:.0f} KiB")
+    print(f"traced allocations incl. caches: {traced / 1024:.0f} KiB")
+    _clear_caches()
+
+
+def bench_parse(number: int = 5000):
+    """Throughput of tag_parser.parse_tag() with and without the SIMPLE_TAG fast path."""
+    simple = sum(tag_parser.SIMPLE_TAG.fullmatch(tag.lower()) is not None for tag in PARSE_CORPUS)
+    print(f"tags: {len(PARSE_CORPUS)} ({simple} simple), {number} rounds")
+
+    def run():
+        for tag in PARSE_CORPUS:
+            tag_parser.parse_tag(tag)
+
+    fast = timeit.timeit(run, number=number)
+    fast_path = tag_parser.SIMPLE_TAG
+    tag_parser.SIMPLE_TAG = re.compile(r'(?!)(a)?(b)?(c)?')  # never matches
+    try:
+        full = timeit.timeit(run, number=number)
+    finally:
+        tag_parser.SIMPLE_TAG = fast_path
+    parses = len(PARSE_CORPUS) * number
+    print(f"with fast path: {parses / fast:,.0f} tags/s ({fast:.3f} s)")
+    print(f"full parser only: {parses / full:,.0f} tags/s ({full:.3f} s)")
+
+
+def bench_coldstart(runs: int = 5):
+    """
+    Time from importing langcodes to the end of the first locale matches in a new
+    process, with and without a warm-start snapshot of the default tags.
+    """
+    _clear_caches()
+    snapshot.load_snapshot(object())  # don't use any snapshot of the app
+    snapshot.warm_caches(None, COLD_START_AVAILABLE)
+    source = snapshot.dump_snapshot()
+    _clear_caches()
+
+    # Run with the search path of this process, but without client_code, whose
+    # locale module shadows the standard library one.
+    client_code = os.path.dirname(os.path.dirname(os.path.abspath(langcodes.__file__)))
+    path = [entry for entry in sys.path if entry and os.path.abspath(entry) != client_code]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path))
+
+    print(f"tags: {', '.join(COLD_START_TAGS)}, median of {runs} runs")
+    for with_snapshot in (False, True):
+        with tempfile.TemporaryDirectory() as directory:
+            package = os.path.join(directory, "coldstart")
+            shutil.copytree(
+                os.path.dirname(os.path.abspath(langcodes.__file__)),
+                os.path.join(package, "langcodes"),
+                ignore=shutil.ignore_patterns("__pycache__"),
+            )
+            open(os.path.join(package, "__init__.py"), "w").close()
+            if with_snapshot:
+                with open(os.path.join(package, "langcodes_snapshot.py"), "w") as file:
+                    file.write(source)
+
+            def run(*flags):
+                times = []
+                for _ in range(runs):
+                    output = subprocess.run(
+                        [sys.executable, *flags, "-c", COLD_START_SCRIPT],
+                        cwd=directory, env=env, check=True, capture_output=True, text=True,
+                    ).stdout
+                    times.append(float(output))
+                return sorted(times)[runs // 2]
+
+            without_pyc = run("-B")
+            run()  # writes the .pyc files
+            with_pyc = run()
+        label = "with snapshot" if with_snapshot else "without snapshot"
+        size = f" ({len(source) / 1024:.0f} KiB)" if with_snapshot else ""
+        print(f"{label}{size}: {without_pyc * 1000:.1f} ms without .pyc, "
+              f"{with_pyc * 1000:.1f} ms with .pyc")
+
+
+BENCHMARKS = {
+    "memory": bench_memory,
+    "parse": bench_parse,
+    "coldstart": bench_coldstart,
+}
+
+
+if __name__ == '__main__':
+    # argparse is not used, since the app's locale module shadows the standard library
+    # one that argparse needs when run from client_code.
+    names = sys.argv[1:] or list(BENCHMARKS)
+    unknown = sorted(set(names) - set(BENCHMARKS))
+    if unknown:
+        sys.exit(f"Unknown benchmarks: {', '.join(unknown)}. Choose from: {', '.join(BENCHMARKS)}")
+    for name in names:
+        print(f"== {name}")
+        BENCHMARKS[name]()
@@ -1,8 +1,13 @@
 import anvil.server
+import hashlib
 import json
+import os
+import pickle
+import time
 import xml.etree.ElementTree as ET
 from langcodes.util import data_filename
 from langcodes.registry_parser import parse_registry
+from langcodes.data_json import dump_tables
 
 
 def read_cldr_supplemental(dataname):
@@ -16,40 +21,31 @@ def read_cldr_supplemental(dataname):
     return data
 
 
-def read_iana_registry_suppress_scripts():
-    scripts = {}
-    for entry in parse_registry():
-        if entry['Type'] == 'language' and 'Suppress-Script' in entry:
-            scripts[entry['Subtag']] = entry['Suppress-Script']
-    return scripts
-
-
-def read_iana_registry_scripts():
+def read_iana_registry():
+    """
+    Read everything we need from the IANA registry in a single pass: the
+    suppressed scripts of languages, all scripts, macrolanguages and
+    replacements.
+    """
+    suppress_scripts = {}
     scripts = set()
-    for entry in parse_registry():
-        if entry['Type'] == 'script':
-            scripts.add(entry['Subtag'])
-    return scripts
-
-
-def read_iana_registry_macrolanguages():
     macros = {}
-    for entry in parse_registry():
-        if entry['Type'] == 'language' and 'Macrolanguage' in entry:
-            macros[entry['Subtag']] = entry['Macrolanguage']
-    return macros
-
-
-def read_iana_registry_replacements():
     replacements = {}
     for entry in parse_registry():
-        if entry['Type'] == 'language' and 'Preferred-Value' in entry:
-            # Replacements for language codes
-            replacements[entry['Subtag']] = entry['Preferred-Value']
+        if entry['Type'] == 'script':
+            scripts.add(entry['Subtag'])
+        if entry['Type'] == 'language':
+            if 'Suppress-Script' in entry:
+                suppress_scripts[entry['Subtag']] = entry['Suppress-Script']
+            if 'Macrolanguage' in entry:
+                macros[entry['Subtag']] = entry['Macrolanguage']
+            if 'Preferred-Value' in entry:
+                # Replacements for language codes
+                replacements[entry['Subtag']] = entry['Preferred-Value']
         elif 'Tag' in entry and 'Preferred-Value' in entry:
             # Replacements for entire tags
             replacements[entry['Tag'].lower()] = entry['Preferred-Value']
-    return replacements
+    return suppress_scripts, scripts, macros, replacements
 
 
 def write_python_dict(outfile, name, d):
@@ -137,15 +133,14 @@ def read_language_distances():
     return tag_distances
 
 
-def build_data():
-    lang_scripts = read_iana_registry_suppress_scripts()
-    all_scripts = read_iana_registry_scripts()
-    macrolanguages = read_iana_registry_macrolanguages()
-    iana_replacements = read_iana_registry_replacements()
-    language_distances = read_language_distances()
-
+def read_aliases(iana_replacements):
+    """
+    Combine the CLDR aliases with the replacements from the IANA registry.
+    Returns the replacements per alias type, the alpha3 codes, the
+    bibliographic alpha3 codes and the normalized macrolanguages.
+    """
+    iana_replacements = dict(iana_replacements)
     alias_data = read_cldr_supplemental('aliases')
-    likely_subtags = read_cldr_supplemental('likelySubtags')
     replacements = {}
 
     # Aliased codes can still have alpha3 codes, and there's no unified source
@@ -215,7 +210,98 @@ def build_data():
                     elif value['_reason'] == 'bibliographic':
                         alpha3_biblio[replacement] = code
 
-    validity_regex = read_validity_regex()
+    return replacements, alpha3_mapping, alpha3_biblio, norm_macrolanguages
+
+
+BUILD_CACHE_DIR = '.build_cache'
+
+CLDR_SUPPLEMENTAL = 'cldr-json/cldr-json/cldr-core/supplemental'
+
+# The langcodes modules that the stages run, besides this script
+BUILD_MODULES = ['registry_parser.py']
+
+
+def _hash_inputs(filenames):
+    """
+    Hash the given input files together with this script and BUILD_MODULES, so
+    that a stage is also rebuilt when the code that builds it changes.
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    code = [__file__] + [os.path.join(directory, name) for name in BUILD_MODULES]
+    digest = hashlib.sha256()
+    for filename in code + list(filenames):
+        digest.update(filename.encode('utf-8'))
+        with open(filename, 'rb') as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def run_stage(name, inputs, build, cache_dir=BUILD_CACHE_DIR):
+    """
+    Return the result of `build()`, reusing the result of a previous run if
+    none of the `inputs` (file names) changed. Prints how long the stage took.
+    """
+    start = time.perf_counter()
+    key = _hash_inputs(inputs)
+    cache_file = None if cache_dir is None else os.path.join(cache_dir, f'{name}.pickle')
+    if cache_file is not None and os.path.exists(cache_file):
+        with open(cache_file, 'rb') as file:
+            cached_key, result = pickle.load(file)
+        if cached_key == key:
+            print(f'{name}: cached ({time.perf_counter() - start:.2f}s)')
+            return result
+
+    result = build()
+    if cache_file is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_file, 'wb') as file:
+            pickle.dump((key, result), file)
+    print(f'{name}: built ({time.perf_counter() - start:.2f}s)')
+    return result
+
+
+def build_data(cache_dir=BUILD_CACHE_DIR, json_file=False):
+    """
+    Write data_dicts.py. Each table is only rebuilt if the data files it is
+    built from changed since the last run (see `run_stage`).
+
+    If `json_file` is true, the tables are also written to data_dicts.json,
+    which can be loaded instead of data_dicts.py (see `langcodes.data_json`).
+    """
+    registry_file = data_filename('language-subtag-registry.txt')
+    aliases_file = data_filename(f'{CLDR_SUPPLEMENTAL}/aliases.json')
+    likely_file = data_filename(f'{CLDR_SUPPLEMENTAL}/likelySubtags.json')
+
+    lang_scripts, all_scripts, macrolanguages, iana_replacements = run_stage(
+        'iana_registry', [registry_file], read_iana_registry, cache_dir
+    )
+    language_distances = run_stage(
+        'language_distances',
+        [data_filename('cldr/common/supplemental/languageInfo.xml')],
+        read_language_distances,
+        cache_dir,
+    )
+    replacements, alpha3_mapping, alpha3_biblio, norm_macrolanguages = run_stage(
+        'aliases',
+        [aliases_file, registry_file],
+        lambda: read_aliases(iana_replacements),
+        cache_dir,
+    )
+    likely_subtags = run_stage(
+        'likely_subtags',
+        [likely_file],
+        lambda: read_cldr_supplemental('likelySubtags'),
+        cache_dir,
+    )
+    validity_regex = run_stage(
+        'validity',
+        [
+            data_filename(f'cldr/common/validity/{codetype}.xml')
+            for codetype in ('language', 'region', 'script', 'variant')
+        ],
+        read_validity_regex,
+        cache_dir,
+    )
 
     # Write the contents of data_dicts.py.
     with open('data_dicts.py', 'w', encoding='utf-8') as outfile:
@@ -238,6 +324,36 @@ def build_data():
         write_python_dict(outfile, 'LANGUAGE_DISTANCES', language_distances)
         print(f"VALIDITY = re.compile({validity_regex!r})", file=outfile)
 
+    if json_file:
+        tables = {
+            'DEFAULT_SCRIPTS': lang_scripts,
+            'LANGUAGE_REPLACEMENTS': replacements['languageAlias'],
+            'LANGUAGE_ALPHA3': alpha3_mapping,
+            'LANGUAGE_ALPHA3_BIBLIOGRAPHIC': alpha3_biblio,
+            'SCRIPT_REPLACEMENTS': replacements['scriptAlias'],
+            'ALL_SCRIPTS': all_scripts,
+            'TERRITORY_REPLACEMENTS': replacements['territoryAlias'],
+            'MACROLANGUAGES': macrolanguages,
+            'NORMALIZED_MACROLANGUAGES': norm_macrolanguages,
+            'LIKELY_SUBTAGS': likely_subtags,
+            'LANGUAGE_DISTANCES': language_distances,
+            'VALIDITY': validity_regex,
+        }
+        with open('data_dicts.json', 'w', encoding='utf-8') as outfile:
+            outfile.write(dump_tables(tables))
+
 
 if __name__ == '__main__':
-    build_data()
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Build data_dicts.py.')
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help='rebuild all tables, even if their inputs did not change',
+    )
+    parser.add_argument(
+        '--json', action='store_true',
+        help='also write the tables to data_dicts.json (see langcodes.data_json)',
+    )
+    args = parser.parse_args()
+    build_data(cache_dir=None if args.no_cache else BUILD_CACHE_DIR, json_file=args.json)
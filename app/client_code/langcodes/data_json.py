@@ -0,0 +1,92 @@
+import anvil.server
+"""
+The data tables of langcodes as JSON.
+
+data_dicts.py is a large Python module. Without a cached .pyc file (e.g., in new
+server processes or in the browser), compiling it takes much longer than parsing
+the same tables from JSON. build_data.py can write them to data_dicts.json, too
+(option --json), and this module loads that file in place of data_dicts.py:
+
+    from langcodes.data_json import install_tables, load_tables
+    install_tables(load_tables(text))
+
+`install_tables` has to be called before the tables are used for the first time,
+e.g., right after the file has been read or downloaded.
+"""
+import json
+import re
+import sys
+from types import ModuleType
+
+# The tables of data_dicts.py, in the order they are written. Sets are stored as
+# sorted lists and regular expressions as their pattern.
+TABLES = (
+    "DEFAULT_SCRIPTS",
+    "LANGUAGE_REPLACEMENTS",
+    "LANGUAGE_ALPHA3",
+    "LANGUAGE_ALPHA3_BIBLIOGRAPHIC",
+    "SCRIPT_REPLACEMENTS",
+    "ALL_SCRIPTS",
+    "TERRITORY_REPLACEMENTS",
+    "MACROLANGUAGES",
+    "NORMALIZED_MACROLANGUAGES",
+    "LIKELY_SUBTAGS",
+    "LANGUAGE_DISTANCES",
+    "VALIDITY",
+)
+SETS = ("ALL_SCRIPTS",)
+PATTERNS = ("VALIDITY",)
+
+DATA_MODULE = f"{__package__}.data_dicts"
+
+
+def dump_tables(tables: dict) -> str:
+    """
+    Return the given tables (e.g., the content of data_dicts.py) as JSON.
+    """
+    data = {}
+    for name in TABLES:
+        value = tables[name]
+        if name in SETS:
+            value = sorted(set(value))
+        elif name in PATTERNS and not isinstance(value, str):
+            value = value.pattern
+        data[name] = value
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+
+
+def load_tables(text) -> dict:
+    """
+    Parse tables written by `dump_tables`. Raises ValueError if any is missing.
+
+    Args:
+        text: The JSON document as str or UTF-8 encoded bytes.
+    """
+    if isinstance(text, bytes):
+        text = text.decode("utf-8")
+    tables = json.loads(text)
+    missing = [name for name in TABLES if name not in tables]
+    if missing:
+        raise ValueError(f"Missing data tables: {', '.join(missing)}")
+    for name in SETS:
+        tables[name] = set(tables[name])
+    for name in PATTERNS:
+        tables[name] = re.compile(tables[name])
+    return tables
+
+
+def install_tables(tables: dict) -> bool:
+    """
+    Use the given tables instead of importing data_dicts.py.
+
+    Returns: True if the tables were installed. False if data_dicts.py has been
+        imported already, so that tables from different sources are never mixed.
+    """
+    if DATA_MODULE in sys.modules:
+        return False
+    module = ModuleType(DATA_MODULE)
+    for name in TABLES:
+        setattr(module, name, tables[name])
+    sys.modules[DATA_MODULE] = module
+    setattr(sys.modules[__package__], "data_dicts", module)
+    return True
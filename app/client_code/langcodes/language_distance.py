@@ -1,11 +1,24 @@
 import anvil.server
-from .data_dicts import LANGUAGE_DISTANCES
-
 
+# The distance data is only imported once a distance has to be computed, so that
+# cached distances (e.g., from a warm-start snapshot) don't need it.
 _DISTANCE_CACHE = {}
-DEFAULT_LANGUAGE_DISTANCE = LANGUAGE_DISTANCES["*"]["*"]
-DEFAULT_SCRIPT_DISTANCE = LANGUAGE_DISTANCES["*_*"]["*_*"]
 DEFAULT_TERRITORY_DISTANCE = 4
+_DEFAULT_DISTANCE_KEYS = {
+    "DEFAULT_LANGUAGE_DISTANCE": "*",
+    "DEFAULT_SCRIPT_DISTANCE": "*_*",
+}
+
+
+def __getattr__(name):
+    # DEFAULT_LANGUAGE_DISTANCE and DEFAULT_SCRIPT_DISTANCE are taken from the
+    # distance data, which is only imported when they are accessed.
+    if name not in _DEFAULT_DISTANCE_KEYS:
+        raise AttributeError(name)
+    from .data_dicts import LANGUAGE_DISTANCES
+
+    key = _DEFAULT_DISTANCE_KEYS[name]
+    return LANGUAGE_DISTANCES[key][key]
 
 
 # Territory clusters used in territory matching:
@@ -107,7 +120,10 @@ def tuple_distance_cached(desired, supported) -> int:
     if (desired, supported) in _DISTANCE_CACHE:
         return _DISTANCE_CACHE[desired, supported]
     else:
-        result = _tuple_distance(desired, supported)
+        from .snapshot import cached_distance
+        result = cached_distance(desired, supported)
+        if result is None:
+            result = _tuple_distance(desired, supported)
         _DISTANCE_CACHE[desired, supported] = result
         return result
 
@@ -117,6 +133,8 @@ def _get2(dictionary: dict, key1: str, key2: str, default):
 
 
 def _tuple_distance(desired, supported) -> int:
+    from .data_dicts import LANGUAGE_DISTANCES
+
     desired_language, desired_script, desired_territory = desired
     supported_language, supported_script, supported_territory = supported
     distance = 0
@@ -126,7 +144,7 @@ def _tuple_distance(desired, supported) -> int:
             LANGUAGE_DISTANCES,
             desired_language,
             supported_language,
-            DEFAULT_LANGUAGE_DISTANCE,
+            LANGUAGE_DISTANCES["*"]["*"],
         )
 
     desired_script_pair = f"{desired_language}_{desired_script}"
@@ -142,7 +160,7 @@ def _tuple_distance(desired, supported) -> int:
             LANGUAGE_DISTANCES,
             desired_script_pair,
             supported_script_pair,
-            DEFAULT_SCRIPT_DISTANCE,
+            LANGUAGE_DISTANCES["*_*"]["*_*"],
         )
 
     if desired_territory != supported_territory:
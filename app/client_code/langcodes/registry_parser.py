@@ -1,50 +1,68 @@
 import anvil.server
-from langcodes.util import data_filename
+"""
+Streaming parser for the IANA language subtag registry.
+
+The registry is parsed by the data builder of langcodes and by the subtag registry
+of fluent_anvil (see registries.IANASubtagRegistry). Both use this parser, so that
+the file is read once by each of them and parsed the same way.
+"""
 
 LIST_KEYS = {'Description', 'Prefix'}
 
 
-def parse_file(file):
+def parse_lines(lines):
     """
-    Take an open file containing the IANA subtag registry, and yield a
-    dictionary of information for each subtag it describes.
+    Take an iterable of the lines of the IANA subtag registry, and yield a
+    dictionary of information for each record, starting with the header record
+    that contains the 'File-Date'.
+
+    The lines are consumed lazily, so a consumer that stops early (e.g. because
+    the 'File-Date' shows that the registry did not change) does not read the
+    rest of the file.
     """
-    lines = []
-    for line in file:
-        line = line.rstrip('\n')
+    lines_of_item = []
+    for line in lines:
+        line = line.rstrip('\r\n')
         if line == '%%':
             # This is a separator between items. Parse the data we've
             # collected and yield the result.
-            yield from parse_item(lines)
-            lines.clear()
-        elif line.startswith('  '):
+            yield parse_item(lines_of_item)
+            lines_of_item.clear()
+        elif line.startswith(' ') or line.startswith('\t'):
             # This is a continuation line. Concatenate it to the previous
-            # line, including one of the spaces.
-            lines[-1] += line[1:]
-        else:
-            lines.append(line)
-    yield from parse_item(lines)
+            # line, separated by a single space.
+            lines_of_item[-1] += ' ' + line.strip()
+        elif line:
+            lines_of_item.append(line)
+    if lines_of_item:
+        yield parse_item(lines_of_item)
+
+
+def parse_file(file):
+    """
+    Take an open file containing the IANA subtag registry, and yield a
+    dictionary of information for each subtag it describes.
+    """
+    for info in parse_lines(file):
+        if 'Subtag' in info or 'Tag' in info:
+            yield info
 
 
 def parse_item(lines):
     """
     Given the lines that form a subtag entry (after joining wrapped lines
-    back together), parse the data they contain.
-
-    Returns a generator that yields once if there was any data there
-    (and an empty generator if this was just the header).
+    back together), parse the data they contain into a dictionary.
     """
     info = {}
     for line in lines:
-        key, value = line.split(': ', 1)
+        key, value = line.split(':', 1)
+        key, value = key.strip(), value.strip()
         if key in LIST_KEYS:
             info.setdefault(key, []).append(value)
         else:
             assert key not in info
             info[key] = value
-
-    if 'Subtag' in info or 'Tag' in info:
-        yield info
+    return info
 
 
 def parse_registry():
@@ -52,6 +70,7 @@ def parse_registry():
     Yield a sequence of dictionaries, containing the info in the included
     IANA subtag registry file.
     """
+    from langcodes.util import data_filename
     with open(
         data_filename('language-subtag-registry.txt'), encoding='utf-8'
     ) as data_file:
@@ -0,0 +1,267 @@
+import anvil.server
+"""
+Warm-start snapshots of the langcodes caches.
+
+Parsing, maximizing and comparing language tags is cached at the class and module
+level, but these caches start out empty in every new process. Server modules often
+run in fresh processes, so the first locale match has to import the data tables
+and fill the caches from scratch.
+
+A snapshot stores the warmed caches for a known set of tags as a compact blob:
+compressed JSON in the single string constant of a generated Python module. If a
+module called `langcodes_snapshot` is part of the app (e.g., in the server code,
+so that it is not sent to the browser), it is imported and decoded on the first
+cache miss. Its entries are only turned into Language objects when they are
+looked up. Lookups of the tags it contains then neither need to parse anything
+nor import the data tables.
+
+A snapshot is created like this::
+
+    warm_caches(requested_tags, available_tags)
+    source = dump_snapshot()
+
+Without requested tags, `warm_caches` covers all tags of the likely-subtag data
+and the tags that are common in Accept-Language headers (`ACCEPT_LANGUAGE_TAGS`).
+
+A snapshot records a hash of the data tables and the langcodes code it was built
+from (see `source_hash`). It is ignored once any of them changes, e.g., after
+data_dicts.py has been rebuilt, so that it never overrides newer results. Create
+a new snapshot in that case.
+"""
+from . import Language, closest_match, standardize_tag
+from .language_distance import _DISTANCE_CACHE
+
+GENERATED_HEADER = "# This file is generated by langcodes.snapshot.dump_snapshot()."
+
+# The files whose content determines the cached results
+SOURCE_FILES = (
+    "data_dicts.py",
+    "__init__.py",
+    "tag_parser.py",
+    "language_distance.py",
+    "snapshot.py",
+)
+
+# Tags as they commonly appear in Accept-Language headers
+ACCEPT_LANGUAGE_TAGS = (
+    'en', 'en-US', 'en-GB', 'en-AU', 'en-CA', 'en-IN', 'en-IE', 'en-NZ', 'en-ZA',
+    'de', 'de-DE', 'de-AT', 'de-CH', 'fr', 'fr-FR', 'fr-CA', 'fr-BE', 'fr-CH',
+    'es', 'es-ES', 'es-MX', 'es-AR', 'es-CO', 'es-US', 'es-419', 'it', 'it-IT',
+    'it-CH', 'pt', 'pt-BR', 'pt-PT', 'nl', 'nl-NL', 'nl-BE', 'da-DK', 'sv-SE',
+    'nb-NO', 'no', 'fi-FI', 'is-IS', 'pl-PL', 'cs-CZ', 'sk-SK', 'hu-HU', 'ro-RO',
+    'bg-BG', 'hr-HR', 'sr-RS', 'sr-Latn-RS', 'sl-SI', 'el-GR', 'tr-TR', 'ru-RU',
+    'uk-UA', 'et-EE', 'lv-LV', 'lt-LT', 'ar', 'ar-SA', 'ar-EG', 'he-IL', 'fa-IR',
+    'hi-IN', 'bn-BD', 'th-TH', 'vi-VN', 'id-ID', 'ms-MY', 'fil-PH', 'ja', 'ja-JP',
+    'ko', 'ko-KR', 'zh', 'zh-CN', 'zh-TW', 'zh-HK', 'zh-SG', 'zh-Hans',
+    'zh-Hans-CN', 'zh-Hant', 'zh-Hant-TW', 'zh-Hant-HK', 'yue-HK',
+)
+
+# The decoded snapshot: None before the first lookup, False if there is none
+_SNAPSHOT = None
+
+
+def source_hash() -> str:
+    """
+    Return a hash of the data tables and the code the cached results depend on,
+    or None if the source files can't be read.
+    """
+    import os
+    from hashlib import sha256
+
+    directory = os.path.dirname(os.path.abspath(__file__))
+    digest = sha256()
+    try:
+        for name in SOURCE_FILES:
+            with open(os.path.join(directory, name), "rb") as file:
+                digest.update(file.read())
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def default_tags() -> list:
+    """
+    Return the tags that snapshots cover by default: all tags of the likely-subtag
+    data (keys and values) and `ACCEPT_LANGUAGE_TAGS`, without duplicates.
+    """
+    from .data_dicts import LIKELY_SUBTAGS
+
+    tags = dict.fromkeys(ACCEPT_LANGUAGE_TAGS)
+    tags.update(dict.fromkeys(LIKELY_SUBTAGS))
+    tags.update(dict.fromkeys(LIKELY_SUBTAGS.values()))
+    return list(tags)
+
+
+def warm_caches(requested: list = None, available: list = ()):
+    """
+    Fill the caches with everything needed to parse and maximize each of the
+    requested tags and to match it against the available tags, as done by
+    `closest_match`.
+
+    Args:
+        requested: Language tags that users are expected to ask for. Defaults to
+            `default_tags()`.
+        available: Language tags that the app supports.
+    """
+    if requested is None:
+        requested = default_tags()
+    available = list(available)
+    for tag in list(requested) + available:
+        standardize_tag(tag)
+        Language.get(tag).prefer_macrolanguage().maximize()
+    if available:
+        for tag in requested:
+            closest_match(tag, available, max_distance=1000)
+
+
+def dump_snapshot() -> str:
+    """
+    Return the source code of a Python module that contains the current content
+    of the caches as a compact blob.
+    """
+    import json
+    import zlib
+    from base64 import b64encode
+
+    instances = list(Language._INSTANCES.values())
+    index = {id(instance): i for i, instance in enumerate(instances)}
+
+    def ref(instance):
+        return None if instance is None else index.get(id(instance))
+
+    def entry(instance):
+        # Rarely used fields come last, so that trailing Nones can be left out.
+        values = [
+            instance.language,
+            instance.script,
+            instance.territory,
+            ref(instance._simplified),
+            ref(instance._macrolanguage),
+            ref(instance._filled),
+            instance.extlangs,
+            instance.variants,
+            instance.extensions,
+            instance.private,
+        ]
+        while values and values[-1] is None:
+            values.pop()
+        return values
+
+    data = {
+        "instances": [entry(instance) for instance in instances],
+        # Parse cache entries, split by the `normalize` argument
+        "normalized": {},
+        "verbatim": {},
+        "distances": {
+            _distance_key(desired, supported): distance
+            for (desired, supported), distance in sorted(_DISTANCE_CACHE.items())
+        },
+    }
+    for (tag, normalize), instance in sorted(Language._PARSE_CACHE.items()):
+        data["normalized" if normalize else "verbatim"][tag] = index[id(instance)]
+
+    blob = zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"), 9)
+    return "\n".join([
+        GENERATED_HEADER,
+        f"SOURCE_HASH = {source_hash()!r}",
+        f"DATA = {b64encode(blob).decode('ascii')!r}",
+    ]) + "\n"
+
+
+def load_snapshot(snapshot=None) -> bool:
+    """
+    Use a snapshot for the following cache misses. Entries that are already cached
+    are kept. Cache misses load the app's snapshot automatically, so this is only
+    needed to use another one.
+
+    Args:
+        snapshot: The snapshot module (or any object with the same attributes). If
+            not given, the app's `langcodes_snapshot` module is used, if there is one.
+
+    Returns: True if a snapshot was loaded. False, otherwise, including snapshots
+        built from other data tables or code (see `source_hash`).
+    """
+    global _SNAPSHOT
+    _SNAPSHOT = False
+    if snapshot is None:
+        try:
+            from .. import langcodes_snapshot as snapshot
+        except ImportError:
+            return False
+
+    expected = getattr(snapshot, "SOURCE_HASH", None)
+    if expected is None or expected != source_hash():
+        return False
+
+    import json
+    import zlib
+    from base64 import b64decode
+
+    data = json.loads(zlib.decompress(b64decode(snapshot.DATA)).decode("utf-8"))
+    data["languages"] = [None] * len(data["instances"])
+    _SNAPSHOT = data
+    return True
+
+
+def _snapshot():
+    if _SNAPSHOT is None:
+        load_snapshot()
+    return _SNAPSHOT
+
+
+def _distance_key(desired: tuple, supported: tuple) -> str:
+    return " ".join(str(subtag) for subtag in desired + supported)
+
+
+def _language(data: dict, position: int) -> Language:
+    """Create the Language object of an instance entry and the ones it links to."""
+    language = data["languages"][position]
+    if language is not None:
+        return language
+
+    entry = data["instances"][position]
+    entry = entry + [None] * (10 - len(entry))
+    language, script, territory, simplified, macrolanguage, filled = entry[:6]
+    extlangs, variants, extensions, private = entry[6:]
+    language = Language.make(
+        language=language,
+        extlangs=extlangs,
+        script=script,
+        territory=territory,
+        variants=variants,
+        extensions=extensions,
+        private=private,
+    )
+    data["languages"][position] = language
+    if simplified is not None and language._simplified is None:
+        language._simplified = _language(data, simplified)
+    if macrolanguage is not None and language._macrolanguage is None:
+        language._macrolanguage = _language(data, macrolanguage)
+    if filled is not None and language._filled is None:
+        language._filled = _language(data, filled)
+    return language
+
+
+def cached_language(tag: str, normalize: bool) -> Language:
+    """
+    Return the Language object that the snapshot holds for `Language.get(tag,
+    normalize)`, or None if it doesn't hold one.
+    """
+    data = _snapshot()
+    if not data:
+        return None
+    position = data["normalized" if normalize else "verbatim"].get(tag)
+    if position is None:
+        return None
+    return _language(data, position)
+
+
+def cached_distance(desired: tuple, supported: tuple) -> int:
+    """
+    Return the distance that the snapshot holds for the given (language, script,
+    territory) triples, or None if it doesn't hold one.
+    """
+    data = _snapshot()
+    if not data:
+        return None
+    return data["distances"].get(_distance_key(desired, supported))
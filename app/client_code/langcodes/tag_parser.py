@@ -97,6 +97,15 @@ Traceback (most recent call last):
 langcodes.tag_parser.LanguageTagError: Language tags must be made of ASCII characters
 """
 
+import re
+
+# The shapes that almost all language tags in the wild have, after
+# normalize_characters(): a language code of 2 or 3 letters, optionally followed
+# by a script and a territory, e.g. 'en', 'en-us', 'zh-hant', 'zh-hant-tw' or
+# 'yue-hk'. These are parsed in one step, everything else goes through
+# parse_subtags().
+SIMPLE_TAG = re.compile(r'([a-z]{2,3})(?:-([a-z]{4}))?(?:-([a-z]{2}|[0-9]{3}))?')
+
 # These tags should not be parsed by the usual parser; they're grandfathered
 # in from RFC 3066. The 'irregular' ones don't fit the syntax at all; the
 # 'regular' ones do, but would give meaningless results when parsed.
@@ -186,6 +195,16 @@ def parse_tag(tag):
     if tag in EXCEPTIONS:
         return [('grandfathered', tag)]
     else:
+        simple = SIMPLE_TAG.fullmatch(tag)
+        if simple is not None:
+            language, script, territory = simple.groups()
+            parsed = [('language', language)]
+            if script:
+                parsed.append(('script', script.title()))
+            if territory:
+                parsed.append(('territory', territory.upper()))
+            return parsed
+
         # The first subtag is always either the language code, or 'x' to mark
         # the entire tag as private-use. Other subtags are distinguished
         # by their length and format, but the language code is distinguished
@@ -1,5 +1,21 @@
+import re
+from functools import lru_cache
 from anvil.http import HttpError
 
+ACCEPT_LANGUAGE_CACHE_SIZE = 1024
+"""Maximum number of distinct Accept-Language headers to keep negotiation results for."""
+
+QVALUE = re.compile(r"0(\.[0-9]{0,3})?|1(\.0{0,3})?")
+"""The syntax of quality values in Accept-Language headers (RFC 9110, section 12.4.2)."""
+
+FALLBACK_CHAIN_CACHE_SIZE = 1024
+"""Maximum number of computed fallback chains to keep.
+
+The requested locales may come from clients (e.g., Accept-Language headers), so 
+the cache must not grow without limit.
+"""
+
+
 class Locale(list):
     """Models a locale and its fallbacks.
     
@@ -22,6 +38,20 @@ class Locale(list):
     max_distance = 100
     """Maximum matching distance between requested locale and available locales."""
 
+    fallbacks_file = None
+    """The name of the file with precomputed fallback chains next to the index.lst file.
+
+    The file is optional and only requested if a name is set, e.g. "fallbacks.json".
+    It can be created using Locale.build_fallback_chains().
+    """
+
+    _INDEX_CACHE = {}
+    _CHAINS = {}
+    """Precomputed fallback chains per (available locales, max_distance)."""
+
+    _FALLBACK_URLS = set()
+    """URLs of fallback files that have been requested, whether they exist or not."""
+
     def __init__(self, locale: str = None):
         if not locale:
             super().__init__([])
@@ -60,10 +90,9 @@ class Locale(list):
                 default fallback locale will be used.
             count: The maximum number of fallback locales to use.
         """
-        from fluent_anvil.registries import LocaleIndex
         fallback = fallback or cls.fallback
         try:
-            index = cls.clean(LocaleIndex(cls.index_url))
+            index = cls.index()
         except HttpError:
             return cls(fallback)
 
@@ -87,16 +116,201 @@ class Locale(list):
         obj._requested = requested
         return obj
 
+    @classmethod
+    def from_accept_language(
+        cls, header: str, available: list = None, fallback: str = None, count: int = 10
+    ):
+        """Select the best matching available locales for an Accept-Language header.
+
+        This is meant for HTTP endpoints, which receive the user's preferences as raw
+        header value, e.g. "de-AT, de;q=0.9, en;q=0.5". The requested locales are 
+        ordered by their quality value and normalized before matching. Results are 
+        cached by the raw header string, because most traffic is made up of a small 
+        number of distinct headers.
+
+        Args:
+            header: The raw value of the Accept-Language header.
+            available: A list of locales that the application supports. If not given,
+                the default index.lst file will be used.
+            fallback: The locale to return if no sensible match is found. If not given, 
+                the default fallback locale will be used.
+            count: The maximum number of fallback locales to use.
+        """
+        available = cls.index() if available is None else available
+        available = cls.clean([available] if isinstance(available, str) else available)
+        fallback = cls.clean(fallback or cls.fallback)
+        locales, requested = _negotiate_accept_language(
+            cls, header or "", tuple(available), fallback, count, cls.max_distance
+        )
+        obj = cls(list(locales))
+        obj._requested = list(requested)
+        return obj
+
+    @classmethod
+    def parse_accept_language(cls, header: str) -> list:
+        """Return the locales of an Accept-Language header in order of preference.
+
+        Entries are sorted by their quality value. Entries with equal quality keep 
+        the order of the header. Wildcards, entries with a quality value of zero or 
+        an invalid one (anything but 0 to 1 with up to three decimals, see RFC 9110) 
+        and tags that cannot be parsed are skipped. The remaining tags are standardized, 
+        e.g., "en-latn-us" becomes "en-US".
+
+        Args:
+            header: The raw value of the Accept-Language header.
+        """
+        from .langcodes import standardize_tag
+        from .langcodes.tag_parser import LanguageTagError
+
+        weighted = []
+        for position, entry in enumerate((header or "").split(",")):
+            tag, _, params = entry.partition(";")
+            tag = tag.strip()
+            if not tag or tag == "*":
+                continue
+            quality = 1.0
+            for param in params.split(";"):
+                key, _, value = param.partition("=")
+                if key.strip().lower() == "q":
+                    value = value.strip()
+                    quality = float(value) if QVALUE.fullmatch(value) else 0.0
+            if quality <= 0:
+                continue
+            try:
+                tag = standardize_tag(cls.clean(tag))
+            except LanguageTagError:
+                continue
+            weighted.append((-quality, position, tag))
+
+        weighted.sort()
+        requested = []
+        for _, _, tag in weighted:
+            if tag not in requested:
+                requested.append(tag)
+        return requested
+
+    @classmethod
+    def index(cls, index_url: str = None) -> list:
+        """Return the available locales listed in the given index.lst file.
+
+        The file is downloaded only once per URL, because the available locales only
+        change when the application is deployed. Relative URLs are resolved against 
+        the app's origin when running on the server.
+
+        Args:
+            index_url: The URL to the index.lst file. If not given, the default 
+                index.lst file will be used.
+        """
+        from fluent_anvil.registries import LocaleIndex
+        import anvil.server
+        index_url = index_url or cls.index_url
+        if index_url not in cls._INDEX_CACHE:
+            url = index_url
+            if anvil.server.context.type == "server_module" and url.startswith("./"):
+                url = f"{anvil.server.get_app_origin()}{url[1:]}"
+            cls._INDEX_CACHE[index_url] = cls.clean(LocaleIndex(url))
+            if cls.fallbacks_file:
+                cls._load_fallback_chains(f"{url[:url.rfind('/') + 1]}{cls.fallbacks_file}")
+        return cls._INDEX_CACHE[index_url]
+
+    @classmethod
+    def fallback_chain(cls, locale: str, available: list) -> list:
+        """Return the available locales that can serve the given locale, best first.
+
+        The result is a list of (locale, distance) tuples containing all available 
+        locales within Locale.max_distance. An available locale that is identical to 
+        the given locale always comes first. Chains are taken from the precomputed 
+        fallbacks file, if there is one, or computed and kept in a cache of limited 
+        size (see FALLBACK_CHAIN_CACHE_SIZE).
+
+        Args:
+            locale: The requested locale, e.g. "de-AT".
+            available: A list of locales that the application supports.
+        """
+        chain = cls._CHAINS.get(cls._chains_key(available), {}).get(locale)
+        if chain is None:
+            available = tuple(available)
+            chain = _rank_locale(locale, available, len(available), cls.max_distance)
+        return list(chain)
+
+    @classmethod
+    def build_fallback_chains(cls, requested: list = (), available: list = None) -> dict:
+        """Compute the fallback chains for all available and the given requested locales.
+
+        The returned dictionary can be stored as JSON file next to the index.lst file 
+        (see Locale.fallbacks_file). If enabled, it is loaded together with the index, 
+        so that matching is a dictionary lookup and gives the same results on client 
+        and server.
+
+        Args:
+            requested: Locales that users are expected to ask for in addition to the
+                available ones, e.g., all locales of the subtag registry.
+            available: A list of locales that the application supports. If not given,
+                the default index.lst file will be used.
+        """
+        available = cls.index() if available is None else cls.clean(list(available))
+        tags = list(dict.fromkeys(available + cls.clean(list(requested))))
+        return {
+            "available": available,
+            "max_distance": cls.max_distance,
+            "chains": {
+                tag: [list(e) for e in cls.fallback_chain(tag, available)] for tag in tags
+            },
+        }
+
+    @classmethod
+    def load_fallback_chains(cls, data: dict):
+        """Make precomputed fallback chains available for matching.
+
+        Args:
+            data: Dictionary as returned by Locale.build_fallback_chains().
+        """
+        key = (tuple(data["available"]), data["max_distance"])
+        chains = cls._CHAINS.setdefault(key, {})
+        for tag, chain in data["chains"].items():
+            chains[tag] = [tuple(e) for e in chain]
+
+    @classmethod
+    def _load_fallback_chains(cls, url: str):
+        from anvil.http import request
+        from json import loads
+        if url in cls._FALLBACK_URLS:
+            return
+        cls._FALLBACK_URLS.add(url)
+        try:
+            response = request(url)
+        except HttpError:
+            return  # The file is optional.
+        cls.load_fallback_chains(loads(response.get_bytes().decode("utf-8")))
+
+    @classmethod
+    def _chains_key(cls, available: list) -> tuple:
+        return (tuple(available), cls.max_distance)
+
+    @classmethod
+    def _has_chains(cls, requested: list, available: list) -> bool:
+        chains = cls._CHAINS.get(cls._chains_key(available), {})
+        return all(loc in chains for loc in requested)
+
+    @classmethod
+    def _best_match(cls, locale: str, available: list):
+        """Return the available locale that serves the given locale best or None."""
+        chain = cls._CHAINS.get(cls._chains_key(available), {}).get(locale)
+        if chain is None:
+            # Only the head of the chain is needed. Do not rank all of them.
+            chain = _rank_locale(locale, tuple(available), 1, cls.max_distance)
+        return chain[0][0] if chain else None
+
     @classmethod
     def _match_py(cls, requested: list, available: list, fallback: str, count: int):
-        from .langcodes import closest_match
         locales = []
-        for index, loc in enumerate(requested):
-            if len(locales) < count:
-                lang, dist = closest_match(loc, available, max_distance=cls.max_distance)
-            if lang not in locales and dist <= cls.max_distance:
-                locales.append(lang)
-        return Locale(locales)
+        for loc in requested:
+            if len(locales) >= count:
+                break
+            best = cls._best_match(loc, available)
+            if best is not None and best not in locales:
+                locales.append(best)
+        return Locale(locales or [fallback])
 
     @classmethod
     def _match_js(cls, requested: list, available: list, fallback: str, count: int):
@@ -124,18 +338,20 @@ class Locale(list):
             force_py: Force the use of the Python implementation of the matching
                 algorithm instead of the JavaScript one.
         """
-        from fluent_anvil.registries import LocaleIndex
         import anvil.server
-        available = LocaleIndex(cls.index_url) if available is None else available
+        available = cls.index() if available is None else available
         fallback = cls.clean(fallback or cls.fallback) 
 
         available = cls.clean([available] if isinstance(available, str) else available)
         requested = cls.clean([requested] if isinstance(requested, str) else requested)      
 
+        # Precomputed fallback chains take precedence, so that client and server
+        # return the same result.
         is_server = anvil.server.context.type == "server_module"
+        use_py = is_server or force_py or cls._has_chains(requested, available)
         obj = (
             cls._match_py(requested, available, fallback, count) 
-            if is_server or force_py else 
+            if use_py else 
             cls._match_js(requested, available, fallback, count)
         )
         obj._requested = cls.clean(requested)
@@ -231,3 +447,25 @@ class Locale(list):
     
     def __str__(self):
         return ", ".join(self)
+
+
+@lru_cache(maxsize=FALLBACK_CHAIN_CACHE_SIZE)
+def _rank_locale(locale: str, available: tuple, k: int, max_distance: int) -> tuple:
+    """Return the k available locales that serve the given locale best (see ranked_matches)."""
+    from .langcodes import ranked_matches
+    return tuple(ranked_matches(locale, available, k, max_distance))
+
+
+@lru_cache(maxsize=ACCEPT_LANGUAGE_CACHE_SIZE)
+def _negotiate_accept_language(
+    cls, header: str, available: tuple, fallback: str, count: int, max_distance: int
+):
+    """Match an Accept-Language header against the available locales.
+
+    cls is the Locale class (or subclass) that from_accept_language() was called on. 
+    The maximum distance is part of the arguments only so that changing 
+    cls.max_distance does not return stale results from the cache.
+    """
+    requested = cls.parse_accept_language(header)
+    locales = cls.match(requested, list(available), fallback, count) if requested else []
+    return tuple(locales or [fallback]), tuple(requested)
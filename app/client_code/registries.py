@@ -1,30 +1,151 @@
-from datetime import datetime
+from datetime import datetime, date
 from anvil.http import request, HttpError
 from anvil.tables import app_tables, Transaction
 from json import loads, dumps
+from bisect import bisect_left
+import re
+
+try:
+    from unicodedata import normalize, combining
+except ImportError:
+    normalize = None  # Not available in the browser.
+
+
+def fold(text: str) -> str:
+    """Return the given text in lower case and, if possible, without accents."""
+    text = (text or "").lower()
+    if normalize is None:
+        return text
+    return "".join(c for c in normalize("NFKD", text) if not combining(c))
+
+
+REGISTRY_FORMAT = "fluent_subtag_registry"
+"""Identifies encoded subtags (see encode_subtags())."""
+
+REGISTRY_FORMAT_VERSION = 2
+"""Version of the encoding. Version 1 is the plain dictionary of subtags."""
+
+CODEC_IDENTITY = "identity"
+"""Keys and values are stored as JSON arrays. Can be decoded in the browser."""
+
+CODEC_ZLIB = "zlib"
+"""Keys and values are stored as base64 encoded, zlib compressed JSON. Server only."""
+
+
+def encode_subtags(subtags: dict, codec: str = CODEC_IDENTITY) -> dict:
+    """Encode the given subtags into the compact registry format.
+
+    The codes are stored in a sorted array, their descriptions in a second array
+    in the same order. 
+    """
+    keys = sorted(subtags)
+    values = [subtags[key] for key in keys]
+    header = {"format": REGISTRY_FORMAT, "format_version": REGISTRY_FORMAT_VERSION, "codec": codec}
+    if codec == CODEC_IDENTITY:
+        return {**header, "keys": keys, "values": values}
+    if codec == CODEC_ZLIB:
+        from base64 import b64encode
+        from zlib import compress
+        data = dumps([keys, values], ensure_ascii=False, separators=(",", ":"))
+        return {**header, "data": b64encode(compress(data.encode("utf-8"), 9)).decode("ascii")}
+    raise ValueError(f'Unknown codec "{codec}".')
+
+
+def decode_subtags(value):
+    """Return the subtags dictionary of the given encoded subtags.
+
+    Plain dictionaries (i.e., format version 1) are returned unchanged.
+    """
+    if not isinstance(value, dict) or value.get("format") != REGISTRY_FORMAT:
+        return value
+    if value["format_version"] > REGISTRY_FORMAT_VERSION:
+        raise ValueError(f'Unsupported registry format version {value["format_version"]}.')
+    if value["codec"] == CODEC_IDENTITY:
+        return dict(zip(value["keys"], value["values"]))
+    if value["codec"] == CODEC_ZLIB:
+        from base64 import b64decode
+        from zlib import decompress
+        keys, values = loads(decompress(b64decode(value["data"])).decode("utf-8"))
+        return dict(zip(keys, values))
+    raise ValueError(f'Unknown codec "{value["codec"]}".')
+
 
 class JSONDB:
+    """Read-only stand-in for the subtag registry table that uses the JSON assets.
+
+    The content of the JSON files is shared by all instances and loaded lazily for 
+    each type. Rows are indexed by the queried columns, so that get() and search() do 
+    not have to scan all rows.
+    """
+
+    _CONTENT = {}
+    """Rows per asset url."""
+
+    _INDEXES = {}
+    """Index per (asset url, column): maps column values to the matching rows."""
 
     def __init__(self):
         import anvil.server
         self._url = f"{anvil.server.get_app_origin()}/_/theme/registry/fluent_subtag_registry"+"_{typename}.json"
-        self._content = {}
+
+    @classmethod
+    def invalidate(cls, typename: str = None):
+        """Forget the loaded content, so that it is downloaded again when needed.
+
+        Args:
+            typename: The type to forget. If not given, all types are forgotten.
+        """
+        if typename is None:
+            cls._CONTENT.clear()
+            cls._INDEXES.clear()
+            return
+        suffix = f"_{typename}.json"
+        for url in [url for url in cls._CONTENT if url.endswith(suffix)]:
+            del cls._CONTENT[url]
+        for key in [key for key in cls._INDEXES if key[0].endswith(suffix)]:
+            del cls._INDEXES[key]
 
     def _load(self, typename):
-        if typename in self._content:
-            return self._content[typename]
         filename = self._url.format(typename=typename)
-        response = request(filename) 
-        self._content[typename] = loads(response.get_bytes().decode("utf-8"))
-        return self._content[typename]
-    
-    def get(self, **kwargs):
-        cont = self._load(kwargs.get("type", ""))
-        return next((row for row in cont if all(row.get(ck) == cv for ck, cv in kwargs.items())))
+        if filename not in self._CONTENT:
+            response = request(filename) 
+            content = loads(response.get_bytes().decode("utf-8"))
+            if isinstance(content, dict):
+                # A single encoded type (see LocalSubtagRegistry.export_json()). The 
+                # subtags are decoded by LocalSubtagRegistry.get_tags() when needed.
+                content = [{
+                    "type": content["type"],
+                    "subtags": content,
+                    "updated_on": content["updated_on"],
+                    "hash": content["hash"],
+                    "version": content["version"],
+                }]
+            self._CONTENT[filename] = content
+        return filename, self._CONTENT[filename]
+
+    def _index(self, filename: str, rows: list, column: str) -> dict:
+        key = (filename, column)
+        if key not in self._INDEXES:
+            index = {}
+            for row in rows:
+                index.setdefault(row.get(column), []).append(row)
+            self._INDEXES[key] = index
+        return self._INDEXES[key]
 
     def search(self, **kwargs):
-        cont = self._load(kwargs.get("type", ""))
-        return [row for row in cont if all(row.get(ck) == cv for ck, cv in kwargs.items())]
+        filename, rows = self._load(kwargs.get("type", ""))
+        criteria = list(kwargs.items())
+        for position, (column, value) in enumerate(criteria):
+            try:
+                rows = self._index(filename, rows, column).get(value, [])
+            except TypeError:
+                continue  # Unhashable values are compared row by row.
+            del criteria[position]
+            break
+        return [row for row in rows if all(row.get(ck) == cv for ck, cv in criteria)]
+
+    def get(self, **kwargs):
+        return next(iter(self.search(**kwargs)), None)
     
 
 def get_subtag_registry():
@@ -32,9 +153,10 @@ def get_subtag_registry():
     if not hasattr(app_tables, "fluent_subtag_registry"):
         raise NoSubtagRegistry(
             'You need to define a table called "fluent_subtag_registry" first. '
-            'It has to have three columns: Text column named "type", '
-            'simple Object column named "subtags", and a date and time '
-            'column named "updated_on".'
+            'It has to have five columns: Text column named "type", '
+            'simple Object column named "subtags", a date and time '
+            'column named "updated_on", a text column named "hash", and a '
+            'number column named "version".'
         )
     return app_tables.fluent_subtag_registry
 
@@ -45,17 +167,21 @@ class IANASubtagRegistry:
     Its purpose is to load the data from the subtag registry and parse it.
     """
     DELIMITER = "%%"
+    FILE_DATE = "file-date"
     SUBTAG = "subtag"
     TYPE = "type"
     REGION = "region"
     LANGUAGE = "language"
     SCRIPT = "script"
     VARIANT = "variant"
+    EXTLANG = "extlang"
     SUPPRESS_SCRIPT = "suppress-script"
     DEPRECATED = "deprecated"
     PREFERRED_VALUE = "preferred-value"
     DESCRIPTION = "description"
     PRIVATE_USE = "private use"
+    TYPES = (LANGUAGE, EXTLANG, SCRIPT, REGION, VARIANT)
+    """The subtag types that are taken from the registry."""
 
     URL_LANGUAGE_TAG_REGISTRY = "https://www.iana.org/assignments/language-subtag-registry/language-subtag-registry"
     """The URL to the IANA Language Tag Registry
@@ -64,35 +190,133 @@ class IANASubtagRegistry:
     A nice description of what each element in that registry means can be found
     here: https://www.w3.org/International/articles/language-tags/
     """
+
+    TIMEOUT = 30
+    """Seconds to wait for the registry server before giving up."""
     
-    def __init__(self):
+    def __init__(self, modified_since: datetime = None, file = None):
+        """Download and parse the registry.
+
+        The registry is streamed and parsed line by line in a single pass. If 
+        modified_since is given, the registry is requested conditionally and parsing 
+        stops as soon as its File-Date shows that it did not change since then. Check 
+        the modified property to find out whether there is new data.
+
+        Args:
+            modified_since: When the registry was downloaded the last time.
+            file: Path or file object of a local copy of the registry. If given, the
+                registry is read from this file instead of being downloaded.
+        """
         self._updated_on = datetime.now().astimezone()
-        # Download the language tag registry. Fortunately,
-        # this is just a text file with no authentication required.
-        response = request(self.URL_LANGUAGE_TAG_REGISTRY)
-        self._content = response.get_bytes().decode("utf-8").splitlines()
-        self._lastkey = None
-        self._entry = {}
-        self._data = None
+        self._modified_since = modified_since
+        self._modified = True
+        self._file_date = None
+        self._by_type = {}
+        self._suppressed_scripts = {}
+
+        if file is not None:
+            if isinstance(file, str):
+                with open(file, encoding="utf-8") as stream:
+                    self._read(stream)
+            else:
+                self._read(
+                    line.decode("utf-8") if isinstance(line, bytes) else line 
+                    for line in file
+                )
+            return
+
+        response = self._open()
+        if response is None:
+            self._modified = False
+            return
+        with response:
+            self._read(line.decode("utf-8") for line in response)
 
     @property
     def updated_on(self):
         return self._updated_on
 
     @property
-    def data(self):
-        if self._data is None:
-            self._data = [e for e in self]
-        return self._data
-
-    def _parse_line(self, line: str):
-        # Is the line a continuation of the previous line?
-        if line.startswith("\t") or line.startswith(" "):
-            self._entry[self._lastkey] += f" {line}"
-        else:
-            key, value = line.split(":", 1)
-            self._lastkey = key.lower().strip()
-            self._entry[self._lastkey] =  value.strip()
+    def modified(self) -> bool:
+        """False if the registry did not change since modified_since. True, otherwise."""
+        return self._modified
+
+    @property
+    def file_date(self):
+        """The File-Date of the registry or None if it was not downloaded."""
+        return self._file_date
+
+    def _open(self):
+        """Request the registry. Returns None if it was not modified.
+
+        Uses urllib instead of anvil.http.request, which reads the whole response
+        before returning it and so can't be parsed while it is downloaded.
+        """
+        from datetime import timezone
+        from urllib.request import Request, urlopen
+        from urllib.error import HTTPError
+        from email.utils import format_datetime, parsedate_to_datetime
+        
+        headers = {}
+        if self._modified_since is not None:
+            since = self._modified_since.astimezone(timezone.utc)
+            headers["If-Modified-Since"] = format_datetime(since, usegmt=True)
+        try:
+            response = urlopen(
+                Request(self.URL_LANGUAGE_TAG_REGISTRY, headers=headers),
+                timeout=self.TIMEOUT
+            )
+        except HTTPError as e:
+            if e.code == 304:
+                return None
+            raise
+
+        # Some servers ignore conditional requests. Check ourselves in that case.
+        last_modified = response.headers.get("Last-Modified")
+        if self._modified_since is not None and last_modified:
+            if parsedate_to_datetime(last_modified) <= self._modified_since:
+                response.close()
+                return None
+        return response
+
+    def _is_unchanged(self, header: dict) -> bool:
+        """Evaluate the File-Date record at the top of the registry."""
+        file_date = header.get(self.FILE_DATE)
+        if file_date is None:
+            return False
+        self._file_date = date.fromisoformat(file_date)
+        return (
+            self._modified_since is not None and 
+            self._file_date < self._modified_since.date()
+        )
+
+    def _read(self, lines):
+        from fluent_anvil.langcodes.registry_parser import parse_lines
+        records = parse_lines(lines)
+        for record in records:
+            # The header record comes first.
+            if self._is_unchanged(self._entry(record)):
+                self._modified = False
+                return
+            break
+        for record in records:
+            entry = self._entry(record)
+            if self._isvalid(entry):
+                self._add(entry)
+
+    @classmethod
+    def _entry(cls, record: dict) -> dict:
+        # Of several descriptions, the last one is used.
+        return {
+            key.lower(): value[-1] if isinstance(value, list) else value 
+            for key, value in record.items()
+        }
+
+    def _add(self, entry: dict):
+        subtag = entry[self.SUBTAG]
+        self._by_type.setdefault(entry[self.TYPE], {})[subtag] = entry[self.DESCRIPTION]
+        if entry.get(self.SUPPRESS_SCRIPT, None):
+            self._suppressed_scripts[subtag] = entry[self.SUPPRESS_SCRIPT]
 
     @classmethod
     def _isvalid(cls, entry: dict):
@@ -103,27 +327,15 @@ class IANASubtagRegistry:
             cls.DEPRECATED not in entry and
             entry.get(cls.DESCRIPTION, "").lower() != cls.PRIVATE_USE
         )
-        
-    def __iter__(self):
-        self._lastkey = None
-        self._entry = {}
-        for line in self._content:
-            if line.startswith(self.DELIMITER):
-                if self._entry and self._isvalid(self._entry):
-                    yield {**self._entry}
-                self._entry.clear()
-                self._lastkey = None
-                continue
-            self._parse_line(line)
 
     def get_by_type(self, typename: str):
-        return {e[self.SUBTAG]: e[self.DESCRIPTION] for e in self.data if e[self.TYPE] == typename}
+        return {**self._by_type.get(typename, {})}
 
     def get_types(self):
-        return {e[self.TYPE] for e in self.data}
+        return set(self._by_type)
 
     def get_suppressed_scripts(self):
-        return {e[self.SUBTAG]: e[self.SUPPRESS_SCRIPT] for e in self.data if e.get(self.SUPPRESS_SCRIPT, None)}
+        return {**self._suppressed_scripts}
 
 
 class LocalSubtagRegistry:
@@ -134,45 +346,371 @@ class LocalSubtagRegistry:
     COL_TYPE = "type"
     COL_SUBTAGS = "subtags"
     COL_UPDATED_ON = "updated_on"
+    COL_HASH = "hash"
+    COL_VERSION = "version"
+
+    TABLE_CODEC = CODEC_ZLIB
+    """The codec used to store subtags in the registry table."""
+
+    _DECODED = {}
+    """Decoded subtags per (type, content hash)."""
+
+    CACHE_TTL = 300
+    """Seconds for which get_tags() reuses subtags without fetching the row again."""
+
+    _CACHE = {}
+    """Subtags and the time they were fetched per (backend, type)."""
+
+    METADATA = "_metadata"
+    """Type name of the row that holds the update date, hash and version of all types.
+
+    Reading this single small row is much cheaper than loading the rows of all types
+    with their large subtags objects.
+    """
+
+    _NO_METADATA = set()
+    """Backends known to have no metadata row (e.g., the JSON assets)."""
 
     def __init__(self, use_json: bool = False):
         self.db = JSONDB() if use_json else get_subtag_registry()
 
+    @classmethod
+    def content_hash(cls, subtags: dict) -> str:
+        """Return a hash of the given subtags that does not depend on their order."""
+        from hashlib import sha256
+        content = dumps(subtags, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return sha256(content.encode("utf-8")).hexdigest()
+
     def update_or_create(self, typename: str, subtags: dict, updated_on: datetime):
+        return self.update_many({typename: subtags}, updated_on)
+
+    def update_many(self, types: dict, updated_on: datetime, retain: list = None) -> list:
+        """Store the subtags of several types in a single transaction.
+
+        Types whose content did not change are not rewritten. Only their update date 
+        is set. The version of each changed type is incremented, so that clients can 
+        tell whether they need to fetch the type again.
+
+        Args:
+            types: Dictionary that maps each type name to its subtags.
+            updated_on: The update date to store.
+            retain: If given, the given types are a complete update: The metadata of
+                all types that are neither given nor listed in retain is removed. 
+                Otherwise, e.g., the display names of a locale that was dropped from 
+                the index.lst file would make the registry look outdated forever.
+
+        Returns: The names of the types that changed.
+        """
+        hashes = {typename: self.content_hash(subtags) for typename, subtags in types.items()}
+        changed = []
+        with Transaction() as txn:
+            metadata = {}
+            for typename, subtags in types.items():
+                row = self.db.get(**{self.COL_TYPE: typename})
+                if row is not None and row[self.COL_HASH] == hashes[typename]:
+                    row.update(**{self.COL_UPDATED_ON: updated_on})
+                else:
+                    data = {
+                        self.COL_TYPE: typename, 
+                        self.COL_SUBTAGS: encode_subtags(subtags, self.TABLE_CODEC), 
+                        self.COL_UPDATED_ON: updated_on,
+                        self.COL_HASH: hashes[typename],
+                        self.COL_VERSION: 1 if row is None else (row[self.COL_VERSION] or 0) + 1,
+                    }
+                    if row is None:
+                        row = self.db.add_row(**data)
+                    else:
+                        row.update(**data)
+                    changed.append(typename)
+                metadata[typename] = self._metadata_entry(row)
+            keep = None if retain is None else set(retain) | set(types)
+            self._update_metadata(metadata, keep)
+        for typename in changed:
+            self.invalidate(typename)
+        return changed
+
+    def _metadata_entry(self, row) -> dict:
+        return {
+            self.COL_UPDATED_ON: row[self.COL_UPDATED_ON].isoformat(),
+            self.COL_HASH: row[self.COL_HASH],
+            self.COL_VERSION: row[self.COL_VERSION],
+        }
+
+    def _update_metadata(self, entries: dict, keep: set = None):
+        """Merge the given entries into the metadata row. Call within a transaction.
+
+        If keep is given, existing entries of other types than those in keep are 
+        removed.
+        """
+        row = self.db.get(**{self.COL_TYPE: self.METADATA})
+        existing = row[self.COL_SUBTAGS] if row is not None else {}
+        if keep is not None:
+            existing = {k: v for k, v in existing.items() if k in keep}
+        metadata = {**existing, **entries}
         data = {
-            self.COL_TYPE: typename, 
-            self.COL_SUBTAGS: subtags, 
-            self.COL_UPDATED_ON: updated_on
+            self.COL_TYPE: self.METADATA,
+            self.COL_SUBTAGS: metadata,
+            self.COL_UPDATED_ON: min(
+                (datetime.fromisoformat(e[self.COL_UPDATED_ON]) for e in metadata.values()),
+                default=None,
+            ),
         }
-    
+        self.db.add_row(**data) if row is None else row.update(**data)
+
+    def get_metadata(self) -> dict:
+        """Return the update date (ISO format), hash and version of each type.
+
+        Returns an empty dictionary if the registry has no metadata row, yet. It is 
+        created by the next update.
+        """
+        row = self._get_metadata_row()
+        return {} if row is None else row[self.COL_SUBTAGS]
+
+    def _get_metadata_row(self):
+        backend = type(self.db).__name__
+        if backend in self._NO_METADATA:
+            return None
+        try:
+            return self.db.get(**{self.COL_TYPE: self.METADATA})
+        except HttpError:
+            # The JSON assets do not contain metadata. Do not ask again.
+            self._NO_METADATA.add(backend)
+            return None
+
+    def get_content_hash(self, typename: str) -> str:
+        """Return the content hash of the given type or None if it is not known.
+
+        Only the small metadata row (or metadata asset, see export_json()) is read, 
+        never the subtags. This makes it a cheap check whether data derived from the
+        subtags is still up to date.
+        """
+        entry = self.get_metadata().get(typename)
+        return None if entry is None else entry[self.COL_HASH]
+
+    def get_version(self, typename: str) -> int:
+        """Return the version of the given type or None if it does not exist.
+
+        The version is incremented whenever the subtags of the type change.
+        """
+        entry = self.get_metadata().get(typename)
+        if entry is not None:
+            return entry[self.COL_VERSION]
+        row = self.db.get(**{self.COL_TYPE: typename})
+        return None if row is None else row.get(self.COL_VERSION, None)
+
+    def touch(self, typenames: list, updated_on: datetime):
+        """Set the update date of the given types without changing their subtags."""
         with Transaction() as txn:
-            row = self.db.get(type = typename)
-            self.db.add_row(**data) if row is None else row.update(**data)
+            metadata = {}
+            for typename in typenames:
+                row = self.db.get(**{self.COL_TYPE: typename})
+                if row is not None:
+                    row.update(**{self.COL_UPDATED_ON: updated_on})
+                    metadata[typename] = self._metadata_entry(row)
+            if metadata:
+                self._update_metadata(metadata)
 
     def get_updated_on(self, typename: str = None) -> datetime:
+        """Return when the given type or, if not given, the oldest type was updated.
+
+        The date is taken from the metadata row, so that the large subtag objects do 
+        not have to be loaded. Returns None if the registry is empty.
+        """
+        metadata = self._get_metadata_row()
+        if metadata is not None:
+            if not typename:
+                updated_on = metadata[self.COL_UPDATED_ON]
+                # The metadata asset stores the date in ISO format.
+                return datetime.fromisoformat(updated_on) if isinstance(updated_on, str) else updated_on
+            entry = metadata[self.COL_SUBTAGS].get(typename)
+            return None if entry is None else datetime.fromisoformat(entry[self.COL_UPDATED_ON])
+
+        # Registries without metadata row
         if typename:
             row = self.db.get(**{self.COL_TYPE: typename})
             return None if row is None else row.get("updated_on", None)   
-        return min([e['updated_on'] for e in self.db.search()])     
+        return min([e['updated_on'] for e in self.db.search()], default=None)
 
     def get_tags(self, typename: str):         
+        from time import time
+        cache_key = (type(self.db).__name__, typename)
+        cached = self._CACHE.get(cache_key)
+        if cached is not None and time() - cached[0] < self.CACHE_TTL:
+            return cached[1]
+
         row = self.db.get(**{self.COL_TYPE: typename})
         if not row:
             raise LookupError("No locale data available.")
-        return row.get(self.COL_SUBTAGS)
+        key = (typename, row.get(self.COL_HASH, None))
+        if key[1] is None:
+            subtags = decode_subtags(row.get(self.COL_SUBTAGS))
+        else:
+            if key not in self._DECODED:
+                self._DECODED[key] = decode_subtags(row.get(self.COL_SUBTAGS))
+            subtags = self._DECODED[key]
+        self._CACHE[cache_key] = (time(), subtags)
+        return subtags
 
-    def download_json(self, typename: str):
-        data = [{"type": e["type"], "subtags": e["subtags"], "updated_on": e["updated_on"].isoformat()} for e in self.db.search(type=typename)]
-        blob = anvil.BlobMedia('text/plain', dumps(data).encode("utf-8"), name=f'fluent_subtag_registry_{typename}.json')
-        anvil.media.download(blob)
+    @classmethod
+    def invalidate(cls, typename: str = None):
+        """Make get_tags() fetch the given type (or all types) again on the next call."""
+        for key in list(cls._CACHE):
+            if typename is None or key[1] == typename:
+                del cls._CACHE[key]
+        if typename is None or typename == cls.METADATA:
+            cls._NO_METADATA.clear()
+        JSONDB.invalidate(typename)
+
+    def get_index(self, typename: str) -> "RegistryIndex":
+        """Return a search index over the subtags of the given type.
+
+        Indexes are shared and only rebuilt when the version of the type changes. 
+        Indexes of older versions are dropped then.
+        """
+        key = (type(self.db).__name__, typename, self.get_version(typename))
+        if key not in RegistryIndex._INSTANCES:
+            for outdated in [e for e in RegistryIndex._INSTANCES if e[:2] == key[:2]]:
+                del RegistryIndex._INSTANCES[outdated]
+            RegistryIndex._INSTANCES[key] = RegistryIndex(self.get_tags(typename))
+        return RegistryIndex._INSTANCES[key]
+
+    def export_json(self, typename: str):
+        """Return the given type as JSON asset in the compact registry format.
+
+        The asset can be decoded in the browser. Put it into the theme's registry 
+        directory, so that it can be used by LocalSubtagRegistry(use_json=True).
+
+        Export the METADATA type, too, whenever assets are updated. It is small and 
+        lets clients check whether data derived from an asset is still up to date 
+        without downloading the asset (see get_content_hash()).
+        """
+        import anvil
+        if typename == self.METADATA:
+            row = self._get_metadata_row()
+            if not row:
+                raise LookupError("No metadata available.")
+            data = [{
+                self.COL_TYPE: self.METADATA,
+                self.COL_SUBTAGS: row[self.COL_SUBTAGS],
+                self.COL_UPDATED_ON: row[self.COL_UPDATED_ON].isoformat(),
+            }]
+            content = dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            return anvil.BlobMedia("application/json", content, name=f"fluent_subtag_registry_{typename}.json")
 
-    def get_descriptions(self, code: str, typename: str):
-        codes = [code] if isinstance(code, str) else code
         row = self.db.get(**{self.COL_TYPE: typename})
         if not row:
             raise LookupError("No locale data available.")
-        data = row.get(self.COL_SUBTAGS, {})
-        return [data[tag] for tag in codes]
+        data = {
+            **encode_subtags(self.get_tags(typename), CODEC_IDENTITY),
+            "type": typename,
+            "updated_on": row[self.COL_UPDATED_ON].isoformat(),
+            "hash": row[self.COL_HASH],
+            "version": row[self.COL_VERSION],
+        }
+        content = dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return anvil.BlobMedia("application/json", content, name=f"fluent_subtag_registry_{typename}.json")
+
+    def download_json(self, typename: str):
+        """Download the given type as JSON asset in the browser (see export_json())."""
+        import anvil.media
+        import anvil.server
+        # Subtags stored with the zlib codec can only be decoded on the server.
+        anvil.media.download(anvil.server.call("export_registry_json", typename))
+
+    def get_descriptions(self, code: str, typename: str, default = None):
+        """Return the descriptions of the given code(s) as list.
+
+        The subtags are cached (see CACHE_TTL), so calling this for single codes in a 
+        loop is cheap. Works the same for the table and the JSON backend.
+
+        Args:
+            code: A single code or a list of codes.
+            typename: The type of the codes, e.g., "region".
+            default: The description to return for unknown codes.
+        """
+        codes = [code] if isinstance(code, str) else code
+        data = self.get_tags(typename)
+        return [data.get(tag, default) for tag in codes]
+
+
+class RegistryIndex:
+    """Search index over the subtags of one type of the registry, e.g., for typeaheads.
+
+    Codes can be searched by prefix and descriptions by the prefixes of their words. 
+    Both lookups use binary search on sorted arrays instead of scanning all subtags.
+    Descriptions are compared in lower case and without accents (the latter only on 
+    the server), so "osterr" finds "Österreich".
+    """
+
+    _INSTANCES = {}
+    """Indexes shared by LocalSubtagRegistry.get_index()."""
+
+    def __init__(self, subtags: dict):
+        """Build the index.
+
+        Args:
+            subtags: Dictionary mapping codes to their descriptions (or list of codes).
+        """
+        subtags = subtags if isinstance(subtags, dict) else {e: None for e in subtags}
+        self._subtags = subtags
+        self._order = {
+            code: position for position, code in enumerate(
+                sorted(subtags, key=lambda e: (fold(subtags[e]), e))
+            )
+        }
+        codes = sorted((code.lower(), code) for code in subtags)
+        self._folded_codes = [e[0] for e in codes]
+        self._codes = [e[1] for e in codes]
+        tokens = sorted(
+            (token, code) for code, description in subtags.items()
+            for token in set(re.findall(r"\w+", fold(description)))
+        )
+        self._tokens = [e[0] for e in tokens]
+        self._token_codes = [e[1] for e in tokens]
+
+    @classmethod
+    def _prefixed(cls, keys: list, values: list, prefix: str) -> list:
+        """Return the values whose sorted key starts with the given prefix."""
+        result = []
+        position = bisect_left(keys, prefix)
+        while position < len(keys) and keys[position].startswith(prefix):
+            result.append(values[position])
+            position += 1
+        return result
+
+    def codes_with_prefix(self, prefix: str, offset: int = 0, limit: int = None) -> list:
+        """Return the codes that start with the given prefix (case insensitive), sorted."""
+        codes = self._prefixed(self._folded_codes, self._codes, prefix.lower())
+        return codes[offset:None if limit is None else offset + limit]
+
+    def search(self, query: str, offset: int = 0, limit: int = 20) -> list:
+        """Return (code, description) tuples matching the query, best first.
+
+        A code that equals the query comes first, followed by codes that start with
+        it and finally by subtags whose description contains words starting with each 
+        word of the query. Matches of the same kind are sorted by description.
+
+        Args:
+            query: The text to search for, e.g., "de", "United K" or "osterr".
+            offset: Number of matches to skip for paging.
+            limit: Maximum number of matches to return. None for all matches.
+        """
+        words = re.findall(r"\w+", fold(query))
+        ranks = {}
+        if query.strip():
+            for code in self.codes_with_prefix(query.strip()):
+                ranks[code] = 0 if code.lower() == query.strip().lower() else 1
+        if words:
+            matches = None
+            for word in words:
+                found = set(self._prefixed(self._tokens, self._token_codes, word))
+                matches = found if matches is None else matches & found
+            for code in matches:
+                ranks.setdefault(code, 2)
+        
+        ranked = sorted(ranks, key=lambda code: (ranks[code], self._order[code]))
+        ranked = ranked[offset:None if limit is None else offset + limit]
+        return [(code, self._subtags[code]) for code in ranked]
 
 
 class CLDRFile:
@@ -192,20 +730,119 @@ class CLDRFile:
 
     URL_CLDR_CONTENT = "https://api.github.com/repos/unicode-org/cldr-json/contents/"
     """API url for obtaining directory contents in the cldr github repository."""
+
+    CACHE_DIR = None
+    """Directory in which downloaded files are cached.
+
+    If not set, a directory in the system's temporary directory is used. Cached files
+    are revalidated using their ETag, so unchanged files are not transferred again.
+    """
+
+    MAX_WORKERS = 8
+    """The maximum number of concurrent downloads (see CLDRFile.fetch_many())."""
+
+    TIMEOUT = 30
+    """Seconds to wait for a response from GitHub before giving up on a file."""
     
-    def __init__(self, path: str):
-        from fluent_anvil.exceptions import NotFound
+    def __init__(self, path: str, archive: "CLDRArchive" = None):
+        """Load the file at the given path of the cldr repository.
+
+        Args:
+            path: Path relative to the repository's root.
+            archive: Read the file from this local copy of the repository instead of
+                downloading it.
+        """
         self._url = self.URL_CLDR_RAW + path
-        # Download the language tag registry. Fortunately,
-        # this is just a text file with no authentication required.
+        self._requested_on = datetime.now().astimezone()
+        self._content = (
+            loads(self._fetch(self._url)) if archive is None else archive.load(path)
+        )
+
+    @classmethod
+    def fetch_many(cls, paths: list, archive: "CLDRArchive" = None) -> dict:
+        """Download the given files of the cldr repository concurrently.
+
+        Args:
+            paths: Paths relative to the repository's root.
+            archive: Read the files from this local copy of the repository instead of
+                downloading them.
+
+        Returns: A dictionary that maps each path to its CLDRFile or to None if the 
+            file does not exist.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from fluent_anvil.exceptions import NotFound
+
+        def load(path):
+            try:
+                return cls(path, archive)
+            except NotFound:
+                return None
+
+        if archive is not None:
+            # Archives are read sequentially. Some archive formats are not thread-safe.
+            return {path: load(path) for path in paths}
+
+        workers = max(1, min(cls.MAX_WORKERS, len(paths)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(paths, executor.map(load, paths)))
+
+    @classmethod
+    def get_cache_dir(cls) -> str:
+        import os
+        from tempfile import gettempdir
+        cache_dir = cls.CACHE_DIR or os.path.join(gettempdir(), "fluent_anvil_cldr")
+        os.makedirs(cache_dir, exist_ok=True)
+        return cache_dir
+
+    @classmethod
+    def _fetch(cls, url: str) -> str:
+        """Return the content of the given url using the on-disk cache.
+
+        Uses urllib instead of anvil.http.request, which does not give access to the
+        ETag header that the cache is validated with.
+        """
+        import os
+        from hashlib import sha1
+        from threading import get_ident
+        from urllib.request import Request, urlopen
+        from urllib.error import HTTPError
+        from fluent_anvil.exceptions import NotFound
+
+        name = os.path.join(cls.get_cache_dir(), sha1(url.encode("utf-8")).hexdigest())
+        cached, etag = None, None
         try:
-            self._requested_on = datetime.now().astimezone()
-            response = request(self._url)
-            self._content = loads(response.get_bytes().decode("utf-8"))
-        except HttpError as e:
-            if e.status == 404:
-                raise NotFound(f'Unable to load "{self._url}"')
-            raise e
+            with open(f"{name}.etag", encoding="utf-8") as file:
+                etag = file.read()
+            with open(f"{name}.body", "rb") as file:
+                cached = file.read()
+        except OSError:
+            cached, etag = None, None
+
+        headers = {"If-None-Match": etag} if etag else {}
+        try:
+            with urlopen(Request(url, headers=headers), timeout=cls.TIMEOUT) as response:
+                body = response.read()
+                etag = response.headers.get("ETag")
+        except HTTPError as e:
+            if e.code == 304 and cached is not None:
+                return cached.decode("utf-8")
+            if e.code == 404:
+                raise NotFound(f'Unable to load "{url}"') from e
+            if e.code in (403, 429) and cached is not None:
+                # Rate limited. A possibly outdated copy is better than nothing.
+                return cached.decode("utf-8")
+            raise
+
+        if etag:
+            # Write to temporary files first, so that concurrent readers never see
+            # a partially written file.
+            for suffix, data in ((".body", body), (".etag", etag.encode("utf-8"))):
+                tmp = f"{name}{suffix}.{os.getpid()}.{get_ident()}"
+                with open(tmp, "wb") as file:
+                    file.write(data)
+                os.replace(tmp, f"{name}{suffix}")
+        return body.decode("utf-8")
 
     @property
     def url(self):
@@ -227,16 +864,104 @@ class CLDRFile:
         return data
 
     @classmethod
-    def listdir(cls, path: str) -> list:
+    def listdir(cls, path: str, archive: "CLDRArchive" = None) -> list:
         """Returns the contents of the given path in the cldr repository.
         """
+        if archive is not None:
+            return archive.listdir(path)
         upath = path[:-1] if path.endswith("/") else path
         url = f"{cls.URL_CLDR_CONTENT}{upath}?ref=main"
-        response = request(url)
-        content = loads(response.get_bytes().decode("utf-8"))
+        content = loads(cls._fetch(url))
         return [(e["name"], e["type"].lower(),) for e in content]
 
 
+class CLDRArchive:
+    """Class that represents a local copy of the cldr json repository.
+
+    The copy is a zip or tar archive of the repository, e.g., as downloaded from 
+    https://github.com/unicode-org/cldr-json/archive/refs/heads/main.zip . Files are 
+    read from the archive directly without extracting it. This allows for fast and 
+    reproducible registry updates without network access.
+    """
+
+    def __init__(self, file):
+        """Open the given archive.
+
+        Args:
+            file: Path or binary file object of a zip or tar (optionally compressed) 
+                archive.
+        """
+        import tarfile
+        import zipfile
+
+        if zipfile.is_zipfile(file):
+            self._zip = zipfile.ZipFile(file)
+            self._tar = None
+            members = [(e.filename.rstrip("/"), e.is_dir()) for e in self._zip.infolist()]
+        else:
+            if not isinstance(file, str):
+                file.seek(0)
+            self._tar = tarfile.open(file) if isinstance(file, str) else tarfile.open(fileobj=file)
+            self._zip = None
+            members = [(e.name, e.isdir()) for e in self._tar.getmembers()]
+
+        # Archives downloaded from GitHub contain a single top level directory 
+        # (e.g. "cldr-json-main/") that is not part of the repository paths.
+        top = {name.split("/", 1)[0] for name, _ in members}
+        prefix = f"{top.pop()}/" if len(top) == 1 else ""
+        if any(name.startswith("cldr-json/") for name, _ in members):
+            prefix = ""
+
+        self._members = {}
+        self._dirs = set()
+        for name, is_dir in members:
+            if not name.startswith(prefix):
+                continue
+            path = name[len(prefix):]
+            if is_dir:
+                self._dirs.add(path)
+            else:
+                self._members[path] = name
+                # Not all archives contain entries for directories.
+                while "/" in path:
+                    path = path.rsplit("/", 1)[0]
+                    self._dirs.add(path)
+
+    def close(self):
+        (self._zip or self._tar).close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def load(self, path: str):
+        """Return the parsed content of the json file at the given repository path."""
+        from json import load
+        from fluent_anvil.exceptions import NotFound
+
+        name = self._members.get(path)
+        stream = None
+        if name is not None:
+            stream = self._zip.open(name) if self._zip else self._tar.extractfile(name)
+        if stream is None:
+            raise NotFound(f'Unable to load "{path}" from archive')
+        with stream:
+            return load(stream)
+
+    def listdir(self, path: str) -> list:
+        """Returns the contents of the given path in the same format as 
+        CLDRFile.listdir()."""
+        path = path if path.endswith("/") else f"{path}/"
+        content = {}
+        for names, tp in ((self._members, "file"), (self._dirs, "dir")):
+            for name in names:
+                if name.startswith(path) and "/" not in name[len(path):]:
+                    content[name[len(path):]] = tp
+        return sorted(content.items())
+
+
 class CLDRLocale:
     """Class that represents a single locale from the cldr json github repository."""
 
@@ -280,22 +1005,26 @@ class CLDRLocale:
     """Directory in which locale translations are stored."""
     
     def _get(self, filename: str, *relpath):
-        from fluent_anvil.exceptions import NotFound
         """Returns information in the given file at the given position in the json treee.
 
         Since all files always start with the "main", locale key, and "localeDisplayNames",
         the given relpath does not have to provide these.
         """
-        try:
-            file = CLDRFile(self._locale_dir + filename)
-            return file.drill("main", self._locale, "localeDisplayNames", *relpath)  
-        except NotFound:
+        file = self._files[self._locale_dir + filename]
+        if file is None:
             return {}
+        return file.drill("main", self._locale, "localeDisplayNames", *relpath)  
 
-    def __init__(self, locale_dir: str):
+    def __init__(self, locale_dir: str, archive: "CLDRArchive" = None):
         self._locale_dir = locale_dir if locale_dir.endswith("/") else f'{locale_dir}/'
         self._locale = self._locale_dir[self._locale_dir[:-1].rfind("/")+1:-1]
         self._updated_on = datetime.now().astimezone()
+        self._files = CLDRFile.fetch_many([
+            self._locale_dir + filename for filename in (
+                self.FILE_DISPLAY, self.FILE_LANGUAGES, self.FILE_TERRITORIES, 
+                self.FILE_VARIANTS, self.FILE_SCRIPTS,
+            )
+        ], archive)
 
         self._patterns = self._get(self.FILE_DISPLAY, "localeDisplayPattern")
         self._languages = self._get(self.FILE_LANGUAGES, "languages")
@@ -309,11 +1038,13 @@ class CLDRLocale:
         self._regions = {k.upper(): v for k, v in self._regions.items()}
 
     @classmethod
-    def find_locales(cls):
-        locales = CLDRFile.listdir(cls.LOCALE_NAME_DIR)
+    def find_locales(cls, archive: "CLDRArchive" = None):
+        locales = CLDRFile.listdir(cls.LOCALE_NAME_DIR, archive)
         return [name for name, tp in locales if tp == "dir"]
 
     def format(self, locale:str) -> str:
+        from fluent_anvil.locale import Locale
+
         def translate(registry: dict, components: dict, key: str):
             return {key: registry.get(components.get(key, None), None)}
         
@@ -356,8 +1087,10 @@ class LocaleIndex(list):
         try:
             response = request(index_url)
             locales = response.get_bytes().decode("utf-8").split("\n")
-            cleaned = list({e.strip().replace("_", "-") for e in locales})
-            super().__init__(cleaned)
+            # Keep the order of the file, so that ties are resolved the same way in
+            # every process.
+            cleaned = [e.strip().replace("_", "-") for e in locales if e.strip()]
+            super().__init__(dict.fromkeys(cleaned))
         except HttpError as e:
             raise HttpError(f'URL "{index_url}": {e}') from e
         
\ No newline at end of file
@@ -0,0 +1,170 @@
+"""Display names of languages, regions, scripts and currencies on the server.
+
+In the browser, Fluent uses JavaScript's Intl.DisplayNames to translate codes into
+names. Server code (e.g. for reports or emails) has no access to it. Therefore, the
+names are compiled from the CLDR data for all locales of the index.lst file in
+advance and stored in the subtag registry, one compact row per locale. Lookups are
+answered from an in-process cache, so that each row is loaded at most once per
+TABLE_TTL seconds per server process.
+"""
+import anvil.server
+from .registries import CLDRFile, CLDRLocale, LocalSubtagRegistry
+from .locale import Locale
+
+TYPE_PREFIX = "display-names:"
+"""Prefix of the registry types that hold the display names of a locale."""
+
+CURRENCY_FILE = "cldr-json/cldr-numbers-full/main/{locale}/currencies.json"
+
+DEFAULT_PATTERNS = {"localePattern": "{0} ({1})", "localeSeparator": "{0}, {1}"}
+"""Patterns to compose locale names if CLDR does not provide any."""
+
+MISSING_TTL = 60
+"""Seconds for which a locale without a table is not looked up again."""
+
+TABLE_TTL = LocalSubtagRegistry.CACHE_TTL
+"""Seconds for which a loaded table is used without looking it up again.
+
+Registry updates only invalidate the tables of the process that ran them. Other 
+server processes pick up the new tables once this has passed.
+"""
+
+_TABLES = {}
+"""Display name tables loaded from the registry and the time they were loaded, per 
+locale."""
+
+_MISSING = {}
+"""The time at which a locale was found to have no table, per locale."""
+
+
+def compile_tables(locales: list, archive = None) -> dict:
+    """Compile the display names for the given locales from the CLDR data.
+
+    Each locale is mapped to the closest locale available in the CLDR repository.
+
+    Args:
+        locales: The locales to compile names for, e.g., those of the index.lst file.
+        archive: Read the CLDR data from this archive instead of downloading it (see
+            CLDRArchive).
+
+    Returns: A dictionary that maps registry type names to tables, ready to be
+        stored using LocalSubtagRegistry.update_many().
+    """
+    from .exceptions import NotFound
+    from .langcodes import closest_supported_match
+    available = CLDRLocale.find_locales(archive)
+    tables = {}
+    for locale in Locale.clean(locales):
+        cldr_locale = closest_supported_match(locale, available)
+        if cldr_locale is None:
+            continue
+        cldr = CLDRLocale(f"{CLDRLocale.LOCALE_NAME_DIR}{cldr_locale}", archive)
+        try:
+            file = CLDRFile(CURRENCY_FILE.format(locale=cldr_locale), archive)
+            currencies = file.drill("main", cldr_locale, "numbers", "currencies")
+        except NotFound:
+            currencies = {}
+        tables[f"{TYPE_PREFIX}{locale}"] = {
+            "patterns": cldr.patterns,
+            "language": cldr.languages,
+            "region": cldr.regions,
+            "script": cldr.scripts,
+            "variant": cldr.variants,
+            "currency": {
+                k.upper(): v["displayName"] for k, v in currencies.items()
+                if "displayName" in v
+            },
+        }
+    return tables
+
+
+def get_table(locale: list) -> dict:
+    """Return the display name table that serves the given locale best.
+
+    The locale's fallbacks are tried in order. Returns None if there is no table.
+    """
+    from time import time
+    locales = [locale] if isinstance(locale, str) else list(locale)
+    for loc in Locale.clean(locales):
+        if loc not in _TABLES or time() - _TABLES[loc][0] >= TABLE_TTL:
+            # The table may be added by a registry update, so this is not cached
+            # for long.
+            if loc in _MISSING and time() - _MISSING[loc] < MISSING_TTL:
+                continue
+            try:
+                _TABLES[loc] = (time(), LocalSubtagRegistry().get_tags(f"{TYPE_PREFIX}{loc}"))
+            except LookupError:
+                _TABLES.pop(loc, None)
+                _MISSING[loc] = time()
+                continue
+            _MISSING.pop(loc, None)
+        return _TABLES[loc][1]
+    return None
+
+
+def invalidate():
+    """Forget all loaded tables, e.g., after the registry has been updated."""
+    _TABLES.clear()
+    _MISSING.clear()
+
+
+# Keys in CLDR are normalized by CLDRLocale. Lookups have to do the same.
+_NORMALIZE = {
+    "language": str.lower,
+    "region": str.upper,
+    "script": str.title,
+    "variant": str.lower,
+    "currency": str.upper,
+}
+
+
+def _lookup(table: dict, typename: str, code: str, width: str):
+    names = table.get(typename, {})
+    normalize = _NORMALIZE[typename]
+    if width != "long":
+        # CLDR only has alternative short names. Use them for narrow, too.
+        name = names.get(normalize(f"{code}-alt-short"))
+        if name:
+            return name
+    return names.get(normalize(code))
+
+
+def _language_name(table: dict, code: str, language_display: str, width: str):
+    # Dialect names like "British English" are listed for complete tags.
+    if language_display == "dialect":
+        name = _lookup(table, "language", code, width)
+        if name:
+            return name
+    try:
+        components = Locale(code).decompose()
+    except Exception:
+        return None
+    language = _lookup(table, "language", components["language"], width)
+    if not language:
+        return None
+    translated = {"language": language}
+    for typename in ("region", "script", "variant"):
+        if components.get(typename):
+            translated[typename] = _lookup(table, typename, components[typename], width)
+    return str(Locale.compose(table.get("patterns") or DEFAULT_PATTERNS, translated))
+
+
+def get_display_names(codes: list, locale: list, typename: str, language_display: str = "dialect", width: str = "long") -> list:
+    """Return the names of the given codes in the given locale like Intl.DisplayNames.
+
+    Args:
+        codes: List of codes to translate.
+        locale: The locale to translate to, including fallbacks.
+        typename: The type ("language", "region", "script", "currency") of the codes.
+        language_display: "dialect" or "standard", only used for languages.
+        width: "long", "short", or "narrow".
+
+    Returns: The names in the order of the given codes. A name is None if it is not
+        known.
+    """
+    table = get_table(locale)
+    if table is None:
+        return [None for _ in codes]
+    if typename == "language":
+        return [_language_name(table, code, language_display, width) for code in codes]
+    return [_lookup(table, typename, code, width) for code in codes]
@@ -0,0 +1,3 @@
+# This file is generated by langcodes.snapshot.dump_snapshot().
+SOURCE_HASH = '88bf91a25c0c68175e02843d711117ca45a2e556d70f76b359370fd960195c21'
+DATA = 'eNpsvdm23bgRLPgv+9kPmwQx9VsNslSW5CpXqWyX7+qHo3kejnQ03Z9v5BRA5u6lk6G1GIEkSIIgguQm/u/pxduPn67ePnry8fT//J//c3ry9vS3tzevXwucx7/t//2bLD7du/pE//35x+lv+9+2SbBUF+9x8e0fT39L498R0whxTEL0P/x5+lse/0rUC1EmIfqffjj9rY5/LeoH4ZW//PP0tz7+becoHUyQ3jr9bdv4b78QK7cvnJT65/8Gk/jvYmsH58X/G/XeMv9dbKpxRbnHT9aDslX+a8ZYqZ+pYmPz2sLJuozpF8wPD8ZBO/PfFvMZty2c7vM7g9n5L8VSxiXlnl6vdd8P/svGWKm//z5KlUEsnKzLmHLB0JHfK/+1mE8P/hT/OHbB3ukvnaN4cCHz2Ia08d9+kfmOHMiP62alxH+HMSa+Nc6JlAexcLIKY/IFc/+/gyn8V2M+4+rC6YEcuyk1/uuxlHF94XRDfz397Tjz3xZLGbct3DzTj53/Uiw1OC8+tj7UB//lqAaZlXzxad2tR+G/agxOwdEyjzaIhdMTV5l2wdAxPTr95XPMp8f0vVt53vhvNwatZezNnAaxcNrGlEkXzG+jWvngvxzzGZeVe/va1aLwXzUG/cm9UaoNYuG0F1KmXTB0DuROf+Uc8ylXzso9vkLncff0t7Lx324MuhzlduU+frZSf4x8JfHfYYyVMu5Q7u1D1H20uZL5rxiDLVauGPdu3U+l8l8zZi2Vchuraso+fYGu5ZeRsdNfPRuDDkm4elbuBRr0L6P1143/dmPQMJXblXuPff/bOCo18d9hDFqAcodyj+b5Oa4oNfNfMQaNVrmi3MdX2PfjqNTKf80Y7HvlmnLPb6zUnXF9rZ3+2tkYK6VcOyt3bfv+9PvYv23jv90YK2XcrtzDZ2iJtweT+O8w5vTTt2vaKcYdyj1Ht3xnnF8t818xBjVUrij3EaV+H8ekVf5rxti6mGvyB85qT1yXP+ZwLP8YbaOf+W8zBvtXuU25Jyh1e9Sw7/yXjDndvn5CB8e4pNwn1P4BMQf/ZWNsXcZl5a5xLH8fx6sX/qvGYJuVq8rdoN38OS6ovfFfN8ZKGdeVe4K+7RYNLs5njc1IXAJBb0a/Ri9x799E7hrJSCs76QQa6733gMhDIxuJsqCz0VduKLKdi0Y18vTD9RX1OLdu0xCP6lxXWo8+Dc7OTaPHspPuK637yhJLcm7EGFX9co/ITWM38nTnyUPKP+nd6KfopH/5ncikcRhplZr0YfTzF+u4eKPhJkcx8vTzk89Xp5UuRj/EKPbHn4msGs3I049P3tIpPelm9KfnaNp3iOwS+9nI04PnV7R60GMMqvRn1PnfVKl909iNtIM/6d3oF4+xvVSpMT6VOIxEHw76MPrNHJz9RWTWKEZifAa6GP30xbwG0BaN4apEA4vrAPPNgviXV67J7l1CxrBEnv7x/orK/uM38h4bUSstK57kZuQrd/Xc0q6RjDzdfXdNre8uNZ0xgB3USkviSR5Gfn/uE2eNYuTpztVb2mU/0TEag1kNV1bJqhHIB/8hsmn0NTF1AEJ3C1/2zrj+bWNYK7HFskJvFr7sH3T2jlGvRIobJHSyCLTsjjHW5fC74xPoLCG1/nbzxFe7aFSwvt7Vgnsd33TGkFiiG4kemnrKMS7WEPqFK5zPGhtYeFUyvWOgrCH8K19610hgfelkIfyNL31oZLC+dLZg/qEvXDSqkXZBu32LBoZ0Mo0xNPiw2U2jg/Wr7hbCf3Clx1haYgNrK+fSY+CsIby/Oo0xtUQCizsn1E+MAbSG8J986UMjg3U1L9lC+G++dNGoYH3pasH8o8e+dNPoYH3pbiF8uLlx1tjAup55DK81hPfdzRh5SySwcKZ0eo5htgbzj/05MkbgEhms2+djuK0hfKh50ahg3XbXaiH8S1+6aXSwvnS3YBP23RUeA3OJzcjTgxd80H98QM08MWf81WN/uMcAXSKBXQeLY7mF8GHdh0YG6yo+RuUazPt9NsbrEtXI0w+fP36yIUurFkL7k7s1jQ7WBjwP6PrRuoXwfqvHKF1iA+vqPYbwGsw/9YV3jWTkeu9u7HAqmMA/e+RLHxoZrF91thDen19j8C5RwfrS1UL4Z7500+hgfeluIfwbd/vufNbYwK6lx3IL4d/50rtGAutLJwvhP/jSh0YGCy98n0pnC+afX/nSRaOC9euuFsK/9qWbRgfrS3cL4f12b2eNDezph+fv3ujoeiy3YP7lM19610hg3brHuF6D+Ve+8KGRjVx7tLHYQuhQuGhUsKf/frz5SvX+F5WuFsy/9nt8jPklOlhf724hvLv27nTnmWMD60rTbWkJ4d/60rtGAmul/3uXSicL4T/50odGBrt2iDvdppZg3p8idKeaoxp5uvWJDdUt6YupWnXyoXTT6GD9ZncL4f1mj35eYgPrSo9uSUN430ypZhwJLG6j3abSyUL49770oZHB+nVnC+ZDxYtGNXK9hT4WWwj9yBduGh2sX3O3EN438mEEJDawrvRwAhrC+4oPKyCRwPrSyUL4b770oZHB+tLZgvl3L33polHB+tLVQnjf0oYZkOhgfeluIby76u/DDUhsYNdh2lhuwfx7f8SGG5BIYO3KzesebkBD+Me+9KGRweK6T+00Zwvhn/jSRaOCdds97ICG8P751bADEh2sL90thHePifZhByQ2sK70sAMawvt9PuyARALrSycLuevk9/mwAxIZ7Nhrb17oWGsst5j8Px9eWc+4l6JRI3/6x69UvlpM/rer129Qvmn0yJ/++IvKdwvh3cB+H5ZAYgPrtn1YAg3h/Vk6LIFEAouhwz0qnSyE9/3isAQSGSwem9CWD0ugIbwftgxLIFHBWmv9mWteLYT3LWZYAokOdr3TOJZbCO/7l+EJJDawVvo+lR6eQEN4396GJ5BIYNc7pGO5BfO+4sMSSGQj7aYgDXnGZZAK5sn7scPwBBIVLO56005r1UJ4f4oPUyDRwZ7+ePb2i728MEyBhvB+vDVMgcQG1jW1YQo0hPeNZbgCiQTWl04WwvuRx3AFEhmsuxAOV6DB/Ce/14YrkKhg/bqrhfBhu5tGB+tLdwvh3cUoDVcgsYFdHsbTcgvmb7750rtGAruueyy3YP6zL3xoZCPX0dpYbCH0a1+4aFSw66VoLLcQ/q0v3TQ6WF/vbiG8O9ppeAKJDawrvW0Wwt/40rtGAutLJwvmv1z50odGBrve8R/LLYR/6EsXjQrWr7taCP/Ol24aHawv3S2E/+pKD1cgsYF1pffNgnnf0IYpkEhGrl356JYO4ibvN3s/NDJYv+pswfx3X7hoVCPxggaXrRagpR1q6abRA81X70Qvtki4NbNPS8MSSGwXZZneLEJZSjwMAUdMzKcWv/dCcSDxeubRzpTgB0O+AdKrLxzFSF+2WAjtz1p6A4ajgbVN+u0ulW4Wwvuzlt6EoTjOYNfB61huIbwzOmmYAYkdrJ05//yNSu8Wwl/70knjALu+cDWWWwjv3zM6skYBu94DGcsthPcd5TADEg2sa77DDmgI78+7o0vkM9jTj1dvbmzdww5oMB8O9zADEjtYt+5hBzSE9yfeMAMSB1hf+rAQ/pEvnTUKWHe8hx3QEP6xL101Gli/7mYhvL8u5i5RzmDdERt2QEN439aGGZDYwbp1DzugIbxva8MMSBxgfenDgvlHT33prFHA+tLFQvjnvnTVaGB96WYh/AtfukvIyzfMYq/9cqLlFsI7a5uGEZDYwbp1DyugIbzvHYYRkDjA+tKHhfD+2jaMgEQB60sXC+E/+NJVo4G1u0dSulkI70cEtUu0M1i37mEFNJh/7Nv5MAISO1hferdg/okvnDQOI/E+z198Xc3ETd43tZY1Cli/6mIhvG9qwwhINLC+dLMQ3p+grUv0M1g4LOochhXQEN43tWEEJHawWDed3sMKaAjvB4DDCEgcYF3NhxXQEP6LL501CljXrQ0roCG8786HEZBoYP26m4XwfjDTO8dxPoNdDdpYbsH8U9fUjmEEJHawa6c4llsI/8GXThoH2NODqzevdeg6llsI798pHVZAooBdhw5juYXw33zpqtHArsPmsdzCvfGmhTuHvfPmLlLHdtbYwLrM22Yh/FtfetdIYN1WDSOgIfxXX/rQyGDt1TR6yWwst2D++UNfumhUsL7m1UJ4v1OGEZDoYNd2OJZbCO8uFMcwAhIbWLfuYQQ0hH/tS+8aCaxb93ACGsK/86UPjQzWrztbCO9b0rACEhWsX3e1YD5sdtPoRuLVpz+pbLcQ2h+vYQUkNrBuzcMLaAjvj1faNRJYXzpZCP/Klz40Mtj19aex3EL4N7500ahg/bqrhfD+HBmGQKKDXZ9vjOUWwvujTe/Cc2xg3brpRXkJ4X2fRS/LcySwvnSyYP7lc1/60MhgfelsIbxvLPQOPUcFuw4qDnqPXkL4l7500+hgXSunl+olhPf7fBgCiQ3seo0ayy2E9/t8GAKJBNZt97AEGsJf+9KHRgbrS2cL4f11YhgCiQoWL/nSdg9LoCH8d1+6aXSwft3dgvlX/lowDIHEBtaVHpZAQ3h/lgxDIJHAuqvrsAQawvuWOgyBRAbr150thL/xpYtGBevO72EJNIT/7Es3jQ7Wr7tb8Fub3mIewxBIbGDXFzPHcgvO7h/6HsMQSCSwY1TB9+ToddKx3IJ5v8uHH5DIRmLN96hsthDan921aFSwbqtrtRDe96i1aXSwvnS3EN4f7WEHJDawrubDEGgI74/2sAMSCaxb93AEGu61YS18cOC1YX+ZGXZAooD1qYuF8P54DDsg0cD60s1C+Pe+dJfQIf/b4LrHcgvmfZ813IDEbqS9i0UvtY7FFkL7znaYAYkDrF/zYSG83+phBiQKWF+6WAjvj8cwAxINrC/dLJh/74czZAY6/bjqDHZ94DOWWzD/wXV4eZgBiR3suu6x3EL4F7500jjArjdHx3IL4d/70lmjgPXrLhbCf/alq0YDu96pGMstmL/2hbuE/CT1YfhB5FhsIfSV/33aprGDXS/MY7mF8M996aRxgF0Nw1huIfxXXzprFLB+3cVC+O++dNVoYN0eH3ZAg/mPvnCXkJ8EPFzugP4or94V4ibvTrC8bxo7WLfqfbcQ/oMvnTQOsKcfrz5yHeiADTegIbyv+fACEgXsel0eyy2E9z9HHF5AooFdR3FjuQXzn9750l1C3v5ndr0u0xuiGsL7dQ83ILGDdXtt+AEN4f0pkpLGAdYaCze14Qc0mL/xzXy4AYkCdn1QwMdbQnjfsQw3INHAWs3/oh9eDj+gIfxjX7pL6IOAm3BLbCy3EN5dwvJwAxI72HXsO5ZbCP/Kl04aB1i/7sNC+De+dNYoYF1bG35AQ3jfWoYbkGhg/bqbhfC+ndNvbCn0QcBNeMtlLLcQ3o0pMv3olmMH60vvFsx/fuhLJ40DLF54/BeVPiyY/+KPN/8Il6KA9esuFsL73px+jMvRwPrSzYL5r75Dpl/mUuiDgK9hFDiWWzD/7Yn/mfCmsYP1pXcL4d/60knjAIuXFqlfG35AQ3i/3cMNSBSwft3FQnjfWoYbkGhgfelmIbzvW0qX0AcB3z6Hdj78gIbw/jI23IDEDtate/gBDea/+55puAGJA6wvfVgI74/Y8AMSBew68h7LLYR/6ktXjQbWr7tZCO/bWu0S+iDge2xrwxFoCO/uO+fhByR2sL70bsG/WfY7bdgBicNI/7EE6qyHKwDvT9DhCCQK2PWzJGO5hfC+mbeq0cD6ijcL5v2TvNy6hIz6Hz2MQ4fhCDSY98/D8rAEEjvY9ebTWG4hvB+jDk8gcYA9/XTFzp5+YzmWWzDvW9qwBBLFSHcBHY5AQ2jfoQ5HINHAuoHDcAQazD/1R5scQafPCpzBrvtsLLdg3v9WoQxHILGDXX/NM5ZbMP/cF04ah5G4EPzJDa0RN/lXvnTWKGAxNL9Pqy4Wwr/xpatGA7vu8rHcQnj/KYNzl5BhP7NrIx/LLYR3TaVsm8YOdn0Rayy3EP7al04aB9jTT8+fXGPdhwXzLx750lmjgPU1LxbM+1+3lmEJJBpYsyR371DpZiG83+dbl5BxP7Oj5vz+Pd2/GcsthHfXkbJvGjtY11D33YL5Vw996aRxgF3fsBnLLYR/7UtnjQLWr7tYCO9by/AEEg2sL90shP/mS3cJGfcz60oPT6DBvP+JRxmeQGIH60vvFsy/eeJLJ40DrC99WAjvO4fhCSQK2NMf777R5t+n4z08gQbzfqeNq4xEM3I13oX6Bgmh/RmWuoSM+pk9/fSOv+lC78WO5RbM+3fAy3AEEjvYtUMdyy2Y96fnkTQOI8dlQH5OTef2cVgI7XvE4QckCtj18w5juYXwL33pqtHA+nU3C+F9f3p0CRnzM+tKDz+gIbw/Q4YfkNjB+tK7hfC+Zxh+QOIA60sfFsL745WzRgGL5wA/Ueli4b7dooUrh329xfcawwtIdLDrJ2EKfY9HQng3Civ0qR6ODazbKvoujwTznx770rtGAnv67Yrt8X26vtH3eSSYv/GFD41spLu68Vd6sqNvv76ys7fwF3woaqD50y+FPuMjwbTvpukrPhzdSL/mbsG07+qGDZDYjHSfoiOjPzjj/U+Dy3ABHPoJJL8zhwmQOMC6jmyYAA3m3/oTa5gAiQJ2vYM4lltIdt8N1qrRwPp1NwvhfZdQu0Q7g3WlhwnQEN6f1MMESOxg3eV+mAAN4X1fNlyAxAHWHUz+aNMxed8ShguQKGBt3Xfp+1LDBWgw79/pK61qNLB+u5uF8B986S4hI31mXenhAjSYf+QHScMFSOxgMVigC9dwARrMP37rSyeNA6xf92EhX+bz2z1sgEQB60sXC+HDuqtGA+uGlsMHaDD/zJ9C5AM6fVLrDHZd91huIbxrqXX4AIkdrC+9Wwj/wpdOGgdYX/qwEP61L501Ctj1NwJjuYXw17501Whg1702llsI/92X7hLbGayr+TACGsy/cPu8bpvGDtaX3i2Yf/nEl04aB1h41ltU+rBg/s1TXzprFLCn+08eP1XHO5ZbMP/uoS9dNRpYX/NmIbw/3luXkME+s+vzibHcQng3wKv7prGDdevedwvhv/jSSeMA60sfFvz5oLe+cNYoRlqfeJ/rXSw497Xf6mEDJBpYv+ZmIfxHX7pLyFCf2fUBw1huwbwfzNRhAyR2sOuHSRPdJx8kBJ/e+OJJ4wC73g0byy2E9wds+ACJAnZ98j+WWwjvN3wYAYkG1u224QQ0hP/mS3cJGe0zu/4coNJ2SzDvn27U4QQkdrDr/cux3EL4R7500jjAupofhwV/z+2T71KHF5AoYH3pYiHZn/nSVaOB9aWbBfOffeEuIcN9IumzX7Tx9//NjWUjbvJ+p+VNYwfrVj2sgAbzX/z5OayAxAHWlz4smP/2zpfOGgXs+lrQWG4h/I0vXTUaWDy9/DuVbhbyIRe/y3OX0E90fo+7fNgBDf4K30O/7mEGJHaw64hpLLdg3l8KhheQOIxcvyMxFlsw/dT3SyVrFLDrvc+x3IL5cPUtVaOBXT8EO5ZbCO9PT/qIJ4U8AGD2dOvZt/dq1it94VOC+Ve+pdHHPDl2sG6P05c+JYT366aPenIcYE935VMWZLIqffFTwn0qUgtnDv1Y5JtQr6JRwfp6VQvh/fGgr39ydLC+dLfAl6n/eH5lZ1EdhkBiCzQbqbHYQmh/gRt+QCKBdesejkBD+A++9KGRwfrS2YJ5f+oOOyBRjbSy5/PGvQ7Vq0IQrq6taXSwft3dQj5z7M/d4QckNrCn2+/e2jdgxnIL4f25O/yARAK7Oq2x3MJ9nFMLHxz4OKcfng47IFHAus0adkBD+JC7ajSwp18+8e/x+OQcdkBD+LBZnaPJkJ/Zdd1juYXw7uldG3ZAYgfrS+8WzN/4wknjMNI/hzqYA+9/wdqGG5AoYNfL9lhuwfzXT7501Whg15WP5RbM+8eOjX5BQKHfsY+PHcdyC/eNUCm8bRz4Rmhgd40E1qdOFsI/9KUPjQzWl84Wwj/zpYtGBetLVwvhX/jSTaOD9aW7hfCuU2rDCkhsYNe3BsZyC+af+sK7RjJyHRCMxRagf3iMz2K04QQkcqBPt7l0thDab/WwAhIVrNvqYQY0hH/jSzeNDnYdc4/lFu672VJ4OAEK+3K2b0fDCEjsYNffVI3lFv4TqVo6ceATqf7kGS5AIoNdPyw+llsw/9IXLhrVSNz3/wef9ZS4gn997Us3jQ7W7e5hAzSY9x9IasMESGxgXekx5tVg3nc449IkkYxExfl362Mc36jLMv6xL31oZLB+1dlCeH92DA8gUcFi0PoPKl0thPc7bXgAiQ7Wr7tbMO+/1tOGCZDYwLrSwwZoMP/hoy+9aySwvnSykGkeHvnSh0YGu150x3IL4f3hHiZAooJdnzGN5RbC+702TIBEBxvsNKXuU+A3fLgAiQ1sKF6JhODG9+TDBkgksHb+8uVtOAEN4X1rG0ZAIoO1lf/n71Q6Wwjvj3gpGhWsO2alWgjvO+NhBCQ6WPTk1J8OK6AhvHPEbRgBiQ2sW/ewAhrCf/Cld40Edr1dNpZbCO+P+DACEhnsanPGcgvhP/vSRaOCXS3WWG4h/Ddfuml0sH67uwXzn33NaVoAjg0semTq7WkOAAnm/appdgCOZOQ6xUWi1wwbTQcgvL+l3GiSAI5s5DpLT6K3EBvNCmB8KF00KtjV1DaeMqBO3rc0njSAooN1+4wmDpAQ3o92hhWQ2MDi2kv7bFgBDeF9Ox1WQCKBdeseVkBDeH8RHF5AIoP1pbOF8H7UMLyARAXrS1cL4f21ZHgBiQ52/SB4IzcgIby7ddPPZ40N7LrusdxC+G++9K6RwK7v447lFsz7Xxf1YQYkMli/7mwh/FNfumhUsL50tRD+jS/dNDrY9Xb2WG4hvN/u7ayxgXXr3jYL4b/70rtGArv+uGIst2Dev7DQhx+QyGBxjv2dSmcL5h/7wkWjGrk+sR2LLYR+4gs3jQ7Wb3W3EN610z7cgMQG1pUebkBDeL/V+66RwPrSyYJ5/8pdH3ZAIoP1pbOF8C996aJRwfrS1UL417500+hgfeluIbxvK8MQSGxg14+fjuUWzD995UvvGgmsW3dKFsz7q1AfnkAig13vw4/lFsw//+hLF40K1q+7WjDvHUsfpkCig8WtVZoQZpgCDeH92T1MgcQG1q17mAIN5l/6vTZcgUQCu/6QZyy3EN638+PQyGD9urOF8De+dNGoYP26qwXzr8K6m0YH69fdLYR34+s+XIHEBtaVHq5Ag3l/wIYpkEhG+rs/nDhN3u/yfGhksK5LzNmCef+J3z5MgUQF6yteLYT/7Es3jQ52fUo3llsw7/f4sAQSm5F44Yi/0kL7q2yT993xcAQSCayr+HAEGsI/86UPjQzWl84WzL8L6y4aFawvXS2E91ff4QgkOli304Yj0BDe3erowxFIbGDduocj0BDeH+7hCCQSWHftHo5AQ3h/xIYjkMhgTw+evL5B6WwhvO8Ta9GoYN2Ip1YL4X2fOByBRAe7js3Hcgvh3X2aPhyBxAb2dPsdP2SUyaQ2C+av/TVwWAKJBNbt82EJNIR/5EsfGhns6af31/wj3L+odLaY/L0XmIeuD1cgUSMvU3UNV6AhfNjyptHBrj+FHcsthPdjXJo9jGMD67acphaTYP5jKL1rJLDrzJyJfjrVaZ4xFfj+nGYT48hGnm7f8HcT5KOt1CXSdGPG+2NGs4pxVLDrpImdphyTEN4fM55djKKDXaei7Dz1WJ+8nxThLDOQMWwQuJkNzjwDmYJIwoRgPNWYQILAzQBy5pnIFETyJeQ4ABmCUI88QSRfQ44CqBCEHHWCSL6HHA3QIVif9xIxQcZMPgVPUiawGY/ug7/4l/mp0rYonoYUOyBB4LeEpiUzEMnHkOMAZAhCjjyBJV8ehRwFUCFY3+EiYoJIXoQcDdAhWN/kImKCSPy0PGeay0xhg8DXg6YtM2DJt1CPfQckCPz+oOnLDHg+t6uQ4gBk49fbRbR8gsvANwDH0gKoyLDcIqTlE3wGuik0ljZAjxlU0SeIwk9lcqZpbRQ2CPyeoIlYDETyKuTYAQkCN0fZOaUJInkTchyADEGoR54gktBv0CxoChWC9XYzERNEEs55mg9NoUNg+/SHv3OOPoEl/kOb25nmRVPYIPDbQnOjGbAkzCd0pvnRFBIE64CLiAluGkRLcSjoRIjP4yoyoEAQqlkmuBkPLUVVsDkPw0lCs6UpdAjCKvoEkYT+jyZNU9ggWB85ETFBJKGV09RpCgkCXw+aPc1AJM9DjgOQIQg58gSRvA45CqBC4OYuPNNUagYseR32Kc2mptAhCPXoE0RyE6btPAM2CE53XvOFlj5XR8QElrwJowWaWU0hQXD67fX1Y5z1NLmagUhCX07zqylkCPy20BRrBix5G+tRABWC1UITMUEk4VShudYUOgRu9s4zTbdmIBI/+di5ngEbBKc7b/jTN9L70KRrBiJ5G3LsgASBbx809ZqBSN6FHAcgQ+D3B03AZsCSmKIAqvGoBV/bap0gijBaoHnYFDoEfo/SVGwGIgl7lKZjU9gg8DloRjYDkYQWRpOyKSQIfAujedkM3GzJluIQ0BmTP4beniZmU5gC/6QwC7tIwnGnCdoUGgT+CtraBJbEDe0G8pOJ58t23uFZk7jfoenaTBE6BZqpjcDmrg59Pc3VppAg8HuSpmszYEm44vAbVALZeJpAhb+0KaPhyuRUhMtzL4BqPEZdPH7sdQJ/wyx0n70BuvHuHTYiJojEHy6ei1lhg8DtCp6q2UAk1yHHDkgQhBxpgnyO7WHIcQAyBG4QylM3G4jkW8hRABWCUI86gSX+ewQbz9Ws0CEIOfoEkfjLq0zpLLBB4HPIxM7blDwOKXYFm5E48gkwBWEVxwSRvAg5MqBAEHKUCSK5CTkqoEEQcrQJLHn6JOToBvL7Cxbg88F86MkjGbDED4p4cmeF3XjfePZ9gihCAyR/pHBA4LdkPyaIJGwJOSSFAkHIUSawJBwUskgKzfjTXy/4P+49eTpoA1b4L3RuPCW0gPw2gwW+FuSSDFjibRDPDK2wG+/cB08PbSCKmCIBDghCLY4JIvkUcmRAgcB5bJ4u2kAkX0KOCmgQhHq0CSL5GnJ0g+MMgc9BHsmAJa/9QISnkFbYIXDjIZ5I2oAlb2KOBDggCPU4JrDkbeicyCUpFAjcBK88q7QBS2I1KqAZ7687PLe0gUhCx3F0A/lRBwv8ppBRMmDJdThXyCYp7BCEHPsElnwMKZKAvLH/IlSSLJJCNn79VfXGU00bsOLLm5CiACoEoY51gkhiJRugQxBy9AksCROv89TTChsElkMOOzkkA5kxPnSR5JAUEgS+HuSQDEQS9gc5JIUMgeX4x33OkSew5FnoWsghKVQIQj3qBJY8DG2YHJJChyA0YrJIBqIJ7YMsksIGga8IWSQDljwJAzCySAoJgpAjTZDtDRtDFkkhQ7C+gb7xRNUGPF98OJfIIilU4093nvBHKOX3EJXP+FohefkitA/ySAodgrApfQJL3nizxfNWK2wQrHMJbDx1tYFIXoccOyBBsD7933gCawOWXIdxoHyKliFD4LeFjJIBS27C5YtskkKFAHbqLueoE1jyOaRogG68mwCdp7Q2IMWrsCHkkhQ240+3n/DDP5n1nrsNckxQxBQ7IEGAb4XwviCnZCCS0DbIKilkCLAvJEeeIJLQNsgsKVQI8J4cN3NySwYiCQNnsksKHQJ/XHufIBJ/rtCU1wYbBC4HzXoNEMnLkGMHJAjckJXmvgaI5E3IcQAyBO6hDs2ADRDJu5CjACoE63v/RExgif96wkZTYRt0CNyQgmbDBogkbAvZJYUNAr9PyS4ZiOR9yLEDEgQhR5ogkg8hxwHIEIQceYJIvoYcBVAhCDnqBJF8CzkaoENgt77+yceWLJMBSx55V0QTZhtsEPg2Rp7JQCSvQo4dkCDAtvyHc6QJInkdchyADIHfH2SaDETyKeQogApByFEnsMS/ArjRTNoGHQJ3baHJtAEi8eMomk/bYIPAmVWaUhsgkrA/yDYpJAj8tvAPXhREEvYH2SaFDAH9apq6ogd3OEeewJInVyFHAVQIMGz4N+eoE0TyNuRogA6BG3rQZNsAkfg7YTTftsEGgd8fZJwMWPI09GPHDkgQrB/OIWKCSK5DjgOQIXA3aWn6bYBIwnlLtkmhQhBy1AksCact2SaFbjy25GfO0CeIIrR0ck0KGwRu3EDTcQNE8jTk2AEJAn9UyD0ZiCT0yOSdFDIE61sgRExgSXg6TbNzG1QIsC28R8k8GYjkYcjRAB2C04Mrflb0k+ToE0QSWjqZJ4UNAn9kyTwZiCRcXcg8KSQI/NWWzJOBSD6GHAcgQ+CPC5knA5GE3oPMk0KF4HT/25vruS11gki+hBwN0CFwD2doAm+ASMKZT95JYYPAbwt5JwOWhMEYWSeFZLwfA5FzMhBFGIuRc1LIEIRa5AkiuQk5CqBCgOsCt3SyTgYiCXuUrJNChyDUo09gSdgUck4Km/HuoQJN8A0QRRjNkXFSSBD4WrQ0QSShCyPjpJAhGDnecacs9cgTRBLaORknhQpBqEedIJLQG5NzUugQhBx9AkvCAIisk8JmvI1t7/KEn0VIp5BXW/glC5r/2yAhw/oaBs0ADggKq8UByDGH9F9knAx8LZQvgMD/wq2TTJNCi2tQRZvgM9yXNXSFJD/QXzOwgmYEB4jCOzyaEtxgh8AdL5oXHCCSlyFHAhwQuBEJTQ8OYMnrkCIDivF48Y9/h1a4jmVRvA0pKqBB4PolmikcIJIPIUc3kB/vs8DvDXJMBiLxPT1NGG6wQxBy7BNE8jXkSIADgpDjmMCSNyFFBhTjT3ef8/XmLr+JWrgCZVE8DCkqoEGAyZJ/5Vq0CSJ5HnJ0A3mO9CrOrkTEBJH4kSZNJm6wQxBy7BNE8jHkSIADgpDjmCCSm5AjAwoEIUeZIJIvIUcFNAhCjjaBJaGh791AHiXx7zbuvn2MqeNpKgEiF4UfadJs4wY7BDjfyGPSnOMAkbwPORLggMBvCbklA5b4F/s3mn/coEDg7mPQHOQAkbwKOSqgQbCOEhNNnUDsIgndT+oG8iyJBX5byC0ZiCS0MPJKCjsE6zfLiZggku8hRwIcEIR6HBNY4n+wv9H05AYFAstBs+QQMUEkoX2QV1JoEIR6tAkiCWft0Q3kYRILfA7ySwYi8f6QJiw32CEIOfYJIgl9KbklhQOCkOOYwJIPoSckt6RQIAg5ygSRhH1KbkmhQRBytAkiCW0sdwP5xNirDxe9GI2NDETiR2iJL6QCOwTu5dDEVwYFloTDwv2LwGF8qMUxQRRh3EFeSaFA4M98cksGIgm9B3klhQYBfvl+j3O0CSIJY5fSDeRLKixwD4lpnnOASELvQV5JYYfAPemj2c4BIglHltySwgGB36fklwxEEq5P5JYUCgTOL9PM5wCWxGpUQDN+/TguLZ8ginCu1G4g74K9Wl9p43t+NAc6QCTeEdE06AY7BH5vkF8yEEk438gtKRwQ+FEp+SUDkYTRC7klhQLB+noeERNEEloYuSWFBkHYljZBJOGEa92gnyHwOcgwGbDkUzgu5JcUdgj8eU+WyUAkYVBJjknhgCDU45ggknBdIMekUCAIOcoEloSGTqZJoRnvnD9NnA6AYvV3iW0TgU6Rvih4zghaPsHV4nTvR+Y3wB4zqGKfAMVfT75bP7bRNOoGR1Dws0JaPkEU/rjSXOoGBQK3P2k6dYBIHoccFdAgCDnaBJE8CTm6gRqj+OUYIiaIxJ8rNL+6wQ5ByLFPEMmbkCMBDgjclYWmWgeI5G3IkQEFglCPMkEk70OOCmgQhBxtgkg+hhzdQK1RnMuNiAks8c+zafJ1g914vzfINhmI4llIkQAHBKEWxwSRXIccGVAgcPfHaTJ2gEi+hhwV0CBw9z9pTnYAS76EFN1AndEX/00LWj5BFKGNkm1S2CHwe4Nsk4FI3oUcCXBAEHIcE/j1kPAsmmZpNygQhBxlAq/m61XIUQENgpCjTRDJo5CjG6gxIoG7rtC07QCSfPoc+h+yTQo7BL4eZJsMZDVhf5BtUjggcM/naAp3gEjCOUu2SaFA4FsY2SYDkYQmRrZJoUEQtqVNEMn3kKMbqDH6Gn0gTeoOYIkf5tOk7ga78biLepsz7BOgWK+RNLW7wREUco+TpncHuFoYnwEzg2yHraMAalDItZwmeQf4dSjfAMqHK1PuBmqJvl1cmcgwGYgk9D1kmBR2CEKOfQJLvoc+kByTwgFByHFMIEn4/RZN/G5QjLcM/+bpd5VcFGG8QIZJoUFAv66/0l/XEzFBJOF8Ld1ALBEL7OW1X8h50UTwAJGEqwoZJoUdAucTaDp4gEiehxwJcEDgz1cyTAYiCf05GSaFAsE6zR0RE0QSrtPkmBQaBP7IkmUyYEk4LLUbiCd6vYzi7vGEeXxQyTVBEdo5GSaFHQJ/rSfDZCCSm5AjAQ4I/JaQYTIQSegByTApFAj8tb6VCSx5FHpzMkwKDYJQjzZBJKE3b91ALBEL7Iog/RMZJgOWPA6HhQyTwg6BrwcZJgOWPAlnCxkmhQOCkOOYIJJwbMkwKRQIQo4yQSRhn5JjUmgQhBxtgkjCPmXHRKATybPgdO/J+0d2h4BmmQeIxD9loYnmDXYIXD1ornmASG5CjgQ4IAg5jgki+R5yZECBwJ0vNO88gCXPQooKaMa7voPmngeIIqboBmKKXj+Lo2uagx7AEn8jjGahN9iNX78UQ8sniOIqpEiAA4JQi2OCSB6HHBlQIAg5ygSRPA05KqBB4N4kppnpAVNy7wUeX200P73Cfo4SbaVkmQxEEo4LeSaFHQK/NWSaDETyPORIgAOCkOOYIJKXIUcGFAjWL5MSMUEkH0OOCmgQjP3xEW/j0NT1AJa8fB9ydAMxRixwvTpNYA9gSXh1hOawN9ghcM+8aRp7gEg+hRwJcEDgfipFk9kDWPL6SciRAQUCf1zINhmI5G3IUQENgpCjTWDJm5ijG4gxYsH6fSkiJojEe0maqsVgh8C3D7JNBiIJx5Zsk8IBgd8Wsk0GLAmbQq5JoRi/vkOXaJJxIhdFaKVHBTQIQi3aBJGE68LRDcQWscDnINNkwJKwQ8k0KezGr2/SJJoOnchFEc5Z8kwKBwShFscEkbwKOTKgQBBylAkieR1yVECDwL3ZmHObIJLrkKMblDMEvh5knAxEEo4sGSeFHYKQY58gknC1JuOkcECAHPc5xzGBJeGpE5sjhQKB739olG3AktD9cCvmz0FkocNlg9uGQIcAA/l/8yr6BJaENkyuSWEz3h80sk0GogiXczJNCgmCkCNNEEk4D8g0KWQI3As1mWyTgUi+hRwFUCEIOeoEkYQDT6ZJoUPgDxr5JgOW+JugmVwTg/yu4/WXcJ6QaVLYIXD3jjKZJgOWhN/7ZTJNCgcE7jMMmUyTgUjCppJpUigQuLshmUyTAU9RF7x5JtOk0CDw12kyTQYiCaMwMk0CYoveXMVnZ5lMk4FIwolApklhh8A9jcxkmgxEEsYLZJoUDgjCux1cy2ORhH6UTJNCgcDvDzJNBiIJFzcyTQoNAtw3lv3RJvgc/OH7sbgrlPN55vjnK76usKSQaTKIEqlJIdukoBLf1RYyTQoJAnfGFbJNBiL5EnIcgAyB664L2SYDkXwPOQqgQoAXr//LOeoEljx8HnI0QIcg1KNPEInvxQrZJoUNAp+DnJOBSD6EHDsgQRBypAkiuQk5DkCGIOTIE0QSjgsZJ4UKQchRJ7Dk0YuQowE6BCFHnyASP1wsZJsUNgh8DjJOBiIJ+5Rsk0KCIORIE0RyHXIcgAxByJEniCQcF7JNChWCkKNOYImfm3osboAOQcjRJ4jEW5JCtklhg8B9mbCQcTIQydOQYwckCNwNjULGyUAk4Zwj26SQIXAvxBQyTgYieRlyFECFwO8PMk4GIgnHlmyTQofAdduFjJOBSPxN+0K2SWGDwD2aKmScDFgSbt4Vsk0KCQK/LWScDEQSji3ZJoUMQciRJ4jkVchRABWCkKNOEMnbkKMBOgTrC1OJh52F/BMk4biQcVLYIPDXF/JOBiL5FHLsgASB3xYyTwYiCectWSeFDEHIkSew5Gk4b8k6KVQI7JzjYV8h82QgknBsyTopdAhwneNzjsyTgUjCcSHrpLBB4LeFzJOBSMJ1jqyTQoIg5EgTRBL6ZLJOChmCkCNPYMmzkKIAqvHYG7e5hfFG1EUReiAyTwodAuSQWvQJIvED+sLNWGCDwG8J10NBJGGPkn1SSBC4QXAh+2QgknClJPukkCFwtzML2ScDkXwLOQqgQuAelBWyTwYsCbuU3JNCNx57lH8MINvZF0UYN5B7Utgg8HuUDJSBSMJRIfukkCAIOdIElsRqHIBsPG51S4Y8QRThKknmSaFCEGpRJ4gknLFknhQ6BP7qRPbJQCRhNEfmSWGDwNeD7JMBS8JFgbyTQjIe85Xf5eOamFwUYYeSdVLIEPhxB5knA5GE40rWSaFCELakThBJOFPIOil0CEKOPkEkfo9Wsk4KGwQuRyXrZMCS1yHFDkjGn+6//vYGhpPO5kruCYonIcUByBCEWuQJInkfchRAhSDkqBNE8jHkaIAOwToxGBETWBJuLlcyTgobBL4eZJwMRHITcuyABEHIkSaI5GvIcQAyBCFHnsCSt+5VlEq+SaEaf7r/jqcFUEWdEBRWjQZQxVWoZzeQp0os8PUk32QgEt8/VXJNCjsEIcc+QSQvQo4EOCBYJ0EgYoJIwtlErkmhQGA/WeaPv1TyTQYkuQ7Nh0xT5QlQOcG7sLfIMil0CMKW9gkiCWcbWSaFDQL3xbpKlslAJM9Djh2QIAg50gSRhLONLJNChmCdW56ICSIJrZwsk0KFwO8PskwGLHkfeg6yTAodgpCjTxBJ2BayTAobBD4HWSYDkXwKOXZAgiDkSBNEEvYHWSaFDEHIkSew5EPo0MkyKVQIQo46gSXXIUUDdOP9TcjKFeiLwrvISoZJYYPAjQMrGSYDkbwMOXZAgsC5+0qGyUAk4YQkw6SQITjdv+abkD/yNYEMkwFLQuMgv8SgvcJHdLM/cfEKaMbjnUFRtAmsCC2HnJKAPE1aP+t9nz9GTIPhSn4JCv+cp5JRUtgh8AedrJKBSEI3TEZJ4YAg5DgmiCR0w2SUFAoEIUeZIJLQ+sgqKTQI3H30SmbJgCXhcVAt3UBexnvjHgdxV05myUAkoR5klRR2CPy2kIkwEEloOzQaVTggcM/uKw+vFFjyOWwLn2sCBYJQjzJBJG9DjgpoEIQcbYJIvoUc3UBex2OBe/ewkl0yYMkXP36vZJYUdgjc10kq2SUDkYTjQmZJ4YDAtw/ySwYi+RxyZECBwNmZSobJQCRhuEB2SaFB4D5hX8kwGbAkvEteWzfQh0pfH4VvX1UyTAYi8W+5VbJLCjsE/tiSYzJgSTi05JcUDuPXgU/i55WVXBMU4ciSXVIoEIRalAkiiVtSAQ0Cd/uykmEyEEk4sr0rNH1e9C3+/qORYTIQiT+yjeySwg6B25ZGjslAJF9DjgQ4IHBvyjWyTAYi+R5yZECB4HT/iuds4AfBjSyTAUu+vwo5KqBBELalTRDJm5CjG8jreCzwOcgyGYjE90CNDJPCDoF7qN3IMhmI5H3IkQAHBKEexwSRhGNLhkmhQBBylAkiCceFLJNCgyDkaBNIEnxT27qBmKLVNv3zdz7jGpOLwvcdjRyTwg6BrwU5JgORPA05EuCAIOQ4JogktDByTAoFgpCjTBBJaB3kmxQaBO5dgra3CSIJrWPvBukMgXsvrJFtMhCJvyHcyDQp7BC4rxs1sk0GIvkYciTAAYHfH2SbDFjyMKTIAjJCehtmEGjkmBQqBGENdYJInoQcDdAhCDn6BJGE1kOOSWGDwOcgx2Qgkuchxw5IELjH5o0ck4FI3oUcByBDEOqRJ4jkJuQogApByFEnsORxSNEA3fj1Wp74jZ129EURzmlyTAobBO5RQCPHZCCS0P7IMSkkCPwUK43XkKYkNA4yTArZ+NW8JX53qJFpgiI0YTJMChUCvz/JNBmIJPTV5JkUOgTORDayTQYiCddhck0KGwS+HuSbDFgSvtrYyDUpJAhCjjSBJc9CigOQjff9CrkmA1GEs548k0KFINSiThBJOCrkmRQ6BCFHnyASf4OhkWdS2CDwbZRckwFLwtcSG3kmhQSBrwe5JgORhEZKnkkhQ+B7DnJNBiIJLYw8k0KFIOSoE1gSHq80vlALdAjCtvQJIvG+ufEJKbBB4HPwGacgkpchxw5IEDhP08g1GYgkXIfJMylkCEI98gSRhJ6UPJNChQBtnX/ZJbWsi+RbyNEAHYJQjz5BJGGURp5JYYPA5yDXZMCSl+HKQp5JIUHgvgzayDYZsCR8bLWRa1LIEIR65AkiifUogApByFEnsORNrEcDdAjcPZHGvklBJH6fdnJNChsErh6dfJMBS96GFDsgGY/W8Su3jsTkongaUhyADEGoRZ4gkuchRwFUCNze6OSaDETyKuRogA5BqEefIBLvrTp5JoUNAp+DXJOBSN6HHDsgQXD6zyOeiY5baSfXZMASP935WHwAMgSjHmxM+NWQTq7JQCRPQo4CqBC4OzOdXJOBSELzIM+k0CE4/X7zli65f9ziHH2CSML+INeksEHg9yn5JgOR3IQcOyBBEHKkCSz58C7kOAAZgvUN2MTvPvc9T8l1SFEA1XjUgn+b0YRcFA9DigboEIQt6RNY8jG0dPJMChsEbp6aTq7JQCThyJJnUkgQ+HqQazIQSdij5JkUMgRhf1RmF8nHkKMAKgShHnWCSD6FHA3QITg9ePtxtnQyTgYsCd8W6mScFDYIfD3IOBmIJDQPMk4KCYKQI01gSZiqsJNxUsgQhBx5gkjCGUfGSaFCEHLUCSIJx4Wck0KHAI/v/+AcfYJI/N2/TtZJYYPA14Osk4FIvoYcOyBBEHKkCSyJ1TgA2Xh317+TdTJgxZdw1pJ1UqgQhFrUCSz5+iHkaIAOAa5x3ErJOhmIJLQwsk4KGwS+HmSdDFjyLaTYAcl4jLHZF9NIr5N7giKcK+ScFDIE7pWwTtbJQCSh/yHrpFAhcHdkO1knA5Z8D+dKaYAOAX4XwVdJsk4GJAlzvXZyTgqb8fhqJt0H7WScDFjxLKbYAQkCf0zIOBmwJHzSsJNxUsgQhBx5gkhCMyfjpFAhCDnqBJaEA0u+SaEbbxlu8bNPGuL32qciWOtOtklhg8DXgmyTgUhC2yBDopAgCDnSBJGE/otsk0KGIOTIE1jyPuwOvpgLVAhCjjqBJeHA8rkk0I0//Xr9bT6877yv+qIIV1kWCGwQ+FqQaTIQSRg/kWlSSBC41+w6mSYDloQdSp5JIRtvT3L4W3GdLJOBKK5CigKoEJx+/ciTVUhPTJbJgCWfYo4G6BCELekTROLGT/t5WCaDDYJxVF491y+XEzGBJf46PRbvgATB6debZ3SAtyNxkjSBNf5Rzlh8ADIE66ElYgJJ3l+FFAVQjT/dvrm+mQ2Mt6J6xfKhpbG8AXpQ8KNkWj7B1UL57Wxg/DNfzW0D7BCsv+sgYoJIXoccCXBAcPrtOX9vgh5aETHBSd5jY7cMKFHCl2EiJogkHLetAhoEYWvaBJG8Dzm6gTxRer8+IPnhPycmJojkxufYN8AOAeohOfYJLHkYGvKeAAcEvg3uxwSWPHoccmRAgWC9jBIxQSRhn+4V0CBYJ68iYgJL/A37sbgbyBOl9+sNe+pgiJggkk8+R9oAOwTr23hETGDJk7A/UgIcEPh9mo4JInkXcmRAgeD0X/lPWnsqE0TyNeSogAZBqEebwJKn4axL3UC+AMGC9QEGERNY8jzkODbADsHaaRMxQSRvQ44EOCAY5+3br/rBUyImsORFrEcGFAj8/jjKBJGE8/aogAZByNEmsORV6LSPbiDfgGDB6cdr/n7YL9wH5fMEkYT2kTfADsH6SygiJrAk7I6cBORVp/evQy3zAcgQ+C3NeQJL/Ot6Y3EBVAjWx8BETGDJ23DtyA3QIQj16BNEElpPOQM2CHyOsk0QSegZyg5IEJxuX/NP4W7zGVnSBJa8i/U4ABmC9TP9RExgyftw5EsBVAjCttQJLLkOx7Y0QIfgdPf51TWu+aVPEEno5eoZsEGwvkRCxASRhGNbd0CCwE3LS8wE1oQ2Vg9ANn6dbyfRj/yJXBQxRQFUCPwurXUCSz6FjqE2QIcg5OgTWHITLujtDNgggKPli0/bJrDkSzi0bQckCHw9WppAkg+xGgcgG49hBT+z7lw4L4pwKW4FUCHAlvCJ3+oEkYTG0RqgQwA/+hPn6BP4JwBXYXjTz4ANAr83eICsIJKXIccOSBCsd9KJmCCScNL2A5AhCPXIE1ji3/AYiwugQoAv/XOX3+sEljyJ29IAHYL1uSQRE0TirxsbWSeFDQK3LRtZJwORfAw5dkCCIORIE1jy7G3IcQAyBO7ispFzMmDJ82chRwFUCE6/v+P/6G1LIiawxH+9bixugA7B+lySiAki8cd2I/OksEFwevCUr3X36czfyD4Z+Bz8mb2xeAekmWP5Eh8RE1jyMhwXMk8KGYL1LQ8iJrDEfyNtLC6ACoH9/Ide8ydiAkvehBQN0I3HIJx/Mtq5jn1RhD1KxklhgwCX2l9OTEwQybuQYwckCNZ6EDFBJGFvkHFSyBC4y+RG1slAJDchRwFUCHA3/hbnqBNYEk4W8k0K3Xj8QOgX3qNcgb4oQjsn26SwQeDPWTJOBiIJ5xvZJoUEwfq+ChET5GddD0OOA5AhcH3YRsbJQCShdZBtUqgQrPewiZggktA6yDYpdAjC/ugTWHIdcpBtUtgg8DnIOBmw5FM4Wcg2KSQI0NL/wTnSBJaEBkauiUCvGn52hcFkQIEAM8Jz70SeyUAk4ciTZ1JoEKAN/8g52gSWfAkpuoGYouvl/aDf+dkFXR03sk1Q+Ht/GzkmhR0Cf9zJMRmIJBwz8k0KBwT+mJFtMmDJt7DDyTQpFAhOd+UJ/z+4n81lAkk+htORPJNCM96NSjYyTQaiCGdB7gbyU6aP6xvHt7l/I9NkIJLnPgdZJoUdgvUdfyImiORDyJEABwTOzG5kmgxEEq5cZJkUCgS+VyDTZCCS0FeTZVJoEJx+fc2ToMs+JdNkIJLPIUc3qGcI0M45B5kmA5F89znIMinsEJz+uLq5Rj3INBmw5GFoHuSYFA4IfCsl02QgknDek2dSKBCEHGWCSN6HHBXQIPBnHLkmA5Y8Cim6gfyS6eOjOM4jz2QginDek2NS2CHwZwt5JgORhHEvOSaFAwJ3G2sj02QgknAZJs+kUCAI21ImiCT0P+SZFBoE6zwiREwQSThbWjfoZwjcbc6NXJMBS7z/38gyKezGu8cGG3kmAyhkn1uOBDiCQo8Kj/MUoLj7HN88HcszoASF5SgToPjjBV4ZH8sroAWF5WgTRBEaae8K+/kMgTuyO3kmA5H4vnQnx6SwQ+DGijt5JgOWPAkpEuAwfn2jj5ZPEMXTkCIDCgRoG79wjjJBJHFLKqBB4MZ5OzkmA5G8CDm6gfyMiQXr+8BETBCJb+c7+SWFHYL1N45ETGDJs5AiAQ7jsTfk/lJlclFchRQZUCA4/fqMnxv9cotrUSaIJG5JBTQI8GlXbl9kmAxE8iXk6AbyRIkF62/6iJggEn9t2skvKewQuGvCTo7JgCXPw5Elv6RwQODc7k6OyUAkr0KODCgQhHqUCSJ5G3JUQINg/a0lERNEchNydAN5osQCd1XYyTMZsCTsDjJMCrvx1PvwKcMf0qGOZyfbBMXjkCIBDgjWdzeImCCS0NDJLykUCPweJcdkIJLXIUcFNAhCjjZBJG9Cjm5wnCHwOcgxGbDk5bXPQX5JYYcg5NgnsCQ0MLJLBDom8XOXD+YAZAjCGvIEkcRaFkCFwF1Dd3JMBiIJ/QL5JYUOQahHn8CScNDIMBHI/c+Pr0PbIruksEPg10B2yUAkoYmTXVI4IMA9Ze6HyS4ZiCRWMwMKBKEeZYJIvoUcFdAgcC5hJ8NkwJLQPMkvCagjWlrnf/7gs1XIRRGuB2SXFHYI3P2cneySgUhehhwJcEAQchwTRBL6P7JLCgUCd49sJ7tkIJL3IUcFNAiGV3ljszERMUEkH0KObqCG6M2HeGTJLhmIJJwHZJcUdgj8tpBdMmBJ2B3klhQO49ffDNLyCaIIvQKZJYUCQdiSMkEkoeMhs6TQIPBjFjJLBiIJR6V2AzVEcX50IiaIxL8+sJNdUtghCDn2CSIJ5xvZJYUDgpDjmMCSdyFFBhTj0c7pNyqFh9TkmKAIVzYySwoNgtMf755RR/an1KJNEEk4Kq0bqB16dzHeILNkIJLQzsktKewQhBz7BJGE8Qa5JYUDgvVr8URMEEk4KuSWFAoEoR5lAkveh6sCD3oFGgQhR5sgktCjc0dJkNQQvY89eqJjayASf94nsksKOwQhxz6BJR9CigQ4jMerWPe4hXH+YyquQ4YsoG3H2NP9W7z+AqjG43wWRZ3gM/z+K/MN0GMGVfQJIQPdg0tkkhS2iwyi2Cb4DPTt/7F0B6SYQRVpgij8nftEHkkhQzDOw2v4/UQuyUAkb0OOAqgQoD+QetQJIgmHizySQofA3aNL5JIMROJ7x0QeSWGDwN27SOSSDFgSmi5ZJIVkvPv9TDkLuSgehxQHIEPgWz95JAORPAs5CqBCEHLUCSL5FnI0QIcA/oOPCnkkA5b4m6+JDJLCZnzYG4nJRfEqpNgBCQK/JSlNEEnoDMghKWQI3AtviTySAUtuQooCqMa7MWYih2QgiquQogE6BGFL+gSR+FtBifyRwgaBz0EOyUAkYY+SP1JIELi7t4l8koFIwtlGJkkhQxDqkSeIJJwqZJIUKgS458lnG5kkA5Z8DimagI6FvwS2G8iTo49f/Hamwt0/WSUoQu9GFklhh8Dc3F/kwRNZJANXC54WZyxNgCPWYlUciyKczWSQFAoEvv2SQTIQyfuQowIaBP6IkUEyEEnY3bkbqAnir3q5/pEskgFLvoa+niySwg6BP5PIIhmIJBxYskgKBwR+W8giGbDk2+uQIwMKBO6NhkQWyUAk4Swgi6TQIDj98Y0ngfrlX5yjTWDJ91iPbqAm6Pvr4KITWSQDnsw6dCzkkBR2408PrvhLw/yDgcJjGXJJULwMKRLggMC9I5LIIhmIJGxJzYACgT8qZJEMRBJaB1kkhQZByNEmiCT09rUbtDMEPgdZJAOWPPSeL5FFUtghCDn2CSIJ13GySAoHBCHHMUEkT0OODCgQhBxlgkhC70EmSaFBEHK0CSJ5F3J0g36GwOcgk2QgknDWkklS2CFwP7FIZJIMRPI95EiAA4JQj2MCS/yENWNxBhQIQo4yQSRhbEQmSaFBcLr79vHsCckkGbDkcWgfbJIIDrFBLBjnLX/dm3+2cpBJMhCJP7YHmRiFHQJ33h403jQQyfOQIwEOCEKOYwJLnoQUGVCMX2edTDRxE5GL4nFIUQENAndUDjJLBiJ5E3J0A3l09Gmdj/gPcX2V2UXiW/pBbklhh2D9FSsRE0TyKeRIgAMCjDzucY5jAkuevgg5MqBA4PcHOSYDloTGsVVAM97e4njwD87QJkCx/pDs2LqBPDtaFHI3+yC/ZOBqYfwGUN73tQe5JYUEgd9SsksGIglHjeySQoYg5MgTRHITchRAhSDkqBNYEk4lcksEm25q+NXMsXeDNAX+VCO3ZCASf3k7yCwp7BCEHPsEkVyHHAlwQBByHBNYEtoneSWFYrw9duQfFhc+U8kyQfE0pKiABoHf4alNEElo46kbyFMjFqAeZFIPsksGIvGG6CCzpLBD4OtBdslAJKHrIbOkcEAQchwTRBIaMZklhQJByFEmiORzyFEBDQL3m7uDTJMBS+Lu6AZiilbD/YAeoB7kmAxEEdo5OSaFHQLkuMutg1ewL5LQRskVKRwQ4BYe7w3yTAYiCR0xeSaFAoFv5+SZDFjyOrRS8kwKDQJ/VMgzGYjka8jRDcQVscDnIM9kIBI/5DjIMynsEPj9QZ7JgCVvQv9EnknhgACtg34GUvjaSMYJkliPDCgQhG0pE1jyNqSogGa8vy3EF2CyTVDELekG6onePo+1IMdkwJJwupFjUtiNRxvlhxB8ja/7oghtgxyTwgFBqMUxQSShByPHpFAgWD/fQcQEkYRrAjkmhQZBqEebwJL3oUOv3UA90fv1ce5t3h+J2UUSekFyTAo7BL4e5JgMRPI95EiAA4KQ45jAkg/h0JJjUigQhBxlAktC90OGiUB+uPMpvF19kFlS6BC4W+dH6xNEEvpqMksKGwTIwUee7JKBSL6EHDsgQeAHaGSXDFjyMaQ4ANn4cDYKuSjC4J2skkKFwP2O8iCzZCCScB6QVVLoEDh7eLBZUhCJv42RySopbBCcHrx4yL9Wodt1mcySgUi+hBw7IEHg2k4ms2TAkk8hxQHIxrvXpzN5JQNRPA4pCqBCEGpRJ4jkScjRAB2CkKNPEEnYo3Q5UNggcHYoU19tIJLrkGMHJAh8PahnMRDJx5DjAGQI3CPSTGbJQCThsJBVUqgQuCtoJrdkwJKb5yFHA3QIwrb0CSLxo6NMZklhg8DnIL9kIJI3IccOSBC4q0Ymv2Qgkg8hxwHIEIR65Aks+Ry3pQAqBOjD/s29Bxevi+Qm5GiADkGoR5/Aki/huJBjUtgg8DnIMxmIJOwPckwKCYJ1dETEBJZ8fRZyHIAMwenBFWYFI2KCSN6FHAVQITg9ePfJPjdJxASWfAspGqAbj77075yhTxCFv6ucyTEpbBD4PUqeyUAkn0OOHZAg8D0heSYDloQv6mRyTAoZArT0HzhHnkCSm4ehhZFjUqgQhG2pE1jy+EXI0QAdgtMPz/jLyrotfYJIwraQZ1LYIPD7g1yTAUtCAyPLpJCMx3RI3DbIMxlAIeuwHAcgB8XpLu8N8kwGrhbGF0Dg70sdKqDFNaiiTRBFaH9klwTEELHg9Ocz/p7BH3+dmJjAEu9kM7klAhkt3IQXGDM5JYUEgftyQyavZMCSNw9DjgOQIcA15VfOkScMySxtKYrA5sjT+bxz6Qrg/bTOsEySWChxoW4g1scXSheFMhUiK6Qg3xb5tBbKF4U6F0qA43JNPRbaNi6UAeWi0JDEQrxNZG8UZEd8XAtdbNN2cKFu0C4eAZMkFuIdQQZGgXfE1fIGL0liocqFEuC4XFO9KNS4UAb8/+yIdlGIdzk5E4XLFrFd7PKdd3nrBv2yRewXu3znNZHxUNgvdvl+saZ05kIJwDvi+/M50whJYiE+TmQuFHhH8O07vU9DkliIjxO5CQXeEev78SSJhWSbukKRRyov1laeLrYpU9vjd8UU9ou9ly/aXj64UAJcnhr5Ypty5UIZcNki8kUzKhsXqoAWX18miS+0HTsX6gbyJGQ9TiSJhXhH0DBfgXfEzeLNSRILZS6UAEc8n0gSCuUzF8qAYj9vtisISWIh3hE0cldol4UudoQcp60b7BenxnZxnLbM20RjcwXeEY+frIXiNu3clxcajCtctIj9oi8/+HQvNPomOPzF4/TDz8wWAA9b1plqSJF0fdUUa4ZbnKEBejw6P/AtQbIIZe+mWDPQULLQsFuBhyzrpPf8tR7ZBhp6i2LNcI8z7AryLubK32c+CWzyHZWV/5X5A5DjpesHvpXHuyhlU6wZ/sUZCkCGf+vkMkMSyvzOZZpAinvlD2a7wXHxmwJSJNnpNMIWxZqBblUUGlkzxH32H2Z3gHzT97X/2GCSQ0ZDa1GsGf7LGQ5AtrerkOG/lIEPKg2sy0Xr+x9nKAJpNq3TD49f26h3cFWg7XkKnmG2ksE1BRkyq+L5uyVFV9i2KVgeURYaTxPIt1xWAc8POrhNQOcH9Yp/smJXkCGzU/CvbwuNpxX41H21fJFKFceEmIPfayo0nlYocSZTVZQJFzmkphUgw+blbJUn7Xya0cC6XG7t3TucowtIJ+kE/AO5QkNqhW1+QcdLtgkXSbimNLAm2OQtb6/4kxUJcMRtIUWSfoFG16JwOfhhVqFxtYIMHJa+RxVlQszBN0gLja4VLvbpb/ywivsfehwhCpfjgaylK+R8IeCdTg8iCLaSL5opP4wvNPRW2GM3SookPRw9jxCFz8FdEo3EFeRS+/0UFceEmINfaCw0MGeQFxpN8eYFzjh6FCGwbix+iTS4KrD216cfPuP14EE2ga2Fi9KPP3AdukDeQ8/Ib+YVegZBsM0WrDRf0mjsTlBiYb5c0cMHBe4418mmfuTLFV8naCwvijUDH2x69EDQwsXqRz7SLQNKvKCSIsl1phVTrBl+4QxVYYsX3B+5pdBzB4V+sQXSUjhDN8WagS+49NRBYbvIwC/K8MWNxv6iWDPw6U3PHBQSOjPLIB1RZ9IUawa+aNMjB4Uc3cWPfNHmayO5ghIv+z/yRZueOCjUiw/uqqROCCn4dOhNYDZ1ZflUYJ/A8/XEffDvQVd60qCwXQwahiSU+YvL7AJpNp7Tj1e4NTG4BOBT+CG/AikSuUxUerRgsCTBJ6bG8iwg7zWbAD9WGFwRyPuaAa8CDK4CuFN8yG9AisSq0SbMJE/wfaixvAss5+npx+evZjXoyYLChg/eiEIueJXMhsHM8Q5f0BzLd0CCkRGFPEWr5D0MZo5rfPZmLD8UzusOm58eHGQGFJwxopDvIVd6smAwc9w8W3JUgOxTvi0mEt2n9GjBYEny/PFM0g3Erjx8dXMyiTwnq/RswcC3QX7hvJJvYUg59GD08YNB7YCLHpI/j8DjzkrOQhRrhtuc4QDkiwz8LPngwtkUawbZhqIQ8//CbAW0i/y/cH5eeTPFmuEeZ+gG8p7V2vv8xD0gjXsrjYBFsWagIVClgZbCflGH+5yhMGmKNQO3bRpWEGwpXAZ++pXpQ+AInc9PvzGbAeWi8xmSUIabKF0WFC7uoZEi8VC8pmaKNcOfnKEbHJe7jcds3Hip567R1fzEnSYZGoWL24w/8QOjg9Pvplgz8OnMTUfguOj2VXJMCCm4F+ZjKyC3WV7P59WkSOwqKh/AIx6c/3GGKlDnuf7T1SvYlso7coDcBTPB29n1yVaOUfixCq5nb8E1EOC+8euj65NJZDBXydkYzCTPr2Y1yNQQlNkTDMGT6ylIAnJvxgTXs55kaRSyVIM6VpHID20reRqDmeTd+08zSRFYnO7pp/dzxFjJ0ii02ZpFQkcklNLDSE5GoS2K67licjEEMiGICpZnIZU8DMEcHtgNI741UcnGKMg459XJKRLby0o2RhQuB49mKzkYhYyfWXpFnhBz0FQcY3kR0Kk4vIIbAzkYhRZreptPbm4MZGPqYmPsqQxfGcjBCFQ8UVkViT1wJTMjCpeDf7ZaycIo8An+cHn28zuP67g1kY+pi49RxR93OUcCHLEef7Al4+ZWD1O4HHJy1Azgc/wV//7CS8qEmOS/UpEKaPHQqaJN8B0F/zKr1i4QrcrPNJSv5GQU+CS/Wu7fqWKbEDLw+snJEJTQV/7MB4NcjMIR++uf5WAUJk2xZuCTm5yMwoWd+Zl/RcenbSum0MLLN8FqqwLbFgUy0K5kZhR6nBD5R36bOAtpCpeDP4hZyc4obPIM4ekpSrYJMQnfk6jkaBT4dH/Iczx6SZoQk/ANhUqmhiCn2TR/fnE1B9fkaRR4nz7m39Gx4nSfr5LkagxmjnfPZsdNpkaBW+bjd/zMhCU6diZzYzCT3LyfvR8ZHIYmT0N4DCMKGdU2sjcGvnnc+oH5DXDxjOgWvz2WOf1uijXDT5whAS6aKCkS34pq5HdavD186xZnyALyZeqVvs10EVhuECp9h+kKaLGB32K/XnjzminWDLKPuoH+qOSFfwc98c2wRj5HFGsGulncyOAQpLh9D5jdFeId/Ft/Mp0AF48VhiIU+R8XyYASH1/c4pO6cL5iCi387Bum3WlkZAjWC8Gt1/hm5eAaoOMbDKKQi2vb+oQlB2an2xu5GAXpH/m3lSKRz+c1MjIGM8knfKBsLN8V4v7jb8g08jEENRyav//K7CHQ4k10OT/IwjAEF8Of9m9kYBRq9Ai3+ewonL6aYs3AbZssDMG2xfswt//OfDdI54s1sFejYUUjH9Oij+HPwTayMAxb3AQ+RuRfCLZ0DgNh/o12IxOjcFxUgG8E0dClkZlpsXnf/o0zZEC5yPAbZ6hMmmLN8C/OUAEXvoYUiW/ettRMsWbgw5i6QLxVdZtPT7IzCpc3eoYklOGTlgyMQrqoE1/SKidMplgz/IczHICLp1q3+QkPjbIa2Zg2n8+cbj/BlHVjeRFYm8/p9mtM5jXIKlDKHAHfnpMADq4B+DT+wi/mikQuNI28jMGaZJ7H5GMI1gvv7Xf4/dTgNoHeFsE1fh88uB2QcKtIFFoLGpoaLDmevJo5DoEeeRkPNhpUEhzbsjtvXs7dSYMlgnUQLlOzmaAqnOPF5s5dXkMT2KKpv3Of6W6gbzStDW1IQhnebL46CVxcge/wCUgD6caXoDhIvMObzX39gHg3+g43ZO6haG7Qcw/9xx2+/HD/MqDNy8Cdq7d4Ptf49Beo64sGD+3+XOPTW2HNMdsgn74C3AZ5ZiRRnO7KNvQJa455FeDTTWBb6/HCHgM2Pp0U1hzvZo4dwI3wOU86JBK5+dZ4ZyusST7OJIfActuHBJ+mIAtsadmUJw9nMyTLQrBtexDIh34bORYF7hC/0UYuilSkEs0ULgc/0GxkXATk3ak1BykSPyRqZF7aeuxFwZ+ra+RbFPaY4w9+uYA3hTyMKFwO/gx9I/eicMQcf/KU1HxSkYVpy011U3AH3jKgXOTgh/G8s1oxheZ4cT2HM60CeJ++pA5IFPJ599bahJnj9c2XmaMLbOflsemdN0tLJwOjIC7mLb1wL5LTPd4hZGAM1iRzaEYGhmA7rw35Zl1NAvBO5S+cikJPazIxBv60/4WH7WRfFErsdn7hYTu3LvIwrYeOhe91NzIvBNseV8ADj94ElkauNJ+s7Fro2cwWk9OQoJNlUdjiqP4XHhJQ0+7kXHq0DTyu7GRZCLYtVu8PppNAjbV7wOwhcMwO7Zf5xYxBZYHFmYnqH79y8QKosfb/YNveeNOqKdYMv3GGJrDNQd/pH1eYDWVw3UBMC3epopAutZNfMVhyTF/fybYo8On98vPJFHKMO7kWg5nj/byudzIuBFscnfIkAZ0eyijk+F7lXe5BGq8/m2LNcJszFIHtiA/5+HWITj6GYEuxJd29z3wDXLwgdZfv8zfevm6KNQMfC/IvCht29d1312S67vIAl7q3Th6mx5d95FCQeSGQ+VNW+j9MJ8DFG3Z3eaRIvWPfD1OsGf7HGTLg4nW7u2wIm5Cm0MLLk8tOLoZgvSMn01+YoAE6etB1goxORsZg5uA57DQHGRmGc1kVbxbFJrAeT/d5+U6WhmFbbq7cfYHfHA0yAeQlVv7hsEhksNDJ0BjMJPwFEEuSBcZBm+ePHHZTFIHlsJ7uLs61k6dRaPN2lEikH+xkagz8keWrRSdnQ7Dl2Px5is1OtkbhoqO8x5d5uip2emLT46D13i+cYQekeDPhHj+Mo6tmJ6fTo9Ohb2GPpYfCHh+U3eO+liyOQonfkbvHl2+66vajmGLNwP3xUQVk0rCV/pPpBrh4o+IeP9aiK3c/uinWDHTDrpPB6fwWWtzCv5jeABfvlN/jB06dE+ym0MLr6UPWhmBbOrqheDf7dPI3BOuxxht9f+d6ZECJP+5XRZlwkYM7RLI3CtwoXy0/plFFmxBzyNlDHkdAjM735b63KOimn8FFDt6n5HkUdvsJ76pI/P5KJ+PTy8X+4LvbnayPwsXdC7m73bn4YQqXg2/PdTJAChfvbMunMDqvoJjC5eDbPJ3cj8LFPlVFmxBzyICldIN68eEGUZD7MYg55GJH7kfh4qG2XOxoSNjJAvV6sU/551idzI/CxT69z+aDho29HqbwObhHqBlQ4vdb7/MDIBpY9lpM4XPItlSBbVse7pmCh1k0QlXo8Q7LfR5mdc7RTeFz8D7lgZjAxatU9/nmLw1kO49Slnsb63daOw8gGl3eL/cp/9Sp8wBB4GKf/iFtvTNpCpfjAZ9RfAUXuLjPRorE7zJ17u7bxT5lq965J+ffxveLbWG71rknFug2RfGqGGvhXdFNoTmevH+Efoz7wgFbXt4dvfcCP74a5CawLW8IDsXSW/J5Sx7oWM+XF2+XHEmgt6V5vMCXPwd3CIyVLCm+PZrXZ27IArxLv77mbxexRO4pdW6nCkuSx0uSCmiShG/6sMSStAn+8iKnHB/8Aeksz3HWy8t92ek7k6ZYM5BZO4+DYnBx4rOC3kkj0hRrhp85QwLIBGnLNxdYQa+sEWmKNcMtzpAF9JPJK/935gvg4m46K6pkqKZYM9zmDE1gW+52Kn+X+S6wXbyzSB9pT+ftLHDUMIygHmcwm8BWo2emd6IHtQvUPQxSuLM5bwngfjr16QTFMSFk+BfzGXBxirOi8u7biinWDL9zhgq4eBrGinoW0hRrhgecoQtsNb5/yy91n/ezwFZyGEnRo89BbQI1x+L/ZXpXiAfwL2aTwHaxh//H9AG4uKXOisotZM+m0MJXz809jOUFUPFbNVHIK/hj+YQlB+aMH8sbgDvJN/LolyXsnImYsCTBDFfpnM4CW5tPZkjxYio2AJ/UX/ndmfvznicRE5Yk149mkgSQF1LfnUxhOY7/j64362ojWdq2/wvHm7WoUkml8plH2m1jexvs3t1rPQcMQhIakcAY3j//5X1FTpXq7yQUlZMix8jxjkRSGpOb25TG0Eh+NfJskudlFAmFumISZUEMus95JJIlkks6jqSz7GL0hyBH55TqoEskT2QTE2lOIql6iWxiIk2VSEokHVs699pI1ablwNHZ5iZVTTOIhFK1fyGEb0VNk0iWRtzEc+5DI1VbZSWSjJo6z5GRKr+ZdfYwyeRoI7FbQ7QNCxIEGSeSEnlcPqREukA8jjJYXRbEnlA4j0RSIs9x3e7cKyP54BkMN5kgw9qI69xtGUKvLJznIBIr1fXTURmkSaQ/RHx5jf8wErvvkltcNlVKRkchRJ4CqnTYRnJwOZUQLWpkOA4h8hRQhMMuEFsdzS4LmC7nnkiRwkf8q0gODoUI0VbmGULkKdDdRgMjw2Kc/YIiGjVGRmUJfMN3aKQaZ83uSz52jUaRtPE0z0L4yh61iWRpRPsDzn0ciXX3tSViFgiozFGXSErk6jI13fbESN6kvkye0lDdVpHUdjVJTcqC+Oy2dSIpkUXWD9uBkWqUTWi/JMNjzrOJZGi6XxBxFsQPs+0wkX6pf2X20Y4iOdg0JkTL/KNtQwgfeXqZBq52bMTbrPMhltH2pvPsjHhrqT7EbjGLIcYnRuqTtLHuQjynMh1XRqp8BfB1P52kELWRqsvWbl+T1SXnOYgk2pjxIcyGjHNPJKXxOE1DznhoxElaTPe+0XzGo0jashcRomW2Nm5DiDwF+ul4HEl3kMJ7UkDALoTIU2DS251EcrC+JETLfK+rQog8BSa9XW3Ew7bl/oyI3cBIVd6Ut5G7a4zkj9+8PwNFNzTSFsPpNxplN4rkYM7+zRqleYYQeQrMSLtxJIdFyIyU6Sqrn64sQm0OVlr2eHKwxUkIvbiQZwiRp3BBCrWRYdHxvv2F78BIfVIXQ+m3v/FvjHTZod+3y/hM1vkNjdTZKPXt8vE6BRgZGWVXjL9NdlkKbSS2f6STGAvBHoPcE0lpzOJNEOfeBWInQkvWHxbEhqBKiiuQLJF4CODcKyN1tkJRiG0KURupsxWICxFNVTnPgZE6n/l8W+5uUojGiCuTrEB2D5kcw0hsZb5VpVsQdsPkkUi/2v77Gv82koOl0H+t91NY4xAiT+ErKXSBHEILuBD9KN81HFRa/XhysA4nhB7myDOEyFPgT7UEEhmXvvQFLX5ExoXA1ki08BEpeyKm2CstekS8KXbvdZdmpJUWPZ4YAMNEqyILYuuaSqueQFIim1mWSGekzl90f39cx3G70spHpDo4cEPtV1ryiFQnpfdbvOtIDt43EaKlDAeDECJPgUxosePJsGwahGhr8wwh8hSoZ611REbFqHn+Ed/WSDmgn/+J7zgSuy2dYQ4RoqUetcypSnACbs9XWt+IlFfWz8/wrSKpS4wUQrS0BC1yqvKJzjnjhBY2nhxuV7LVSCPR6qYqX+igvCutbaommojL/em8zSiStoQ/IERLG2vaECJPgTG9GUdysPlLiJaG2HQhRJ6CdioqLWc8qUrNRIh2YJ4hRJ4CmkErGk8GB+3ob1Ig8iCE8JEv07qp0lqmwshmNiE7zybKlVYznthYyGzbghz9TXPUciaQLJHH7G9aI946vQ8xXT+lEGMjdTapO59dZgE6I9lLBhcgG9a1oPEkPQe1ELYqqLSkCSSlMb/J0qgjSfcELURIY5BIlsY6S6Mx4i2DxxCzFGJoJD+x9NYHQ4iREW99MIbYpBBtJH0Thhv/skoeiWSJxFtJzr0z4o2rhRDP6W+0whEZZdfNzh+z3Gpx40kdbVtZCD9ma20TSErjeZn9ySCSZG/HB+HRvjwSyRJJ+zeV1jYVyAPlTPPCUhhFcjCXJETLoK4FTtUWff7iAymMIzk45yVEy6CvNU7VFn1eQA+DSosbTw6m44RoUQta4Ry8GmcDotLSRqQqH+cC8lBpSVOBf1zOKQBOr8aNkfrgOossSzivYSSjclgjRDswzxAiT4HhX8uZijOecgeWU6JKyxlPDi7E2DkSyk1rmqpc0wCsXWk5U4F8XN6eumBw12JGpHz2D6BopfWMiAcUzf2Zpmg9I3Kg+zD6VWk9U3VNMPrlvS6nabzUisaTUbJUY0FszVRpRRNIlsgijZda0XiSvc+xIH4g0qImkCyR5SQl0hnxBmBiiLhvUGtZI+JmbV0WYrVMISojdX64eJFu1zrP2ohHJA0hfj2kEAMjTXan1ey7hACNEW/fxYe4zf9kGAmF+jKd9Q3EyyORlMh0mSXSRmJba9gityBWM7WWOIGkRGaXlymRzkib1/8svvUf1FrgiGQ9NEANswyqtcgRcfOCgxCfkEKLHE/QQoubh6MyyCCRMpHPlIdWOZ4MDxLxQYaJpEQAvA6ZGRlpuqz257tZCtBGYjvAhqlMEGuotZY4gaRE1vtUplrkiLh+lzXDTcTcH9Q69qlBPS5PbjgVrrXmESmX8AKZdh51JIPyGuAPG3ZbPEOIPIW/SaGJ5ABu5IdNtcZ4hhB5Cv+QwiiStgS/8yHaRGIpGGRpKIWxEQ9Zmv3HTyuFLpDBATwhIfT4Xp4hRJ6CZnK1JoyeHOz8EkKP8+UZQuQpUNtSgSIH68ufP/BujDTZudTPy3nqPtIvntDTf9GgLMjR5++kMUokJTJ/SK2S6jQyjhdALIS9u66pLk/6cv71Af8ukObgZRQhhEIgzxAiT0Fr5dr8q2D03XtdptlXrSWQJ/YeYKOjJgvi+45WQYGkRK5nqWdoFSTiNF7RcvXC2HkNIzm4C0OI1iQYhRA+8naS/UdrxA3iWYj94+8UYmykroruyQKhbrpAhgc3DP62ZjXAM4TIU9BqqtYyyJODnQ1CtBSEVkN1dn3t78lLalrDgZGqyZBv/p5njW/YGKkOdjNl7t15DY14c+/eK71XcZ6jSAxScSXlYkHsHL/WWigQe6bTg7x3zuNIuhggWJe0djHsEklBsmfTg1orIU+qMogdPdRaCgXSlyQEqCPxAX73RdVCyJMmBuiLquVQIAEgrZfE0EgCUJsXAUaRtDFAjr8tj0QsyEORxjiSLgYo0ugSsSBP/TS0FPKkigH6aWgdFAhB9pdFGnUkgxigSGOQCEEeigLTKsiTYQxQpDFMhCC/ZkUao0jaGKBIo03EgiyLNMaRdDFAkUaXSFB6eRJaChlJSjGBgzqvKpKEGJuDg9ZaDwVShAj/MYik7v+HTce0JPJkGFPwl9d9iGEippKmRTZGkbQxQL8ktCwKJKq1XhrjQILeWxcBukAMhPlXad1UHokQZNJPQisjT+rg3zPW0qIotESKIa6LJAaRNDFAvCfKUK0lUiAWZFukMYxkFAPkdxrlkQhBitLS0qjm9Y+JOS/FHEfSxQBxd+1//EWXiAXp2R8YDLQ48qSKAXoFPtDqKBCCLPdFGnUkgxgggry9J41BIgRZ3RZpNJEMY4DcgLM8ErEgT0Uao0jaGKB3d2mghVEgBNkUSYwj6YJ/AmuvSKJLxIL0h+GB1kaeVDFAr+YHWh0FQpBdIYfWRZ4MYoB4Y5ri0LooEII8ros0mkiGMUDPuvdAy6JALEiZl1EkbQzQbx5aFwXC4+fLIolxJF3w7zcOrYwCsRD9Lj3QwsiTKgaI99i1VBxobRSIBbkr0qgjGcQA/ZxoaRSIBVkWaTSRDGOAnknHgRZHgViQola0OvKkjQEKOdpELMiuSGMcSRcD5Iag5JEIQa7649NA6yNPqhggvlGglWqJFIgFuS/SqCMZxAA9q7YDrZQCsSBFXrRW8mQYA+QW0+WRCEH69oqd8yiSNgbol6nWSYEQZFLKMY6kiwGKNLpECDIt5NBCyZMqBuinoQVTIASZTYs06kgGMUCRxiARgsyvijSaSIYxQJHGMBEL8likMYqkjQGKNNpELEihXLRg8qSLAYo0ukQIclcMH1oueVLFAP00tGIKxIIU9aIFkyeDGKBIY5AIQUolp1WTJ8MYoLdYHmjhFAhBVsWoriWTJ20MUMjRJkKQ9XWRxjiSLgYo0ugSsSBFeWjB5EkVA/QebA60YArEghTtQwsmTwYxQF8OLZkCIUhRHFoveTIM/r0j0IGWTYFYiKKla8XkSRsDFFK0iViQoma1YvKkiwGKNLpECLIr0tCKyZMqBuinoRVTIBEkpJdGbSShiCyKAINImhig+JMmEYI8rIo0hpGMYoD+cKsVUyAEeSyqXuslT8YxQDCM8dbSGCdiQYqhQeslIwadQIB+XrRkCoQg5cxCayZP6higSKNOhHPdy0IOrZk8aWKAOD35ThpNIgS5KrqTVk2ejGKAQo5RIhEispdGayRhSBb6SaumAfhvHutyUjTBcReIrYt+Tw6aoFZNgRCkv2AeaNXkSR38i6XTCM8UYlnUiVZNnjQxQCFFk0h8EdRLY2gkPRm6KQKMjMTnQOVqQisnT1IAD/vDY0F5JBIv/vfS6DyJLwP6NdJo1QQJd+nXl0WAypN4+7ZMoY5kEAP0OmOjNVMgBOkbx3XOTSTDGKC3799ozRSIBVkXaYwiaWOAXqU1WjMFEi+L9dIYexJuk+2uigBdIHZ3jgD9P9GiKZB4CyNPA/w37s+FaxrzIkAdySAGKP5kkIgFWRVpNJEMY4AijWEiFqQoDS2ZPGljgN6+ZKMlUyAEeZoUaYwj6WKAQo4uEUBbLvvDSqNFkydVDNBbEjdaNAViQbZFGnUkgxggNwInj0QsyL5Io4lkGAP086JFUyAW5KFIYxRJGwMUabSJWJBfRRrjSLoYoAdJ3WjRFIgFee6noUWTJ1UM0JdDi6ZALMhLkUYdySAGKNIYJEKQq6IzaNHkyTAGKNIYJmJBik6pRZMnbQzQLw8tmgKxIGV5jCPpYoBCji4RghSrr0aLJk+qGKCfhhZNgRBkWqZRRzKIAYo0BolYkKcijSaSYQxQpDFMhCCLos9JR3rSxgBFGm0iBFkWfV+LJk+6GKBIo0vEghSaQYsmT6oYoJ+GFk2BWJBlkUYdySAGKNIYJEKQVZlGE8kwBijSGCZCkKJItWbypA3+8a0OOk5LpkAsRKHjtGTypIsBCim6RAhSqjAtmTypYoB+GloyBWJBiprVksmTQQxQpDFIxIIUJao1kyfDGKA3aW20aAqEIPtiRNaiyZM2BijkaBMhyGMxAmnR5EkXA0Tt8j/S6BKxIEV5aNEk4i+pJn9bSTRaMXlSxwC9xUajhVMgZZDwL4NIfJC7QowmkmEM0C8OrZoCsSCFgtKayZM2BijSaBOxIMUApDWTJ10MUKTRJRKAQfIktGRqxicZcEgxMGjJ5EkdA8SFt24JNloyBUKQm6K8tGTypIkBelsIjZZMgRBkUgo6jGQUA8Ru/Zk0RonEK1G9NFpPwp2pWTxc+0EC40i68sG4D9El0k8BIz2N1kueVGUKPkSVSGFexUupFVPT9Q2weGjMN6QwiOTgWbsP0SRSpPAB/2Eko4MULMQokQJkMkjZGslhKBManfMaR3JQlj5El0g/BR7nD7VagmTP97PXZEMtljypy3/wIepEihQ+4D+I5KAkfYgmkSKFP/AfRnJQkj7EKJF+ClyrH2qZ5Mm4TMGHGCfST+HC/qELpG959CG80R1qlRRIPwXAGodaJHlyUJI+RJ1IPwXuOA21RPLkoCR9iCaR+CAz65xDrZAg4cXm/LIIMIqkjQF6o91QK6RAIs5YL42xkQhEtlwVAbpA7IkRAXoXkodaIQVCkFV/XTnU+siTOgaImu5v0qgTIch6UqQxiKSJAfqZ1QopEII8FkkMIxkF/2KDZoxnClFoh6FWR56MY4BYGrTOepwIF5mujjLA7ZCO8NKokZt410B2CLw3oAtVeB3u7xC9Tt562WrvOUJtcYAWvAMS+VFcSLIfErxBMMb7+SizmBa8uX4HEEOcTMi0WPAeetNiR1cx8TeZaCNvUw9LsQmCPni3//H2q6/TEPwjeY//440ZXz/nY3zw7v4zsu3fm30s1XepVPXgyLabbn4dZZgfwTtgfhzFi2t2LB386/+0/h3u47/I7lY+3oLAbVDnmH0I3s1/xrbGu42pf0jF6tY8Hqj7drf7N9lH/xkP/ZuB/b/5t/8Z26T4NhaNtHzwHv9nbOYGo537o49Z7M55U+fT5b9kza1zOlt/TNdH2dPS4F35p6VH0/3TUWZGK/jX/+msPU4f/6XBueWN4VkfTWO1fDxL3npmaSf5s3+t1qEsL9gMZhaGL7Cjg/8oYEcfzWLZvM7+IBqKBJc3XQoO/uOI/RshVPLOOuwCvPnRIhwqAFrp/Ue6ye39Y+meproZVQHc/igacOKOdvCvA5bk0WL9L+U3GgSIx6PFZvFvAYT1bNdY444yt3mD/1AoVfzBMhbw59TtZPbH3m4fLaMAMuUW/F0BDu1uaHySw/3w4D8OiIB2uftQQA13NvUCeMXr+1REGC61lfhqepRBKgX/KkAqHa3SrCgVoVu/VCOb0K9iCQlyKfgPAuTSUVxg5wIKLdugVI7iRnXPXyAoXr7YBM9SExRWtsERHa1iEzxLTVAocQY7chT3uY++fE/+slRq42Z8OMWF0uAv+z72/+ubfxseZKzUA9dHzclWafCvAljG0ToeVh99SW1AD4bGNvqtYw19SePXWLiQVkIRr7zn3/zHLmeu76P3aSpAt1CpOtuaTDdIM5U2luUpU1rr/ebfArTSeZZAKuFUQm6VUnW24t/8m1IUKLZH4dv8Ww0LDS4gyl3+m38VMPePtvv8CmLw14Nzm6jdx/L9lipIYHAnNgTHZ/X5GKoHQ5XtQ+9i+ctca/AfBnOtR/HWKc+mg398Nn0Uj0Yxphj8W2Fu2Nu52EU/px4i8Dd/oz9u6XNNPfh34Zr6Uaqf81j/I0H72VNa7o8n6+vBvwrW14/iZkpWvyM9D/LzjmjGt+fvys/fpEk66OKf5B8fXB09/Ev9jYB9s+2Lh8m/+Y/C2yLnvzocokbCwm6S/Z2ygY0EiN0MPOhpHGMuPqUAXXhTd/SQBrEvsYmMBIXd2A3oh/W/FIFQDwxs8Ci+e+HBW/Cvw4O3o4dtFPHbaQowCBgdRw//VgeCwW5MUT78Sln4mQIMw6O4HtQAm4gjLTNGWo6MqghT6vOY+bfJP4oQDTtG647lPwA0MtIaY6S1yMg6SvqHzN8HKlM45T+0whhpJTKy45qUQu5fR/80iX2NdTotQETqUR0hcLw/WOFafYg4/y7Y2M5uK4+0+hCpR9aUownDo9fAgWrtIeL8hwfguKDKa/Eh4kK0/c76OnbWUY3V+5Pwbt37A9StsxkR52+dLU7JXv8Pq8onRpz/sHcXP5l/jzbg+/5nUZkEu+p9/2+pK3h75/0Suvgz+TfJSnmMH21nRwPa/RqItq+jAewifrBcHc1XF/7BLnU0Th3sTmcbWrI6HU1P91txtCkdDUuXNfjGzI9WRoJV5yRBtH0bDeAW/sGybTRvW/gHy7TRPG3Rz4Ld2Wh8togfrMpG07IHwMigyevsZYSB0kHZk4OR12jptd/KowHWaIU1WEdN1lOxjRoNpPandJlC8WYx+/6n35N/HS1VPqYp4bvkP4hWKK+iwvyeRlNvRLIf/zy1YW8gsp//aPIw2j3st9Fo0DBaNezP2NIeQDBI2E8/WryLZu8K/2DPLhq16/9/tDcXjc4V+ixYk4sm5QLgerLu5uXzBtz6LSjaHIuGxwr/YDEsmg0r/INBr2jVq/AP5rqiza5+/qMxrmiR6wAOGzh3namMsObTVEUKwXRWtJ/Vb8HRMFa0jlX+wx/0Ip2ojLiPNjrp/0O0mRQNJ/VXpm+TQvZGdPr+aUMkGMjp+5+nGYU3flOsfJOe8EZp+vJF4yrRwkq/DUXrJtHESd8/2g+JRkT6k7ZoVSOa1ujHjzYvouGLYNMi2bzAokU0a1HEDwYpolWKYHAirdwxNxFtTvTjR6ME0TJBvw9EkwPR7kB/0hoNBkSrAf02HPH+I+h/8f8Brj9i9gfw+XyM1IlJwJ/vpx9h5SO2fH+mk81ZPW58P36EYY9Y7H3/CLEecdb7k/4Inx4x1Ps9KAKfR/TzIv0Aah6Rzfv+EY48YpL3/SPUeMQbDzDh5c5PQArvl3/Csw6g1oV8Ea06QFYHNOoMrRos6jZhUefxI5J0gJMu/COOcgBTLuSLKMkBKrko34gzHMCG+xvJCWQ0II32/z9BiAYc0f74kOA9A8ZnX74EBRnwIPvxE7BhQDcs/CNsYcAu7MuXQAkDMmHhH1H/AvRfkX7E9AvAfn35E2JfgO3r+ydotoDPVq413gEYoGVGq9VIm8DZfA/N/Kvon3KQcNjahMOW94CIIRaAxPoSJoSwABMWULwylC8wvAKQV4ACyFC6wOAKQFzF/0eErQCz1V9pJHysAJLVb6EJ/SpAYPVrKGFbBYCrIn8RuSrAVxUjQMTqCYA9hX/cFglwPIV/xNkJYDt9+RPMTcC66cuXQGoCUk1fAyZAiYAq0c9/gosImBH9+klADQGtoR8/wTAELIZ+/hI6QYAo6I/g6dF/ePnfz196jx8e5ffTT6/tw5P73lPTbMshvCbt3afu+Y/ibek0g8kObVrZ3PEVHM/7egmM42lehGjB8rnz6ozkttGzaXCrZYgnB7bTXYhiZk+SuuzlyQHemgtRTMbtX5pIDqD+Dv7lIy1P6wtPDoB4XYiis3wlyjiSA0yl869lFEZArSI8OUA1PT8voliX08LBk4PsuxA4pbfTvoa0WvBkWIQ4ev1PimQlHyKNPLEVxhVvCfNH3a0WCRBv2epyeZDGOJKuDKLdit4ZqI+jhYEnlblpv3F3uV8c/V8IH4SPp6YFKWKkIzf2kFqtHDwZxADxSfv7ozISnVmXrzwZHkb6UEYCoLTVbStP2oNIH7+XkUyxa2HgSXcQ6euZRdIdgRygutVywJOqCCHTFzj1zr5cwDqSQfDPcCOCqYBelCaSYTQlYGhFMcq+bH+a6XvSFiF0sh2dsrbDhYjWze7/9azb+XSBuBm8r/Nfl8vJ+np+abV+nY8l5/9/7eQwTjIN7tKuIqnLND9Y7aUoPLxvdUvKk6aM4kLgdL3tF6pm+p6MYoCjt5eLVSrV68VVv2lpeu/JOAYomtbNZX5Y6kJ2noxtyn2TCXdqbSStwnj8PNZtJ0/q0jTcm/dFFIpgrDm7J00ZxRdBttb7QZRhJAfW7F0IlO+kN3kYa2buyTj4Z7dmerte1g7HJ10gVWw0283y+WGztvpXhGBPOm50HbSZfpR1T2e6pKtI6nLaqiD9SNXwhEiDSJoykoL0IzGKjTU19+TAaJkfxLIolJlm454cTKlfn5ZRPhKlC+QQANmFKKKob4414/bkoARen5dRaDKaZHtykP/XF0WUN2+IMozkIPsuRBGFEtNU2pOD7L8pS+wN2a+7QAYH2X9TZv+Nhu+xJsyeHGT/zVkZhRLTHNmTg+y/KUvszV9EGUZymP2/yij/EKWN5DD7/xRR3r4lShfI4YmRC1FE0dbnWPNdTw6y70IUUT4RZRDJQfbffiqjUMjNMJKD7L8tC/nt/4jSRnKQfReiiPI3UbpAhofZ/7uIAgrIWK8VPDnI/ruyjb0j+3qc4MlB9t+V2X9H9vUWwZOD7L9L2T96t48gTAMZtQ9kXITQlmWxh/Wd/+kCGR0UgJ86pygf6DHa+vbkoAA+lD1Gt7sGMlwfyEEBfPizjEKZaYPbk4MC+FCWGY/AZJ4+kIP6/1A2mdN3ROkCaQ+yf/qujMIQq31rTw6yf1oOsaf0GG1Ue3KQ/dOyx5xSyLrm78lB9k/LQj4l+7rV78lB9k8Psk/zb7tAxofZL5v/H9SLNp09Ocj+H2W9sNaSYfhADrLv11pZFPKirWVPDrL/sczLx69EaSM5yP7Hr0WUP+nK4y6Q7iD7f5Zd+U8E01zRk4Ps/1kKxja9TLgHcpD9T+W/fKL2NVX05CD7n8ra//SFKG0kB9n/9KWMQu0zTxTpTg6y/6ms/c9SF7LFHshB9j+X6gIcSdlfD+Qg+5/LEYaNfxldD+Qg+5/LcQyrgTKzHshB9s/KXqlbbwMZVvekOsj+Wdkr2XGXHfVADrJ/Vraxs29EGURykH0XoohC9jXl8+Qg+2cH2b8gShvJYfbL6RU2/mQM3ZPDed/ZjzKKthNl/TyQw+z/LKP8RZRBJIfZL2cx3GOXifNADrNfNkt24mXRPJCD7H95XUb5QJQukMN535cPZRSNYzJYHshB9r+U49gXGr+mfJ4cZP9L2fi/UC+a8nlykP0vZb3wHkTWxwM5yP63siVjMUjWxj35l5tC5TD+TSOMzIsHcpD9b+UIwwmB7IkHcpD9b2X2MdQjE+KBHGT/W9lgvluUNpKD7H8vo5y/IUoXyOG877xcW3BWIMvggRxk/7wc+jg+kCHwQA6yf17OLrA5IrvfgRxk/7xUFucMfZrweXKQ/fNy6DunwQy7QA5nfedlg8HciYx4B3KY/VIlYQ1SNrsDOcx+2V/YMJWJ7kAOs18OfSAMyiJ3IIfZL2f95/8QpQvkcNZ3Xq6TLqh9Tfg8Ocj+RVn7WAGQee1ADrJ/UXYxQPdlTTuQg+xflPrlgpFfEz5PDrJ/UY78gPPLVrYnh7O+i3IYB6dPprEDOcx+WWKczcgSdiAH2f9RNssfZ0QZRnKQ/R/l5Oon9aIJnycH2f9Z1stPE6wL5HDW97MU7CeNXxM+Tw6y/7Ns/EBwy2h1IAfZ/1kO42BZy0h1IAfZ/6ts/P9QYprweXKQ/X/KEgNdGRPUIs3J4azvHz9apgt5bhhvZHM6kAO88jffyyj/EGUQSXMQ5Z8iirRYI6vSgYwOjMj9UUb5myhtJOODKDZVuBXwzusbntzp+mMj29GRlCG099BgPTqQMsQpslZVIgchLI06kYMQfxFikEgZ4jPlXjWJlCHOLMQwkTKErkU3siMdyUGIU0K0iZQhNJA3siQdyUGIL4ToEokhst3+RtakIeN6UATw1VJXiZQhrFrqOpEyhFVLPUjkIISl0SRyEIKs1MNEDkJQcfUokTKEVVzdJlKGsIqrx4mUIazi6i6RgxBU3OAkkTKEVdygSqT/rE4bU42MSgcyCP7FxlR2ufcjUZpIhiVEvN8vzW7DviPKKJIDm0Bv3xVRdAjcyEJ0IAdGgPwhcHaj8b+K0pxEcmD1x4XoR9HTt0bWnwM5MDL3x0UR5Ywyb5pIDrLv15lZFCqhGUVykH1/bnfbuwHeyJJzIAfZ92uz7LIRzWV4EslB9r+8L6J8px0P60gOsu/nzSnKTwQbNpEcZN9rtfR4UrcsG1lhDqQN/rFebKo9nbzku5KN7C4H0sUAEefWNE72jvIDkUYnkaSHlsVhXhbpM815VEcyOIj02dozpp2zg/FGVpUh9cimqbPLfMOvkV3lQEalcWi/4ZeiWP2NWiPRnvS8HEFH40i6IkQ4Q5ytBYLxx2q9jbHaEyPViT37ne3yJ8eNzCYHUgf/2J9t6ZwBr4ZEB5E0RQjdveWy6XaS30huZBU5kFEMkA29uO3Lkm5bI5XHcSREZoGhkSXkQLoiRCiW9CJTT0QaGT4OpAr+8TDqaxHlLdppXEcyKKO8/VBGYagYN5EMD6LYULGMltW4EtzIkHEgbQwQz3xtFFulJ+kXzLXG40i6GKCYna8YOjZmyYn66E4SSVbl7XKAL9quMlK1dVMang9BaiPRNv1BDXaDSJoiRNjOyZ3emHDDRPpPSD6iUrpRJG1MIfSFd0f9KOdURzeOpCuj+GVy9i5UOz6NDBIHUsUAxZbPuvcUrpEJ4kDiW9KiPaZrfm/+S5QmkmFpKPPNf4sob/8iyiiSA9uab/8qomih3MiwcCDdgTlOWyhvrvNLGI3MCAdSBf/sykX/pah2uxtZDQ4kviQtdrsj/i1g9I2MBAcyDP7h9sh3Uyp6T3p0+hhvoNcn5N3Na+OL0ogayCutRlaBIfWJ7W9u5z0AqkZGgQPpYoC43LTcpXeq2jZrKs1iPamCfzRTbROm7KXOH0SpIxmUxv78cWn2NIL2oPmpJ8Myip/KpCifKUNNRz1pyyj+fkV6U6tnVo0M/AbSBf/Y6r4WUfQqppE930CqMsp7W23vgAvPjAU3MuML8caCe0EwPNnIjm8k/acGugHWyI5vIMPgn90RK14nnBJlFElbRvl0WkQ5MynGkXRllLN3RRTdgW9koDeQqozywzThHpjIXGfJLG8ggzJIGCTM7evyepGiNUbqYI30phhsZY0XUle2UbG/mfUUjMzxBtLGAIWC2U/yA99GBngD6YJ/ceCbopwzCmgi6klVRvHbmPuDGY6s7AYyKIPoTUFyy8wWNjKs25h1XVNT+9k6RzNqZFc3kFEMcHT2LJwCBbFHoJf5k/xGdnQDGccAcez/6iPdFZG6QPw779XdYaRNb60jU7mB1MG/WOukKHp50sgybiBNGeX9RRHFxmXNRj0ZlVH8uAxEbHavr5HlW4jtrWX+R2eW6DiRGKJXpaPOiL+/3Z9cOi9NTwMpQ/yPIVdz00D6T9+1mdvI5m0gg+BfbObuywmsbNxCam+NIT3htSaveaono+BfNvnn3mX6RjZtAxnHAN56roL039V/tsx1gYzju3tvGlQh+lHO+JtxFUldRjkr/4Wpj0zVBtKUUfzU52FStJfxMJJRDFA0mIfelaVGBmkDGQf/4srSw2bR18LjLhCbhhKg0MKPL2XD1MzUk7o0J/Xjn6PC9GOINDAS7GCZ0cN+kCaSYRkknFbnthJDtJGRYFYqwofyYrqRjdlAxiV86Bvr4il3R28ZSrrOk9r2aXsYm2+/lpH0YKGRDdlA6oNIP63WIjplmEI0mI0V8UohIK3t7U6H/JpEyhA6Gm9kNjaS//u//xytN7vV5XL+Mrk5evX/dO//lVSIY47dmPaKRwP6cIv5V7wQ0IfkxFvPCZKLG9FeVRZ+7jgLPDe/f/6RC4EX4mq43G8gl0dxDVzuN/yPsMVeyaq6Y47VgI5P38uhxUE8SGPug78ew+VJ4HfvuNEJnCWC30hiXe3E1XAW7/QPuUisqwdxDVyW5gixnsUh13PuJ8Gub8SN4XI/yXI9cVx7Amd+bj30SgOoc5mJq+HM78epXCTLjWqobeAyOVvJckOaI7js/1rJcnMnbgyX+0mWm63jxidwx7pDfvxGVUnd3ih/4xrOysxN9V9plHIuL+KQ5SVLcyxZJMpYokyOX//aPxx//C4HSTJRTY7HcMea0RxffJGLJJno37oTuCzFTpLcipEgt+bz5bWr9BOahHf557WCDHDAV6/+9CEPsOSOLqfXCtPA5f8gmaeqr24El/tJ6ulU3Bgu99MfTFeuK5ycwCU/9W/nshFXw+V+knJ6Lw5Z7s3v7ZlcJMvsUtwILo8nWWZLcWO43E+yzPR/1Qnc8evZZnXs5qmvZGH56PJuKq6Gy+JVkmUhRqIsUquSNWTngNcI7lh2To/d/POVzBwfXS4lZTWGy1OUJEvXE2WlWFzmV0uS5VpcDWd+bhLxSjaHncuDuAYutThZExYG4CuZDXYMow0AgHw8zOa4yGSwcyDcGC7/a4m10l8PTuAyPxrHSoVnSfrK+nIqF4m12opr4PJ4EoskJZZP0a25X8nirnO4FjeGy2NJkrUKtjmBy/waSbJWkk0Nl/tJkvWzuAYu95MkmztxI7jcT7JsVCoM7pu8VBixN64r14zYm5c0HNWM2FvlgRF7e20dlniM2NsbcQ2c78wqMUbs7UTcCC77P8bs7U7cGC73kyxusf6qZpje7jM/humt5GSY3r7kfpJFIzg9Znf8WgphRCPamVhyEVRNcnmjFj4aj5LLu39QaZnLe4279LngoEhj+p53oTN09HXv8udXXLJYn9Stuyr7809/ySUX8PMbuTRZOp//lgsF713OGPIYaYKL9PJJlcnz9Uwubfbv31xr1Nve5PJfpVPlsc41dJ5kAp6/UxBad3D5Wy7U+i6N2wMbuL3L3yp3a0c7ChiAGn3YbMJnRgUNLIg+KOPKorwnyshE9XMOK6OPn/mwxFTmQDLoQ8UN/oI+VNKAKfDxFx+WgMp3EKpbRQvmgD7OTFVYHAq09ZVHWbaV+VCMrS80SrD1NWqFZx6UW+sr9vwrQnsf4o/sPynMdmAZvSDOyP6GQm19qVGeLb1+p17IJGSnXriao1JrJiHO5f3yeWUuY0ZY5/Tl6lJDKZMT/2ltk8mJc/l2uVzRB9IngtXMUHYz9QbEnWVdjRnKTsMTM5SdH57efpYLgmoQZYay84PoG/0pM5SdNB4zlN193ucQaE/vg0uNsrZafqbbwaWuUDND2b2QabjUa2tmKEqS+t8fa8fcdCHzkz08ELHuQ2qMprH3auxCYjFd2WsUY7qynxyfT9dPxz80utPq91N6OlxWRExX9ht6OFzux/890NfhMo3BJORBsjAJechVKpOQB/5vDJf7SZaHO8YGOF8ljBaS5fFZXA2X4g2YhPwSI1F+JWU7YAryayluBJfG/QF949da3BguT1GS/HpgvIHL/JiC/HoUV8PlfpLk6VJcA3esTTarIiYhT1fiRnB5PMnytGEYgsv9JMvTbw1IJ3CZH11EhcIc5JkWCh6wPmKbHTAfedZf06Gf879mPvIiRlJZy9PXOH7ZMEUfDw4aXNBB3uGCLkxneaH4GQjSp9XGwBwsuRPjlRIzFVODxBvFz+PXiNjiYGm4rFypgDWkX13mqY/+w3vgVzJ7KS5kRU+K4/fxt08KMTaX+Jd8i9WMxnHHbzTbY+4gSBCc4nRCJi+dy1ZcBWfV/OWbXGq57MQhqp8WvNY0ryGlvTik36fZskxPOhe14gZxf2V11CCemkCDeL+deKtHiycldUWJaJLjuCye1NTV1RVtAi73kyxX1+KGcC7Nh0XI8ticUpalsa6ubsS1cHlShFa/1bzHcVm2RoinohohXjbnlDVF57JDu8LlfhLv+hb9Cpf7SRYtLgfU7PUs95Ms13PUIpyX5SPqUC4rNB5cFk9K4OqaxjCAy/2QZYMOhMv9kOVeHLLc2xze/JBFI0WLLPlIISVwdaPy1ODvuNxPskzESJTJ8Zu/qcEhHzR4XKQQnIN/mf6KR+7OQWU2JmxeZtIKVxOVmbSB43I/yTlR/UkbOC6bOnWkqTKTNnCcj6e67ZBTo2SHoPko2SHckzhkecraUocsas4dsuQjWocsGo86ZHlJeky2546ubm/EVXCpncmqnHO5FzeAO9aGIyNvQwe+fRA3hEsjgazAOZdncS1cGrEbesFUjESZHr9x+pgqmfpa0HeTvr8zP6AlTfkAks59uF4mM2/isuSlSPQU/5UMuImz6b5PwH194KvxX1HkamAujJ0tDdB92RyPJjf9rVDE+32s18eMz7LfdnQ1uxI3gstlUeZnyqsUkONSlcjemnNxXUqG1cRl8aSArrSOl8E0cVk8aZ0rreNlCE1cHm+YuZz9YH5kwY8/qf8wwekYpmeqnBqJn/PUJTFCKZDv5j9/yEHyzpVPKRnHZbGkxa7myqeUjuNyPwkwX4hr4Mzv2x9ykbzzlbgRXB4PSVSPyDtfpyV3gzqZqwzQGfNs6GjQHXM1WXTG/D73kyx3M3ENXO4nWe6UdXTG3TwNOQ264+5O3BguK3N0x53kRGfcZRqtQXfcSU50xl0uJ7rjbicOWXa5H7Koa6Eg7vwQcK7/Q1HcvYhDlpc8nmRZqF+gIBbZpkKDoliorFEQi1XWzVEUC5UZCmKRlxmKYvEobgR3/OZxdkP91S1Nd/GYVSm6Y/FL3BguT0riLdVMGFOXvpmc/S0XiafNnYaOunxwI42bIP5UltEdkpxe6wU/+yyHIQ7gZ7wCV8N9qn7pv6u8flEkK7VDevNqkftJsJXybyncZ3+BIlkp/yiQVaZuGoYtVT3jlZveaJOWTr+2FYU5jHFgutqSyFplgDZZ510FbbJWRtEm67w7oE3WW3EdXOaHNlErQ5lswj81fJxp8fb2CxN6c2EPVy4NqkabQg3DRL4p1KBqtCnUoGryTaEGVbNRxlE1m3XuJ0G3Gl1QNdvntLYaomrur8VVcCneEFVzPxc3gEuT4iGq5n4rbgiXx5Ms97/EtXBpajJE1ezESBTfwz4oRfTG7lJcBZd69BC9ofXtEJ3g1rdRSwwZ/3e/xQ3h8niSROvNIU1gl/XMIW1gL0aSuPWm7TmP+AhT+7F9hukzVe4nswo/pLft78RVcNkfoCj29+IGcG7iuXeRlVkUxV7/joLYZxPkISpAK84hQ79bccZhb4gOeNiI6+BSPx+iBB4Uj8H/IZulsO169aAqYfB/+GWFRAHSBh9V8Az+j9law4rjUc2Dwf/RN4+/L+QiWR5vxHVw2f+hBB6n4io4N0RNwzqDkn+cplF5iF54XIgbwOVJId5KHOJlo+QQvfCo4kAfPG7yePyLihh98JhtTQ7RC4+P4hDvMfeTLL+uxA3g/P76f+UiWZ6UZfTBU55l9MKTmjb64GmX+0mW32q/6IPf2Sg4RC88T8RVcLmfZHleixvA+Y1zNSH0wrP+D33wnP8feuFZeWfwf87zjhJ4VlNg8H/+lZUnSuBZfYnB/zmbsA5RAi9qJgz+L5e5n2R5UR4Y/l8mabQeMu6/3Ipr4fJ4kuVF5cJ4/5KXC+P+y5O4Ci73c7JcSxQN99eXx6/fscqyD23NYM7HPo4jUtErgI/k+oEZpcZm9/Hxgg+LbGvYd+w9t8lFacqOhHNQ7UtROM6f9eE3kotqaky0dS6ty+W1lo1D/v4qHySkKK61xBsiTVjiaU4luw0gGr0aItz19ljIRmgw2WTAxRSL9IEOKIfGZB1YeuFaJ3iysiAuGzCkF65vVYzSC45LcslmwtG1ztBkHUFcOteUPQTZSHolwweOOT79QYGP+bDO8kO+EnG2EDeE84P9mVwk1mwlroVLIstagXPZiOvgUjHLDoFz2Yqr4NLOmWwMOJedOOTaHb+dTXY+nmSZX4sbwuVpSpa7S3EtnN/x/0MukuVOckpLOM6lebliDiQ0f+fyS1wFlxWfxn7hSr2yRrm4ShtMnHLIxZY1VMtiKfchXJ6KJFuoJGiLi03uJ8kWz+I6uMxPmuBaR31CwxeX+0my1UTcAC73k2QrVbo0geOOzzfPbr6i3EoTyOWfy/UVLgMOhrRbMKKvbZIuH9EWNqomqQbHHb/dbB/Y5xUA/dG1jowENC8utUhByx9dqwalBq5dBV6u91a50gLXmgEIHl6cNZgf+Em03Z24Fi6PJ0l2aoTSAo7L/KQFrqXnBdguLvdDElX8EFFWuR+yKAdDZPE5OH8rF8mCl0RxEVy5aky8Dhpe34RR45BecJwvgc9ykZR7N+oJJF1c9r/SD9cPN+JquONvl04jn6lDST9oB0bY5o7JupO0g3M4XV6qYqUZ/BfLemGVH12rEUsvXP/KI0oUNTBphevn49M3dHNcfTd/I18nlS45CFHcMcfvPqm3wJ5yBqTBJdx9wJNwyoYUyc1lpkTZWb3RzQHhh4tLU0chhjsXZUKKxHF5vLFc1Dxa/i1TJJw03ei8XJje4rK+P0YWtbgxsuyy/I+RRUUzRhbfvz+9l4tk0S6hcLbF5f8nWXR1RRja4jI/Dfc31xqHNNw7zo8L6mEa7m9u1uIGcHk8ycJtEf2yyarhx7Fv3rPJVvHxVkvAGvadrtt0sO9tL3HAB9pOIHP6+PyRnURL9PMPfIb2EfZy6yp9k/wgffMf4/T9nkMYjafBRX8gGHK5qLQ6Us9LqyM0uUaMdTaiS0HdTNW2aEPTbBwTfrZzmYmr4HI/FcF0Lm4Al/upJKdLcUO4dFIiTGvnshPXwiVZ2Cm+mb6IQ5ZsKSEs6qMbTTCEOi0u95MsdxNxAziv4N/LRbKsbsUN4Y7PJje3KP+WUlzfhZ6wvit7wuZKoVq4/P8k50Z5p/Y32SYWewO4bFzW2HlqOwvulvaLnT++MaetwldwWeo0rs2TuAFc7qfcaIgWcrO4Y72LYVlbmaA7iVUbl0fUH2o8FeSyuLTgEcgyFhVfcfbqOBod9hT5iu1QcMpHNw8rcQO4NAcVVLJzUZak2ByXtjk4ub150L9LjTkuk0x67ObhWVwHl84/WiTQsklAxeLSPFrQxM7lWtwALktTmuxGyyYBDIvL/SSLlk3CDhaX+0mWX2IkilvAzd1IdvaTShzhog9MSerjYnZ5iQuXAG9+SdAhXnnrlJq7eVJ9Ss05LveToM8bcUO4tOXFuf7N86O4Fs6viT/IRYK++BtqNy/cTcNuqD76t9VuXpRX6TzHZX8t3Te5UvLSJI5LQy/H7hP1Jw1ok0m6/cQ5nHPQhRYALo8mt2pwUoCOSxNrDt4mjAHSfo7zS9ELuYzloiqX/nPc8fvp85apC+cOk4VKUkrPcZnI0n4TzcdaaTXHHX/SyZqUM1vbE/2duvLETTO4zaB6cR+nbsKkoV+strDlWdMSggshBnwHBM1XwHEeTVYIM4LLhVG2Vsq8FKPjcj/Fcyno39fHAtZ8BeymvoSY+Qo8TX2xSy+gTD4oVXVjfXzko7OPc45yLAWO/wRIyYdWIHBv3uDsP0i3tqTekFRtSb054zDIknpDugNL6s1ffPgEOMwZWAKMzsa9xdmSkq4CTpGPT3xYUhzXCQKRj//x4ROw0yZLgHFGgIR8nHJ05j9IbWipvSO1oaUGJuArsAL1yYUYoQDyccFZncX6QK5Hlt6HP/nwPiQ+svQ+kPjIUmP+Zdw7nC3dUyqmtaROyXXrg/EnrSV1SlKtT+oH6+XaPsi1NYvjP/j7saX2Ufrds59xt4Q/ktbYEpbSsLgfv+Jsf/EnxTc2nz+J0FlSn/DxBfEJGTtL6tMXPiyBT4jVWQKf33JEZwloBw3oMz7O+bAEbNaiyVv69FV3kly4d9iNsjAq2ib7tOKpkgslUadvDSNYlIsu38ylSy6aYGZJcNnVIpydIrPl8+wPPizi2VcOIC3a2Tc+LJ9n5NN3xrMLPnwCP/jwCfzkvNIn8BcfPoG/+bAEuG3b+S745QMfloDPmff5zJmnpfaFYvf98Qt/6vvjF92sNXcrBl/a38ia76fcR+h87/z2haNTS/gbCfve+Q2Zfe/8bh+WwPkbPiyBcxqE7512gOs75Pl7PiyBc0rad8dzxPHd8fwjB7Q+AfLpeyD3vjrfA8//x4dPgINb3+/OZ5fSm+OT+EUzan3fuUBA3y0vyLvvlhfUse+WF9Sk75YXVJ7viRd2SmwJ/CAfvvv94Ezadz8uN8H95B999/tpESypn+TVd7+f1Jzvfn+RV9/9aKGe5S98T/yHWrCeuFYO+b9sedKaYPfi6Eb3uZ9S1CxCa6bJxmsctnwnfkqBU4vkTBG1gpr0pohkRPdJ9Ef746bqdM4H/5pBFpY7QGww6OM7J+mVfdixusXW1TfMzPHxVT7Gfsfd0nrLGFDZxzs74x7x8f41H519vGVtZQnYziPsKTceRxb9lKG/tUB/fOHDRPlI9NaCkV3L2jA5kL8ufXM5j4VUcPFX+U4yF2Wqyr6/EyL7m7ccRTdZnHcc6o+b5PKeK3taTEWXt7jkYZTl7Fv5lm2zzOWCO32D5PIHl/pGWbofSbcbJZcz9bs2fX/5yN22LM43bsuNszDf3uOSlRUjy0mXuZz/5IZaVjY//uZaWVaeP7kUO7D/QhATDBlY4rmPb3ah1LLFP7Oc08cftDVLEAlY/ejjb3zsA0lCrakXN/aHP+ymqZXgT7tPSiBNlTvjjk83a3sowCb2ZK+pMpPI/WNSPuxp69pKq+2DycPxe2kxLZzDDRZzUAoPWvXSqB6ygwRWFpMHkmjhjj8+XC5tpqx14uSBf+7gUryx/clvcaT+O/eTnI9iJN6j7zWNfcRGZa1MVwXZkpiEq4KavY21UJ/8fhDXwuXxJJbOKWyGnJ9TCL1eVj1fMd+9vbSbJ2y83vpdX7nUbJsGFx7CqGqDw8Wf3AGscTHfAbw8MBDqPvgTgvT+n4BX4gh1lfshxVTcCC73a+UyFzeGy/06ubhxeVyTu3XqiEzKb2/FSJTbY7Cl3FcTv1iyAdsVXeyaEUXlXU5p0ZRZcLEwdebyRQkPM4e/CDJILp8Zkavsz8/MJYulfRFwtZLLKS5tcpG2BjcruXCLqbJM2GEtoFjh0+fSiqN3mapOLpbLepC5WJgmc+GPfDbNhWzWo+Ri2azb5GLZrMfJxbJZd5kL2RxkMls2B5nM55QxAqot2J/mbcH+lCrmz7I9EJZYROM/5ixBRrj5jfuP2tvSt9oufzu/TBfkxhoPb+dLcQO4tG9f8W/OxT5a+7iYLqc2BeTt0+1c/ZXeMQ+3Z97LRYV5J0bZubPVEKe+t37PSy6s9m6XO3FjuCzbUo+3eu8z1kh5m7/3YQV4q1FEw+vthsUb2Fz6+MA1Ymnb23B88VVBlcHNjbgGLk+PwOpuWqLfhosWbySjJqq3G8moSYTj8niSUS9sxlr33+YvbFhk3t7vxdVwuZ9k0eMbSbJj7UxN7mjT2Bvm4yPZ8oFsIGrtg9kOheY+dm7s+MBsgD62Y/lcW8i370jDu5M6heY+mNVTLDtbWVfGsn/c2L/aNdjGouv5CEhjfLAB3Vla7x63SxMBLeFc+LBop8ytRpbgKSKMLIOnTJtGPtg3PkxsjXQglOnjjws+7K/scUlnqbG9zZb87S4NCjUb/9GFob0X5jOzrSq5qGBqtj+jyykuw8zlIy7jzOWMGVidXHhI0fmsxqOzPJVT5l++cszlA7Ork8yFudQgS0VlU499Ldq2Ga+Z2uy/VRY1S6ngwvOMrs3SOXvL+4Qs1tkHXDJ5zv7Li4XsvzTU1axagssX0hlmZfGNdPIy/cYbqC5L+ft73h1k/86Krxpk5X7OdnWTycxjmG6cufBUhxe10eUDLlne2TCscpkvuJU5zvL11wceFWQlrzswA57Z3fonSUzK9fGWO9gmKYXGWYM+GOS9xNxlO/H9hZLkAOLWv2ni9EMfPwhmHxQm5w36QIkM7YNC5RxBH/YOylKjKFtflN9RV15qijQ0ZUqz9a3t3N5bWSHZcyffdim+1lcDJdf61mcPoXyf5oKqEO30QeGxTe4+KLfWyuBaA5xxadrKZtrtTsP5kBxsU/dgZ+12pyHWWtQunAeM7CueB7DtdqtThfEIkfYhZGtfKaQ2AW4fNSvT+sJxpvWYaWpP4Fa79WN6atitV47YpLt91JDOsPSYD+mMTY+aemkN6LjUXdm4u32cOQ59+5gdXbGPd/t4Lw5Z7tN8gW2920flnX76uEvb1uzy3T7+Eocsv9Ksgk2/Wz0pGrfI8pz/n2T5pTS1keE435Gk8ekRiqYF/62PpS0h9gGdA9tDXLTSId1Y/W56aZtpvPN2Hx+tzDs+4lYae4dTJsljwmVP49lAnOoMeDwm5ezCEPuJUybJWglNwyT5TOJqQJnqDHgsTTPNz4DZbZxeapbRIeRd7ocsmjR1yLLK/ZBF2r5DFrd45The1dghy9PRq+4EWbKzE3Yqp3qw1J0gy3O67MbG5VQPWTotcab5Qxb2MadXt+JGcLmfZNGl207TKcelkz22D6eCNug0NkxzaAN2E6dXL+JquLSuYXNxqhsXnabljkt6hr1GvbDvNI6EB/aqXDYepzqO7jQJn+bgBexDTnWK3Wn+Pc1PsdmWnN7o3zQaOS73kyS6qMQj2+nkKveTJHq30Wma4LjcT7LocKWTunVc7idZ9Maik8p0HDvyIGDaV3iFzhbn9HYhrobLUtFYN9XzhU4DnePSISAboNPZXtwILo8nyTRh5nr/NEyYtePNNuhU1+w7qZRpfs2eXdHpnWTRNMZx6bIrm6RTXW3vNIBO7/LS1cx0evcobgSXx5MsC+KN4fJ4kmXhhttOqsRxmZ9mpjoo41XzdOnX6oRbpjU3W6/TpUTWaO64rIlpNJ/qgX/HkJA/8Gdjdrr6JW4Ml05+2ael1DV8T8Mu+99yqHD4xmshJFyrmWrwdlyWvAbvqW52M82a5je72d+dbog3gsv9JNZGvVCDt+MysTR4T3W+3mnwdlwWT4P3VBe0mWw5LuuhGrynWjcwyXLc8cVk+ej9kEX9okWWXTZatMiiFtYiyz4Nw+wUTzduWdWNkeXh+HTzMONSFFOw6U79SaO34zI5NXxPpXyZKk11G327e+D4i21luXyer4k8Sp92EMnwvONPx3DpNjn7zdOdhkSG510+JDI87/Gr4WwhwX1bfX2ga1LZ7usz65mR94u3T9i3nqqNM44/Hp8+3tm9BTaxp4/+lTANUiq9Y0x/9LnXnjC72lMdzneM6eFwXnumbHJPpe4rXu1P89P5is3k6SOwBQzrjznyDLvL08cnWIR76sVFvN+wiPS754tML7AI9ZJOvCt2Z6a/2KqTUL/sAI7byFOv6OVSsUUz/XULW8Pmf8JgL11vA5nT9cVA9mtPMDz3vZjyfbqGHcGmWzMVezPTpznsGDbdm6nYlZk+CZGHHRnH5nFRCc/ERSc85yBAbMYIWKViE2Z26V+6ghEcPpmnVey3BBdAQFgrzrIdjIr9FufiI5i37fpoNAi4LV/YRlZDjC6gStQWxmbdI/s7n+5YHwKcYQNnlu/dVezgzEBRYtvBsWkS4ZzI4gqWTK16cflP2tQAeZ+ys8WTAULQagaI8JI2MZ2TcqtHsRWL41n+KtY5SSrAglgtOzYNcs5JUk3gJNTk+I/JlWE6CINUDsYrkZklMoTt/YUkpmqlfvLndAIYPfKv3yo1rtk8bttpyHWfZ5ezO+vMVrVzmkGD52XvX5TNOW1eesmx9j8fwLvSqCOnuJHkQuFEbWnsmc17taWRYzafwTawPV9kXcKShXwX7ETqbLZEUOmz2bInqBTabPkI6MkJ7PEfSzdI6M2ic5JUK0YejXqOPf623N34ViJNNlvRiWj6qxzXylrv2uKOYJPqr6yprqlMynY9ySriRPpM8NaCTTmBPf5jJU3J5gPFZ05bno6mIFvfCFuCrGFrWDXvjT1HY80yC2eFVkrmtIFtYHNppQtn5qmsbNLpegVIymzDMCRl6Ng8J9KGcvrrcueRCIDfmW3InDSkY/MIUpGzDYUqHenYvFClJGeM9VKSsx0PfhrL7u74DxajsHampW8JvKfD4RUvqw39V7o0eWJhKTUpVMfmg4I068wEU6Ye2NYa8MRk5oWUSyWc6aMZTYqaci3qh85jjH101ajvmkXPzB+uyIXCeKRrShk7Ns+5dKx1auI9H782ddPax261xqUSkPTRjOFHWnb2knC+KjZzrM9Ky4Yuy0lvxYncXMuqiuOoef5couJAag46kPCexfZ8nXRzLZ94sjgPy6f4ZHHOkCfYZ7HZAF5JBc/BfwN2aN4DgAM1aK5HJRXQMPPry56vJAbnDeibef4Wv2IcnN/ASeAbw4aT9prfZGBxUmLzGwuH300vEXznsEPYnq8kvnmEbWF7vpL4dgLbwaatrUrAykcMeJXUbRjvrFCkdedTigx5p7mWMImnpCv159ier2RCYA3R8/nx33NHaMIcCcz1QNexHWweU2pSL5AdJ4myK9mVEI2di3kOYHsxJdHiAXYIm002hEvsnJ5gW9heXMm0+A3bwea+UpLz5Qa2gs1GLaEKH81X5juA7cWVVOvYANZlpa9pOdKRjs1g+QQZfDS3VCVvfiGiAthxvqHOpeUcm/+ntN18R/FLpc13vfYi1Tbfw0nc/fFHnQhXsCacvhVIL3wlxQMzbP7ogU0l/v4hbTIhYTi6OWPvtU4uP19zan6CC95tbcniww3aOXmRXp0/pocNFYCR88c4BZCGmD+F2cf8qZh9zJ9WRBrB9jItCZ8s12PYnq8keKEmpIDn4bmZ1YQU8Pxl7s+NHVecG+uFEE357vL4j7lTMX+y0a6h+s4+aMvit248MwfiHX+6XPvgnSVAd5Oav7vsdTep+Tsmg8BX3oXJoO7PVeBX3tm4KDV/1x8XpebvrmhKUvOO7bUl6fm7K8pf4+bdVa8tqWHcTWjAahN3k96ArPq4my7iH08XB3885Y+lz++m2Ul9BdDlHY1U+vxubnX5g9mFFOvdnMKQPr+b9wpDauxudc1z7RPYBJFRsV1/t1rC1rBpNVMBd3m3YzDnT3a9wVza+e6RMUR62LHpdUoF6KWedVWAXt79Ov7zUlOGdwBF1bik3g2a2t1TDP1U+i0QQnp6celxT4edfUzcQh9UVPAyF5cWsob1z5sQV/p4YW1GCnkR2sw78x3KiWKSFnasV4gUv9Tw4hKVIz28uOypnA5JVDvAYS566K/gYS60aVoBiLkIu6YoDhAxF7RVIDEXoa2yZAUTc3G5gUWqTTqKrkDFXOj5TMXRsGOzMRFczOgE4hJXnBdX/Jn64uIq7/aAZS6EvVOBlrnIwXcq4DIXQMkCmLnIH+RUQGYurn7D8ie/e74I+gyLoB7N7AuZlKpdXEuxgpvp2LyApGsX1wvYGtan/BdOkup6CdvA5v8rZbu4foAdwfZ8JRXPgQDNXIQN2AvzlVQ3MyYgJ7DZXADczMUN/ytF69g8ZSncxQ3/K0XrWD0kmPMYcmAlGZw+M95TfMHpguN/qeXFhNFS6tixfjz4iZNkZ6QBZnMRH/yc4STZtWNbcda2mOQ4tSBtLm5pVNI8i3Bor+PWisn+QkflFWCbi9tdNtkHbXNxS01K2y1yAJwKvM0FFSmlt/D1+Nb0t2RiDgRQ4mKa4/+CuLmY3sLWsLnE0r2LKS1TWs+xaSOqAnVzwf4GsJuLsN9gMkmZLQRjUwG86djji0u3aHxrvpJqRjlKmTk2z4+U2WJGm5eacWze/aRmFtq1rgAoXOTb1hUIhQtWH0AROvZYkP4hZaR6gkWqp2z1BhDhgiUBSISLWa/+pGUWjDZSMot5PmBIxyzmDDbSIo7txZRMzB5AI1z4yYKtnYEjXDBhAI/Qsb24komEpUYWd9kqBUDCxR0DkbSIY/OY0iKLO5qFtMgCFN7NhqZfAUu4uKMUpUUc24srme5ob1IMju35SiaGBjTDwrZsgB9cLPwuVwXioP8MAQbJxdoBw3+2316BNxhc9FC3AmXQufgII/vQ4PoJYdA+ixC75eMTeGcji3hmEZH5mgSJkeMxg1a4oJiBKVwsMnC0CsBCPXKuQCpcLO1pKIgH4cWzXCrgCxdCG67ALVwEuGEaCQCGi+U9bAebi4BmEGBNBXahY3u+EnD5G3YA2/OVgCs4CbiyEQ8ABn3MXPuXSwWm4WJ1BdvC+mu6X3GSgIK7qYAzXOR4NxW4hgvWEAAaLnprCKANF6s97AC254uAj7BI+NjzRaonWKR66vlKKsoU3eCBb8CUcB+f1jd+2ACscLG+ha1g0yW3CvjChfaBKtAJFzniTQXo4cLyJkbbGdPjT9zzYVTYuHmUyzAunFI6l0/c46GbmU9lqRx/2uwm+NYcGkYXghB8DjeEzSYPoCMuNgvYFjYbF8FDlJMvAP6MZoni2eS6EPDDxYb6QPGEo5cPtGgUkFCYK/APF5uXXlylrNteFQiIjvVXB1v/FW8KVgAiLrYUOmpoe9tLSRJvKVcU0bbXZlBIwmauQEVc5ODMFbCIiy1NHkW07TV5FNI9LRlFdH/V85VU90iFIrrvSYVCuqdsUET3vbbKsHH/DFvBZnvLoCEuEJkG2JOYGtkxxqCGdDSV6hZ1xIoXQMRFWPGeM3SgjnaMQDS43V22fgcTcbGjrlFDu2W2+AMVcbEjPyiiXS8/KKQdfY/62z3mbQqFZFEl1D4eUmSfnJvXIAcEFx95jAsmil5hb899UieorbBpyMwOLMXF/ga2gs2lRIHtqTF61P42H4FRYHtGJhTXfpZtR4KauNhTdiiuHMioAjdxsafKUFz7Xp2hwR6QGU3ycJXXNirtgZEV5fWw6sWVVA+0bhTZQ691o6q4mU5HDzfT47PdBVWCxnoMShM4Rf8J3kYFnGJwEap0BYiiMNLso7IPRnGuytG6vcspFy5HmQtzDvAbncvfE20ZVIAx+k9b0wHGuNARZAUa4+Ix717AMS44aASPcdE7aASQcaGbRRWQjIv8alEFwuLi8Q4W2e96vuRtBYtQGbZKBVri4nENi1TrXlyk2sIi1bbni1R7WKTKOwmYiUKZq8BKXPzK/xXV9uv422S3MgxbtlgXv6Z4DmB7aUlKnVRWACgufmUn4hUYiYtfv2Fb2GwKCkwiO4DgI4YNwFOqGv32RMmh3556JYfi0ouDCojERY5OXIGVuHi6hx3C9nwl02+ssaB2fl/2fCXT72vYDjbrIiAmLn5T2yia373aRtH8XsbB5/fyYPD5TW2jhn6vsqUYmIqL39Qnauj3Ni8pFM9vigrF8/up97/I/AKLzLmCA1lRr50rEBUXz6H7AaLoP23CCZiic/EfQ/tg9nmKS42L7f1VwCsGMBt6GvCKzsV/SKpnygrF89wrKxTPMy0DxZMDWFWgLC5eZh76wXEF9MPi5S4MNS935VDzQmtEY73seqkqey8PMeZDEZPzQDAbw3Gg9kMrsBudC5ujQ/OmAKXZlhqp5utLblxU4DYu2cQBsNGx2Y4oxyCAu1ScfyzD6TM6A+zGpW7FVYA2OjZvAtJsS7Z4AG5chi0e7NcA2bi8pMO3SNXr8NJVS0SWqlpe2Q1rsMeWV+mecQWC4/KKOpPaWl5N8rFBamvJxiTgjcvexiQwjssr2qjUlmPzkUBqa3lN65faWuZIxxUAjctrWr/UlmOtb1hLlNpa3iC/1JZj87hSW8sJRS61tZz0xmepreWEHEltLSe9Vii1tZwglXTTctKTSopjOUEqqSrHHn+ebK+tP4PHuJzcw1awuVGkE6TC6NIJUvWsLp0g1QssUmWY5BWojEL6rEBlXGaAXhWojMupeXawPStQkgkzTVI3wTiMbiBVIDMuOecDmnHZO5sHm3HJwRjgjMv5Tc9XEnFyDzzjMpzcs4ULPqOcPs9ZbQHTGL59YdUIhtg1kvXErhFtBotos54vot3BItpdOuiowGBccnwCCONShybzvd97AYVxebeF7WCzRgnSxZJtDoAYHZutzkFiXHJ+BRTjMpxfcfYFFuNyOYEdwvZMbkkqFsfA2y2X656vpFqZbwebrphVAKYsWXuCELIMa0/Lr5TMckWOpEaW+ROaisc49rfSIktb7GLpWR9vDTa9tQ8eWtGn7WEEppqPgqTsqHFZe7mmdBui7Xv/pnyszbJYB9szLaY/JRtSPEvbjBmAasiBXdie4V7ZkrN/boMtcyjVirtTS5aJnM47tucrAVkYcuq9DAtDE3/If+1gO9g87ggBydwICXuZGyEVfXSEVC8JZ7xiQbpk+WMaYXedNx1GVuf0kQcvjH20I4reNSNuBDTGM/rioHQe6COUUTBE8fknTpKfokaLPObZRJk80rVRIhHhxnwl/SMVgRIJ2JufzMyb/lVXzivwH5fhzrn3lcDcdgMB0rF5NtEmv7AKJ5l+magMfb8y2RkAn6gjtMrTMpv5gBC55KwPjEjHZvcrQHKU0zdd1QKJl1P95QsyoWheXrI5CPCOKzQw+I6ry/xYH4DHFfbOQHhcXeYrLyAeV+hnMB4dm03gAHlcmf09KRrH9nwbc/L7FZ19Xcx3M3/DpeKvacfSRKuAbmaCdSNzOrtc2AnWgDtwK65egAjpWHYmKjAgV/H1qEk+NicDc66AggzfFgucyBVTBGAhV2GKQEUDECknQ7W3YnrCg3zl801AIldcZgMdchUsY+gBdgVM5OpqBjuG7cWV7Jx9ghC5uspn7kBFrsyWoNTVqncABFjkivkHKJGr3vwDuMgV8w/QPlZXPZmltlYywlCBFLC6nvd8JRXzDwAxHJv7SmOtrpFKmsqxPV9JdW02DhvYnq+kukZmaarVdU9maawVdgdBiVzdXPZ8JRWHR+BErgQnF+9j8vJ5dXMLW8NmcwggI1ccLfHMeRWOlr6Z6UVJhd1C0CJXPcOFPEdc3ZCjAVLlazpwIlc3v7HbiFS/sxUSSJErZmO8SFz1ZmO8S1wxG+Mp4qo3GwPnYTVZwI5ge76SiuMogB9W4TiKLSUwI+V0NlnfGEgIdy5XATKEUXM1IVNDY/PmP0RsjFEOEbtvjRKxqcQhYvcqUVppdUslShut4utzilpaacV9HzAkV+G+zxnVJK20uiVT0kaOzVOWVlpxigaO5Oq211mklVa3NEtpI8f2fCXVFE5Chec3p7i0uABug/JYTWkpUjurgM93ZslIQL0rqEDFWE2XPVOcxEVAKZ5V70IByBkrjtRAi3RsNmsELG81xcZni4TP2WII4Eh254HcCJvzZxSp1I5zAY4Hhbfi7irwkatZr2NL36xmiD8mYE986ZuVRZV8YbpsfhKPKS8Qkqv5bS+mxOMaESCSq949Ip6lrjjlAkZy1Tvl4onqilaORlkcv+bdL03Qn/a8BieECvYupxyuU0He5ewTSViYU94hDi09+QxQ+ysmt7yrXYXJrRdC2eOcB1zH1aJXMOibBTWHZln0xkP0Dxs3vCFc9a5uAfLIbQ/AHb3BkwFTD/dxhjE1gAZROUsz1opnz7IqSma5hR3B9nwl4HIPO4ZNr+EqcB9XzKB5gLnqnd4AC7LifAbIx1XvfAackNXqN2wD2/OVVGsPnOim7R4ycWQfVAvwjeYgVEX8x/EzA1kMLmccN9BQ1pigRRutc1UAKNaK4x6gzVbr256vsrGeww5geelBslX69uWOlnJOZw+TOUHq9O3vcTPArqlhy+iTHSxzU8XnzjtplBtwAdsKHJXmy1sGZ+h2G/KFitv086WsbmgDqLjNJLsjCJDkaoPJXlTcZtbzVVaZvvOudRWm73osXrHFs9pQj6i4Ta8e0Q1bWhcqbttrXai4LSmj4nJjmRWvY1fbB9gatucrqTjJ4eXsqneSA5Dk6p7egYq7X/Z8JdUOTkLltyLAkvRH+wMm7aqOzU2sMf3X7gZ7xSew2VgLnOSKAxdwJFcCXo5zBQAlVztqj3rcbY7Pdm7eiAEOICU56wRKcpUOTRh6/BHJG2vDw+QiiL8KhMngwr2skU/kDSABFPQ+hG35wPgL15TDsarC1iP/d3HLjjutzsF4++dzlrEMWdQP6jVs811gwvkEF2DZWPCsHq5xr2Dz2kDlPtDnGIkfen0OlftAn0PVPsx7vqRMVaJsH3p1yTDOeg3oylWOSFqBXbni7RLglavHXc/itKRiax/4ylXY2mdXAvzK1S9Spo386vU28iv7ghW4k6vcwGAFAOXq1zNsB5vtP4KetnpawFaw2T0VgMZWT8iMUn3q5Rft+vQLdgib2+VGvT4x2KBWn56yRwsgjK3YkAdazLHZ3SxQllZsqvN+xLE9C9ySigzReJ4ZvwYsavWRRjQU5DOZow0/L3rJSMBn+xOirrIZL+BKq2cyh2J8zs9TAM5YPT/BVrC5OW80JLvgQCytwi44e33gKq2eDZ8VqV7c8tBNb83gN1rxZQHbwvZSllQvK9gONvdFK76sYSvYbFkPGtLqBcvlaMOXbS+upHohR2jDl16OUIUszoFCWr30zJdLEaLjwEIKKu4L/yoV51zALmSzYc1VSZCR1pd5zwQjac0qHoyddf7wvAIzac1CG5Sj9WWvYDRqrFlVg9exzh+KV4DxrC/Jeo2E22zvDTiP9eU9LFLdZzeUgN1Zs8AGd2fd24MH+GONfXZppnV47vBV8O3p+/xPoDM6XPC0wLiji9c8fAA1ZN17+ADuzvoa6/DSaY7t+SrNa8pMOm193Ssz6bQ1jyZA31mHRxMs6UHZWct+QAXMzjo3N1iBs7NmiQvQzrq3xAVphwdPIO3ER79/4dLhAmohm0nrG6pcGsyx2ToE4J31DYUrDeZY/2JnfGJfGcy59JmctO/d8GyFN1XgV6wnhnLMYiy8r5JLzfASXFCbwFs4FzNHp77qPrCoyT7WekJ1SqGt80fwFdAX6wldxP7mqZdqZ05fJk/eQCfPsdYTxoER4uaTBlAv1lyXBPZifbvr+Sq3Uzjlb5o3SVrPlAZDK5v2Gow005oHJUBfrHsPSrgKtGblB/jFOqz8rD6kmdZceQT+wrF5XGmmNa8SAcBwbN6cpJnWXEwEAsOxPV9JxcILEIx1b+EFCsaalyzAYDg296VaOCoACWMdjwre4SSpWLRxn309X/fiSiouLoJ0sQ4XF78wjo9bcwJNdWiJP+OBjM+9lJCRMbBDxt4YKD21vqMzST+tg2E7VCXwF2vut/IUbL2Y9uJKxoXFHcH2fCXjUuaC9Hv8GhvdDGNL0KiGnv0vzbnh4+1ffFgMu1jxF9awB8lFcWmWy3SeRBP33+ffeWFiLniOYXFn1q+P//FH+lhZ9ozNZj7gdKxXKjiAOhybZQ+kDl4vgtQRXipqkKxA6ljbx4Bt5DWLJXA71r3FEsAda175gNzh2EwEoDvW6wXsGLYXVwLKyFzFvbh1bmWuAr5jza07Xh849vgvGcWhZgHw0FtKet0mG/7HfHvRJa+wDipgPtaAHTityF4SOB9rVksgfTg2m2WB9bHeUEDo2Y1bgD2ud2C3VaB9rDcIh6bNjQVUXN1b834JwI917/0SiB/r+w1sA2sgX+y/6yttM4MAst7BScRdBqkMAohz+YdzIDqZYA8q8EDWOe5Bxeub9Z56QOvuM3MwFSAga95kggLi2Dwu2nePuGjdaCXc4g7NyUshkWTerQIXZL3f91LC9wF2DHt8sd6HAkelcmEKbJB178IU4CBrlgCgg6xztM4KeJA17zrBB1n33nUCELLmdg8IIeve7R4gQtYsAcAIWYclgOCQK0BC1sIXqkAJWT/+yuOiRwE3AChk3QM3AB1kbVEl1K9saQE6yPqJ+mKAeerVF+PB73vYMazvVZQUI89vyoKB5HevLNBvz3ASyY+lgsSuAAZxLuBjc3qzZiIOTIhjsy1DcELWzzQKlN3zOptMgxSy5gYYV8TW4dUYiBBghfBcGayQzTVgKQ1HTZvrBGpVARyymVrIGjbPifTehhuTYIdselcmAQ/ZcPEK9JDNolcz0nsb8ia1t1kZDD3HVO5D29QNb+qCMUl5VwCL2C4TyCKbHDmlAlpkY2OmVNZm3esnGic3HO6CLrLpHe4CL7LZIpC6qmN7vpKWjKpSNmFjQvrOfXzdPYdOgvxsLnTmmassoEY23NcEa8Sx2SYlECJs8IAhstn7rVDGM6lC56JVVsOD3M3+EvcR7PHX/XTiW6704ubBfMewvT+RgA8LmemR0nGsE38xY1uuBkhko35aAyTi2OOvj9PdcdUMcJOEWmbVIIls8mVWDZLI9hJuJM5vndQgh/hPltc1wCHO5fRRhdHwhth/mvkXcEe2l6GYKz4sqhrpVqeWNagi23CriGf9oItsZYO+BlXEscffZjIk/x2nJjpt+R6mb/pufWKikMUKGVa95MmJxSULWyYQTWVht9mcAlCR6KRZSM1Gc3TSXKRm12x7+UgEshMs5Foays4V9SGttL2a5wUu7bS9voEdwmZ4jeCIbK/JiTTRNtxBAoQEaJCt1h81J6/bmwzorgYtZKvnVjUoIY5NW5E1aCHbCf8r5bPNT71q0EK2AlavQQlx7PH/RKwKpHa2mvvXnFht87l/DVrI9pbqk7pxbFrp1KCFbGf4St04NrXsGrSQrR4e1aCEONbV6/o3l2lrdgy3c4s7hM3/V2pnO6depW4c2/OVVLp00/CefbugkUvzOFbQpTPfaqWBtguyLs2zXWR3D2pAPbZIIMWzXSbraho9wzcvUBlHnAueFvgHj5XVQbdL/n9IpMtcUCmtrXYva1BAtmED8SNmuaS0tmt6jpTWNh88a1BAtmuKT0prmw+eNSgg2zUNQlrLsckETA0KyHZjcRvY9CKhBgVku730Ft4dV1h4324pMWmxbf6KoAYhZLsjt9Jijj3+NLvc+ZFAWmy7oxlKjTk2bevU4GFsd+RWqsux2bPjmqfcW0qKwt8b5Da3Hrb7DHKbhxHOxQy/06f3Fm0Em4srnaadcur+gctIA87B3Yce1lHt/jU7+Ab6+Ak4bccHiLE8zNcHC5rW0vrMwO/Tiu96ao62gwt/Uafvt9hgajIXJVmzgxFcZNejRq1Gl3+4jZGF+Sajutn3+QULoCzOxWeASk06TIXYUPdgqXFo5T5IyDJHGpyHuA+it5YV+mBL+F4fRMRHxklp/m0wjQsWLYgp2ycaijS/Y/O40vz3FrURh6mCBiQI9yHbAQ0v4u8fE15/DVSKcwFCnysw948Ml8rmfQDnwogASCn3j7S1MYlOM7MEQKXsLhnENSfYXfYGcSm3nW661hxNOTZ1j5pTh90l/UOTgt1lr39oVrDTLlfNCcIu7HJ9JwOqgt3EUh7Dpu2BGqgTOX2/01EZaLQ1oTRCsY20yzELa9BPdrJ1UbM5tJvse74SVLB4NWvtXQDGY+jhstduNoUdwfpngGcAYlXm9H2jIA0PtcI3xzINb6uiE7HARdnphmfNOns3zx6p1uCi7LSvUjOt3YV9FS3Ya1BO5OS/avu6uNX55GucJNIdmdWkwbFpT6sGBmWnu5I1UxfHJhvuNXMBWeis0Ray0MnRPfW3ygwWgoiyWyGjBhbHJsTzGkiUnU4Za8aKXThmtLiaDuxWiFCT8EM2+HFAtNOhb82YsQuHvloc14Ci7KgqatzbuuKe1i7AhpsIEnBNEat/7PJT2hpUiR36xGos6JMz85WA8Yw0zIPPuOtFCylOTXUMB56v98Rd/yB7gjXv73bBoCAtGJiV3Ybi06zCsWl9VAOzsttQfJpV6IQvl1052+GrWcVu1/PV7GL3QBVq+NyFpS7QXcCs7ChbTSrclPXN3zRR+4jvV2u2BHaZyVM65CPPCxoT+dHes3L9wn2cWVsf80EMCyTd35igenxTA9ji2GRrtgawZccYxN7ULoxBsk5Ug9gi/MOacTvgHwp0uQavxblg04ibeTsdfNWAt+zCwZcVqtTL7olikzLbPfWKTWP77pmSkb5wbIYwAizKnrakiYhbs7yZLfbe2qO62z6bF9TApDiX092l79HsczuXL5wJcQo8snTOZzvvAlaKXIRg5F2IRSPRDGd/mRlVqIFb2esRQu2jZhg4NUAoex2A1D6Z+2w6BxDK/pIhQjOcfTgAscY5Irf0TxPzIbylo0np++tSIAwNrSh8+9yPyP0vWKT+lZDFa3BS9rqRWIOP4tjj88tHbzkTnJT9FQWtSc7+qtdpNdvZX9GINLNxbM9XUguwogaafB8AK6z2pZb313AS6jof4aWU99e0G/Vax+a1qQ6+v0azSBk7Npu5g4Syv2ZAUkdwbC9lyXRNm5Oe3YfjGF4uAm6yv6YWxgi1z1YqwJvoXWINksn+Jpzm04H2GRpdDb7J/sZXUg22if/0edD47Vw+gdtWA2/iP0OAES7n87X9Yxs/QwDJypoLgJP9TV6CAJ3sdYexBuDEsdmIDtCJnLhjTWffT3CXnBNURkMv30/SZmsNAopzOWc/RR19P7nFfQibWQUADmU/sf9vYbPhHDiUvW7Q1MCgODadYtRgn+yZG4B5so/Wkj7jJNmncJJ2ajYcuOa7n2bGC4BB2esApwa/w7HHX4V7LWjuGhiU/dT+hKj7dJ285sLxfvoE28GmY+saGJS9rOTWwJ/sczO5NTAo+xmZk17dJ9RHRjx9a27Ad5O+ba4ATMpe9uRr4FH2s0UvbUnNshR4FMemo/gamBQ5XbAmGBL9EY8ONusmgKbsEVKad+9k5OYbrWqudjbDpQY/Za/XLTW4KfvwugX7guCn7OdUhzToPn+cUoOMsmedDCLKvrdOBhllL3joGkSUfY4PXYOMsr/bwVawPV9JRSlJge59IZ1/khU1vmH1n8JyqMFK2edYDjVYKfuF/cEINuvBYKXI6exx+WBW/ViQ7xc0GfrGYt9LTlkgq4QL5zvCwa74hsWLwhzimm92AK2yX1Ip6KfwCOkbDZ/GsrR/GML24ioLy2fYFjZTIECr7Clp9NbKzJlycXrvS10uNdeSg4vM5tXgrjgXbOhxfX6/ok+h4oI9VqaCgLDI6QsrIsRY3eExgO2FbczJhyVd2jXqb7XOJq8AtOz1bqcGmMWxTkWt7GVgDUDLfnUPSzL3ebmg3tjFAJhlH3YxLGXUG3+LdlunE/YagJb9mtaDclv3Wg/KbU0LpJmtF/kgRSNcIzHaLQeRqEFo2a9/w1awPV9koiZRb+vnnq+k2sBJqI3ZoLEJx4ZO2dj8YuP3vUcWzIqeYRwduDn+qqqSy+DEErUPHjvsN3RpVORmeny+md4A01UD8+KdNjgNbH6xoSjQmpvekEWT31A9dIRNr3pQlBsGKZTk5jG9b6mBhtlvKAo05KZXFKjILZ2J0X/b60yMZOyQgemy3+bdBbCYPVs2wLzs82uKNTAv+3s4CXXvrxkT8v74/dLNgrhmzFWcvc8QLmDABBddJq45rwgu//sEYKu5cNeYK8Tu4+f8YWZ/Y+PivYVlx0WgBDWYMvsdU0rqtY2fgLbW3KULLmdW9+Pk8l1GR7JvJV9zcc0DHRChi5+GBGvTwwBJ8B452uSidVUNSk100d/k35r8glQTXMA6A50muPyP7bDWwvg/GfHh0zchSdr+3KdqsvkEKagr2AbWtVGPkVuDd7NnmQq2zT4sTc8tLqlSymj+XWZ7pwbjZr9TdwXbxrHZTA6MGzbxgLaJe3ivcRngIouqjU2l93Z2yjOiPZNJMG/2OchFDfbNnkkOmDf7/bTnK2n3z7BjWK+RyQu6XksFcG72D2Y7mKv2+/Bk7hzDSKPkYuIyE3gIEkp2znaAxHFsLgNTgQe6CFOAh/tsbx3EGllrrAGq2UfMS1swPGaaCfga53L+uL75//g6s+a0uSZa/xXq3H9VNmSwLz0FOzaOY7DzJndMZpYwkhBw6vz3w25pQ6Pea92kJJbzqPc89y4njiSe3A7PujiySbLuyYdd8GTcKq5rEu00oi4ubJJMjJaCk+kBp7iwSTJJZukP6N2hdXFhk2SSkhI1fmlYLp8SpzXJWp6cUev/XcmVmRLH67LHLM1EObhycl2O5fhfXLsnrd66eHTG5AJ0QcrlxGFdXNjsX+T6aDmCcbgYoJC/HH+RkaNsbPC/FMGU/kd+XMBtFP3QvLhsV06l7V/eiluNXLByKTXSIcnLa4Hc/UV1ca2TOI/43q6+tUVyqXRI8pHOA9IhyZfyKB/RTaC41klyiU9p+/O1LlPS59hIaZWGbRPpLCPdjI1EnUSi9uhQF+c6yXYuj1/lUU2niXMd91N7Oy82aTeKPLmVXCF16ra4GOpLMWh1b9vyOGpdvO8kuwJ+KY+qhybed1LJuK4uS8sVRznzt395Kmq5S3kRR84yuN2/yNZrGcvuXzrd8txHXfz1pDKbK/56Uj+bK/OG4q8nldVJcZnhbixV0eBanbQrUejCkWrn03VxyJPKZESjMEg3yuKBJ+1JsouFvf6J6qzqSdUlJvdOqi7XlUjd3T518cCT6st96uKBJ+1JlnE1+f7xRHVWuQOOdfHAk+oDjnXxwJP2JNkvxapcLaaKBx73U6c76hX3McoQOnVXAtXFKc/+8QTnDHWnGuvilCfVpxrr4pQn7Usd6/oW+8ejB7G6uMVJBxIFrm+xf3ROC4fFqq944kkHI3k8l0eVbOKVJ5WRubjT2T+eqM4q5wBbVjBS7//64GcjHcpfOW3os5f8fDwFX/9S/DKQx+/yqIImq2Spc9xQF7c7qXfc4M761cXtjvupXfR45L/HIpzLY9mrlLT1N1u7qqQuLnlSdw6wLi550qFaz6mLS57U3cxZF5c8qb7Rsy4ueVKJMdcUpyO/2i8ueMrXYmAmHnj2vxRuU3/K31zIL6XszHSbTOrijyfVm0zq4oUnHUl4XLObjuIT1Rnm7l2pi/ed/eOJ6iyTdHOt7r63JhvLxMCx9gzq7JN1ZXHNs3/U6dsQ9VMez+XxRHUWj+UeTNfA7h9PVGexxKDkjYk0+A053pgWNzw15Niwe5E7n8QtnSTo5HgLVF28+KSymiFefFK9S7QuXnxSGdGLF5/9o6KJF5/U+TSvixefdKJ7BeLFJ5URvfjpSU9G9OKnJ51I5H+RAJxE/hexai2PYpW63K0ufnrS4rPOqPKrsqgqW6r8LzK/JRuR/C8dNzUinnzSmaSKa+dSf2avI5nGtXPuJ7nBXs5ZpzIxIH5+Ur8T6UrsdK1eKss14uZn/6jTSGzx18em1dtj07nEumsP94869F9F3cjjpTxq1bWHqQzuxeNP6gf3hUWSARaSM117mPoTn859b10897if5MIXOTieLgrSV3k8+Y6zPpInZ+J+DCD7US6Kl2NPUXz1lC8NOXmeRsX3L+VRMyUtJNGlUSzTvPNLfqnLLx0Zd0r9ISsw4sMnjU8iSFo7GZWKD5/943GrW118+KSxTIBLyyHjTXHnk56MN8WdT7qUQiQN33JyvHqjLj583E8vchOs1GJLyc3SDC5PcrM0g8udPMof7k5UZ+6nBFuqys+TvC7NoGQwidqVXErVkNOtfqvjjVzyKUmrxk3SUhUjHmm/ZOVIXADtH9XwSlwBpSspTdJursrS1JHoKj6Uy6N8Idc1rDSWiTy5b+gRjTgCSv0gRup0GcSIN6D9o9rHIV6B0uTj0HtJPkzvRYY44isoTfTOK/EZlDpPfXXxFbR//F9n0kuL0wbiMyiVvrP4CkoT3QEUn0HuMve6uApKU7UIIx6D0nQgj9/k8eR/OoulhRVfQfvHE9XZlIpNUopS5UWqLk6DUklT8RaU6i2rdfEalEqcireg/aOa5hCvQWlhsjSEaaqKt3gNSt1FmnXxFpTqmzTr4jAozVzFJo6C9o9aldbQucmri6Og/aMqNeIwKHXXcNbFUVCafZ78X2fVeuAdtu0fqw7b0nXx3W/yWGawd/npe/FTRzakSPjWmQgX8njyHReCXMInrWN+Ej5pJXOxUVrHXN0VWhfnQulmJI9f5HHfEStPCtfFuVC6ieXxmzz+rxOnxabyujgXSrfy5IzaHq/trYtroXTruvLiUmj/qG2S6HDH1uriUijVx9bq4loolX2N4lIo9fsaZX5ffAtlPYkL1+JlvZO4cC1f5m5HqYuDoP3j/65G454nX7qfhOzas/2j/q5r12TJVpwCZaOjd7q6+AbKRuXcUV38ApWvxeqyuAfyv7SK/3Ihv5TyN3kpFWekLKyIZ6D94//eRt1i1FQXz0AyAhfHQJk/cX8rs01nx1/axfzTl+MvcqPfpbzL4r34jsiKqfyGuIrYvxTX/u0fZZ5cPA1lfp5cdoiJx6HMedOqi6ehTPsurovHoUzW1MTTkJt2ODury+t3/9qQ10v/+tW9usareL2U10b5en4ur1/9q/zf7x51/kVePepcUBcedf5dXg+oC3k9oORDFx5Vlw9deFRd1EuPapzJq0c15LuXHtWQ7156VKP4vx711dksk5vF6xd59aiv3+XVo76dy2uJOv9Sl9dL/yqo83P/+lVeS9T51zN5/epfBXXuUcV3zz3qq/zfeomqSxqJwxj3+kUiRzzEuNcrOR5dL9Pz6k7eLso3uf/c1SzyJjedu5pE3mTHUKOElpvgvpRvssm24Zlye3vDM2WtpFGaetWRqZ7S0vIMkP9CMQ3kmf/kzTMH84W8lzHgSrq8+6+M40L33ynGROKDxb/L+e+6OMA4/iRnvr/W1U+lY96G+qk8Uv5V/1T8x+/qJ+cOvC6uVg4/ldustBFSL8hA5PjTm/ykv1heWKi/KB2Ob9/0FzvFX+kvSispPlSOP8kd9t91sKXj8+27/qLMYn37fviic1hSF5cp5Xsk7/7za5k3Fa8p7l1m1b/5wivzR+InRd4kj/mSfC157KIM/7WE4KJM82sx3pdq2Qr1zRfqawnFhf+e5M1L/4Xi5L5nSt689MxiA3gZjmsJ+KWnSJh94b6WbZtnnvlX3jyzK3Xod1/Ur7uyyeu7L+vXXZnXFh8ixbuMwL77wl/4yah/96XfbcGR/Tf+a7HsxRVPIfK+ks0x4hukfJfv+wrhOhsV756fjQfyXvJl1vG7rxFkkV/cd8hbU95Ksuxq++7rA9mRIBvH5E38w9Q902VmcZYhb7J/yNcH7q7U+ndfH9y8yFtp6434lGl45pu8eWaxVdYzi535nikp8MVT/smbp3Sdb/76d1/+3aEteffc7krix5f/G7lRs/7dl/SbsfPRVP/ui/nNeCX//6sPQez2E9fFF4W8LyX/f/cF3r2XBvoC727MlaUl/8miAyEuH/y797hTVz+VC1Jf1E/iYvq7b3O1Y57v6qein+BLf9G7kWT4rr9Y9h0a6qfyBp2v6qdyhavEy6z0d1+ab+XeTF+ab+Uvffm9lQ/6ZvlW0siX33JHz3dfgvUZ6Av1U3kv55n6SWrE775Ay09S/X33pfp20pXy5Zvt23gk6enb7dtMljO/+7J9J9dL+XZbtgdf+LJ8dydvJemuKW9l3N/JnZW+FBezRL4Mu7Nb9QvfgMt80YUvv3dyy6Jvze/+yZv/wmi7lHdPncumMfFaULy7s2d18VQg76nskLnw5VeW4y988/7jl7yV8SInUC58Wy97tC982ZZcdeHbeneje/3Cl23ZlXfhy3ZTFmx9yy+LOhe+pDflkjNftt3G+fqFL9uSSS982W5K/HwpQyEbti98W19uiC+tdhdfybu3VLwX1y98aW/K0bP6hS/t+3eJIV+63SXX8u7tX8ls/oUv7W6kLe9fju9FKbjwjbq7NlrevQlyQqp+4Qv8/aO8lQbct+StDOi9RJAv5/fFDRdldN1LsH3pLi7f9M36fdd5aqhf+ILuLsiQ94vDuyS8b83dLaryXj+8J/L+5fCeyrvnD3sSJt+Ii4to2Z934Uu6/CQ9ngtf3OUn2Xhy4dtsfUNbQ/8kKezLu7sDT949e+7uvq5f+H64u0VW7h49O7xLOfDF3F1PKu/lJx6klPoSLn2wC1++ZTvLhW/Hi32qvqzL8tOlb8eLWU7fjj/Icq4v+bL/Tw5vy1uxQnTpa4KfckTD1wTFbX1n5RfdzSXyfunfpa679LWBu/FP3ssvleuP5ZfcRuS6nK2Wt3t5K0P2KBcO+LqgvPGkDEtxVYqvBx7/yJv/QrHzubT9seivXPqW3G0HlnfPHbtrA+uXvq/v7rOR93P/LpstL30d8DiRGZlLXwu4BR5599+LV0N592Eq6qxLXzPI5cGXvmaQk2GXvmZwN7vXL33NIDvpLn3NUC6/l1+RDYeXvlZwR3Pql75OcC5g65e+RniSKUFfHzyVofetvXMKLO/+K2qC/Kv+qbj84bv+6bdsBtM/XRcnic7VT9I5uvT1Q/GT3GzzRf/Hct5S/0dpQS+/NdRP0rBcftN2lVdQaFZTdi580190lVTjm68s1JT/yV8V+e27NkJmXy6/ayPK7TnaiFbxH7UR5aGmC/2TfNF3Ho7bXC4vtF0yHXJ5ob/YkSi80F+UCdnLC/3F8tCe/+Jw6VazLn0NU3gKr1/6ob/zoC/v9cN7ofsPT2QnxqXvZTxtZdHz0tdBT9tB8V6aUESUr3daN3LEovxWeeCiJLfkCnlfs7R+yFtZVsQ/5pmvWWSn05mvV1riYtSPEsSv1JmvY1qyF9/3OOT015mvb1q/5c1/71XevNUdefNfeJNjZ/4L7/Lmv/CfvPkv/JU3/4XiuFoZU+5ydnn3Yeq6s5qNM1/fOIdS4iz17PA+kXf/pa5zct048/VLa+hczjbOfP3i/K3Ku+cPy7+/OLzH4p/O86UP1TjztYpzYSfvni89isaZr1lacmKlceZ7IIXTwsaZL69ua6u8+1jbuvqyceZrmMN9eI0z3+nQbgvLrzpvOY0zX8U8S37xtYusOZ35KuP5Qc5ZlPRnyQW+VhAXHme+S1F49vHVw3MZz75L8dx127waZ75L8dzrSjh8l8I5B5J3/6VZEQ++8D/LrujGme9i/JIc6DsUbo+4vJf04mBF48x3JdwBd9kzeebft/I1369wh+flve7fF4Veft0dgZf3MnQvEn8X5dflgOCZL/svUqZ8yZdVqTNfzmWPw5kv5cUOZV/GXyRufQl/kfD52YIXKTe+l/HSlntq/BfkMKbvV7hT441zX9pf/sqb/0LXzV01zn3pf+m684yNc1/+3SU48l7mBOeDXN4v/btryxvnvtwXh+gb577ku8PW8u6/PndncxvnvrfxskqL/19+//eVvJVf+/1L3spvuQOMjXNf/l9F8yX+VcLvS3xxa4/vb8gZpnNf+t3RRnkvv1GcL2yc+9GG8xcjDsjKuGyLRb4uaN/IWxm6tmw88jMLbbHP1wJum3jj3PcxSqdmZWrJTPi5rw/K26n9F+SEkq8LZCvvua8JSi9D/gvFkVvPdLXjue9jtCWVfXF3u6zl3VtalLxzX9rdQSF599aOnOPTxrkfUrTH3eL90r8XqeinE9pyT3zj3M8dFKddGue+HmjLleKNc18TuH3I8v7t8B7Lu/9+7HrrjXPfGWjHW9F9zdDOCr6vGdwuMHn3sbaVGvjc9wk6xQax8mudH/JWhs3NUzbOfS0gdeK5L/MdSTVf4mVXwbmfDyyPN/svSBr65r8jaehLvyyLn/vS35E09K2+LKyd+7qgIznV1wWyze/c1wVuQ5S8+y92Z5Jmvr13G5fk/fLw7mrHuq8T3H40efdflgFdo+5riU53ncq7//qw/P/++x/l3/vvj+bFu//+2F0J3aj7msGti4rP/7Pje3F7Qd1XFvqy3rr6qbys13940hPD/JDE3Scg7/7DUSIf9tWEWxqUzZLlh8VHQt1XG+VGyvJzb3/lrfySbIOv+4rCrYXJe5mMxZXxvpp4v5Mt3iX1XcLlOwjvb/JWUt+7E4kI311wO8TlvbT/zw95K7lyPqPuK4M/XSkIdd9VcL605L1kl/vQS/J/4mGjUfcdg/8S5+WoUfdVxF+x2XcT3KR6o+47CcXVcI267w78nRRW+ypDHBTWfYXxT2YHGvViRkKiqagrVkcvy416UV2sysm2Rr2oLtReqEa96EWs/JsEU2wuOhQbjZPaxG0OESeumT6eUMwOih1Sx6xOFkIujr+Uyxlfjr+USxfF3xQ78SRVV0Xvs1hjKrxLNIolppVEjNRdK7X7rSGHWrKVZNaCl56oLjbcZo2GHGbJVrlWpSorMrKMipLuieq+67JNMeWcqqV1caKcpRJ26QnpHQsNOfKSrSXDSaytxyeqs3gt9YLUh+v5ieos3rknqR53hTsMOetSXoIir43Dq/+DuvxSFHapL3eH4w6X54dX/wdf5Re/tfyycXj1BXJv5Fq6HXLkZd0daSMvRJUkcRXuuns8pueqTvdelMAvspHUv8t1pg052bZ20yENOfOy1ttrG3LmZT2Up3P3dNxB05ATL/tf5EVSZT3sy+8NeTwe4mzI8Ze1u0SrIcdf1sPlcbDZkOMva7HfVeXrMke9yy3GdfmheHYWTIpPXMhjOTz9T35yxrtddw05ErOeKL9aDTkas3au4htyJGbtXcW71a+GnI1ZO48DDTn1svYeB24L1VnsLuttyGGOtb+st1WQncmxPDmjYuVOpSHnSdaxKw9yxGP/qMItZ0nWMjKSMx9rf9r+Tj7rOoxrd/VjQ46BrP3Vj9IoyjGQdVaQv8mjDq5rGWToIKdAvNuPIrCulci7Lk3lEMj+8ehAoSGHQHK3U7shp0Dy7lRzXWczd/NwDTnssX88bsdsyGGPXLKSHPbIT7KSHPbIpUGRwx77x+M+qYYc9sjdEeuGnPbI/RHrK4kpVx/l7kqYhhzh2D8edwk35AhH3hOya3L2j8ct+A05wpG7mYKGnOHI9fbohpzayIfF/72QxxPVWTWS/+v6qvtHrbo2Kpe+s5zR2D+eqM6qSU8ev8jjieqsco5GG3JGI59kJ6qzqsjMrunKTzOza7/yqSSv6+3uH7Xq2rN8Kja73u/+8UR1VhUFwTVsuS8I0gbL6Yd8ITnSNWy5vjOhIacfcneOsCGnHnJ9jrAhpx9ymTeQUw/7x3LhvSU/OasiCa9r4/LoJLyurcvls65h8u4TZCAgZx/yWOLRtTh5fBKPrsXJYwmPa3FyfX1XQ4425CtRXYuTr05U1+LkiaSfa3H2j7KWUU5YSyy7k7kN2fWXJ7OT/+vsdL4wGnJmYf+o85xraPJMQusamP3j0b90Q84s5Jmkrmtg8uwkdV1LkxeF17UzeX6Suq5l2XTl/7pmZ+NdILil84acWdj0JA1co7LpnaS9azs2fYlm12bsH2VltTgPKS7+N30pCa4Z2T/KOm25Huly1WYoMemaic3wJCZdM7EZy5P7u7FqJuQ8w/6XsplwJswlcK6Z2MxPAueaic1cMphrJvaPMslXmCBO/TbuyHGjUT7KlJ9Xnc1FHe5akf2jLFzJbGyjUahSNbmGYuOu3ehGZXdcPLdtZIAoRx427hz6cNUvRrficq38KS5/ciV/42YrG3IwYuNclnfdOT2ZAnG5bhMVuLo8qrwhZyU2bv9vQ85IbGJ1tWNDDkRsnM+whhx+2MS6DpVDEJtlQb6QR5k/kJnjhjjd2ci4Vs5DbLQz1Yach9hI/0pOQGycQxBns/SJxQ3Jxh2jb8jxh00yOfm/zmZ37Lohxx82yeJEdTYnYpWYkOgOrpyD2ORDebyQx5P/uzd02134a3q33UX1mt6t8/PUkNMSW+/nSZpeOSGxdW4HG3JCYutdCLrdcw05IbF1jkgackJiqz2xN+SExFZm2+SExP7xRP3uflrL44U8Ht0DN+Q0xLa7dY8NsWqr/29DrNrJo1i1O1GdVT1JBddWbbUbkkYRBT1JQQl6r6e/69qqba/47oU8nvxfZ5W0ZHK2YXvSksnG1+2oUOvyeKI6q5yXiIacbdg/nqjOKuc0VSYQtpOydyPbPfZvN7KF2lWI+xe3WtmQjUr7F1mGlD8+lzNo/qdylfPi+EuxyOmqPv9LucZZP/5SLnF+Ub8UK5yFUTL59K20UIa8svPTvcjqixgwk7zkaqGtdpvdkJMaW5k/kBMa2/lJLnVtwVZG+3L+YjvXLb2cw9g6fwYNOX+x1f4MGnLyYrso1C/yeKK6mBKjXAncxrKT6ovMaWzj47mRhhy12BYVgwTrtGJwje+2KPqu8d2eFn3X+G5XEjjX+O4fT1Rn4EoMdK2vjEvEl8HlZfF2bGDkqIX7yQ3+v8hMyjaRIuaa5m1yUsRc07zNJKu7pnnrj7/KuoUcsNhmYpNrmrdZceisIYcr3Nu93Hj8rXyRxfSGnKfw7/7v64efUjHq+CdpCRFDpvLHX+RRmyl5VXrScvhie9KTlpMX20xKhuTX7KRkuOZ7JyF0WXfX1euL3+QXyTOuHd/5QZu0IHLoYjcQm1w7vn9UvSU5dLEbFuCv8nh009aQQxc7d1lbQ05d7B+Pflca4rBGbtJ0lYm7NPtN/vBCXuTGHTlI4V5kW1tDTk6Ur8Uqntx/tf/lprizXJ6lYMuJCvfyQ16KDxRxXCCLTRMNOTJRvhZIuWeg+KVodetye0B5z6fswz+8ld/9dvzBfeKLTMT5X9yC2heZivO/tOUO7Ib/IZU7xw9vPhouj7+UcXF+/KUM4xf1SxHQb8dfitCq/yRnveWch/+lXOxTGFkakSMeh1/E18+Z/htxh3emPiWT3XKAw/8ik7NyaOPwi3OQ3VAfl8pOTm74X2Rq7mtpTmltwRRD5VyKu1y1sLEIWWleEZulZUVkFtFc4EsDi5QtbDsrTCnMKr5SWlSAS2MEvJFHwW5kLavsjrkSuXMuDBtyimSnL6luyCmSnTu21pBTJPtH2f9QljrXqO5kRUcOlOwfy1GzXHPoOhE7t3e2IQdKdv62P1k8lYMlO3dLSEMOlOwf9XddJ2KXyZOzL1N9XDk4sv+l7OM6q6RWkNMjO18tyLz31/rF/3MTIKteV84X/t/922CSpN2o73rX//f/dLs199e125+1wbB83Fe2rkZQ0jAqHl3cVqWkeHTVrJbuXiFwLyGgkxCwg4EdDOwEgJPih3//AsSjZpFKM8wZYc4Ic0aYGWFmhJlhZq/mZgJrzbsTpCypKU0jjaaQpUbis0fis0fis/dZfLDCLD94FAOWKtGauip+ad4HTD1q1lSlGVNTEvyUBD8lwd8S5pYwt5jZH2Cm0gxTa4ZZgh5uA8yjZplKM8xx+cfNAPOoaWajqlWZgy5Od6UZO7VmmEMcn0qzzCGOz8GUMKeEOSXMbVEgXt8CRUmJtihp0RSlwY6YuiOm7rCpw5o7S1J7eA1YetSsoUozdg57NdfVrXWeQ9CjGKAq0WJJCR2SEjokJfSjeH++ssijZIhKAsB/GPgPA/8FgKM+DrXSDFJrhknqpRGpl0akXhqNCHNEmCPCXBDmgjAXhBkTZkyYMWF+Fj/ctALMo2aZSqsyx11sp9IMU2uGOSfMOWHOCTOuudN/tYdQYVeiLexaNIV9SrLTlGSnKclOM9wizYINUqMiGeCs5jYg1B5+B8KuRBt2LZqwz0nSz0nSz0nSz0mPcU56jHPSY5yXf/zfY4B51CxTaYaZkqZTiTZKtWiidFFzy5jVEU1V09AvFckiSeW0IJXTglROi4gwI8KMCLOsuJ4DnTulWabSDHNJ7FwSO5fYzvJv79oWeZQMUUkGSFrOiLScEWk5IzLojMigMyKDzogkekQSPSKJHpG+UkT6ShHpK8WkpxyTnnJMesoxKUQxKUQxKUTxDo+QlGaZOzxCWvaLjmlwcKxEWy1p0dQhy0HZ322GsEcxgFWixZJx0pKMk5ZknLRcEeaKMFeEmRBmQpgJYZJB0pIMkpZkkLQq4vrs/GsgmZRok0mLJplK8fwLwToRYkVE2Ks7TL26w9CrO8y8vsfM63vMvL7HzMo8aFWDzMpM6Kn2jzD/EeY/zLxrYuZdEzPvmoRJ4vOOxOcdic+7V8J8JcxXzHx4wsy9BplOg8zfhPmbMH9j5s9fmLnXINNpiPnYwszHFmY+tgjzD2H+Icw/mPl0jZl7DTKdBpl/CfMvYf7FzNYVZrauMLN1RZgkz7dInm+RPP+LpPsvku6/SLq/tDHzpY2ZL23M/E3i8zeJz98kPtuE2SbMNmPeEuYtYd4SJinvbVLe26S8t0katUkatUkatUk5apNy1CblqEPis0Pis0PiMzhjuyITtisyX1tqf0k/5C/ph/wN9kNcb3oxCc9XKzFAVWII69x+QKwXg9iDGMK6E5+gWTqKQexBDGHdoUaQq45iEHsQLXaMe85KMz1nrZmec/nHN08B5lGzTKUZZjkxcf0rwDxqlqk0w/xkHcdP1nP8ZF3HhNWnCatQE1ajbllTumVt6ZY1pjvW092xru6O9HWTmjvhFJ4gPmoWqjTLLKc6O4G8qjSTB7RWzQPJsOZOhe7/OGToUTy19KwiWlPJTHZCZrITMpOdkEWMhCxiJGQRI0nxBJzSLDPFU3ApmclOyUx2SmayUxKfKYnPlMRnWk5R3QSW7ZRmmUqrMjMyBZeRKbiMTMGtyeT4msyNr8nU+HpOpraUGKDOydTWmsxqrsms5prMaq7Jvo812fexJvs+1mTLz5ps+VmTLT95t+b2x4erPCXaKNWiidK8h01VmjFVa8ZUUpPkpCbJSU2SbwhzQ5gbzNziNn+Lm/xtsMWvi0Qic0sic0sic0dmNnZkZmNHZja89kqYr4T5ipkdwuwQZifMlCrm6l+Q6bUQ86AhZrC625Hqbkequ3Ka9yqQ7EfJpLqSKone62IjlWaM1FrVyF63rFlfHkPQoxigKjGElV9e7IKt1qqhP9FM8PfFy60SP9yGTD2KAVOVaE2N4CKO1qypEVzE6XWXReX6/BIy9SgGTFWiNbVc4bjqBEw9atZUpRlTE7ijRGuWmcAdJb19LwDVeFqzzDWs8XrdTc354q3aWUbMUQxEqRJNlPZwv1FrxtQe7jf2ej3C7BFmjzD7NedqOJz5lWiDr0Ub/D7O/EqzpvZx5u8NSPAHJPgDEvwpzqVKs8wpzqW9JbFzSexcEjtXhLkiTLx22et/YKbSDFNrhjkmzDFhjgmz3MBz8xBgHjXLVJphLoidC2LngtgZEWZEmBFhxoQZE2ZMmJ/FnqDQcEmLtshr0RT5fkZMzYipeBjSG5AiPyBFfkCK/LDotVwHph6VZgOvNBP2ISlKQ1KUhqQoDUlRGpKiNCRFaTjFKxlaDIR+itcyekNfKgK1qNKqGxNPNGNqSoKfkuCnJPg5bpWUZpk5bpWGG2Lnhti5IXbu4Nyg1ixzB+cGex8D3NIpzTC1ZpifNeexLDhLoEWbnbRostNHSsYOSgxgUzJ2+NjiOQ0tBrBbPKfRG5X1QmDKWWkWqjTEfP2Fma+/MPP1V4jZJ8FXYoDaZ8GP8GYdLQawEd6ucxR/MOwPhv1BsKHJCC1ibGg64iCGVty1iLGhNfeDGCwISsTYYEEYbWrOgX1w9kSLAawSDXbcIxlMiRarRYvFs+VaMxXXGM+W9/Z9GGLqhJk6YabOialzYuqcmBozU2NmasxMLcXWG8G23gi29RbGOs/t0FovBrEH0WK3JGK3JGLxSoQ/SPr+ZpFHyRCVZIBkeD4hw/MJGZ5PSOafkMw/IZl/Uu7kfrkPMI+aZSrNMMl4akLGUxMynppEcNu/1iwzgtv+exMynpqQ8dSEjKcmn4T5SZifmDklnf8p6fxPSed/OiHjPiXasqlFUzanU1JBKTGAnZIKakqmT6dk+nRKpk+nJPWnJPWnJPWnZGZmSmZmpmRmZlqOYdrPAeZRs0ylGeaO2LkjduJd5b0ZPp+iNcOc9QlzgccpSrPMBR6nzEgJnZESOiMldJbV3J1p1Vq0yLxKtNleiybbzzJcOSvNmprhynlGps1nZNp8RqbN52nNOaOuvYdKvRJt8LVogl8mYstutlKSMVRJVTsXNXcjQRXoP+Y1a6XSrJGkcl6QynlBKufFjDBnhDkjzE8Sm58kOj9JfJJZvgWZ5VuQWb6o2CZ1HZqUOmrVo41aMkkU4R1bSkPIYIMUka5YRLpiEemKRaTbFJFuU0S6TRFZfojI8kNElh/2BcHtvLwJRedRs6VIaSY+45pzGo+YXgsxDxpiPhDmA2EG050cGuyRQ4M9cmiwRw4N9sihwR45NNiLyfJDTJYfYrL8sNyScqREG6NaNFH6SfoNn6Tf8En6DZ8TMrOjRGuqFq2ppDR9ktL0SUrT5xovaCnNMtd4QavsTf6wHrSUZIhKMkCyA0yLNj5XZAdYbzUmU1pKDGDHZEprtWHWbpi1G2Yt6TSvSKd5RTrNSTnvG9j5rDRrqNKMneUP13bzp5KMlUoyRpJKLyGVXkIqveSz5m45rj2FSqgSA0FXog072WiSkI0mCdlokqRkqKzEgKkpGSqnMe7cK82YqrWqqSlZJ0vJOllK1snSdVEmgoVUiTb4WjTBz9hGs4ztNMvYVrOsbBX+BnYvKc3EgNaqMZCRheeMLDxnZOE52/dVsxHYZ6bEQPCVaIM/whMlSrOmjvBESUZGIxkZjWRkNJKRgX1GBvYZGdhnZEInIxM6GZnQyRLCTAgzIUwyasrIqCkjo6Z1OW3c/G2ZSjNMrVWZOcn2Ocn2Ocn2OZkgy8kEWU4myDZkBL4hI/ANGYFvscsJrRnmdkiYUel+J9TkKdEWeS2aIr8lUbolUbolUbol2X5Lsv2WZPvtGhd5pVnmGhf5LdlvsSX7LbZkv8WObNbckc2aO7JZczfEky9Ks8whnnzZkW1GO7LNaEe2Ge1IUdqRorQjRWmXE2ZOmDlk9suovrKtnJKqRC1Vjk94KXBYTEkIWDkqpoGBIZiSELAyBNPAhw4EPnQg8KETAA783waIR+0EeVbRTLrgaQetWTPxtEO/h0cfWjPMHh599P0O08BqotYMU2uGuazddGeL4MylFk31fiJWq/eDGBrMahFjQ4PZ/hD3vpVmoUPc9+4Pe3BEozUTq1qrxuoHro21ZpgfuDbuex+dAf/AWjNMrVWZZcZo2g0ESjJEJRlg2Xv+0QoQj5pFKs0wFyTVlWiTXYsm3ccxrkmUZmoSrRlTl/AIq9Zs8JfwCGt/vKrdjIer4IloLWro97OKZkI/6ePQK82EXmtVS6fd0kFOYD1RizahtGhMne5TcdxdBNfptBjAKtFi8ZKi1kxaTfGSYn/Ww4cPtWhN1aIx9SC+Muwrw76GsHivl9ZMDMzmJAZiwowJMybMLWFuCRNvneoT96594t61T9y79hd4+KU1w1wMCXNUc7dS11qhzK9Em/RaNEm/F93duhDrxSD2IBpsjPuPMe4/xnAKvx/vewPxMg16w9CitVOLxk7vuzDU5ivNWKq1qqn72rYbJdWqv/jeUbOGKs3YuRoXDdhbEHoUA1QlWuyU2Tplxk6ZtTOGnTHsjGHnDDtn2DnDLhh2wbALhi1/ad/YrKU0k7W0Vs1afpo/UK8cJUNUkgH6vutTgHjULFJphpmT+FSijU8tmvhMB7WXbtavtQL70rVosVo02Iz0KTPSpcxIjzKrNefdUfAYhdJCzINmmMTZSJ84G+kTZyP9sllsXtvEP0oaWa9IlaT3t4Xc2hPtSqpmJi0BYPMJAptPENh8CgDxrLDWLBLPCg+6I8IcEeaIMMeEOSbMMWHOYFdfa9Wu/olmmCucL7VoMuaJWM2ZA3/K/fEuYOpRs8FXWtVUcuZ6QM5cD8iZ60HvkzA/CRPvxhz0Sx/VoSkTLdoo1aKJ0gGe3NKaMXWAJ7c85/zrqc/kimSQWgPIivuGUwUBA74bvHR9h3jXd5B3fQd5N/eId3MPeTf3kHeLrbjFVtz9Q1bc/YO8O5yQDzDWH3CsP+BYf3pAvKcHyHt6wLw3yHvDvLcAj9QFQ1IXDEld4P84MOejNcuM4JzPYIRHp1ozzBEenQ5GpGkZkaZlRJqW0YQwJ4Q5IUziCk2Lth4cEVdog9EKJ5PSrKkrkkw7EvwdCT7eWzWYkKSfkKSfkKSflqDnQLOqNMPUWpW5+Ki1hoOP6mJEEdlKtMmkRZNM0RRuLNSaMVVrVVNjfKpNa4YZ41Ntg5gcv9SiDX5Mjl+KGO+zHMSWYhjrxRC2051hrBeD2INosUsSsUsSsUsSsTlh5oSJF14HK1JNrUg1tSLV1H68DvfXadFGqRZNlPoR9m2lqJ6dasZUrVVNTfGRFK0ZZooPpQzSMglbfwPMo2aZSjNMvH9Da5aJ928M0i12N6ZFm0xaNMmUdeG2EK0ZU7VWNTXDW8q1Zpl4S/kgI2PUjIxRMzJGXdduJ/uxYes9EKNHzUao0kx8rmudcbeLmF4LMQ+aZZKWdE1a0jVpSXNSO+WkdspJ7bSN4VFJrRmm1gyz3HV3/SPAPGqWqbQqc1ecMLkOXN+mNJtGSjNptCP5c0fy5w7nz2Evg5MIWqsyT7QqcwhvLVRS1TmQlgCw04TAThMCO3Ypf/gxgZtDtGZCrbUqczSH23e0ZphaM8xt7W60XQZXdLRo8tGJWM1Iwxku7Fozps5wYR/OtrVH5xszNPWsRWuqFo2p88IByU3Ae5fSLFRpiNl8xczmK2Y2A8vDwwWJ0gWJ0gWJ0sWEMCeEiXti+7+9TVZpcH+E0jTy69mpZIJe/u3Z2bk1U2knzIpkrSy1OkHWMbJOkA2CbGBkgyAvCfISIy8x8pzE5TmOy3MSl+cXBHmBkRcESQJ+jgN+TgJeJwGv44DXScC/khT/ilP8K0nxr18I8gtGfiHI7wT5HSO/Q+T51zOIdBpAigSRXwjyC0bigNdJGa/jMl4nZfzqDhIrjsm+niqI18S8JuQ1Me8B8x4g7wHz2ph3WpdXFMTrYF4H2tfBvDfMe4O8N8i7voa862vEu77GPJxfrmF+ucb55Rqn7zVM32ucvtctzGtBXgvzcH65bkMezi/XfzDvD+T9wbx/mPcP8v5BXmAWG6w1fD1VEO8G824g7wbz7jHvHvLuMe8R8x4h7xHzcP67gfnvBue/m/8w7z/I+w/z/mLeX8j7C3mB6UQlAd4trg9ucftxC9uPW9x+3OL0vYXpe4vT9xan7y1M31ucvnevkFc5+/b1VEE83B7dwfboDrdHd7g9uoPt0R1uj37g+v4HrO9/4Pr+x0/M+wl5PzEP55cfML/8wPnlB84vP2B++YHzSxO3503Ynjdxe968xbxbyLvFPFx+m7D8NnH5beL6vgnr+yau75s4/zVh/mvi/NfE6duE6dsk6YvLW+XETEVBPFzfN2F938T1/T0uH/ewfNzj8vGA+5MPsP14wO3HwxPmPUHeE+bh9H2A6fuA0/fhGfOeIe8Z835h3i/I+wV5P3F6/ITp8ROnx08cfz9h/P3E8feI7XuE9j1i+x5xffAI64NHXB884vR9hOn7iNP3EZffR1h+H3H5fcL98SfYH3/C/fEn3H95gv2XJ9x/ecLjrSc43nrC460Wbo9asD1q4faohduj1j2qn1u4PWrh8tuC5beFy2/rBfNeoH0vmIfTowXTo0XSA/dPW7B/2sL90xZuL1uwf9rC7WVlobgiId475uHxfguO91t4vN/C9UEL1gctXB884/H+MxzvP+Px/vMPzPsBeT8wD5ffZ1h+n3H5fcb9g2fYP3jG/YNnXP89w/rvGdd/zzg/P8P8/Izz8zOeH3qG80PPeH7oBafHC0yPF5weL7g+fYH9+xdcn77g/ukL7J++4P7pC27PX2B7/oLb8xecX15eUf38gvPLC65fXmD98oLrl9+4PfoN26PfuD16xfa9QvtesX1tPP5tw/FvG49/27g/1Ib9oTbuD7XxeLoNx9NtPJ5u4/5uG/Z327i/28bltw3LbxuX3zYuv21Yftu4/LZxf7wN++Nt3B9v4/q+Dev7Nq7v27g/1Ib9oTbuD7Xx/G4bzu+28fxuG9f3bVjft3F938HlowPLRweXjw6unzuwfu7g+rmD66sOrK86uL7q4P5pB/ZPO7h/2sH9yQ7sT3Zwf7KD07cD07eD0/cN1wdvsD54w/XBGx7vv7VQ+/aGx/tvuLy94VL1jnPtO8y17zjXvuNYeoex9I5j6R3Xcu8PKJbecS33jnuN77DX+I57jX9wrP+BtdwfnB7/8CjjHxxl/MOjjH84l/2Ds0r/cC77h3sp/2Av5V+wl9Ied/PqLL3f++W1E2BFslvG8DlLrZmdbVFEdrZ9EuYnYeJjpsOYbG2Lw1vbGlWtyiTnK4bkfMWQnK/w72fnga1OSjNMrSmmluqXGFm/xMj6JUJ+OcfIL+cY+eUcIq9eIfHqFQKvXhHv+hfkXf+CvOtfkIftu8b2XWP7/mHeP8z7h3g3T5B38wR5N0+Qh+PvBsffDYy/Gxx/Nzj+bmD83bxh3hvmvSHeLQ7vLQ7vLQzv3RXk3V1B3t1p4/JVKTeYd4N5N9C+Nua1Ma+N7Av4NFYS4lU8GmteB/M6mNdB4b1/hrz7Z8i7f0a8B5weDzg9Hm5QeFv/QV7rP8h7foD/6/mB/S8Qqheca19wrn25grw7zLvDvDvIu8e8e8y7R7H+gmulF1wrvcBa6eUv5v3FvL+I136HvPY75LXfEe8Nl/qASxQtAR4O7xsO7xsM7zvOL+84v7wH8suo1oyjsENWLdojIlo0vd4kI/GYkYjM8OCwvNXhLhD0o2SCriQDxL7GtWaR2Nf4ME1rD2l3Xj0aVcSKEm18atHEZ5oRUzNiakZM3RDmhjCxu/FhhhvNDDeaGfQ8PcxjvDFTaQaptaqRmxRbqTTD1FqVSfysD4mf9SHxs/7RxfeEK83kJK1VM5LXQh5DlQaZIX+hXuv8xMzOT8zs/AwxcXxqrRqfJ5qJzx5h9gizR5gjwhwR5ogwJ4Q5IcwJYUaw+6k1y4zglRofH7WrwXxRPUtcpN9Rs+muNJPupXbTwsybFmbetDCzeY+ZzXvMbN4TJrGzSexsMjufCfOZMJ8J8w9h/iHMP5gZuuxKaZAZuurKay3CbBFmizAr3m2qGmRWvNucak3CbBJmEzPbT5jZfsLM9hNhkrzUJnmpHc5LyHeAkkwN8gE9B3gp0LYrCQEDLbuXAruOlYSAgW3HBwlb2MQWNomFzxj4jIHPGPgHA/9g4B8IDOwMVBICBrYGeqmFgS0MbGFgwGuVkhAw4LPqIDUxsImBTQgMrF4rCQEDy9cHCWebNs427VC2IX2MD9LH+CB9jA/sT0hrlon9CfnPBc6dKMkQJ/Dgycek7HW2AxebaNFWjVo0deNkDidetGYtncM9UU7rjOaj4D3sWgyYqkRragr3pmjNmprC7SkfU3icR0mGOIXneT7meGyuNYOc47H5xwK7JdOaYS6wW7KPGJ5TU5IhxvCgmpd+/ILAH78g8MevABD7ttSaRQ5IqP1J1EB6K80ylWaYJMVjkuIxSfElvnlBa4a5xDcvfHxib2RaM8xP7I3sY1W7Xu1Hbz9Cvd+jZsu50kwxX9Vus+UcMb0WYh60ABOdIleSCfkKHiM/SD8w8AcG/sDABwx8wMAHDPyJgT8x8CcGPmHgEwY+QWDg6PcH9l/6gd2XHqRbDLzFwFsMxKl8g1P5BqfyTRMDmxjYxMB7DLzHwHsMxPnwBufDG5wPQ2OlFR4rrfBYqZRucca+xRn7Fmfs238Y+A8D/0Fg4NaYD3zx+we++N1LTVxSmrikNHFJaeKM3cQZu4kzdmh4uMLDwxUeHnrpBQNfMPAFA39j4G8M/A2B9x0IvO9A4H0HAh9xSXnEJeURl5SnNwgMuBvXEgC2cD5s4XzYwvmwdYOBNxh4g4E4Y7dwxm7hjN3CNXYL19gtXGO3cDPaws1oCzejLZyxWzhjt3DGbuHqq4Wrrxauvlo4H7ZwPmzhfPiMs80zzjbPONs84/7hM+4fPuP+4QvOhy84H77gfPiCK4cXXDm84MrhFQf5FQf5FQc5cPJGSRD4BwLbOJXbOJXbOJXbuJFq40aqjRup9l8M/IuBfyGwg3uwHdyD7eAebAfnww7Ohx2cDzu4Puzg+rCD68MOTpQOTpQOTpR3XNu849rmHdc2f3Ac/sFx+AfH4V/cc/iLew5/Qz0HfPmp1qq7Vk40w1ySXuySdGOXpB+7gt6btGaZK+jA6cPfMxdkJoSZYGZW3jIaXM1Vop2E0KKZhcgGOCcpzZiqNWMqmSnKyExRRmaKMrLYk5HVnows92RjYueY2Dkmdn7iZltplvmJG+5sBV1Ea80yV9BF9Ee2xus0SrPMNV6pybYkPrckPvEdsh/rFTxMqjXD1FqVuYXn35VkiFt4AN7fCBRwSKWk6mV/WgLAgEcgJSFgwCXQyG/lCazmaq16IuVEM8wPmNxaq0bkiWaY5Vae1m2AedQsU2mGOSZ2jomdY2LnlDCnhDklzAVhLghzQZj7Yb1c+xnYu6BF02qciNVWY9TNiak5MTUnppYF7CGU9EfNMpVWZfbwzjetGWYP73wb9Ui275Fs3yPZvrfANx1p0SaTFk0y9bbE1C0xdUtM3eFdj1oMmLrD+x5HfTz9pzVjah9PAI4GuFoe4Gp5gKvlAe7YaM0YOcAdmxG5O3JE7o4ckbsjR4MVYa4IEy//jYZ4w6fWDHPYI0xSiw5JLToktehwTphzwpwT5q64TeoulOeVaPO8Fk2eP4gdhu0wbGB/++hjhmNAaSYGtFaNgTFeqNWaYY7xQu3Ib9cI+J3TmmFqzTBJGzohbeiEtKHTWVFvVfzpFJGtRJtMWjTJNCUFf0oK/pQU/GnGTM2YqRkxdUZMnRFTZ8TU2ZIwl4SJN5D4K3ECZxGUZIhzeGJiNJ+Rxk6JNj61aOJzQXLpguTSBcmlizW+K0+L1lQtGlMjeMZMScbQKHjGTKI0wltotGaReAvNKBoR5ogw8cGBEdnqMyJbfUZkq88o/iBppESbRlo0aRRPiKkTYuqEmMp6pDHrkcasRxpHtc5wngHsUQxglWixKzx2UJqNgRUeO8QJnCbQmmUmeKIgTmvNOB3X3q5CwT+KgeAr0QR/RfpmK9I3W5G+2apfu1mu0uAVWlq0pmrRmtqvPU2iXvAWLS0GsQfRYtPa9XBfnIP5SokBrBItloxzV2ScuyLj3CQP7485lQxSawhZnRc/lSAyMC1+0CrXjF+cShAZuGh8lNWa2TR8P67SbAopzSRQ1oOeMrRm7NSasbMPvVFozTL7QX8UhUZak4y0JhlpTfz0bmhOT2mWucJzehnJ8BnJ8BnJ8NmGMDeEuSHMHfSBrTXL3EE32KM1dHOuJENcQz/nozWZKVqTmaI1mSlar/Bdu1q0xUiLphytyfhuTcZ3azK+y/v4knktWlO1aEzNJ3CPptaMqVozpqbM1JSZmhJTt6RjtiUdsy3umI27eBlQaVWklqpmei10Dk9pCBk6hjcmB0PG4XMhFxUpgES13RgvYIzx+oWXAit1SkLAwDrdQWpiYBMDmwEgHteMyYHoMTkQPe7O8IqAFk1WPxFt6iyIqQti6oKYmsMtBFo7mcE9q2iGucOOALQYCP4OuwIY93APXGsm+D3cAx8Ptni0qEVrqhaNqcPa/bC3qt4OUtUsVGmGOcYLDVozwR/jhYa9+dJcnTW+BAxVorVUi8bUCR7XKg1CQ73Q8QReaKIkE/gJvNFkL7W64yky0mshIw+aNRKvhWnNmtklafRRxMqPnyFDj2LAUiVaUz/gETitWVM/4CG48YTUpRNSl05IXToZE+aYMMeEiQ8/jsnhxzE5/Diek6Sfk6Sfk6SfZ7X7+b7b3wkM5LVok16LJukXg9rLfDUIN09KtFgtWmyKY0BpJga0Vo2BaIAn27VoTdWiMTUakhpKiQHskNRR0bR2v3ATnlch7FEMYJUIsMvgzeBaPMWeVUSLld0HcfC4rhYD1ioxhIWFK4pw4YrwbQvj/bdINohZNohJNojhJRNKMobG8JaJcdwn+UqJ1k4tWjv7tT/dFcZ6MYg9iBY7ZdZOmbVTZi2pB2JSD8SkHvDHCe14VEmGqCQAvH+FwPtXCLy3M1rjpAf3o2rNILVmmGRnkRZtAiVkZ9E4hSeYlGQMTeEJpvG+scn2ldf9W8DMo2atVJoxsvSxdm+3cyvJGKkkYySeKNCaRZKJgu2+cllEtavQRMFRswFXmgn4Dt6UpCRj5Q5eleT7liFP2VqrDppPNMPEq9Vaq5p5ohnmijBXhIl31Ez8JrPAPVZaM0ytGWYPzkFozTJ7cBZiQnaRTcgusgnZRTbp4x6p1gyz3yXMMWGOCRP3xifl9PtZ46tlKs0wtQaYgbVKJSFiYKVyMsCLC1qzyAEJ+IQwJ4Q5IcyMMDPCxI43Jx9DePhHa4aptSpzhMvQCM7jackA8eyQ1oyRIzw7NBkNCXNImHgv4mRS+zvZ/xNq0pVmmgytVZuMyRTv8dOasXOK9/hNZnBeUEnVk0VaMkC8ZU5rxsjZjBiZwnUKrVlmCtcpJrOc2JkTO3Ni54YwN4SJl+cm8xiOs7RmmFqrMhcxtlNphqm1KjMa1262q3ntNdA71KLN8lo0eZ7c/zEB938YrWpqTCrPmFSeMak8yZ0iE3KnyITcKTLxTucDZfMoVTdda6kKTH1Taq//0JoxUmuAGXBRoiREDOzA8FLghJaSEDBwPuvgH6wFge0WBLZbEPh+BYHvVxD4HqiLstqNjOIC80lKsyVHaabgZLjKzHCNmeEKM8fLUlozyBwvS03yhDATwsRr5ZNd2Qd9tUNKrRmm1irMabd2P1l1az8DOwWUZhJIa9UE2ms/l/txEmB6LcQ8aAHmYzeCdnotxDxolol7XFPinnpK3FNP/VJl4B53rVnmAl7lPu2RpuJENNQeaSymPdxYaM1CcWMxHeJhtdYMc4iH1dMR7ndpzTBHM8LEXu61ZpnYy/10QrLThGSnCclOiz68xlBrhqk1w5zj3UFatIVJi6Y0rfBoXWvG1BUerU+zFHp71Jphaq3KXNd+dt3Mb2DXidJs4JVmwr6Go3UlGSvXcLQ+69aaw3hVawY8aSvt5OLDilS1cdbtFp3Rt38h5lE0IT8RLbYHvZBprRr4E82Evsy9rVaAedQsU2mGiec/tGaZeP5jRu4NmJF7A2bk3oCZP/wbmFjQmmVO4dTCzDcugY2QWrPMBdwIOevG0B+U1iwzhh6hZr0BHmlp0WZRLZos6sXQKrQWMTa0Cj3r4W6j1kwM9HC3cdZbEuaSMJeE+UmYn4T5SZgbwtwQ5oYwt+VewVClp8RAMinRJFMfz9RpzZjax3N1s/4M3oOqNcucwatQZ318JlVrlonPpM76KWGmhIlXMmceFOiSaM0wtWaYYzhBqzXLHMMJ2tmAxOeAxOeAxOcgrXXG+9r7MbDjQIs2i2rRZFEvhrZdaBFjQ9suDmKHWdth1nZC1g7LDtuNvQJOayZitVaNWP/Hgf641iwzgv3x2XCHM4DSLHOHM4D3+x1wM6s1w9SaYa7wLgYt2mTSokmmjy3Dbhl2S7Aj6KtYSSb8I+ireObXGh5CxCHsPZ9ohokPVWjNMvGhitloCU8Rac0yl/AU0czv6w5sCtWaYWrNMHu1TneeBRdotGjTXYsm3ccRyU5KDGAjkp3Gn7gbqTQbA5+4G0n8EMyIH4IZ8UMwG6e11naxAsE/ioHgK9EGP8f7wrQYwOZ4X9hsTKq+Man6xqTqm+AxxAQPISZ4BDHBi35as8gpMbKcm+oECqnSLFNphpkTO3NiJ15Pm03hHhklGeIU7pGZTcnwdkqGt1MyvJ26WjuOw90SJdrMqUWTOaekeE5J8ZyS4jndEuaWMPH2k9kMHwJRmg38DB8B8Vqwbj5qkBmsmYn7iRnxPjEjzie81iJ2toidrbCdMpZ+/Bdkei3EPGiW2cfprjST7loz6T7FfVGlWeYU90XLMUUz0ModJUNUkgFGuDpWmkVGuEKek4mCOZkomJOJgjkZgc7JCHRORqBzMvkwJ5MPczL5sKg9jveNdHBgd9TMhKuSTN5clDOcV/aIuNaMmVozZuLta1qzzDEJekyYMWHGhEnq+AWp4xekjl9khJkRZkaYpG1fkLZ9Qdr2feGKBqCjfNRMVlKSyUoRvnRQa8bMCF87OIvIVGNEphojMtUYu03bo9pjqCk6araKV5oJe1z72d1nNcD0Woh50ALMx3g1rD2+BJleCzEPGmS+EuYrYQbtnJAJcSUGqBMyIR7PyFhOiQHsjIzlYjLjFpMZt5jMuHlHOT8CjbHSLFNphklGRzEZHcVkdOQvMAu4ntaaYWoNMQM3g2oNMgN3g86WZGZkSWZGlmRmZEkakCVpQJakAVmuCHNFmCvCJP2GJek3LEm/4RMv+mvNMD97hEnS6JOk0SdJI3KJ3oxcojcjl+jNPsnZcy3aauSTnD2fkZQnCU/S3fmagrWoEq2dWrR2TuCls1qr7gE/0YypU7gnVms29FO4J3a2msNtY1qzzDncNjZbkey0ItlpRbLTKiOtkhIDyZSRVikphqQVB79VzUKVhphBS48aZAI7cegTEviEhb2H1+qUZpJJa9VkSshMU0JmmhIy05Tgi8m1Zpn4avJZMobnGbVmmWN4nnGWkCnLhExZJmTKMiH1XUIqvITUeGmP1MxKtLlJiyY7pWTHQ0p2PKRkx0NKOg8p6TykpPNQuql9+B0I/VGzgVeaCXupPV1j5tM1Zj5dB5nFQD+Q64+SCbmSbMCLzuQdBDbvILB5B4Gh6XQym04m07Pa3+FuEt7YdtRC0XjQbDSSPlhG+mAZ6YMRX3wz4otvRnzxzciVNzNy5c2MXHkzy0iNlJEaKSM1UrYg/SUlBlJpQfpLWURMjYipETGVTGJkZBIjI5MYGenbZKRvk5G+zZrE6JpE6JrE57r2MlwtENNrIeZBs0zsAEdrJuzrEQk79rurNcvEfndn6w1ZN1ViIPQbsm6aw8sglGQMzeFlELOcFM+cFM+cFM+ctJg5aTFz0mJu8OZtrRnmpkuYfdIJUaJNIy2aNNosyK4mJQawC7KrabMkOUqJAeyS5KgNmWDekAnmDZlg3pD5qw2Zv9qQ+astWZjckoXJLVmY3JYLd80g02sh5kELMGGHZIs7JFvcIdmSRnlLGuUtaZS3ZKJpSyaatmSiaUeGCTsyTNjhYYL33BU47qekKlFLBthz7re7QcfdWjRpfiJWE33eHWB3hFoMYAfYIeHce8AMjI61ZiNgBEfH8+4YVyNaDJg6xtXI3O/uf2sGTD1q1lSlGVNxP0drlon7OfNe+ObuE8UAe/Di7nlviDtOWrTRqUUTneTo25wcfZuTo2/zXg67OVqzzBx2c+Z9PODWmmH28YB73l8WrWCoqteijVItmigd4EGY1oypAzwImw/xIExrhjkcEOaQMIeEOSRMkkxDkkxDkkzD/QhluOwH5wO1aJNJiyaZhp/E1E9i6icxlZSmISlNQ1KahjtS8JUYCP6OFPwRrkZHwVq08r+MnSM8YNKaCfsID5jmE3iniJIMcQJvFJkTr65z4tV1Try6ziekbE5I2ZyQsun9vYZOpmrRJroWTaI7j6+TRXi6XotB7EG0WJL0xFnsfMKSfkyYY8IcE+YU+p3QmmVOoeeJufPFMUnCm8y1GIhSJZoonS5xG6o0Y6rWqqbOJnh/pBatqVo0pnoPPAH/QlqrOhg60aqmzknbNCdt05y0TfOIMCPCxLNu8wW5oEmLNkoX5IKmud9QFsqoSjOmas2YiicItWaZeILQx0xgX5+SDDGCu/q8FDhToyQEDJypOUg/MPAHBv7AwCYGNjEw0G5GZPARkcFHRAYfEemHRKQfEpF+SIy3wCutuplPSyabx3hOUGvGzHhKzJwR5owwZ4Q5x9lSaZY5xxkzXhE7V8ROMosRk6wUk6wUk6x02OrVCjCPmukpaq3KXPXxsqQWba2pRZOdDuIrw74ybKh9K5upp0BdfJRMnCqpGvy07PY8vQeIR80ilVZlZjiHZjiDZjh/Zl1C7BJklzBjuFVfa5YZw63682xLmFvC3BImubRbizYjZeTS7vkaJ/sap/oaJ3o+xwsAWrR2atHYuRtjX9VatFgthrAv7q4dhPViEHsQLXYHJ8K1ZuJVa5WIXXSx01mtVZknmmHinT1as0y8s2exjxO4VUqLJkpPxGqULroThp0w7IRjO5PVGGK9GMQeRIudkcSakcSakcSa1VrdWdg3khYDpirRmlr+eTOUB46aNVVpxtSo9jzb97CawVg9igFTlWhNTWC9qjVragLr1YMWWGbQGmQGlhkWXbysqDXLxMuKi+7O/xBgHjXLVJpm7ke7ix6ez9CaYfbwfMaiFxNmTJgxYX4S5idhfhJmRpgZYWaESdK9R9K9R9K9j71Yac0w+xPCXBLmkjCXhEnSqE/SqE/SqL8izBVhrgiTpHufpHufpPsAz+BqzTAHXcIc4vsstWirUC2aKnTwgWfutRjAfuCZ+4V39RPYGa81GwNjuDN+MZiSWJ2SWJ2SWMW7nbRmmXi302KwwTtptBiI0g3eSbMgy2sLsry2IMtrC7K8tiDLawuyvLYYzghzRpgzwozg4Q2tWWYED284rTWMBlVmGdlH0SaTFm0yrXCfRGnW1BXukwxTEqUpidKURCmp98gy4IIsAy4+ysteQ2M9Ldoo1aKJUn+xQ8seidFadXrnRDOm4ol2rZngf0Qk+KSr80G6Oh+kq/NBmtEP0ox+kGa0nKJp2elhJRmikgywrLVbASOVZpFKM0x8PFVrljknAcd+hBfEj/CC+BFejJZ4FVSLNs9r0eT50RYPQ5RmTd3iYYiP7UCbfJQMUUkGSPqiY9IXHZO+6Jik+5ik+5iku19sDyCPUvUCAy0ZID7zqTVj5OSDGBnhrojSLDPCXRHiDGlBnCEtiDOkReng5SrUbB41m92VZnJ7qYU2IioNMkPbEL3WesTM1iNmth5DzAnphCsxQJ2QTviM5PkZyfMzkudnZEw3I2O6GRnTkbtqFuSumgW5q2axj+n5dhGebztq1SU7LZnoJAvzC7IwvyAL84s5ic45ic45ic55+UM7UOKVZplKqzKJe5gFcQ+zIO5hFsSVy4K4clkQVy6LxYYwN4SJN10vorLkhrLSUbNlU2kmL+2f4yi8HqC0EPOgIWaLMFuEGbaTTDlEZMohIlMOEWnlItLKRaSViya16+E+EMHyrsRA6JVogz+ptdLhBGK9GMQeRIvNC2+QrVYIexQDWCVCbHCcpESMDY6TYpIHYpIHYpIH4iG8v0drljmEN/gs4jFhjglzTJjlD9c/AsyjZplKM0xSR8WkjopJHbUk7ciStCNL0o4sE8JMCDMhTDLlsCRTDksy5UA8uiyIR5cF8eiy+CRdp0/SdfokXSfi4XlBHDwviH9nVxPEgwliei3EPGiWOSBDTyUGqAMy9FxNyZSwEgPYKZkSXsW11iqOa9eh5UolBrBKNNjSScd1KGKPmoUqDTFvbjBzr0Gm0xAzuFh71CDzgYS9cttwVYPMym3DXivqQ+sZS0mmOCmpWpoSPKxN8Kg2wYPaBN6xrCQEDNyw7KV2EwLbTQhsB+bDyjqwZXdjKclMVyrJALHjVK0ZG1PsOHWRkt5dSnp3KendpWRCKCUTQimZEEpZdZyy+jhlFfJhD1hgLlBpxlStVU3NyPpkRtYnM7I+6f0UBHaua626c/1EqzLXpKO4Jh3FNekorsmE+ppMqK/JhPp6i49natEmvRZN0ucz6MVea8ZUrVVNzVkuzVkuzVkuzfFdZVqzpuLbyhZ5XrtfRMtqjio/eBRPTT2riMbUTR/esqM1Y6rWqqZu8FE9rVkmPqq32JIh3TY4ovtSkUzQt2TJc0uWPLdkyXO7IKvISrQZSovWVOLbRIsBLPFustiSmcEtmRnckplBf74+cPxPa5a5gQcAF9tdrdWNBsFds1oMBF+JJvg7kgF2JAPsSAbYkby/I3l/R/L+LsKbhrVog69FG3wyqN2RQe2ODGp3JEftSI7akRy12xHmjjCxKw4/f/Zsd/YqqUrUkgHivp7WLLJPjPwgzA/C/CDMGWHOCHNGmBHe1a1Fkz9PxGr+jLpLeFRNa9bUJTyqFnU/4aUgWrPMT3gtSER8PETEx0NEfDxE5YH9Z3v8TUmGqCQAbP+EwL2EgE6qAvu4N6o1g+zj3mjUHxLmkDCHhEkKUZ8Uoj4pRP0x3MWrNcscw128UT8mdsbEzpjYmRFmRph4CSgawP6ikgxxAHuL0aAPt6FozSL7cBtKNEigX1KtWWYC/ZIetIDLAK1BZsBpQDQsBhHXnUDFedSqvVotmVpziEc0SkPI0HDGa6EJS6UhZGi2MhpiTyZaM5E5xJ5MomHO7MzxxOqJaE3Na8/DHGO9GMQeRIvdkBjYkBjA0+rRB57J0JphfuCZjGiEG8wRbi9HuLkckYZjRBqOEWk4RiQ7jUh2GpHs5LekheolpVnmHNdLY2LnmNg5JnaOh7gxUpplDnFjNM4JMyfMHDPJ7quI7L6KyO6raDIhzAlhTghzCidvtGaZUzh5E00iYmdE7IyInWUj/fwWYB41y1SaYW6JnVti55bYuSPMHWGS4ds0hnd6as0wtVZlzrCrGa0Z5gy7molmpFM3I526GenUldXLVaADdpQMUUkAeH0Hgdd3EHh9h4G/MfA3Bv6GwBsc5Bsc5Bsc5FBXbo57cnPckSul9isEtl8hsP2Kgf9h4H8Y+J8F+p3ggZUTrRmk1gyTFO0FKdoLUrQjPPKN8Mg3wiNfsh8qIvuhIrIfKorGODKVZpljHJkRmZmJyMxMRGZmogVhLghzQZjL2p/+OA6PMJRo+8NaNP3hGKd7jNM9xukeuzFn1A1u19KitVOL1k42wIqHeMnoRLTYqPaaRata+y6EPYoBrBItFs/xas3GK57jjWIyqxCTWYWYzCp8xviouRZt8LVogu/HNYHBy1EyhiqpaueKdOBXpAO/Ih34ZFa7kUnQgP8jLdqwa9GEPSF9zoT0ORPS50xiHKFKq26SONEMk0yfJmT6NCHTp0la60QJKKRKDESpEk2UkrtZInI3S0TuZolSMmZPyZg9JWP2jAyLMjIsysiwiNwCEZFbICJyC0Tkdzu02wHmUbNMpRnmmti5JnauiZ1kriYjczUZmatZww0iSqruD9FSFZiTqiknVVNOqqZNuexxExhnKc0wtWaYJMNvSIbfkAxfDj9bgQHCUTK1kpIMcAEP8mnNGKk1w4zgyrjWrJkRXBmPdmWJbdrTgVozdmqtwozLefU7mzOVVCVqCQB/vELgj1cI/GEHR/EIL7ZqzSBHeLE1JlcixuROxJhcihjP1oS5JkxcF8VlBruzi6JKquYhLQFg4OS7khAwcO49jvBEitZMqCM8kRJHEWFGhBkRZkKYCWHijke8xD0ErRnmEvcQ4lXt12ob7ssorbr8oqVqRyZe4XkprRkzVzExM8OnLLVo+lwnojE1KQ+LBsZFSrNQpSFmaDeV0iAztJcq3vcZfyWjYXB/nhbN/rwT0WDTLolVJVpjtWixs33umI2Dp9m0GMAq0WD3Hchf2WhVO//SCHC1asEnqiGTfVUx2VcVk31Vyy7ep6q0KlJLVTP3WjNbhZ02K61aVrVkkSPolEdr1swRdMqz7M5rL+P5JLijTIsmlU5Ea6qIy+BGIC0i7DK4EWjZXZAYWJAYWJAYWMJpdK1Z5hJOpB+0wMS31iAzMPV90G6InTfEzpuQneVEzEuIedQsU2lVZg8PObVmmD085Fz2B7DjqDXD1JphlnniuRlgHrWqW4kTrcr0O1ECYzmtVQdzJ5phpvC0pdZM2LVWZRJfVEvii2pJfFEth3HtP/dPsCZRoi3yWjRFnuyOWJLdEUuyO2L5MYebgrRmmFqrMsdz3Dxr0QZfiyb4430hG0eb4E24WgxglWiwE3zsUmsmBib42OVysiTMJWEuCROfntGaKVATfHpmOevWrlfdsItYLdoo1aKJ0hl2PK01E/wZdjy9LGP7xa5OKskQlQSAb1cQ+HYFgW+BmmSO9/BozSLxHp7l4fCgHdlqzTC1VmWSoeiSDEWXZCi6JEPRJRmKLslQdBmlteZqOAu60tGizZxaNJkzLv/8h12m1JoxVWtVU5d46Kg1w1zioeNy1a09jrurcE9ciTb4WjTBXw3wuQktBrADfG5iuSozx9nZuY0CLZo4OBGrkVAe7736ETD2qJmhg5KMpQkZ4CTBAc6XimSReNJkSVZrlmS1xjsfODv7aplKM0ytAWbg/hglIWLg/hgvXb9C4PUrBF6/QuDNPQTe3EPgzT0GvmPgOwa+Q2DzNwQ2f0Ng8zcG/sHAPxj4BwKf3iAwcBemlgCwhbNNC2ebFs42gU2kSoJAXFheOhD40oHAlw4EtjGwjYFtDOw8QWDnCQI7ge5LSrqYKelipqSLmZVj2WagT6Q0w9RalZmTXlFOekU57hV9lp+7thlSSVWilhSwoaS7Gwi8u4HAuxsIfLmDwJc7CHy5CwDLYXGzEyAeNYtUmonGEQn2iIR7FAy401ZdPOWhtSrzRDPMKd5dpEXTZTkRq632qhsTU2NiKu60rfwBqVeb8FozTK1VmUO891prhjnEe6+d9jp1HsgCPly0aKNUiyZKh3gsrTVrKh5Lr4YJYSaEiTtXq1EEh1VaM0ytVZnjUemKJnAaX4s2SrVoonQvvsb7f0K+hrQYxB5EiEXWehFjg9b6i1sDe9C1ZiJWa9WI9WcdAhuTtWaZH3BrstM6H84BYWB7mRZt8LVogj9N8GkrLVqsFg12lhb+AoN5QIkWq0WDXQQ72/VTyUTrAna2V4syxn882JRSmkUqzTBjOCTQmmXGxM4Uj4G1aONTizY+y/a7Haj8lWZNVVrV1PJvrwMxepSqGxG0ZIC4P7Yi3jVXxLvmys8MtULMEezRn2hVZpl8rUCjd5QMUUkA+PoLAl9/QeDrrwCwh9tlpVlkD7fL8QfcYqU1y/yAW6ycuzmY4jHp58Skn0P2SqzIXokV2Sux8htCf9jj+FozTK1VmVmxOeH861mgpCvRlnQtmpJ+EM8Z9pxhzzH2+i+mXv/F0Ou/mPnYxMzHJmY+NgnzH2H+I8x/mNm6xczWLWa2bjEztKVFaZAZ2tLitbcrzHy7wsy3ULchGzLokFGHDFtWr+1rW6CUZgqU1qoFqjzL+mpnq5RkiEoywBmu8ZRmkTNc4+WkdspJ7ZST2mmb1R7d+Zefoa6dEm0aabGaRkm3dj2eJcGhrdIMVGsBJhwuKy3EhIPlvdZcdSPE9FqIedACzGdxQxVmei3EPGgBZnu8gkyvhZgHLcScDDCz1IJMr1nmB9yjrLVqFj3RKlk06Y5xfafFgKVjXOMl3s1PYDVXa9bUT7iam3SxK1WtWSZ2ppp0U5bvU5bxU5bz09qveX8GsV4MYg+ixZbbmdvPgRg4ajYGlGZiYFdrd7MVMPUoBkxVojG1h4cMWjOm9vCQIekNCXNImEPCXMKmRGuWuYRNSdKHE0VKMsQ+nCZK9vkB51Il2jTSokmjPtlzo8UAluy5SfoRCX9EIiAiMVC2ss3rAPOoWabSDDOBO8O0ZpkJ3BmWDPBCsdKqC8VaMtE5IGk/CCb9RUUKIB/H8RQhvRZAHqQAsj1B7fJRCyAPkkWScjQgBWlAStJgXM7F/A7ZeRRtlteiNXWMJ4e0SLCByaFkCKfGlGTCP4QTY14KnA1XEgIGzoZ7KTB7pSQEDMxdJUN/lXoozEfNIpVmmPh+Pq1ZJr6fLxlOoGMfrVnmBDr2SQ4/PAWYCXTMfKJV7fROJ+y9IEoyRCUZYLf2a9Rd1B4C50i0aLO6Fk1WH5W/PAUKu9KspUozpubYh7AWA6bm2IdwMsLOOrRmTcXOOhJ/JWAr0BYpzTC1FmDC9Qot2uBr0QR/jN1raM2aOiPBj7BXai0GTI2wY+qDGPJcoUWMDXmuSMbkgJYWA1hyQCuZuLZwX+WE+g5HzfQdlGSRA3jIUWsmrbRWTasJ3gqqNcvEW0ETsp86IfupE7KfOpksCHNBmPigUzLFZ1u1ZphTfLY1KYtF+9Eij5IhKskA8aFerVlknxi5Ih1bJdosr0WTP/diK5unEOvFIPYgWmxCYiAhMYCX/xPvESrQLzlKhqgkA8SHSLRmkQNi5ATueNeaZU7gnvdkTsrmnJTNOSmb8y2eylGaZW7xVE5ZbM++2c3EWjNMrQHmVRsir9qQeNWGwD8Y+AcD/4SAXdylV5pFdnGn3muhXr3SIDPUr19MiZ1TYueU2Dkldk6JnVNiZ4THXEqzzAiPuhbLWru770w8BO4M1qKt5bRoarkFvhtda9ZUfDd64s+ABIOfkOAnOPgRdHStpOp2BC0ZIGngItLARaSBi/ClOFqzTHwpThItiZ1LYueS2LkhzA1hbghzS5hbwsTOSr2fqlu7Lq8kk+hKAsBQTzaG7jq0BIChFYoYuutI8GkzL7V/QWD7FwS2f4WAv1ydWgGeN041kyxKMnVGPKq149Gg9hYauijRVkVaBNiYYWOGjQGWDDVjMtSMyVAzJrVmTGrNmNSacVbrjLuT8DhTiYHgK9EGn5TLmJTLmJTLJel1Lkmvc0l6nUvSQ1ySHuKS9BDJpa4JudQ1IZe6Jp+1u3mvW7sKNcNHzSCVZJKozBRXgVbjKJkyryRrY/H+CIGtRwhsPULgfxj4Hwb+FwS+T9IxikWvBWLxIJlYXJV7kUITVUfNlh6lIWbrDjNbd5jZusPM1zZmvrYx87WNmf89YuZ/j5j532OQWWzlDEwmHiWTQkqqpnkpte4gsHUHga07CAxsrFQSAgY2Vh6kNga2MbCNgW8Y+IaBbxDYeYXAzisEdl4hMFSyV8GSXZUMsLdvi1dgqVGJgcyoRJsbI+jTW2vW0gh69U5WK7wTQmmWucI7IVYbstKqxEDwN2Sx1bvYDDRkR8kYqqSqnQl0HaskBAw4jk0S0idISJ8gIX2ChMwSJ2SWOCGzxEnZr7kLZCSlWabSqkx/hDVQbxwl0zwqCQBDqZNCv75aMkDSCU5JJzglneD0E3pw0ZplfkIPLkmGp/QyPKOX4Qm9rNbO3N6AwO5epdnSqDRTGDOyLSkj25Iysi0pI9uSMrItKSPbkjK8w1Vrlol3uCbkeuaEXM+ckOuZE+9AuBmoh5VmmUqrMsvNaleBlfWjZIhKAsDQnNYaT2mt8YzWGs87rvG04xrPOpZ7nc/Ov1ii0ky1oTXI/E6Y3wnzO2Te3ELkzS0k3txCYGgSJseTMDmehMlxucmDxaZRkQAw4GtYSQgY8DSc5L1iQexv4K46LdqKTYumZstHuEpXmsmVWjOmkgnMnExg5mQCM1+TXpYSA8Ffk17WJsLNj9KMqVqrmrrBd/BqzTLxHbzJdo6PZWrRBl+LJvh7sb2dxxDrxSD2IFrsai+u+uHtckoMYJUIse2/BNv+S7DtwLGlZIf9fWnNpNcOe/xKu7VOdzEP5lalVTdlaKlqptdC+zyUhpChfR5ea/3FyNZfiGz9xch2EyPbTYhsN0PIKT7prEWT7CeixeLpR61Vk/1EM8keEWZEmBFhfhLmJ2Himee0h5fCtGaYvT5hDghzQJgDwvwgzA/C/CDMEWGOCHNEmDFhxoQZE2YOve5qzTJz6HXXaZ3uqFdlFgVCibYoadEUpd6OBH9Hgo+3NqZ97N1Fa4bZnxDmtvYYDcKdCC3a4GvRBH8w2MfNfBh0u6xFi9WixY5IvafEAHZE6r3BmGHHDDsm2GGtM5yHPW8rzVT8SrJIUqMQf7kp8ZebDstNMe2nAPOoWabSDBOvCWvNMvGq8EELDCC0BpmBIUQ6xJ7BtGaZ2DdY+kGK6Qcpph+kmI7wpkGl2fw5wlsG95qse3R+BpleCzEPmmWSVpRcg5KSa1DSEWlJRqQlGZGWZJQRZkaY+MK4dIyXrpVm43OMF67T8ZzUTEoMUOekZhp/Muwnw34y7IphVwy7IthJcYTgLnAkSGmmHlUSRHYIsoORnRCSdMzIZdIpuUw6nYxY0EfBsFvRmjojps6IqTNi6oIwF4S5IExS8iek5E9IyZ+sobd9rVnmGnrb9+sDV/ZokJIMUUkA+PAKgQ+vEPjwCoGdFgR2WhDYaQWA5ZCv8xggHjWLVJphltPjV4HkVpplKs0wU1IlKdGWIC2aEjQnhX1OCvucFPb5hjA3hLkhzC2OUqVZ5hZH6aI8zPcc6NspzTC1Zph4g5bWLBNv0Eq9Gy67W1ZJ1flmLQFgYEFSSQgYWJBM/d3LoVArzYRaa1VmWfV17H4QJRkjlWSAJKvHJKvHJKvHI3g7otYscwTvR0z9VsXADQ1aq97QcKIZJploIlscU7LFMV36EyKBBkhphqk1wySNL7njLSV3vKVLMoOxJDMYSzKD8Uka9E/SoH+SBr2s/G/+WuRRMkQlAWBge1GKtxeleHtRusoIMSPIjDDL7kgnUIKUZplKM8ycjDKVaNtKLZq2Eu+ySfEumxTvskmTAb6aQovWTi1aO/GtZlqzluJbzdJkWutMemntOjTQUGLAVCVaU/F6mtasqXg9LU2x+yKlWUNT7LwoTcl0VUqmq1IyXZUOCXNImEPCnOKpJaVZ5hRPLZFbtFNyi3ZKbtFO96UCzzEoMZBKCZllSFPcS1SaNTXFvcSM9G0y0rfJSN8mI+tTGVmfysj6VLbAXRGlmR6T1gyTdBsy0m3ISLdhTYrSmhSlNSlKaz8Yew8wj5plKs0wyczamsysrcnMWk7yUk7yUk7yUv6JRzFKs8xPPIrZjGqdbjQKr3oo0RZPLZriuYlrnXjfRQ8uJCgxgFWiwZZDp5fArMVRMuFXUjX4W7wlUGsWibcEpts1aZaUaMOuRRN2fwdrwEuI1oypWquYmvVwztdalXmiVZmDSe1qNO4Fg69FE/wTsRr8bLDAsarFAHaBYzUrVxtC2V9pFqq0ABN6u1VaiAm93Xqt9YyZrWfMbAXt7NbeRt1VcCeOFgNUJRrsDDvmVZqFzrBjXq+1HzGz/YiZ7UfMDPnQVRpkhjzoZt6XQuCuOK2ZAqW1aoFa9OAtXFozTK1VmdGgdrNcmCFoEQgl2tBr0QQ/KlvuK3vZldaMqVoLmFpMb71j5vU7Zl6/Y+bNC2bevGDmzQtmNtuY2WxjZrONmfctzLxvYeZ9K8j8t9vtgg6MtBhM+oNok35V7FAMtfhaDGCVGMLCyXAtBrFwMjyLNszaDbN2Q6wt3d0EqUetukanJYRsvWFk6w0iW28YGZozyVbQT2VGfPlkK7yBQGsmo67wBoJslRJmSpgpYeaEmRMmnoXIEtyH1JphJrgPmaV4+KA1w0zHhLkizBVh4tF9tiZ2romda2Lnek6Yc8LEQ+Zsh68FVZot7Tt8L+hek35AsOt41ELMg4aYIVcKSoPMkCOFrJzcPv/SsPGpNBOfWrPxWfztP4h8+weJbzaB1l28n1NrVeSJZphl5fL0GmAeNctUWoD53p1MqkyJaS2aJDoRq2m0JluO12TL8ZpsOV4P4SS2kgxxCCex10Psk1drFol98q6HS3jUWmuWuYSHrddl8r3bY2lKMkQlGWAZgPZ/AeJRs0ilGeYap7jSLHONU3xe/nBtJ4i0ZphaqzL9VVuBo0VaM0ytGWYOffJqzTJz6JN3HePrpLVmmDG+THodpzhzKs0yU5w5/YVGd4E0Upphaq3KzCJ48E1rhqk1w8S9L61ZJu59+RtaA9lTSVWilgxwCO9605pFDuFdb3l3CgOuNcuckoDP8eY9LZpW40Sstho5aTVy0mrkpNXIuyu4pKg1y1zBJcXc35dwZcuR1gxTa4b5ibeqa9FGqRZNlPZW+ISiFgPYFT6hmJNzEDk5B5GTcxD5EPfntWaYQ9yfz0fEzhGxc0TsHOOundYMc4y7dvmkh5lKM0ytGWZGmBlhZoS5Jsw1YeJWPp/i8abWDHPaJUyS7lOS7lOS7r5X8ceu1mjNMLVWZS7wbhytGeYC78bJiUfJnHiUzIlHyTyaFAPHx4BPcy3aakSLphqJSBaNSBaNSBaNoTMdJRliDF3p5DEpmzEpmzEpm3FCmAlhYo9w+YowV4S5IsxkVGvGYF5RizbdtWjSPcG737VmTE3w7vc8XZCWTonWVC0aU7Osdt+NkuC0iBYtVosWSyrSjFSkGalIc1KR5qQizXFFuvG3bV3bOQetVZknWpXZw5Wz1gyzhyvnTT+u3Yz3OTk006RFk0wnYjWZNv1V7aa7mlT3DRoxgFWiwZIr3TfkSvcNudJ9M4bTI0qq7qHRUhU4x9lJa8bIOclO830bs+2D+FSijU8tmvh0buS3A4Q9igGsEg12P+ZvDuNVrRnwu6hFi9Wixe5fuvt2MVSlaDGAVaLFrmqtoXMncRvCHsUAVokAGzNszLBxGBu5Syydq73AcrUWLVaLFkvGO1oMYMl4Z+N3vQd2J2rNlAWtVctCjEe7WrNMPNrdLFe1l1U6Cd7dpUUbfC2a4K9wF0hrxtQV7gJt3O2gLhn/hgqXEq2pWjSmJqRxSUjjkpDGJVkQ5oIwF4RJFoK1GAg+WQje5HhrrtaMqTnemrvt4uBrrco80QwzhlOmWrPMGE6ZbrtLuFlFa5a5hJtVtt2EhD0hYU9I2FPCTAkzJcyyv3UTCvtRs0ylGeaW2Lkldm6JnTvC3BEmPtKyJdezbsn1rFtyPeu218PxqTTL7OH47JH47JH47JH4JJNmWzJptiWTZtsRYY4Ic8SYOWHmhIk3Kmwntfthb2WWSKQi1GJ158eJVq1BvXhzhaGVi1S/VCSErNz3WtUQsnLd68l/a99hZMVt45eKhJBvJOBvOOBvJOBvbYI83UL25exUMsgZnjHTmslIMzxjtp3jRlNrhjknjeZ8RJgjwhwR5pww54SJd5JsF4S5IMwFYZZRfW3vS1FSdSiqJQAMOAxQEgIG3AVsSd97S/reW9L33pJO8pZ0krekk7xdkZy5IjlzRXLmag6ndLRmmXM4pXPQbn5h5s0vzLz5hZnvd5j5foeZ73aBdZuQ7lxCunMJ6c55d8qB23O1Zphaq9yeu82GeNZRi2Z0cCKayrMQ09r9I8SKiLCFaLF4iVlrNgamJFZJJ5ms12/Jev02I52QjHRCMtwJ2ZWJeGOXG5RUJWrJAMsGoH0bIB41i1RalTmY4uUbLZp0PxGr6b4b+nv3rOsurRlTtVY1dTTGF/1q0ZqqRWPquHYd//++zi01QiCIoltxCeaxAf2QQPCBigvInySZBKxAGJi9JxN1cu2qe78PHIrumm6rdLo/P9L/aqfMS4EFzt+fxAtz7ixy3ljsjFuDwIgzbgyubMnyh5xJV0isG2Tau8d7rr1Cqv2DTMtHYBEjsMgRiJY9YNQZLXo7q1vurFvurFvujM6pBUad0UG1K7P0W5WUEael36ocWNlwZ9lwZ9lwZ1QkAaPOqEq6sUo4K+GsuJPnkolcMpFLFt4OAYw6o9shdsbz00R+mshPy7qCO7uCO7tCOMUcdWKOOjFH0YGywLjziTuHnjuHnjuHnjtHEeco4hxFnHxXMrErmdiVLKzjgR2d+ZEx5yTWkEmsIVO4hnxnzfVe+njz+IeBFaDTzrzBiMw958y8wXh+tex5NrLPAfShInShvm0999GXyshcqMjSUN+3VyO1P98HmXMiS50nXtgic84TL2zPX/QNOKC0S4AoFe6P6cGpQchckMgOzsvlB/tXyzA='
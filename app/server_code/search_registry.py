@@ -0,0 +1,25 @@
+import anvil.server
+from .registries import LocalSubtagRegistry
+
+MAX_LIMIT = 100
+"""The maximum number of results a single search call returns."""
+
+@anvil.server.callable
+def search_subtags(typename: str, query: str, offset: int = 0, limit: int = 20) -> list:
+    """Search the registry, e.g., for a typeahead over locales, regions or currencies.
+
+    Only the requested page of results is sent to the client instead of the complete
+    registry. See RegistryIndex.search() for how results are matched and ordered.
+
+    Args:
+        typename: The registry type to search, e.g., "locale", "region", "currency".
+        query: The text the user entered.
+        offset: Number of results to skip.
+        limit: Maximum number of results to return. It is clamped to 1 to MAX_LIMIT.
+            None returns MAX_LIMIT results.
+
+    Returns: List of (code, description) tuples.
+    """
+    limit = MAX_LIMIT if limit is None else max(1, min(limit, MAX_LIMIT))
+    index = LocalSubtagRegistry().get_index(typename)
+    return index.search(query, max(0, offset), limit)
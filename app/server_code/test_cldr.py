@@ -0,0 +1,186 @@
+import anvil.server
+from ._test import TestCase
+
+from .registries import CLDRFile, CLDRLocale, CLDRArchive, IANASubtagRegistry
+from . import display_names
+
+LOCALE_DIR = "cldr-json/cldr-localenames-full/main/de"
+
+def _display_file(locale, section, content):
+    return {"main": {locale: {"localeDisplayNames": {section: content}}}}
+
+FILES = {
+    f"/raw/{LOCALE_DIR}/languages.json": _display_file("de", "languages", {"de": "Deutsch"}),
+    f"/raw/{LOCALE_DIR}/territories.json": _display_file(
+        "de", "territories", {"AT": "Österreich", "GB": "Vereinigtes Königreich", "GB-alt-short": "UK"}
+    ),
+    f"/raw/{LOCALE_DIR}/localeDisplayNames.json": _display_file(
+        "de", "localeDisplayPattern", {"localePattern": "{0} ({1})"}
+    ),
+    "/api/cldr-json/cldr-localenames-full/main": [
+        {"name": "de", "type": "dir"}, {"name": "README.md", "type": "file"}
+    ],
+}
+
+def _serve(files: dict):
+    """Start a local stand-in for GitHub that supports ETags and counts requests."""
+    from json import dumps
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+    from threading import Thread
+
+    class Handler(BaseHTTPRequestHandler):
+        requests = []
+
+        def do_GET(self):
+            path = self.path.split("?")[0]
+            if path not in files:
+                self.requests.append((path, 404))
+                self.send_error(404)
+                return
+            body = dumps(files[path]).encode("utf-8")
+            etag = f'"{hash(body)}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.requests.append((path, 304))
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.requests.append((path, 200))
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server, Handler.requests
+
+@anvil.server.callable
+def test_cldr_fetch():
+    from tempfile import TemporaryDirectory
+    server, requests = _serve(FILES)
+    origin = f"http://127.0.0.1:{server.server_address[1]}"
+    defaults = CLDRFile.URL_CLDR_RAW, CLDRFile.URL_CLDR_CONTENT, CLDRFile.CACHE_DIR
+    try:
+        with TemporaryDirectory() as cache_dir:
+            CLDRFile.URL_CLDR_RAW = f"{origin}/raw/"
+            CLDRFile.URL_CLDR_CONTENT = f"{origin}/api/"
+            CLDRFile.CACHE_DIR = cache_dir
+
+            locale = CLDRLocale(LOCALE_DIR)
+            TestCase.assertEqual(locale.languages, {"de": "Deutsch"})
+            TestCase.assertEqual(locale.regions["AT"], "Österreich")
+            TestCase.assertEqual(locale.scripts, {})
+            TestCase.assertEqual(locale.format("de-AT"), "Deutsch (Österreich)")
+            TestCase.assertEqual(sorted(code for _, code in requests), [200, 200, 200, 404, 404])
+
+            # Unchanged files are revalidated, but not transferred again.
+            requests.clear()
+            CLDRLocale(LOCALE_DIR)
+            TestCase.assertEqual(sorted(code for _, code in requests), [304, 304, 304, 404, 404])
+
+            TestCase.assertEqual(CLDRLocale.find_locales(), ["de"])
+            TestCase.assertEqual(CLDRLocale.find_locales(), ["de"])
+            TestCase.assertEqual(requests[-1], ("/api/cldr-json/cldr-localenames-full/main", 304))
+    finally:
+        CLDRFile.URL_CLDR_RAW, CLDRFile.URL_CLDR_CONTENT, CLDRFile.CACHE_DIR = defaults
+        server.shutdown()
+        server.server_close()
+
+def _archives(files: dict) -> list:
+    """Return the given files as zip and tar archive like downloaded from GitHub."""
+    import io
+    import tarfile
+    import zipfile
+    from json import dumps
+
+    content = {
+        f"cldr-json-main/{path[len('/raw/'):]}": dumps(data).encode("utf-8")
+        for path, data in files.items() if path.startswith("/raw/")
+    }
+    zip_file = io.BytesIO()
+    with zipfile.ZipFile(zip_file, "w") as archive:
+        for name, data in content.items():
+            archive.writestr(name, data)
+    tar_file = io.BytesIO()
+    with tarfile.open(fileobj=tar_file, mode="w:gz") as archive:
+        for name, data in content.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return [zip_file, tar_file]
+
+@anvil.server.callable
+def test_cldr_archive():
+    for file in _archives(FILES):
+        with CLDRArchive(file) as archive:
+            locale = CLDRLocale(LOCALE_DIR, archive)
+            TestCase.assertEqual(locale.format("de-AT"), "Deutsch (Österreich)")
+            TestCase.assertEqual(locale.scripts, {})
+            TestCase.assertEqual(CLDRLocale.find_locales(archive), ["de"])
+
+    registry = IANASubtagRegistry(file=[
+        "File-Date: 2024-03-07", "%%", 
+        "Type: language", "Subtag: de", "Description: German", "Suppress-Script: Latn", "%%",
+        "Type: region", "Subtag: BU", "Description: Burma", "Deprecated: 1989-12-05",
+    ])
+    TestCase.assertEqual(registry.get_types(), {"language"})
+    TestCase.assertEqual(registry.get_by_type("language"), {"de": "German"})
+    TestCase.assertEqual(registry.get_suppressed_scripts(), {"de": "Latn"})
+
+@anvil.server.callable
+def test_display_names():
+    from time import time
+    with CLDRArchive(_archives(FILES)[0]) as archive:
+        tables = display_names.compile_tables(["de-DE", "ja"], archive)
+    TestCase.assertEqual(list(tables), ["display-names:de-DE"])
+
+    display_names.invalidate()
+    display_names._TABLES["de-DE"] = (time(), tables["display-names:de-DE"])
+    try:
+        names = display_names.get_display_names(["AT", "gb", "XX"], ["de-DE"], "region")
+        TestCase.assertEqual(names, ["Österreich", "Vereinigtes Königreich", None])
+        names = display_names.get_display_names(["GB"], ["de-DE"], "region", width="short")
+        TestCase.assertEqual(names, ["UK"])
+        names = display_names.get_display_names(["de-AT", "xx"], ["de-DE"], "language")
+        TestCase.assertEqual(names, ["Deutsch (Österreich)", None])
+    finally:
+        display_names.invalidate()
+
+    # Locales without a table are looked up again once MISSING_TTL has passed.
+    lookups = []
+    registry_tables = {}
+    class Registry:
+        def get_tags(self, typename):
+            lookups.append(typename)
+            if typename not in registry_tables:
+                raise LookupError(typename)
+            return registry_tables[typename]
+
+    defaults = display_names.LocalSubtagRegistry, display_names.MISSING_TTL, display_names.TABLE_TTL
+    display_names.LocalSubtagRegistry = Registry
+    try:
+        TestCase.assertEqual(display_names.get_table(["fr-FR"]), None)
+        TestCase.assertEqual(display_names.get_table(["fr-FR"]), None)
+        TestCase.assertEqual(lookups, ["display-names:fr-FR"])
+        display_names.MISSING_TTL = 0
+        TestCase.assertEqual(display_names.get_table(["fr-FR"]), None)
+        TestCase.assertEqual(lookups, ["display-names:fr-FR"] * 2)
+
+        # Loaded tables are looked up again once TABLE_TTL has passed, so that
+        # updates made by other server processes are picked up.
+        registry_tables["display-names:fr-FR"] = {"region": {"AT": "Autriche"}}
+        TestCase.assertEqual(display_names.get_table(["fr-FR"]), {"region": {"AT": "Autriche"}})
+        TestCase.assertEqual(display_names.get_table(["fr-FR"]), {"region": {"AT": "Autriche"}})
+        TestCase.assertEqual(len(lookups), 3)
+        registry_tables["display-names:fr-FR"] = {"region": {"AT": "l’Autriche"}}
+        display_names.TABLE_TTL = 0
+        TestCase.assertEqual(display_names.get_table(["fr-FR"]), {"region": {"AT": "l’Autriche"}})
+        TestCase.assertEqual(len(lookups), 4)
+    finally:
+        (display_names.LocalSubtagRegistry, display_names.MISSING_TTL, 
+            display_names.TABLE_TTL) = defaults
+        display_names.invalidate()
@@ -18,3 +18,201 @@ def test_locale():
     locale = Locale.match(['zh'], ['fr', 'en'], 'en')
     TestCase.assertEqual(locale, 'en')
     TestCase.assertEqual(locale.requested, ['zh'])
+
+    locale = Locale.from_accept_language(
+        "fr-CH, fr;q=0.9, en;q=0.8, de;q=0.7, *;q=0.5", ['fr', 'en']
+    )
+    TestCase.assertEqual(locale, ['fr', 'en'])
+    TestCase.assertEqual(locale.requested, ['fr-CH', 'fr', 'en', 'de'])
+
+    locale = Locale.from_accept_language("zh;q=0.8, it;q=0", ['fr', 'en'], 'en')
+    TestCase.assertEqual(locale, 'en')
+    TestCase.assertEqual(locale.requested, ['zh'])
+
+    # Quality values outside of 0 to 1 or with more than three decimals are invalid.
+    requested = Locale.parse_accept_language(
+        "de;q=nan, fr;q=inf, es;q=2, it;q=0.5555, pt;q=-0.5, en;q=1.000, nl;q=0.5, sv;q=1."
+    )
+    TestCase.assertEqual(requested, ['en', 'sv', 'nl'])
+
+    class MyLocale(Locale):
+        max_distance = 0
+
+    locale = MyLocale.from_accept_language("fr-CH", ['fr', 'en'], 'en')
+    TestCase.assertEqual(locale, 'en')
+    TestCase.assertEqual(type(locale), MyLocale)
+    TestCase.assertEqual(Locale.from_accept_language("fr-CH", ['fr', 'en'], 'en'), 'fr')
+
+    chains = Locale.build_fallback_chains(['pt'], ['pt-BR', 'pt-PT', 'en'])
+    TestCase.assertEqual(chains["chains"]["pt"][0], ['pt-BR', 0])
+    TestCase.assertEqual(chains["chains"]["pt-PT"][0], ['pt-PT', 0])
+    Locale.load_fallback_chains(chains)
+    TestCase.assertEqual(Locale.match(['pt', 'en'], ['pt-BR', 'pt-PT', 'en']), ['pt-BR', 'en'])
+
+@anvil.server.callable
+def test_locale_index():
+    import anvil.http
+    from . import registries
+
+    class Response:
+        def __init__(self, text):
+            self.text = text
+
+        def get_bytes(self):
+            return self.text.encode("utf-8")
+
+    files = {
+        "https://example.com/l10n/index.lst": "de-DE\nen-US\n",
+        "https://example.com/l10n/fallbacks.json": (
+            '{"available": ["de-DE", "en-US"], "max_distance": 100,'
+            ' "chains": {"de-AT": [["de-DE", 4]]}}'
+        ),
+    }
+    requested = []
+
+    def request(url, *args, **kwargs):
+        requested.append(url)
+        return Response(files[url])
+
+    class FallbacksLocale(Locale):
+        fallbacks_file = "fallbacks.json"
+
+    index_request, fallbacks_request = registries.request, anvil.http.request
+    registries.request = anvil.http.request = request
+    try:
+        # The fallbacks file is only requested if the app opts in.
+        TestCase.assertEqual(Locale.index("https://example.com/l10n/index.lst"), ['de-DE', 'en-US'])
+        TestCase.assertEqual(requested, ["https://example.com/l10n/index.lst"])
+        Locale._INDEX_CACHE.clear()
+        requested.clear()
+        FallbacksLocale.index("https://example.com/l10n/index.lst")
+        FallbacksLocale.index("https://example.com/l10n/index.lst")
+        TestCase.assertEqual(requested, list(files))
+        TestCase.assertEqual(Locale.fallback_chain("de-AT", ['de-DE', 'en-US']), [("de-DE", 4)])
+    finally:
+        registries.request, anvil.http.request = index_request, fallbacks_request
+        Locale._INDEX_CACHE.clear()
+        Locale._FALLBACK_URLS.clear()
+        Locale._CHAINS.clear()
+
+@anvil.server.callable
+def test_closest_match_many():
+    from concurrent.futures import ThreadPoolExecutor
+    from .langcodes import closest_match, closest_match_many
+    from .langcodes.tag_parser import LanguageTagError
+
+    supported = ['de', 'en-GB', 'en-US', 'fr', 'pt-BR', 'sr-Latn', 'he']
+    desired = [
+        # exact, standardized and duplicate tags
+        'fr', 'en-GB', 'en_us', 'fr', 'en-AU', 'en-AU', 'de-AT', 'iw', 'sh', 'pt',
+        # unknown languages
+        'xx', 'qaa', 'tlh', 'und', 'xx-YY',
+        # farther than the default max_distance
+        'ja', 'af', 'zh-Hant', 'ja',
+    ]
+    for max_distance in (0, 25, 1000):
+        expected = [closest_match(tag, supported, max_distance) for tag in desired]
+        TestCase.assertEqual(closest_match_many(desired, supported, max_distance), expected)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            TestCase.assertEqual(
+                closest_match_many(desired, supported, max_distance, executor, chunksize=4),
+                expected,
+            )
+    TestCase.assertEqual(closest_match_many(['ja'], supported)[0], ('und', 1000))
+    TestCase.assertEqual(closest_match_many([], supported), [])
+
+    # Tags that can't be parsed fail like in closest_match().
+    try:
+        closest_match_many(['fr', 'spa-mx-latn'], supported)
+    except LanguageTagError:
+        pass
+    else:
+        raise AssertionError("LanguageTagError not raised")
+
+@anvil.server.callable
+def test_langcodes_data_json():
+    import sys
+    from . import langcodes
+    from .langcodes import data_dicts
+    from .langcodes.data_json import TABLES, dump_tables, load_tables, install_tables
+
+    tables = {name: getattr(data_dicts, name) for name in TABLES}
+    loaded = load_tables(dump_tables(tables).encode("utf-8"))
+    for name in TABLES:
+        if name == "VALIDITY":
+            TestCase.assertEqual(loaded[name].pattern, tables[name].pattern)
+        else:
+            TestCase.assertEqual(loaded[name], tables[name])
+    try:
+        load_tables('{"LIKELY_SUBTAGS": {}}')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("ValueError not raised")
+
+    # Tables are only installed before data_dicts.py has been imported.
+    TestCase.assertFalse(install_tables(loaded))
+    del sys.modules[data_dicts.__name__]
+    try:
+        TestCase.assertTrue(install_tables(loaded))
+        from .langcodes.data_dicts import LIKELY_SUBTAGS
+        TestCase.assertTrue(LIKELY_SUBTAGS is loaded["LIKELY_SUBTAGS"])
+    finally:
+        sys.modules[data_dicts.__name__] = data_dicts
+        langcodes.data_dicts = data_dicts
+
+@anvil.server.callable
+def test_langcodes_snapshot():
+    from types import SimpleNamespace
+    from .langcodes import Language, closest_match, language_distance, tag_parser
+    from .langcodes.language_distance import _DISTANCE_CACHE
+    from .langcodes.snapshot import warm_caches, dump_snapshot, load_snapshot
+
+    def clear_caches():
+        Language._INSTANCES.clear()
+        Language._PARSE_CACHE.clear()
+        _DISTANCE_CACHE.clear()
+
+    requested = ['de-AT', 'sh', 'zh-TW', 'pt', 'en-GB', 'ja']
+    available = ['de-DE', 'en-US', 'sr-Latn', 'zh-Hant', 'pt-BR']
+
+    def results():
+        return [
+            (closest_match(tag, available, max_distance=1000), str(Language.get(tag).maximize()))
+            for tag in requested
+        ]
+
+    def fail(*args):
+        raise AssertionError("not taken from the snapshot")
+
+    clear_caches()
+    load_snapshot(SimpleNamespace())
+    warm_caches(requested, available)
+    namespace = {}
+    exec(dump_snapshot(), namespace)
+    snapshot = SimpleNamespace(**namespace)
+    clear_caches()
+    expected = results()
+
+    # Results taken from a snapshot are the same as computed ones, without parsing
+    # or computing distances. Entries are only created when they are looked up.
+    clear_caches()
+    TestCase.assertTrue(load_snapshot(snapshot))
+    TestCase.assertEqual(len(Language._PARSE_CACHE), 0)
+    parse_tag, tuple_distance = tag_parser.parse_tag, language_distance._tuple_distance
+    tag_parser.parse_tag = language_distance._tuple_distance = fail
+    try:
+        TestCase.assertEqual(results(), expected)
+    finally:
+        tag_parser.parse_tag, language_distance._tuple_distance = parse_tag, tuple_distance
+
+    # Tags that the snapshot doesn't cover are still parsed.
+    TestCase.assertEqual(str(Language.get('fr-CA').maximize()), 'fr-Latn-CA')
+
+    # Snapshots of other data tables or code are ignored.
+    clear_caches()
+    snapshot.SOURCE_HASH = "outdated"
+    TestCase.assertFalse(load_snapshot(snapshot))
+    TestCase.assertEqual(results(), expected)
+    clear_caches()
+    load_snapshot()
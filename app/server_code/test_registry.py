@@ -0,0 +1,109 @@
+import anvil.server
+from ._test import TestCase
+
+from .registries import RegistryIndex, LocalSubtagRegistry, encode_subtags, decode_subtags
+
+class _MemoryDB:
+    """In-memory stand-in for the subtag registry table. Rows are dictionaries."""
+
+    def __init__(self, rows: list = ()):
+        self.rows = [dict(row) for row in rows]
+
+    def search(self, **kwargs):
+        return [row for row in self.rows if all(row.get(k) == v for k, v in kwargs.items())]
+
+    def get(self, **kwargs):
+        return next(iter(self.search(**kwargs)), None)
+
+    def add_row(self, **data):
+        self.rows.append(data)
+        return data
+
+def _memory_registry(rows: list = ()) -> LocalSubtagRegistry:
+    registry = LocalSubtagRegistry.__new__(LocalSubtagRegistry)
+    registry.db = _MemoryDB(rows)
+    LocalSubtagRegistry.invalidate()
+    return registry
+
+@anvil.server.callable
+def test_registry_index():
+    index = RegistryIndex({
+        "AT": "Austria", "AU": "Australia", "GB": "United Kingdom", 
+        "RE": "Réunion", "US": "United States",
+    })
+    TestCase.assertEqual(index.codes_with_prefix("a"), ["AT", "AU"])
+    TestCase.assertEqual(index.search("au"), [("AU", "Australia"), ("AT", "Austria")])
+    TestCase.assertEqual(index.search("united"), [("GB", "United Kingdom"), ("US", "United States")])
+    TestCase.assertEqual(index.search("united", offset=1, limit=1), [("US", "United States")])
+    TestCase.assertEqual(index.search("united st"), [("US", "United States")])
+    TestCase.assertEqual(index.search("reu"), [("RE", "Réunion")])
+    TestCase.assertEqual(index.search("xyz"), [])
+
+@anvil.server.callable
+def test_registry_search():
+    from datetime import datetime
+    from . import search_registry
+    registry = _memory_registry()
+    now = datetime.now().astimezone()
+    registry.update_or_create("region", {f"R{i:03}": f"Region {i}" for i in range(150)}, now)
+    search_registry.LocalSubtagRegistry = lambda: registry
+    try:
+        search = search_registry.search_subtags
+        TestCase.assertEqual(len(search("region", "region")), 20)
+        TestCase.assertEqual(len(search("region", "region", limit=500)), search_registry.MAX_LIMIT)
+        TestCase.assertEqual(len(search("region", "region", limit=None)), search_registry.MAX_LIMIT)
+        TestCase.assertEqual(search("region", "region", limit=-1), [("R000", "Region 0")])
+        TestCase.assertEqual(search("region", "region", limit=0), [("R000", "Region 0")])
+
+        # Only the index of the current version is kept.
+        registry.update_or_create("region", {"AT": "Austria"}, now)
+        TestCase.assertEqual(search("region", "a"), [("AT", "Austria")])
+        keys = [key for key in RegistryIndex._INSTANCES if key[:2] == ("_MemoryDB", "region")]
+        TestCase.assertEqual(keys, [("_MemoryDB", "region", registry.get_version("region"))])
+    finally:
+        search_registry.LocalSubtagRegistry = LocalSubtagRegistry
+        LocalSubtagRegistry.invalidate()
+
+@anvil.server.callable
+def test_registry_format():
+    subtags = {"US": "United States", "AT": "Austria", "RE": "Réunion"}
+    encoded = encode_subtags(subtags)
+    TestCase.assertEqual(encoded["keys"], ["AT", "RE", "US"])
+    TestCase.assertEqual(decode_subtags(encoded), subtags)
+    TestCase.assertEqual(decode_subtags(encode_subtags(subtags, "zlib")), subtags)
+    TestCase.assertEqual(decode_subtags(subtags), subtags)
+
+@anvil.server.callable
+def test_registry_descriptions():
+    from datetime import datetime
+    registry = _memory_registry()
+    registry.update_or_create("region", {"AT": "Austria", "US": "United States"}, datetime.now().astimezone())
+    try:
+        TestCase.assertEqual(registry.get_descriptions(["AT", "XX"], "region"), ["Austria", None])
+        TestCase.assertEqual(registry.get_descriptions("XX", "region", default="?"), ["?"])
+        TestCase.assertEqual(registry.get_descriptions("US", "region"), ["United States"])
+    finally:
+        LocalSubtagRegistry.invalidate()
+
+@anvil.server.callable
+def test_registry_metadata():
+    from datetime import datetime, timedelta
+    now = datetime.now().astimezone()
+    registry = _memory_registry()
+    registry.update_many(
+        {"region": {"AT": "Austria"}, "display-names:fr": {"region": {}}}, now - timedelta(days=60)
+    )
+    TestCase.assertEqual(registry.get_updated_on(), now - timedelta(days=60))
+
+    # A complete update drops the metadata of types that are no longer written.
+    TestCase.assertEqual(registry.update_many({"region": {"AT": "Austria"}}, now, retain=["script"]), [])
+    TestCase.assertEqual(list(registry.get_metadata()), ["region"])
+    TestCase.assertEqual(registry.get_updated_on(), now)
+    TestCase.assertEqual(registry.get_version("region"), 1)
+    TestCase.assertEqual(registry.get_content_hash("region"), registry.content_hash({"AT": "Austria"}))
+    TestCase.assertEqual(registry.get_content_hash("script"), None)
+
+    # Partial updates keep the metadata of all other types.
+    registry.update_or_create("script", {"Latn": "Latin"}, now)
+    TestCase.assertEqual(sorted(registry.get_metadata()), ["region", "script"])
+    LocalSubtagRegistry.invalidate()
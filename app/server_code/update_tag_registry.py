@@ -17,50 +17,127 @@ here: https://www.w3.org/International/articles/language-tags/
 
 from datetime import datetime, timedelta
 from anvil.tables import app_tables
-from .registries import IANASubtagRegistry, LocalSubtagRegistry, CLDRFile, CLDRLocale
+from .registries import IANASubtagRegistry, LocalSubtagRegistry, CLDRFile, CLDRLocale, CLDRArchive
+from .locale import Locale
+from . import display_names
 import anvil.server
 
 REGISTRY_MAX_AGE = timedelta(days=30)
         
 @anvil.server.background_task
 def task_update_subtag_registry():
-    local_reg = LocalSubtagRegistry()
-    age = datetime.now().astimezone() - local_reg.get_updated_on()
-    if age <= REGISTRY_MAX_AGE:
+    # Only reads the small metadata row. The registry rows are loaded if an update
+    # is due.
+    updated_on = LocalSubtagRegistry().get_updated_on()
+    if updated_on is not None and datetime.now().astimezone() - updated_on <= REGISTRY_MAX_AGE:
         return
-        
+    update_subtag_registry()
+
+def update_subtag_registry(cldr_archive = None, iana_file = None):
+    """Update the app's subtag registry.
+
+    By default, the IANA subtag registry and the CLDR files are downloaded. For fast, 
+    reproducible or offline updates, local copies can be used instead. They result 
+    in the same registry rows as the downloaded data of the same version.
+
+    Args:
+        cldr_archive: Path or binary file object of a zip or tar archive of the 
+            cldr-json repository (see CLDRArchive).
+        iana_file: Path or file object of a copy of the IANA subtag registry.
+    """
+    local_reg = LocalSubtagRegistry()
+    updates = {}
+    touched = ()
+
     ## Update IANA subtag registry
-    registry = IANASubtagRegistry()
-    updated_on = registry.updated_on
-    
-    for typename in registry.get_types():
-        subtags = registry.get_by_type(typename)
-        local_reg.update_or_create(typename, subtags, updated_on)
-
-    local_reg.update_or_create(
-        registry.SUPPRESS_SCRIPT, 
-        registry.get_suppressed_scripts(), 
-        registry.updated_on
+    modified_since = (
+        local_reg.get_updated_on(IANASubtagRegistry.SUPPRESS_SCRIPT) 
+        if iana_file is None else None
     )
+    registry = IANASubtagRegistry(modified_since, iana_file)
+    updated_on = registry.updated_on
+
+    if not registry.modified:
+        # Nothing new. Just remember that the registry has been checked.
+        touched = registry.TYPES + (registry.SUPPRESS_SCRIPT,)
+        local_reg.touch(touched, updated_on)
+    else:
+        for typename in registry.get_types():
+            updates[typename] = registry.get_by_type(typename)
+        updates[registry.SUPPRESS_SCRIPT] = registry.get_suppressed_scripts()
+
+    archive = None if cldr_archive is None else CLDRArchive(cldr_archive)
+    try:
+        ## Update locale registry
+        LOCALE_NAME_DIR = "cldr-json/cldr-localenames-full/main/en"
+        updated_on = datetime.now().astimezone()
+        locales = CLDRLocale.find_locales(archive)
+        cldr = CLDRLocale(LOCALE_NAME_DIR, archive)
+        translated = {key: cldr.format(key) for key in locales}
+        translated = {k: v for k,v in translated.items() if v is not None}
+        updates["locale"] = translated
+
+        ## Update currency registry
+        CURRENCY_FILE = "cldr-json/cldr-numbers-full/main/en/currencies.json"
+        file = CLDRFile(CURRENCY_FILE, archive)
+        currencies = file.drill("main", "en", "numbers", "currencies")
+        currencies = {k: v.get("displayName", None) for k, v in currencies.items()}
+        updates["currency"] = currencies
 
-    ## Update locale registry
-    LOCALE_NAME_DIR = "cldr-json/cldr-localenames-full/main/en"
-    updated_on = datetime.now().astimezone()
-    locales = CLDRLocale.find_locales()
-    cldr = CLDRLocale(LOCALE_NAME_DIR)
-    translated = {key: cldr.format(key) for key in locales}
-    translated = {k: v for k,v in translated.items() if v is not None}
-    local_reg.update_or_create("locale", translated, updated_on)
-
-
-    ## Update currency registry
-    CURRENCY_FILE = "cldr-json/cldr-numbers-full/main/en/currencies.json"
-    file = CLDRFile(CURRENCY_FILE)
-    currencies = file.drill("main", "en", "numbers", "currencies")
-    currencies = {k: v.get("displayName", None) for k, v in currencies.items()}
-    local_reg.update_or_create("currency", currencies, updated_on)
+        ## Update display names for the app's locales (used on the server)
+        updates.update(display_names.compile_tables(Locale.index(), archive))
+    finally:
+        if archive is not None:
+            archive.close()
+
+    # Only changed types are written, all of them in a single transaction. The
+    # metadata of types that are no longer produced (e.g., display names of locales
+    # that were removed from index.lst) is dropped.
+    local_reg.update_many(updates, updated_on, retain=touched)
+    display_names.invalidate()
     
 @anvil.server.callable
 def launch_registry_update():
     anvil.server.launch_background_task('task_update_subtag_registry')
-    
+
+@anvil.server.callable
+def export_registry_json(typename: str):
+    """Return the given registry type as JSON asset (see LocalSubtagRegistry.export_json())."""
+    return LocalSubtagRegistry().export_json(typename)
+
+@anvil.server.callable
+def export_langcodes_snapshot():
+    """Return a warm-start snapshot of the langcodes caches as a Python module.
+
+    The snapshot covers the likely-subtag data, common Accept-Language tags and the
+    locales of the registry, each matched against the locales listed in the
+    index.lst file. Add the downloaded file to the app's server code as
+    "langcodes_snapshot" so that new server processes use it on their first
+    locale match.
+    """
+    from .locale import Locale
+    from .langcodes.snapshot import warm_caches, dump_snapshot, default_tags
+
+    available = Locale.index()
+    requested = default_tags() + list(LocalSubtagRegistry().get_tags("locale"))
+    warm_caches(requested, available)
+    source = dump_snapshot().encode("utf-8")
+    return anvil.BlobMedia("text/x-python", source, name="langcodes_snapshot.py")
+
+@anvil.server.callable
+def export_fallback_chains():
+    """Return the precomputed fallback chains for the locales of the index.lst file.
+
+    Chains are computed for every locale of the registry and every locale listed in
+    the index.lst file. Put the downloaded file next to the index.lst file and set
+    Locale.fallbacks_file to its name so that locale matching becomes a lookup that
+    returns the same result on client and server.
+    """
+    from json import dumps
+    from .locale import Locale
+
+    available = Locale.index()
+    requested = list(LocalSubtagRegistry().get_tags("locale"))
+    chains = Locale.build_fallback_chains(requested, available)
+    source = dumps(chains, separators=(",", ":")).encode("utf-8")
+    return anvil.BlobMedia("application/json", source, name=Locale.fallbacks_file or "fallbacks.json")